@@ -3,4 +3,12 @@
 content ...
 """
 
-from .model.api_config import APIConfig
+from typing import TYPE_CHECKING
+
+from ._utils.importing import lazy_import
+
+if TYPE_CHECKING:
+    from .model.api_config import APIConfig
+
+# The command line would import this package first, so it doesn't import the data models until they are used
+__getattr__ = lazy_import(__name__, {"APIConfig": ".model.api_config"})
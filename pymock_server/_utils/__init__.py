@@ -1,4 +1,23 @@
 """*Sub-package for utility functions*"""
 
-from .file.operation import JSON, YAML
-from .importing import ensure_importing, import_web_lib
+from typing import TYPE_CHECKING
+
+from .importing import (
+    ensure_importing,
+    import_compression_lib,
+    import_json_lib,
+    import_web_lib,
+    lazy_import,
+)
+
+if TYPE_CHECKING:
+    from .file.operation import JSON, YAML
+
+# The file operations need the YAML library, so it only imports them when they are used
+__getattr__ = lazy_import(
+    __name__,
+    {
+        "JSON": ".file.operation",
+        "YAML": ".file.operation",
+    },
+)
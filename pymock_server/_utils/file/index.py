@@ -0,0 +1,227 @@
+"""*The in-memory index of directories*
+
+Loading the divided configuration checks a lot of paths in the same directories, e.g., whether the divided
+configuration of the HTTP request of each API exists or not. This module lists each directory only once by
+*os.scandir* and answers all the checking from memory, so the amount of system calls only grows with the amount of
+directories instead of the amount of checking.
+"""
+
+import fnmatch
+import os
+import pathlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from .manifest import depend_on_directory, depend_on_missing_path
+
+_Current_Directory_Index: ContextVar[Optional["DirectoryIndex"]] = ContextVar(
+    "pymock_current_directory_index", default=None
+)
+
+
+class DirectoryIndex:
+    """*The in-memory index of directories*
+
+    Each directory would be listed lazily when it's checked the first time. The index would not know the changes of
+    files after that, so it should only be used in a short period, e.g., loading the configuration once.
+    """
+
+    def __init__(self):
+        self._cwd = os.getcwd()
+        # The data structure would be:
+        # {
+        #     <absolute directory path>: {
+        #         <the name of file or directory in it>: <it's a directory or not>
+        #     }
+        # }
+        # It would be ``None`` if the path is not a directory.
+        self._directories: Dict[str, Optional[Dict[str, bool]]] = {}
+
+    def _absolute_path(self, path: str) -> str:
+        return os.path.normpath(os.path.join(self._cwd, path))
+
+    def _scan(self, directory: str) -> Optional[Dict[str, bool]]:
+        if directory not in self._directories:
+            try:
+                with os.scandir(directory) as entries:
+                    self._directories[directory] = {entry.name: entry.is_dir() for entry in entries}
+            except OSError:
+                self._directories[directory] = None
+        return self._directories[directory]
+
+    def _lookup(self, path: str) -> Optional[bool]:
+        absolute_path = self._absolute_path(path)
+        parent, name = os.path.split(absolute_path)
+        if not name:
+            # The root directory
+            return True if self._scan(absolute_path) is not None else None
+        entries = self._scan(parent)
+        return entries.get(name, None) if entries is not None else None
+
+    def exists(self, path: str) -> bool:
+        """Check whether the path exists or not.
+
+        Args:
+            path (str): The path of file or directory.
+
+        Returns:
+            A boolean value.
+
+        """
+        return self._lookup(path) is not None
+
+    def is_file(self, path: str) -> bool:
+        """Check whether the path is an existing file or not.
+
+        Args:
+            path (str): The path.
+
+        Returns:
+            A boolean value.
+
+        """
+        return self._lookup(path) is False
+
+    def is_dir(self, path: str) -> bool:
+        """Check whether the path is an existing directory or not.
+
+        Args:
+            path (str): The path.
+
+        Returns:
+            A boolean value.
+
+        """
+        return self._lookup(path) is True
+
+    def list(self, directory: str) -> List[str]:
+        """Get the paths of all the files and directories in the directory, in the order of the file system as
+        *os.scandir* does.
+
+        Args:
+            directory (str): The directory path.
+
+        Returns:
+            A list of paths which are joined with the directory path.
+
+        """
+        entries = self._scan(self._absolute_path(directory))
+        return [str(pathlib.Path(directory, name)) for name in entries] if entries else []
+
+    def glob(self, directory: str, pattern: str) -> List[str]:
+        """Get the paths of the files and directories which name matches the pattern in the directory. As *glob.glob*
+        does, the hidden ones would be ignored if the pattern doesn't start with *.*.
+
+        Args:
+            directory (str): The directory path.
+            pattern (str): The shell-style pattern of names, e.g., *\\*\\*-api.yaml*.
+
+        Returns:
+            A list of paths which are joined with the directory path.
+
+        """
+        entries = self._scan(self._absolute_path(directory))
+        if not entries:
+            return []
+        include_hidden = pattern.startswith(".")
+        return [
+            str(pathlib.Path(directory, name))
+            for name in entries
+            if (include_hidden or not name.startswith(".")) and fnmatch.fnmatch(name, pattern)
+        ]
+
+
+@contextmanager
+def shared_directory_index() -> Iterator[DirectoryIndex]:
+    """Share one directory index with all the functions in this module in current context. It would reuse the index
+    if there is already one in current context.
+
+    Returns:
+        The shared directory index.
+
+    """
+    index = _Current_Directory_Index.get()
+    if index is not None:
+        yield index
+        return
+    index = DirectoryIndex()
+    token = _Current_Directory_Index.set(index)
+    try:
+        yield index
+    finally:
+        _Current_Directory_Index.reset(token)
+
+
+def path_exists(path: str) -> bool:
+    """Check whether the path exists or not by the shared directory index if it has, and record it as a dependency if
+    it doesn't exist.
+
+    Args:
+        path (str): The path of file or directory.
+
+    Returns:
+        A boolean value.
+
+    """
+    index = _Current_Directory_Index.get()
+    exists = index.exists(path) if index is not None else os.path.exists(path)
+    if not exists:
+        depend_on_missing_path(path)
+    return exists
+
+
+def path_is_file(path: str) -> bool:
+    """Check whether the path is an existing file or not by the shared directory index if it has, and record it as a
+    dependency if it doesn't exist.
+
+    Args:
+        path (str): The path.
+
+    Returns:
+        A boolean value.
+
+    """
+    index = _Current_Directory_Index.get()
+    if index is not None:
+        is_file = index.is_file(path)
+        exists = is_file or index.exists(path)
+    else:
+        is_file = os.path.isfile(path)
+        exists = is_file or os.path.exists(path)
+    if not exists:
+        depend_on_missing_path(path)
+    return is_file
+
+
+def path_is_dir(path: str) -> bool:
+    """Check whether the path is an existing directory or not by the shared directory index if it has.
+
+    Args:
+        path (str): The path.
+
+    Returns:
+        A boolean value.
+
+    """
+    index = _Current_Directory_Index.get()
+    return index.is_dir(path) if index is not None else os.path.isdir(path)
+
+
+def glob_paths(directory: str, pattern: str) -> List[str]:
+    """Get the paths which name matches the pattern in the directory by the shared directory index if it has, and
+    record the directory as a dependency.
+
+    Args:
+        directory (str): The directory path.
+        pattern (str): The shell-style pattern of names.
+
+    Returns:
+        A list of paths which are joined with the directory path.
+
+    """
+    depend_on_directory(directory)
+    index = _Current_Directory_Index.get()
+    if index is not None:
+        return index.glob(directory, pattern)
+    return DirectoryIndex().glob(directory, pattern)
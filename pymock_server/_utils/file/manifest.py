@@ -0,0 +1,194 @@
+"""*Record the files which some data depends on*
+
+Record all the files it reads, all the paths it checks but don't exist and all the directories it lists while loading
+some data, e.g., the configuration with divided files. The record could tell whether the data is still the same as
+before or not without loading it again.
+"""
+
+import hashlib
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+_Recording_Manifest: ContextVar[Optional["FileManifest"]] = ContextVar("pymock_recording_manifest", default=None)
+
+
+def file_digest(path: str) -> str:
+    """Get the hash of the file content.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        The hex string of the hash of the file content.
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file_stream:
+        for chunk in iter(lambda: file_stream.read(64 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _list_directory(path: str) -> List[str]:
+    # The hidden files, e.g., the cache or the temporary files of editors, are not the dependencies
+    return sorted(name for name in os.listdir(path) if not name.startswith("."))
+
+
+class FileManifest:
+    """*The record of files which some data depends on*
+
+    A file would be checked by its modified time and size first, and it only compares the hash of its content if they
+    are different. So it doesn't need to read any file if nothing has been changed.
+    """
+
+    def __init__(self):
+        # The data structure would be:
+        # {
+        #     <file path>: (<modified time in nanoseconds>, <file size>, <hash of file content>)
+        # }
+        self._files: Dict[str, Tuple[int, int, str]] = {}
+        self._missing_paths: Set[str] = set()
+        # The data structure would be:
+        # {
+        #     <directory path>: [<the name of file or directory in it>]
+        # }
+        self._directories: Dict[str, List[str]] = {}
+
+    @property
+    def files(self) -> List[str]:
+        """:obj:`list` of :obj:`str`: Property with only getter for the paths of files it depends on."""
+        return list(self._files.keys())
+
+    def add_file(self, path: str) -> None:
+        """Record the file it reads.
+
+        Args:
+            path (str): The file path.
+
+        """
+        path = os.path.abspath(path)
+        if path in self._files:
+            return
+        stat_result = os.stat(path)
+        self._files[path] = (stat_result.st_mtime_ns, stat_result.st_size, file_digest(path))
+
+    def add_missing_path(self, path: str) -> None:
+        """Record the path it checks but doesn't exist.
+
+        Args:
+            path (str): The path of file or directory.
+
+        """
+        self._missing_paths.add(os.path.abspath(path))
+
+    def add_directory(self, path: str) -> None:
+        """Record the directory it lists.
+
+        Args:
+            path (str): The directory path.
+
+        """
+        path = os.path.abspath(path)
+        if path in self._directories:
+            return
+        try:
+            self._directories[path] = _list_directory(path)
+        except OSError:
+            self.add_missing_path(path)
+
+    def is_fresh(self) -> bool:
+        """Check whether all the files are the same as the ones it records or not.
+
+        Returns:
+            It returns ``True`` if nothing has been changed.
+
+        """
+        for path, (mtime_ns, size, digest) in self._files.items():
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                return False
+            if stat_result.st_size != size:
+                return False
+            if stat_result.st_mtime_ns != mtime_ns and file_digest(path) != digest:
+                return False
+        if any(os.path.exists(path) for path in self._missing_paths):
+            return False
+        for path, names in self._directories.items():
+            try:
+                if _list_directory(path) != names:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def serialize(self) -> Dict[str, Any]:
+        return {
+            "files": {path: list(signature) for path, signature in self._files.items()},
+            "missing_paths": sorted(self._missing_paths),
+            "directories": self._directories,
+        }
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any]) -> "FileManifest":
+        manifest = cls()
+        manifest._files = {
+            path: (int(mtime_ns), int(size), str(digest)) for path, (mtime_ns, size, digest) in data["files"].items()
+        }
+        manifest._missing_paths = set(data["missing_paths"])
+        manifest._directories = {path: list(names) for path, names in data["directories"].items()}
+        return manifest
+
+
+@contextmanager
+def record_dependencies() -> Iterator[FileManifest]:
+    """Record the files which are read, checked or listed by the functions in this module in current context.
+
+    Returns:
+        The manifest which has all the records.
+
+    """
+    manifest = FileManifest()
+    token = _Recording_Manifest.set(manifest)
+    try:
+        yield manifest
+    finally:
+        _Recording_Manifest.reset(token)
+
+
+def depend_on_file(path: str) -> None:
+    """Record the file it reads if it's recording.
+
+    Args:
+        path (str): The file path.
+
+    """
+    manifest = _Recording_Manifest.get()
+    if manifest is not None:
+        manifest.add_file(path)
+
+
+def depend_on_missing_path(path: str) -> None:
+    """Record the path it checks but doesn't exist if it's recording.
+
+    Args:
+        path (str): The path of file or directory.
+
+    """
+    manifest = _Recording_Manifest.get()
+    if manifest is not None:
+        manifest.add_missing_path(path)
+
+
+def depend_on_directory(path: str) -> None:
+    """Record the directory it lists if it's recording.
+
+    Args:
+        path (str): The directory path.
+
+    """
+    manifest = _Recording_Manifest.get()
+    if manifest is not None:
+        manifest.add_directory(path)
@@ -4,18 +4,129 @@ Read the configuration and parse its content to a specific data object so that i
 """
 
 import json
+import logging
+import multiprocessing
 import os
+import threading
 from abc import ABCMeta, abstractmethod
-from typing import Union
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from yaml import dump, load
 
+from .index import path_exists
+from .manifest import depend_on_file
+
 try:
     from yaml import CDumper as Dumper
     from yaml import CLoader as Loader
 except ImportError:
     from yaml import Dumper, Loader  # type: ignore
 
+logger = logging.getLogger(__name__)
+
+# The data structure would be:
+# {
+#     <absolute file path>: <the parsed content of file>
+# }
+_Preloaded_Content: ContextVar[Optional[Dict[str, Any]]] = ContextVar("pymock_preloaded_content", default=None)
+
+
+def _load_yaml_files(paths: List[str]) -> List[Tuple[str, Any]]:
+    contents = []
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as file_stream:
+                contents.append((path, load(stream=file_stream, Loader=Loader)))
+        except Exception:  # pylint: disable=broad-except
+            # Skip it, it would raise the error again when it really reads the file
+            continue
+    return contents
+
+
+def parse_yaml_files(paths: Sequence[str], max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """Parse the YAML files by multiple processes. The files which cannot be parsed would be skipped.
+
+    The processes are started by *forkserver* (or *spawn* if the platform doesn't support it) instead of *fork*, so it
+    doesn't copy the other running threads and their locks, e.g., the threads of file watcher or response pools.
+
+    Args:
+        paths (Sequence[str]): The YAML file paths.
+        max_workers (Optional[int]): The maximum amount of processes. It would be the amount of CPUs if it's empty.
+
+    Returns:
+        A dict type value which key is the absolute file path and value is its parsed content.
+
+    """
+    paths = [os.path.abspath(path) for path in paths]
+    max_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if max_workers <= 1:
+        return dict(_load_yaml_files(paths))
+
+    # Each process parses a batch of files so that it doesn't need to send each file path and content one by one
+    batches = [paths[i::max_workers] for i in range(max_workers)]
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=_multiprocessing_context()) as executor:
+            return {path: content for contents in executor.map(_load_yaml_files, batches) for path, content in contents}
+    except Exception as e:  # pylint: disable=broad-except
+        logger.debug(f"Cannot parse YAML files by multiple processes: {e}")
+        return {}
+
+
+def _multiprocessing_context() -> multiprocessing.context.BaseContext:
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(start_method)
+
+
+@contextmanager
+def preload_content(contents: Dict[str, Any]) -> Iterator[None]:
+    """Let the file operations use the parsed content directly in current context instead of reading the file again.
+    Each content would only be used once, because the caller may modify it.
+
+    Args:
+        contents (Dict[str, Any]): The parsed content of files which key is the absolute file path.
+
+    """
+    token = _Preloaded_Content.set(contents)
+    try:
+        yield
+    finally:
+        _Preloaded_Content.reset(token)
+
+
+def is_preloading() -> bool:
+    """Check whether it's using the preloaded content of files or not in current context.
+
+    Returns:
+        A boolean value.
+
+    """
+    return _Preloaded_Content.get() is not None
+
+
+def can_parse_in_parallel() -> bool:
+    """Check whether it could parse files by multiple processes or not. It only starts the processes in the main
+    thread, i.e., loading the configuration at start-up. Reloading it in the thread of file watcher parses the files one
+    by one.
+
+    Returns:
+        A boolean value.
+
+    """
+    return (os.cpu_count() or 1) > 1 and threading.current_thread() is threading.main_thread()
+
+
+def _pop_preloaded_content(path: str) -> Tuple[bool, Any]:
+    contents = _Preloaded_Content.get()
+    if not contents:
+        return False, None
+    abs_path = os.path.abspath(path)
+    if abs_path not in contents:
+        return False, None
+    return True, contents.pop(abs_path)
+
 
 class _BaseFileOperation(metaclass=ABCMeta):
     @abstractmethod
@@ -33,12 +144,15 @@ class _BaseFileOperation(metaclass=ABCMeta):
 
 class YAML(_BaseFileOperation):
     def read(self, path: str) -> dict:
-        exist_file = os.path.exists(path)
+        exist_file = path_exists(path)
         if not exist_file:
             raise FileNotFoundError(f"The target configuration file {path} doesn't exist.")
 
-        with open(path, "r", encoding="utf-8") as file_stream:
-            data: dict = load(stream=file_stream, Loader=Loader)
+        preloaded, data = _pop_preloaded_content(path)
+        if not preloaded:
+            with open(path, "r", encoding="utf-8") as file_stream:
+                data = load(stream=file_stream, Loader=Loader)
+        depend_on_file(path)
         return data
 
     def write(self, path: str, config: Union[str, dict], mode: str = "a+") -> None:
@@ -52,12 +166,13 @@ class YAML(_BaseFileOperation):
 
 class JSON(_BaseFileOperation):
     def read(self, path: str) -> dict:
-        exist_file = os.path.exists(path)
+        exist_file = path_exists(path)
         if not exist_file:
             raise FileNotFoundError(f"The target configuration file {path} doesn't exist.")
 
         with open(path, "r", encoding="utf-8") as file_stream:
             data: dict = json.loads(file_stream.read())
+        depend_on_file(path)
         return data
 
     def write(self, path: str, config: Union[str, dict], mode: str = "a+") -> None:
@@ -0,0 +1,317 @@
+"""*Watch the changes of files*
+
+Watch the files by the Linux kernel subsystem *inotify* if it could, or it would check their status periodically. Both
+of them compare the modified time and size of the files to find out which files have been changed, *inotify* only makes
+it know the changes immediately instead of waiting for the next checking.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import stat
+import struct
+import sys
+import threading
+from abc import ABCMeta, abstractmethod
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# The data structure would be:
+# {
+#     <file path>: (<modified time in nanoseconds>, <file size>)
+# }
+FileSnapshot = Dict[str, Tuple[int, int]]
+
+
+def snapshot_files(paths: Iterable[str]) -> Tuple[FileSnapshot, Set[str]]:
+    """Get the status of the files. The path which doesn't exist would be ignored.
+
+    Args:
+        paths (Iterable[str]): The paths of files or directories.
+
+    Returns:
+        A tuple of the status of all the files and all the paths which are directories.
+
+    """
+    files: FileSnapshot = {}
+    directories: Set[str] = set()
+    for path in paths:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISDIR(stat_result.st_mode):
+            directories.add(path)
+        else:
+            files[path] = (stat_result.st_mtime_ns, stat_result.st_size)
+    return files, directories
+
+
+def changed_files(previous: FileSnapshot, current: FileSnapshot) -> Set[str]:
+    """Compare the status of files to find out which files have been added, modified or deleted.
+
+    Args:
+        previous (FileSnapshot): The status of files in the previous checking.
+        current (FileSnapshot): The status of files in the current checking.
+
+    Returns:
+        A set of the changed file paths.
+
+    """
+    changed = {path for path, signature in current.items() if previous.get(path, None) != signature}
+    changed.update(path for path in previous.keys() if path not in current)
+    return changed
+
+
+class BaseFileWatcher(metaclass=ABCMeta):
+    """*Watch the changes of files in a daemon thread*
+
+    It gets the paths it should watch by the callable object each time it checks the files, so the new files, e.g., the
+    new divided configuration, could be watched without restarting it. The directories in the paths wouldn't be
+    compared, they only be watched for getting the changes of the files in them immediately.
+    """
+
+    # The time (in seconds) to wait for the other changes after getting one. Editors may save a file by multiple steps.
+    debounce: float = 0.1
+
+    def __init__(
+        self, list_paths: Callable[[], Iterable[str]], on_change: Callable[[Set[str]], None], interval: float = 1.0
+    ):
+        """
+
+        Args:
+            list_paths (Callable[[], Iterable[str]]): The callable object which returns the paths of files or
+                directories it should watch.
+            on_change (Callable[[Set[str]], None]): The callback function which receives the changed file paths.
+            interval (float): The interval (in seconds) between each checking.
+        """
+        self._list_paths = list_paths
+        self._on_change = on_change
+        self._interval = interval
+        self._stop_watching = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._snapshot: FileSnapshot = {}
+        self._directories: Set[str] = set()
+
+    @property
+    def is_running(self) -> bool:
+        """:obj:`bool`: Property with only getter for whether it's watching the files or not."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching the files in a daemon thread. The current status of files would be the base of comparing. It
+        could be started again after stopping it.
+        """
+        if self.is_running:
+            return
+        self._stop_watching.clear()
+        self._open()
+        self._refresh()
+        self._thread = threading.Thread(target=self._watch, name="pymock-file-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching the files and release the resources of watching."""
+        self._stop_watching.set()
+        self._wake_up()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        # Release the resources after the watching thread has finished so that it never uses the closed ones
+        self._close()
+
+    def check(self) -> Set[str]:
+        """Check the files once and call the callback function if any of them has been changed.
+
+        Returns:
+            A set of the changed file paths.
+
+        """
+        previous = self._snapshot
+        self._refresh()
+        changed = changed_files(previous, self._snapshot)
+        if changed:
+            try:
+                self._on_change(changed)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(f"Cannot handle the changes of files {sorted(changed)}: {e}")
+            # The callback function may change the files which should be watched
+            self._refresh()
+        return changed
+
+    def _refresh(self) -> None:
+        self._snapshot, self._directories = snapshot_files(self._list_paths())
+
+    def _watch(self) -> None:
+        while not self._stop_watching.is_set():
+            if self._wait_for_changes():
+                # Wait for the other changes so that it only handles them once
+                self._stop_watching.wait(self.debounce)
+            self.check()
+
+    @abstractmethod
+    def _wait_for_changes(self) -> bool:
+        """Block until it's time to check the files.
+
+        Returns:
+            It returns ``True`` if it's waked up by the changes of files.
+
+        """
+
+    def _open(self) -> None:
+        pass
+
+    def _wake_up(self) -> None:
+        pass
+
+    def _close(self) -> None:
+        pass
+
+
+class PollingFileWatcher(BaseFileWatcher):
+    """*Check the status of files periodically*"""
+
+    def _wait_for_changes(self) -> bool:
+        self._stop_watching.wait(self._interval)
+        return False
+
+
+class InotifyFileWatcher(BaseFileWatcher):
+    """*Get the changes of files immediately by the Linux kernel subsystem inotify*
+
+    It watches the directories of the files instead of the files themselves, because a lot of editors save the file by
+    writing a new file and renaming it as the original one.
+    """
+
+    _IN_CLOSE_WRITE: int = 0x00000008
+    _IN_MOVED_FROM: int = 0x00000040
+    _IN_MOVED_TO: int = 0x00000080
+    _IN_CREATE: int = 0x00000100
+    _IN_DELETE: int = 0x00000200
+    _IN_DELETE_SELF: int = 0x00000400
+    _IN_MOVE_SELF: int = 0x00000800
+    _IN_Q_OVERFLOW: int = 0x00004000
+    _Watching_Events: int = (
+        _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+    )
+    # The structure *inotify_event* without the file name: watch descriptor, mask, cookie and length of name
+    _Event_Header = struct.Struct("iIII")
+
+    def __init__(
+        self, list_paths: Callable[[], Iterable[str]], on_change: Callable[[Set[str]], None], interval: float = 1.0
+    ):
+        super().__init__(list_paths=list_paths, on_change=on_change, interval=interval)
+        self._libc = self._load_libc()
+        if self._libc is None:
+            raise OSError("The inotify API is not available in current platform.")
+        # The file descriptors would be opened when starting watching and closed when stopping it
+        self._fd: int = -1
+        # The pipe for waking up the watching thread which is blocked by waiting for the events when it's stopped
+        self._wake_up_reader: int = -1
+        self._wake_up_writer: int = -1
+        # The data structure would be:
+        # {
+        #     <directory path>: <watch descriptor>
+        # }
+        self._watch_descriptors: Dict[str, int] = {}
+
+    @staticmethod
+    def _load_libc() -> Optional[ctypes.CDLL]:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        except OSError:
+            return None
+        if not hasattr(libc, "inotify_init1") or not hasattr(libc, "inotify_add_watch"):
+            return None
+        return libc
+
+    def _refresh(self) -> None:
+        super()._refresh()
+        if self._fd < 0:
+            return
+        directories = set(self._directories)
+        directories.update(os.path.dirname(path) or "." for path in self._snapshot.keys())
+        for directory in directories - set(self._watch_descriptors.keys()):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._Watching_Events)
+            if wd < 0:
+                logger.warning(f"Cannot watch the directory *{directory}* by inotify (errno: {ctypes.get_errno()}).")
+                continue
+            self._watch_descriptors[directory] = wd
+        for directory in set(self._watch_descriptors.keys()) - directories:
+            self._libc.inotify_rm_watch(self._fd, self._watch_descriptors.pop(directory))
+
+    def _wait_for_changes(self) -> bool:
+        readable, _, _ = select.select([self._fd, self._wake_up_reader], [], [], self._interval)
+        if self._fd not in readable:
+            return False
+        self._read_events()
+        return True
+
+    def _read_events(self) -> None:
+        # It doesn't care about the details of events, because it would compare the status of files anyway
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            if not data:
+                return
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_length = self._Event_Header.unpack_from(data, offset)
+                offset += self._Event_Header.size + name_length
+                if mask & (self._IN_DELETE_SELF | self._IN_MOVE_SELF):
+                    # The directory has gone, so it should be watched again if it comes back
+                    for directory, descriptor in list(self._watch_descriptors.items()):
+                        if descriptor == wd:
+                            self._watch_descriptors.pop(directory)
+
+    def _open(self) -> None:
+        if self._fd >= 0:
+            return
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "Cannot initial inotify.")
+        self._fd = fd
+        self._wake_up_reader, self._wake_up_writer = os.pipe()
+
+    def _wake_up(self) -> None:
+        if self._wake_up_writer >= 0:
+            os.write(self._wake_up_writer, b"\0")
+
+    def _close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._watch_descriptors.clear()
+        for pipe_fd in (self._wake_up_reader, self._wake_up_writer):
+            if pipe_fd >= 0:
+                os.close(pipe_fd)
+        self._wake_up_reader = self._wake_up_writer = -1
+
+
+def file_watcher(
+    list_paths: Callable[[], Iterable[str]], on_change: Callable[[Set[str]], None], interval: float = 1.0
+) -> BaseFileWatcher:
+    """Get the file watcher which gets the changes of files as soon as possible in current platform.
+
+    Args:
+        list_paths (Callable[[], Iterable[str]]): The callable object which returns the paths of files or directories
+            it should watch.
+        on_change (Callable[[Set[str]], None]): The callback function which receives the changed file paths.
+        interval (float): The interval (in seconds) between each checking.
+
+    Returns:
+        An **InotifyFileWatcher** type object if it could use inotify, nor a **PollingFileWatcher** type object.
+
+    """
+    try:
+        return InotifyFileWatcher(list_paths=list_paths, on_change=on_change, interval=interval)
+    except OSError as e:
+        logger.debug(f"Use polling to watch the files because inotify is not available: {e}")
+        return PollingFileWatcher(list_paths=list_paths, on_change=on_change, interval=interval)
@@ -1,7 +1,17 @@
 """*Handle importing*"""
 
+import importlib
 import re
-from typing import Callable, Optional
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, Optional
+
+
+def _chk_lib_ready(lib_name: str) -> bool:
+    # Only find the library instead of importing it, importing a library, e.g., a web framework, takes a lot of time
+    try:
+        return find_spec(lib_name) is not None
+    except (ImportError, ValueError):
+        return False
 
 
 class import_web_lib:
@@ -34,20 +44,52 @@ class import_web_lib:
 
     @staticmethod
     def flask_ready() -> bool:
-        return import_web_lib._chk_lib_ready(import_web_lib.flask)
+        return _chk_lib_ready("flask")
 
     @staticmethod
     def fastapi_ready() -> bool:
-        return import_web_lib._chk_lib_ready(import_web_lib.fastapi)
+        return _chk_lib_ready("fastapi")
+
+
+class import_json_lib:
+    """*Import the Python JSON library which is faster than the built-in one and return it.*"""
 
     @staticmethod
-    def _chk_lib_ready(lib_import: Callable) -> bool:
-        try:
-            lib_import()
-        except ImportError:
-            return False
-        else:
-            return True
+    def orjson() -> "orjson":  # type: ignore
+        """Import Python JSON library *orjson*."""
+        import orjson
+
+        return orjson
+
+    @staticmethod
+    def ujson() -> "ujson":  # type: ignore
+        """Import Python JSON library *ujson*."""
+        import ujson
+
+        return ujson
+
+    @staticmethod
+    def orjson_ready() -> bool:
+        return _chk_lib_ready("orjson")
+
+    @staticmethod
+    def ujson_ready() -> bool:
+        return _chk_lib_ready("ujson")
+
+
+class import_compression_lib:
+    """*Import the Python compression library which is not built-in and return it.*"""
+
+    @staticmethod
+    def brotli() -> "brotli":  # type: ignore
+        """Import Python compression library *brotli*."""
+        import brotli
+
+        return brotli
+
+    @staticmethod
+    def brotli_ready() -> bool:
+        return _chk_lib_ready("brotli")
 
 
 def ensure_importing(import_callback: Callable, import_err_callback: Optional[Callable] = None) -> Callable:
@@ -79,3 +121,27 @@ def ensure_importing(import_callback: Callable, import_err_callback: Optional[Ca
         return _
 
     return _import
+
+
+def lazy_import(package: str, attributes: Dict[str, str]) -> Callable[[str], Any]:
+    """Generate the function *__getattr__* of a package which imports its attributes from the modules only when they
+    are used the first time. So importing the package doesn't need to import all the modules of it.
+
+    Args:
+        package (str): The name of package, i.e., *__name__* of the package.
+        attributes (Dict[str, str]): The mapping of the attribute name and the relative module name which has it.
+
+    Returns:
+        The function *__getattr__* of the package.
+
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(attributes[name], package), name)
+        # Save it into the package, so it won't get into this function again
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    return __getattr__
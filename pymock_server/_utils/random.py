@@ -2,12 +2,40 @@ import random
 import string
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import Any, Sequence
+from typing import Any, Iterator, List, Sequence
 
 ValueSize = namedtuple("ValueSize", ("min", "max"), defaults=(-127, 128))
 DigitRange = namedtuple("DigitRange", ("integer", "decimal"))
 
+_Boolean_Values = (True, False)
+
+# The source of randomness in current context. It's the module *random* (the global state) by default, and it would be
+# an independent *random.Random* object in the context of *seeded_random*.
+_Random_Source: ContextVar[Any] = ContextVar("pymock_random_source", default=random)
+
+
+@contextmanager
+def seeded_random(seed: int) -> Iterator[random.Random]:
+    """Generate all the random values by the specific seed in this context. It doesn't change the global state of
+    module *random*, and the other threads or coroutines won't be affected.
+
+    Args:
+        seed (int): The seed of randomness.
+
+    Returns:
+        The *random.Random* object which is used in this context.
+
+    """
+    source = random.Random(seed)
+    token = _Random_Source.set(source)
+    try:
+        yield source
+    finally:
+        _Random_Source.reset(token)
+
 
 class BaseRandomGenerator(metaclass=ABCMeta):
 
@@ -19,18 +47,45 @@ class BaseRandomGenerator(metaclass=ABCMeta):
     def generate(*args, **kwargs) -> Any:
         pass
 
+    @staticmethod
+    @abstractmethod
+    def generate_many(amount: int, *args, **kwargs) -> List[Any]:
+        pass
+
 
 class RandomString(BaseRandomGenerator):
     @staticmethod
     def generate(size: ValueSize = ValueSize()) -> str:
-        string_size = random.randint(size.min, size.max)
-        return "".join([random.choice(string.ascii_letters) for _ in range(string_size)])
+        source = _Random_Source.get()
+        string_size = source.randint(size.min, size.max)
+        return "".join(source.choices(string.ascii_letters, k=string_size))
+
+    @staticmethod
+    def generate_many(amount: int, size: ValueSize = ValueSize()) -> List[str]:
+        source = _Random_Source.get()
+        randrange = source.randrange
+        string_sizes = [randrange(size.min, size.max + 1) for _ in range(amount)]
+        # Draw all the characters at once and slice them into each string
+        characters = "".join(source.choices(string.ascii_letters, k=sum(string_sizes)))
+        values: List[str] = []
+        start = 0
+        for string_size in string_sizes:
+            end = start + string_size
+            values.append(characters[start:end])
+            start = end
+        return values
 
 
 class RandomInteger(BaseRandomGenerator):
     @staticmethod
     def generate(value_range: ValueSize = ValueSize()) -> int:
-        return random.randint(value_range.min, value_range.max)
+        return _Random_Source.get().randint(value_range.min, value_range.max)
+
+    @staticmethod
+    def generate_many(amount: int, value_range: ValueSize = ValueSize()) -> List[int]:
+        randrange = _Random_Source.get().randrange
+        start, stop = value_range.min, value_range.max + 1
+        return [randrange(start, stop) for _ in range(amount)]
 
 
 class RandomBigDecimal(BaseRandomGenerator):
@@ -42,14 +97,30 @@ class RandomBigDecimal(BaseRandomGenerator):
         decimal = RandomInteger.generate(value_range=decimal_range)
         return Decimal(f"{integer}.{decimal}")
 
+    @staticmethod
+    def generate_many(
+        amount: int, integer_range: ValueSize = ValueSize(), decimal_range: ValueSize = ValueSize(min=0, max=128)
+    ) -> List[Decimal]:
+        integers = RandomInteger.generate_many(amount, value_range=integer_range)
+        decimals = RandomInteger.generate_many(amount, value_range=decimal_range)
+        return [Decimal(f"{integer}.{decimal}") for integer, decimal in zip(integers, decimals)]
+
 
 class RandomBoolean(BaseRandomGenerator):
     @staticmethod
     def generate() -> bool:
-        return random.choice([True, False])
+        return _Random_Source.get().choice(_Boolean_Values)
+
+    @staticmethod
+    def generate_many(amount: int) -> List[bool]:
+        return _Random_Source.get().choices(_Boolean_Values, k=amount)
 
 
 class RandomFromSequence(BaseRandomGenerator):
     @staticmethod
     def generate(sequence: Sequence) -> bool:
-        return random.choice(sequence)
+        return _Random_Source.get().choice(sequence)
+
+    @staticmethod
+    def generate_many(amount: int, sequence: Sequence) -> List[Any]:
+        return _Random_Source.get().choices(sequence, k=amount)
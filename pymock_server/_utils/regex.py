@@ -0,0 +1,93 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Pattern, Tuple
+
+
+class RegexPatternCache:
+    """*The bounded cache of compiled regular expressions*
+
+    The cache in Python's module *re* is small, so it would be thrashed easily if it has hundreds of different regular
+    expressions. This cache keeps the most recently used compiled regular expressions with the bounded size, and
+    records the hit and miss counts of it.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+
+        Args:
+            max_size (int): The maximum amount of compiled regular expressions it keeps.
+        """
+        if max_size <= 0:
+            raise ValueError("The maximum size of regular expression cache must be greater than 0.")
+        self._max_size = max_size
+        self._patterns: "OrderedDict[Tuple[str, int], Pattern]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def max_size(self) -> int:
+        """:obj:`int`: Property with only getter for the maximum amount of compiled regular expressions."""
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        """:obj:`int`: Property with only getter for the current amount of compiled regular expressions."""
+        return len(self._patterns)
+
+    @property
+    def hits(self) -> int:
+        """:obj:`int`: Property with only getter for how many times it gets the compiled one from cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """:obj:`int`: Property with only getter for how many times it needs to compile the regular expression."""
+        return self._misses
+
+    def compile(self, pattern: str, flags: int = 0) -> Pattern:
+        """Get the compiled regular expression. It only compiles it if it doesn't have it in cache.
+
+        Args:
+            pattern (str): The regular expression.
+            flags (int): The flags of the regular expression, e.g., *re.IGNORECASE*.
+
+        Returns:
+            A compiled regular expression.
+
+        """
+        key = (pattern, flags)
+        with self._lock:
+            compiled = self._patterns.get(key, None)
+            if compiled is not None:
+                self._hits += 1
+                self._patterns.move_to_end(key)
+                return compiled
+            self._misses += 1
+
+        compiled = re.compile(pattern, flags)
+        with self._lock:
+            self._patterns[key] = compiled
+            if len(self._patterns) > self._max_size:
+                self._patterns.popitem(last=False)
+        return compiled
+
+    def info(self) -> Dict[str, int]:
+        """Get the statistics of this cache.
+
+        Returns:
+            A dict type value which has the hit count, miss count, current size and maximum size.
+
+        """
+        return {"hits": self._hits, "misses": self._misses, "size": self.size, "max_size": self._max_size}
+
+    def clear(self) -> None:
+        """Clear all the compiled regular expressions and the statistics."""
+        with self._lock:
+            self._patterns.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+Shared_Regex_Pattern_Cache = RegexPatternCache()
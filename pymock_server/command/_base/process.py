@@ -68,6 +68,8 @@ class CommandProcessor:
 
     @property
     def _subcmd_component(self) -> BaseSubCmdComponent:
+        # All the processors are loaded to dispatch the command line, so the component which may import a lot of
+        # modules, e.g., the web frameworks, should be imported here only when its subcommand runs.
         raise NotImplementedError
 
     def distribute(self, cmd_index: int = 0) -> "CommandProcessor":
@@ -1,15 +1,34 @@
 import logging
 import pathlib
-from typing import Any, Dict, Optional
+import re
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
 
 from pymock_server._utils import YAML
 from pymock_server.model.api_config import APIConfig
+from pymock_server.model.api_config.apis.response_strategy import ResponseStrategy
 from pymock_server.model.api_config.template._divide import DivideStrategy
 from pymock_server.model.cmd_args import _BaseSubCmdArgumentsSavingConfig
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def exit_if_invalid_response_strategy() -> Iterator[None]:
+    """Exit the program with exit code *1* if it fails to load the configuration because of the invalid HTTP response
+    strategy. The other errors would be raised as they are.
+    """
+    try:
+        yield
+    except ValueError as e:
+        if re.search(r"is not a valid " + re.escape(ResponseStrategy.__name__), str(e), re.IGNORECASE):
+            invalid_strategy = str(e).split("'")[1]
+            logger.error(f"*{invalid_strategy}* is a invalid HTTP response strategy.")
+            sys.exit(1)
+        raise e
+
+
 class SavingConfigComponent:
 
     def __init__(self):
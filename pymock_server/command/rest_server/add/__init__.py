@@ -1 +1,8 @@
-from .component import SubCmdAddComponent
+from typing import TYPE_CHECKING
+
+from pymock_server._utils.importing import lazy_import
+
+if TYPE_CHECKING:
+    from .component import SubCmdAddComponent
+
+__getattr__ = lazy_import(__name__, {"SubCmdAddComponent": ".component"})
@@ -1,12 +1,13 @@
 from argparse import ArgumentParser
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from pymock_server.command._base.process import BaseCommandProcessor
 from pymock_server.command.subcommand import SubCommandLine
 from pymock_server.model import SubcmdAddArguments, deserialize_args
 from pymock_server.model.subcmd_common import SysArg
 
-from .component import SubCmdAddComponent
+if TYPE_CHECKING:
+    from .component import SubCmdAddComponent
 
 
 class SubCmdAdd(BaseCommandProcessor):
@@ -16,7 +17,9 @@ class SubCmdAdd(BaseCommandProcessor):
     )
 
     @property
-    def _subcmd_component(self) -> SubCmdAddComponent:
+    def _subcmd_component(self) -> "SubCmdAddComponent":
+        from .component import SubCmdAddComponent
+
         return SubCmdAddComponent()
 
     def _parse_process(self, parser: ArgumentParser, cmd_args: Optional[List[str]] = None) -> SubcmdAddArguments:
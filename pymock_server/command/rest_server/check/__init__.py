@@ -1 +1,8 @@
-from .component import SubCmdCheckComponent
+from typing import TYPE_CHECKING
+
+from pymock_server._utils.importing import lazy_import
+
+if TYPE_CHECKING:
+    from .component import SubCmdCheckComponent
+
+__getattr__ = lazy_import(__name__, {"SubCmdCheckComponent": ".component"})
@@ -1,5 +1,4 @@
 import logging
-import re
 import sys
 from abc import ABCMeta, abstractmethod
 from argparse import ArgumentParser
@@ -7,6 +6,7 @@ from typing import Any, Optional
 
 from pymock_server._utils.api_client import URLLibHTTPClient
 from pymock_server.command._base.component import BaseSubCmdComponent
+from pymock_server.command._common.component import exit_if_invalid_response_strategy
 from pymock_server.model import (
     APIConfig,
     BaseAPIDocumentConfig,
@@ -15,7 +15,6 @@ from pymock_server.model import (
     load_config,
 )
 from pymock_server.model.api_config.apis import APIParameter as MockedAPIParameter
-from pymock_server.model.api_config.apis.response_strategy import ResponseStrategy
 from pymock_server.model.rest_api_doc_config._base_model_adapter import (
     BaseAPIAdapter as SwaggerAPI,
 )
@@ -32,14 +31,8 @@ class SubCmdCheckComponent(BaseSubCmdComponent):
         self._check_config: _BaseCheckingFactory = ConfigCheckingFactory()
 
     def process(self, parser: ArgumentParser, args: SubcmdCheckArguments) -> None:  # type: ignore[override]
-        try:
+        with exit_if_invalid_response_strategy():
             api_config: Optional[APIConfig] = load_config(path=args.config_path)
-        except ValueError as e:
-            if re.search(r"is not a valid " + re.escape(ResponseStrategy.__name__), str(e), re.IGNORECASE):
-                invalid_strategy = str(e).split("'")[1]
-                logger.error(f"*{invalid_strategy}* is a invalid HTTP response strategy.")
-                sys.exit(1)
-            raise e
 
         valid_api_config = self._check_config.validity(args=args, api_config=api_config)
         if args.swagger_doc_url:
@@ -1,12 +1,13 @@
 from argparse import ArgumentParser
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from pymock_server.command._base.process import BaseCommandProcessor
 from pymock_server.command.subcommand import SubCommandLine
 from pymock_server.model import SubcmdCheckArguments, deserialize_args
 from pymock_server.model.subcmd_common import SysArg
 
-from .component import SubCmdCheckComponent
+if TYPE_CHECKING:
+    from .component import SubCmdCheckComponent
 
 
 class SubCmdCheck(BaseCommandProcessor):
@@ -16,7 +17,9 @@ class SubCmdCheck(BaseCommandProcessor):
     )
 
     @property
-    def _subcmd_component(self) -> SubCmdCheckComponent:
+    def _subcmd_component(self) -> "SubCmdCheckComponent":
+        from .component import SubCmdCheckComponent
+
         return SubCmdCheckComponent()
 
     def _parse_process(self, parser: ArgumentParser, cmd_args: Optional[List[str]] = None) -> SubcmdCheckArguments:
@@ -0,0 +1,8 @@
+from typing import TYPE_CHECKING
+
+from pymock_server._utils.importing import lazy_import
+
+if TYPE_CHECKING:
+    from .component import SubCmdCompileComponent
+
+__getattr__ = lazy_import(__name__, {"SubCmdCompileComponent": ".component"})
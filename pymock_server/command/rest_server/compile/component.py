@@ -0,0 +1,29 @@
+import logging
+import sys
+from argparse import ArgumentParser
+from typing import Optional
+
+from pymock_server.command._base.component import BaseSubCmdComponent
+from pymock_server.command._common.component import exit_if_invalid_response_strategy
+from pymock_server.model import APIConfig, SubcmdCompileArguments, load_config
+from pymock_server.model.compiled_config import compile_config, compiled_config_path
+
+logger = logging.getLogger(__name__)
+
+
+class SubCmdCompileComponent(BaseSubCmdComponent):
+    def process(self, parser: ArgumentParser, args: SubcmdCompileArguments) -> None:  # type: ignore[override]
+        with exit_if_invalid_response_strategy():
+            api_config: Optional[APIConfig] = load_config(path=args.config_path, cache=False)
+        if api_config is None:
+            logger.error("❌  Configuration is empty.")
+            sys.exit(1)
+        # Only compile the valid configuration, so it could use the compiled one directly without checking it again
+        api_config.stop_if_fail = False
+        if api_config.is_work() is False:
+            logger.error(f"❌  Configuration *{args.config_path}* is invalid, it doesn't compile it.")
+            sys.exit(1)
+
+        output_path = args.output_path or compiled_config_path(args.config_path)
+        compile_config(api_config, path=output_path, source=args.config_path)
+        logger.info(f"🍻  Compile configuration *{args.config_path}* into file {output_path}.")
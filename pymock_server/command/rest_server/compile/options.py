@@ -0,0 +1,31 @@
+from pymock_server.command._base.options import MetaCommandOption
+from pymock_server.command.rest_server.option import BaseSubCommandRestServer
+from pymock_server.command.subcommand import SubCommandLine
+from pymock_server.model.subcmd_common import SubParserAttr
+
+
+class SubCommandCompileOption(BaseSubCommandRestServer):
+    sub_parser: SubParserAttr = SubParserAttr(
+        name=SubCommandLine.Compile,
+        help="Validate and compile *PyMock-API* configuration into one binary file which could be loaded faster.",
+    )
+
+
+BaseSubCmdCompileOption: type = MetaCommandOption("BaseSubCmdCompileOption", (SubCommandCompileOption,), {})
+
+
+class ConfigPath(BaseSubCmdCompileOption):
+    cli_option: str = "-p, --config-path"
+    name: str = "config_path"
+    help_description: str = "The file path of configuration."
+    default_value: str = "api.yaml"
+
+
+class Output(BaseSubCmdCompileOption):
+    cli_option: str = "-o, --output"
+    name: str = "output_path"
+    help_description: str = (
+        "Save the compiled configuration to this path. It would be the configuration file path with extension"
+        " *.pymock* if it's empty."
+    )
+    default_value: str = ""
@@ -0,0 +1,26 @@
+from argparse import ArgumentParser
+from typing import TYPE_CHECKING, List, Optional
+
+from pymock_server.command._base.process import BaseCommandProcessor
+from pymock_server.command.subcommand import SubCommandLine
+from pymock_server.model import SubcmdCompileArguments, deserialize_args
+from pymock_server.model.subcmd_common import SysArg
+
+if TYPE_CHECKING:
+    from .component import SubCmdCompileComponent
+
+
+class SubCmdCompile(BaseCommandProcessor):
+    responsible_subcommand: SysArg = SysArg(
+        pre_subcmd=SysArg(pre_subcmd=SysArg(subcmd=SubCommandLine.Base), subcmd=SubCommandLine.RestServer),
+        subcmd=SubCommandLine.Compile,
+    )
+
+    @property
+    def _subcmd_component(self) -> "SubCmdCompileComponent":
+        from .component import SubCmdCompileComponent
+
+        return SubCmdCompileComponent()
+
+    def _parse_process(self, parser: ArgumentParser, cmd_args: Optional[List[str]] = None) -> SubcmdCompileArguments:
+        return deserialize_args.subcmd_compile(self._parse_cmd_arguments(parser, cmd_args))
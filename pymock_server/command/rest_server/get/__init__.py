@@ -1 +1,8 @@
-from .component import SubCmdGetComponent
+from typing import TYPE_CHECKING
+
+from pymock_server._utils.importing import lazy_import
+
+if TYPE_CHECKING:
+    from .component import SubCmdGetComponent
+
+__getattr__ = lazy_import(__name__, {"SubCmdGetComponent": ".component"})
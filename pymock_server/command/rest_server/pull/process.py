@@ -1,12 +1,13 @@
 from argparse import ArgumentParser
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from pymock_server.command._base.process import BaseCommandProcessor
 from pymock_server.command.subcommand import SubCommandLine
 from pymock_server.model import SubcmdPullArguments, deserialize_args
 from pymock_server.model.subcmd_common import SysArg
 
-from .component import SubCmdPullComponent
+if TYPE_CHECKING:
+    from .component import SubCmdPullComponent
 
 
 class SubCmdPull(BaseCommandProcessor):
@@ -16,7 +17,9 @@ class SubCmdPull(BaseCommandProcessor):
     )
 
     @property
-    def _subcmd_component(self) -> SubCmdPullComponent:
+    def _subcmd_component(self) -> "SubCmdPullComponent":
+        from .component import SubCmdPullComponent
+
         return SubCmdPullComponent()
 
     def _parse_process(self, parser: ArgumentParser, cmd_args: Optional[List[str]] = None) -> SubcmdPullArguments:
@@ -1 +1,8 @@
-from .component import SubCmdRunComponent
+from typing import TYPE_CHECKING
+
+from pymock_server._utils.importing import lazy_import
+
+if TYPE_CHECKING:
+    from .component import SubCmdRunComponent
+
+__getattr__ = lazy_import(__name__, {"SubCmdRunComponent": ".component"})
@@ -1,12 +1,29 @@
 import os
 import re
+import tempfile
 from argparse import ArgumentParser
 
 from pymock_server._utils import import_web_lib
 from pymock_server.command._base.component import BaseSubCmdComponent
 from pymock_server.exceptions import InvalidAppType, NoValidWebLibrary
 from pymock_server.model import SubcmdRunArguments
-from pymock_server.server import BaseSGIServer, setup_asgi, setup_wsgi
+from pymock_server.server import (
+    BaseSGIServer,
+    Hot_Reload_Environment_Variable,
+    setup_asgi,
+    setup_asgi_native,
+    setup_wsgi,
+    setup_wsgi_native,
+)
+from pymock_server.server.rest.application.metrics import (
+    Metrics_Dir_Environment_Variable,
+    Metrics_Environment_Variable,
+    reset_metrics_directory,
+)
+from pymock_server.server.rest.application.response import (
+    JSON_Backend_Environment_Variable,
+    json_serializer,
+)
 
 
 def _option_cannot_be_empty_assertion(cmd_option: str) -> str:
@@ -29,6 +46,28 @@ class SubCmdRunComponent(BaseSubCmdComponent):
         if parser_options.config:
             os.environ["MockAPI_Config"] = parser_options.config
 
+        # Handle *json-backend*
+        if parser_options.json_backend:
+            # Check it ahead so that it won't fail in each worker of server gateway
+            json_serializer(parser_options.json_backend)
+            os.environ[JSON_Backend_Environment_Variable] = parser_options.json_backend
+
+        # Handle *hot-reload*
+        if parser_options.hot_reload:
+            os.environ[Hot_Reload_Environment_Variable] = "true"
+
+        # Handle *metrics* and *metrics-dir*
+        metrics_dir = parser_options.metrics_dir
+        if parser_options.metrics or metrics_dir:
+            os.environ[Metrics_Environment_Variable] = "true"
+            if not metrics_dir and int(parser_options.workers) > 1:
+                # Each worker only has its own metrics, so they need one directory to share them
+                metrics_dir = tempfile.mkdtemp(prefix="pymock-metrics-")
+            if metrics_dir:
+                # Drop the metrics of the workers which have been stopped
+                reset_metrics_directory(metrics_dir)
+                os.environ[Metrics_Dir_Environment_Variable] = metrics_dir
+
         # Handle *app-type*
         assert parser_options.app_type, _option_cannot_be_empty_assertion("--app-type")
         self._initial_server_gateway(lib=parser_options.app_type)
@@ -39,6 +78,10 @@ class SubCmdRunComponent(BaseSubCmdComponent):
             if not web_lib:
                 raise NoValidWebLibrary
             self._initial_server_gateway(lib=web_lib)
+        elif re.search(r"asgi-native", lib, re.IGNORECASE):
+            self._server_gateway = setup_asgi_native()
+        elif re.search(r"wsgi-native", lib, re.IGNORECASE):
+            self._server_gateway = setup_wsgi_native()
         elif re.search(r"flask", lib, re.IGNORECASE):
             self._server_gateway = setup_wsgi()
         elif re.search(r"fastapi", lib, re.IGNORECASE):
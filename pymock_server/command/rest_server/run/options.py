@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pymock_server.command._base.options import MetaCommandOption
 from pymock_server.command.rest_server.option import BaseSubCommandRestServer
@@ -25,19 +25,24 @@ class WebAppType(BaseSubCmdRunOption):
         * *auto*: it would automatically scan which Python web library it could use to initial and set up server gateway in current runtime environment.
         * *flask*: Use Python web framework Flask (https://palletsprojects.com/p/flask/) to set up web application.
         * *fastapi*: Use Python web framework FastAPI (https://fastapi.tiangolo.com/) to set up web application.
+        * *asgi-native*: Use the raw ASGI application without any Python web framework which be served by uvicorn.
+        * *wsgi-native*: Use the raw WSGI application without any Python web framework which be served by gunicorn.
     """
 
     cli_option: str = "--app-type"
     name: str = "app_type"
     help_description: str = "Which Python web framework it should use to set up web server for mocking APIs."
     default_value: str = "auto"
-    _options: List[str] = ["auto", "flask", "fastapi"]
+    _options: List[str] = ["auto", "flask", "fastapi", "asgi-native", "wsgi-native"]
 
 
 class Config(BaseSubCmdRunOption):
     cli_option: str = "-c, --config"
     name: str = "config"
-    help_description: str = "The configuration of tool PyMock-API."
+    help_description: str = (
+        "The configuration of tool PyMock-API. It also could be the compiled configuration (*.pymock* file) by"
+        " subcommand *compile*."
+    )
     default_value: str = "api.yaml"
 
 
@@ -61,3 +66,55 @@ class LegLevel(BaseSubCmdRunOption):
     help_description: str = "The log level."
     default_value: str = "info"
     _options: List[str] = ["critical", "error", "warning", "info", "debug", "trace"]
+
+
+class JSONBackend(BaseSubCmdRunOption):
+    """
+    Which Python JSON library it should use to serialize the HTTP response of mocked APIs.
+
+    Option values:
+        * *auto*: it would use the fastest one it could import in current runtime environment, i.e., *orjson*, *ujson* and *stdlib* in order.
+        * *stdlib*: Use the Python built-in library *json*.
+        * *orjson*: Use the Python library orjson (https://github.com/ijl/orjson).
+        * *ujson*: Use the Python library ujson (https://github.com/ultrajson/ultrajson).
+    """
+
+    cli_option: str = "--json-backend"
+    name: str = "json_backend"
+    help_description: str = "Which Python JSON library it should use to serialize the HTTP response of mocked APIs."
+    default_value: str = "auto"
+    _options: List[str] = ["auto", "stdlib", "orjson", "ujson"]
+
+
+class HotReload(BaseSubCmdRunOption):
+    cli_option: str = "--hot-reload"
+    name: str = "hot_reload"
+    help_description: str = (
+        "If it's true, it would reload the configuration in each worker once it has been changed without restarting "
+        "the server."
+    )
+    action: str = "store_true"
+    option_value_type: Optional[type] = None
+    default_value: bool = False
+
+
+class Metrics(BaseSubCmdRunOption):
+    cli_option: str = "--metrics"
+    name: str = "metrics"
+    help_description: str = (
+        "If it's true, it would record the metrics of mocked APIs and expose them in Prometheus text format at URL "
+        "path */__pymock__/metrics*."
+    )
+    action: str = "store_true"
+    option_value_type: Optional[type] = None
+    default_value: bool = False
+
+
+class MetricsDir(BaseSubCmdRunOption):
+    cli_option: str = "--metrics-dir"
+    name: str = "metrics_dir"
+    help_description: str = (
+        "The directory to share the metrics between all the workers. It enables option *--metrics*, and it would be a "
+        "temporary directory if it's empty but there are multiple workers."
+    )
+    default_value: str = ""
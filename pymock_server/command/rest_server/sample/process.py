@@ -1,14 +1,15 @@
 import logging
 import sys
 from argparse import ArgumentParser
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from pymock_server.command._base.process import BaseCommandProcessor
 from pymock_server.command.subcommand import SubCommandLine
 from pymock_server.model import SubcmdSampleArguments, deserialize_args
 from pymock_server.model.subcmd_common import SysArg
 
-from .component import SubCmdSampleComponent
+if TYPE_CHECKING:
+    from .component import SubCmdSampleComponent
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,9 @@ class SubCmdSample(BaseCommandProcessor):
     )
 
     @property
-    def _subcmd_component(self) -> SubCmdSampleComponent:
+    def _subcmd_component(self) -> "SubCmdSampleComponent":
+        from .component import SubCmdSampleComponent
+
         return SubCmdSampleComponent()
 
     def _parse_process(self, parser: ArgumentParser, cmd_args: Optional[List[str]] = None) -> SubcmdSampleArguments:
@@ -8,6 +8,7 @@ class SubCommandLine(Enum):
     Run: str = "run"
     Add: str = "add"
     Check: str = "check"
+    Compile: str = "compile"
     Get: str = "get"
     Sample: str = "sample"
     Pull: str = "pull"
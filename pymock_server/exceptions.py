@@ -27,7 +27,18 @@ class NoValidWebLibrary(RuntimeError):
 
 class InvalidAppType(ValueError):
     def __str__(self):
-        return "Invalid value at argument *app-type*. It only supports 'auto', 'flask' or 'fastapi' currently."
+        return (
+            "Invalid value at argument *app-type*. It only supports 'auto', 'flask', 'fastapi', 'asgi-native' or "
+            "'wsgi-native' currently."
+        )
+
+
+class InvalidJSONBackend(ValueError):
+    def __str__(self):
+        return (
+            "Invalid value at argument *json-backend*. It only supports 'auto', 'stdlib', 'orjson' or 'ujson' "
+            "currently."
+        )
 
 
 class CannotParsingAPIDocumentVersion(ValueError):
@@ -41,3 +52,15 @@ class NotSupportAPIDocumentVersion(ValueError):
 
     def __str__(self):
         return f"Currently, it doesn't support processing the configuration of API document version {self._version}."
+
+
+class InvalidCompiledConfig(ValueError):
+    def __init__(self, path: str, reason: str):
+        self._path = path
+        self._reason = reason
+
+    def __str__(self):
+        return (
+            f"Cannot load the compiled configuration *{self._path}* because {self._reason}. Please compile the "
+            "configuration again by subcommand *compile*."
+        )
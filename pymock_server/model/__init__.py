@@ -5,31 +5,61 @@ content ...
 
 import pathlib
 from argparse import Namespace
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from pymock_server.exceptions import NotSupportAPIDocumentVersion
+from pymock_server._utils.importing import lazy_import
 
-from .api_config import APIConfig, MockAPIs
-from .api_config.apis import HTTP, APIParameter, HTTPRequest, HTTPResponse, MockAPI
-from .api_config.base import BaseConfig
-from .api_config.template import TemplateConfig
 from .cmd_args import (
     DeserializeParsedArgs,
     ParserArguments,
     SubcmdAddArguments,
     SubcmdCheckArguments,
+    SubcmdCompileArguments,
     SubcmdGetArguments,
     SubcmdPullArguments,
     SubcmdRunArguments,
     SubcmdSampleArguments,
 )
-from .rest_api_doc_config.config import (
-    BaseAPIDocumentConfig,
-    OpenAPIDocumentConfig,
-    SwaggerAPIDocumentConfig,
-    get_api_doc_version,
+
+if TYPE_CHECKING:
+    from .api_config import APIConfig, MockAPIs
+    from .api_config.apis import HTTP, APIParameter, HTTPRequest, HTTPResponse, MockAPI
+    from .api_config.base import BaseConfig
+    from .api_config.template import TemplateConfig
+    from .compiled_config import is_compiled_config, load_compiled_config
+    from .config_cache import ConfigCache, config_cache_is_enabled
+    from .rest_api_doc_config.config import (
+        BaseAPIDocumentConfig,
+        OpenAPIDocumentConfig,
+        SwaggerAPIDocumentConfig,
+        get_api_doc_version,
+    )
+    from .rest_api_doc_config.version import OpenAPIVersion
+
+# The command line only needs the arguments, so the data models of configuration are imported when they are used
+__getattr__ = lazy_import(
+    __name__,
+    {
+        "APIConfig": ".api_config",
+        "MockAPIs": ".api_config",
+        "HTTP": ".api_config.apis",
+        "APIParameter": ".api_config.apis",
+        "HTTPRequest": ".api_config.apis",
+        "HTTPResponse": ".api_config.apis",
+        "MockAPI": ".api_config.apis",
+        "BaseConfig": ".api_config.base",
+        "TemplateConfig": ".api_config.template",
+        "is_compiled_config": ".compiled_config",
+        "load_compiled_config": ".compiled_config",
+        "ConfigCache": ".config_cache",
+        "config_cache_is_enabled": ".config_cache",
+        "BaseAPIDocumentConfig": ".rest_api_doc_config.config",
+        "OpenAPIDocumentConfig": ".rest_api_doc_config.config",
+        "SwaggerAPIDocumentConfig": ".rest_api_doc_config.config",
+        "get_api_doc_version": ".rest_api_doc_config.config",
+        "OpenAPIVersion": ".rest_api_doc_config.version",
+    },
 )
-from .rest_api_doc_config.version import OpenAPIVersion
 
 
 class deserialize_args:
@@ -72,6 +102,19 @@ class deserialize_args:
         """
         return DeserializeParsedArgs.subcommand_check(args)
 
+    @classmethod
+    def subcmd_compile(cls, args: Namespace) -> SubcmdCompileArguments:
+        """Deserialize the object *argparse.Namespace* to *ParserArguments*.
+
+        Args:
+            args (Namespace): The arguments which be parsed from current command line.
+
+        Returns:
+            A *ParserArguments* type object.
+
+        """
+        return DeserializeParsedArgs.subcommand_compile(args)
+
     @classmethod
     def subcmd_get(cls, args: Namespace) -> SubcmdGetArguments:
         """Deserialize the object *argparse.Namespace* to *ParserArguments*.
@@ -112,7 +155,16 @@ class deserialize_args:
         return DeserializeParsedArgs.subcommand_pull(args)
 
 
-def deserialize_api_doc_config(data: dict) -> BaseAPIDocumentConfig:
+def deserialize_api_doc_config(data: dict) -> "BaseAPIDocumentConfig":
+    from pymock_server.exceptions import NotSupportAPIDocumentVersion
+
+    from .rest_api_doc_config.config import (
+        OpenAPIDocumentConfig,
+        SwaggerAPIDocumentConfig,
+        get_api_doc_version,
+    )
+    from .rest_api_doc_config.version import OpenAPIVersion
+
     api_doc_version = get_api_doc_version(data)
     if api_doc_version is OpenAPIVersion.V2:
         return SwaggerAPIDocumentConfig().deserialize(data)
@@ -124,16 +176,36 @@ def deserialize_api_doc_config(data: dict) -> BaseAPIDocumentConfig:
         )
 
 
-def load_config(path: str, is_pull: bool = False, base_file_path: str = "") -> Optional[APIConfig]:
-    api_config = APIConfig()
-    api_config_path = pathlib.Path(path)
-    api_config.config_file_name = api_config_path.name
-    api_config.base_file_path = base_file_path if base_file_path else str(api_config_path.parent)
-    api_config.is_pull = is_pull
-    return api_config.from_yaml(path=path, is_pull=is_pull)
-
+def load_config(
+    path: str, is_pull: bool = False, base_file_path: str = "", cache: Optional[bool] = None
+) -> Optional["APIConfig"]:
+    from .api_config import APIConfig
+    from .compiled_config import is_compiled_config, load_compiled_config
+    from .config_cache import ConfigCache, config_cache_is_enabled
+
+    def _load() -> Optional[APIConfig]:
+        api_config = APIConfig()
+        api_config_path = pathlib.Path(path)
+        api_config.config_file_name = api_config_path.name
+        api_config.base_file_path = base_file_path if base_file_path else str(api_config_path.parent)
+        api_config.is_pull = is_pull
+        return api_config.from_yaml(path=path, is_pull=is_pull)
+
+    if is_compiled_config(path):
+        # It has been loaded and validated when compiling it
+        return load_compiled_config(path)
+    if cache is None:
+        cache = config_cache_is_enabled()
+    if not cache:
+        return _load()
+    return ConfigCache().load(path, loader=_load, is_pull=is_pull, base_file_path=base_file_path)
+
+
+def generate_empty_config(name: str = "", description: str = "") -> "APIConfig":
+    from .api_config import APIConfig, MockAPIs
+    from .api_config.base import BaseConfig
+    from .api_config.template import TemplateConfig
 
-def generate_empty_config(name: str = "", description: str = "") -> APIConfig:
     return APIConfig(
         name=name,
         description=description,
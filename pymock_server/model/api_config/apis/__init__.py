@@ -26,6 +26,7 @@ from pymock_server.model.api_config.template.file import (
 
 from .request import APIParameter, HTTPRequest
 from .response import HTTPResponse, ResponseProperty
+from .response_pool import ResponsePool, ResponsePoolOrder, ResponsePoolRefill
 from .response_strategy import ResponseStrategy
 
 logger = logging.getLogger(__name__)
@@ -12,6 +12,7 @@ from pymock_server.model.api_config.template._base_wrapper import (
 from pymock_server.model.api_config.template.file import TemplateConfigPathResponse
 
 from ._property import BaseProperty
+from .response_pool import ResponsePool
 from .response_strategy import ResponseStrategy
 
 logger = logging.getLogger(__name__)
@@ -101,12 +102,33 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
 
     # Strategy: file
     path: str = field(default_factory=str)
+    # Send the file content without any change instead of parsing and serializing it
+    passthrough: bool = False
 
     # Strategy: object
     properties: List[ResponseProperty] = field(default_factory=list)
 
+    # Pre-generate the responses with strategy *object*
+    pool: Optional[ResponsePool] = None
+
+    # Send the response with strategy *object* chunk by chunk instead of generating the entire value in memory
+    stream: bool = False
+
+    # Pre-compress the responses with strategy *string* or *file* if the client accepts it
+    compress: bool = True
+
+    # Generate the same response with strategy *object* for the same request by the seed from the request
+    deterministic: bool = False
+
     def _compare(self, other: "HTTPResponse") -> bool:
-        templatable_config = super()._compare(other)
+        templatable_config = (
+            super()._compare(other)
+            and self.pool == other.pool
+            and self.stream == other.stream
+            and self.passthrough == other.passthrough
+            and self.compress == other.compress
+            and self.deterministic == other.deterministic
+        )
         if not self.strategy:
             raise ValueError("Miss necessary argument *strategy*.")
         if self.strategy is not other.strategy:
@@ -125,6 +147,8 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
             self._convert_strategy()
         if self.properties is not None:
             self._convert_properties()
+        if self.pool is not None:
+            self._convert_pool()
 
     def _convert_strategy(self) -> None:
         if isinstance(self.strategy, str):
@@ -135,6 +159,11 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
             raise TypeError("The data type of key *properties* must be dict or ResponseProperty.")
         self.properties = [ResponseProperty().deserialize(i) if isinstance(i, dict) else i for i in self.properties]
 
+    def _convert_pool(self):
+        if not isinstance(self.pool, (dict, ResponsePool)):
+            raise TypeError("The data type of key *pool* must be dict or ResponsePool.")
+        self.pool = ResponsePool().deserialize(self.pool) if isinstance(self.pool, dict) else self.pool
+
     @property
     def key(self) -> str:
         return "response"
@@ -153,6 +182,8 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
                     "value": value,
                 }
             )
+            if self._get_prop(data, prop="compress") is False:
+                serialized_data["compress"] = False
             return serialized_data
         elif strategy is ResponseStrategy.FILE:
             path: str = self._get_prop(data, prop="path")
@@ -162,6 +193,10 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
                     "path": path,
                 }
             )
+            if self._get_prop(data, prop="passthrough"):
+                serialized_data["passthrough"] = True
+            if self._get_prop(data, prop="compress") is False:
+                serialized_data["compress"] = False
             return serialized_data
         elif strategy is ResponseStrategy.OBJECT:
             all_properties = (data or self).properties if (data and data.properties) or self.properties else None
@@ -172,6 +207,14 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
                     "properties": properties,
                 }
             )
+            pool: Optional[ResponsePool] = self._get_prop(data, prop="pool")
+            serialized_pool = pool.serialize() if pool else None
+            if serialized_pool:
+                serialized_data["pool"] = serialized_pool
+            if self._get_prop(data, prop="stream"):
+                serialized_data["stream"] = True
+            if self._get_prop(data, prop="deterministic"):
+                serialized_data["deterministic"] = True
             return serialized_data
         else:
             raise NotImplementedError
@@ -219,6 +262,16 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
             self.properties = properties
         else:
             raise NotImplementedError
+
+        pool = data.get("pool", None)
+        if pool:
+            response_pool = ResponsePool()
+            response_pool.absolute_model_key = self.key
+            self.pool = response_pool.deserialize(pool)
+        self.stream = data.get("stream", False)
+        self.passthrough = data.get("passthrough", False)
+        self.compress = data.get("compress", True)
+        self.deterministic = data.get("deterministic", False)
         return self
 
     @property
@@ -227,6 +280,74 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
 
     def is_work(self) -> bool:
         assert self.strategy is not None
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.pool",
+            condition=self.pool is not None and ResponseStrategy(self.strategy) is not ResponseStrategy.OBJECT,
+            err_msg="Only the HTTP response with strategy *object* could be pre-generated in pool.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.stream",
+            condition=not isinstance(self.stream, bool),
+            err_msg="The value of key *stream* must be a boolean value.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.stream",
+            condition=self.stream is True and ResponseStrategy(self.strategy) is not ResponseStrategy.OBJECT,
+            err_msg="Only the HTTP response with strategy *object* could be sent as stream.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.stream",
+            condition=self.stream is True and self.pool is not None,
+            err_msg="The HTTP response which is sent as stream cannot be pre-generated in pool at the same time.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.passthrough",
+            condition=not isinstance(self.passthrough, bool),
+            err_msg="The value of key *passthrough* must be a boolean value.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.passthrough",
+            condition=self.passthrough is True and ResponseStrategy(self.strategy) is not ResponseStrategy.FILE,
+            err_msg="Only the HTTP response with strategy *file* could be sent as the file content directly.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.compress",
+            condition=not isinstance(self.compress, bool),
+            err_msg="The value of key *compress* must be a boolean value.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.compress",
+            condition=self.compress is False and ResponseStrategy(self.strategy) is ResponseStrategy.OBJECT,
+            err_msg="It's meaningless to disable compression for the HTTP response with strategy *object* because it "
+            "never be pre-compressed.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.deterministic",
+            condition=not isinstance(self.deterministic, bool),
+            err_msg="The value of key *deterministic* must be a boolean value.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.deterministic",
+            condition=self.deterministic is True and ResponseStrategy(self.strategy) is not ResponseStrategy.OBJECT,
+            err_msg="Only the HTTP response with strategy *object* could be generated deterministically.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.deterministic",
+            condition=self.deterministic is True and (self.pool is not None or self.stream is True),
+            err_msg="The HTTP response which is generated deterministically cannot be pre-generated in pool or sent "
+            "as stream at the same time.",
+        ):
+            return False
         if ResponseStrategy(self.strategy) is ResponseStrategy.STRING:
             return self.should_not_be_none(
                 config_key=f"{self.absolute_model_key}.value",
@@ -248,6 +369,9 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
                 valid_callback=self._chk_response_value_validity,
             ):
                 return False
+            if self.pool:
+                self.pool.stop_if_fail = self.stop_if_fail
+                return self.pool.is_work()
         else:
             raise NotImplementedError
         return True
@@ -285,6 +409,17 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
                 if self._stop_if_fail:
                     self._exit_program(1)
                 return False
+            if self.passthrough and config_value.endswith(".json"):
+                # The file content would be sent without parsing, so it only could be checked here
+                try:
+                    with open(config_value, "r", encoding="utf-8") as file_stream:
+                        json.load(file_stream)
+                except:
+                    logger.error("The file which is the response content is not a valid JSON format file.")
+                    self._config_is_wrong = True
+                    if self._stop_if_fail:
+                        self._exit_program(1)
+                    return False
             return True
         elif response_strategy == "properties":
             assert isinstance(
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from pymock_server.model.api_config._base import _Checkable, _Config
+
+
+class ResponsePoolRefill(Enum):
+    NONE: str = "none"
+    BACKGROUND: str = "background"
+
+
+class ResponsePoolOrder(Enum):
+    ROUND_ROBIN: str = "round-robin"
+    RANDOM: str = "random"
+
+
+@dataclass(eq=False)
+class ResponsePool(_Config, _Checkable):
+    """*The **http.response.pool** section in **mocked_apis.<api>***"""
+
+    size: int = 0
+    refill: ResponsePoolRefill = ResponsePoolRefill.NONE
+    """
+    Refill:
+    * none: Generate all the responses in pool once at startup and keep using them.
+    * background: Keep regenerating the responses in pool one by one in background.
+    """
+    order: ResponsePoolOrder = ResponsePoolOrder.ROUND_ROBIN
+    """
+    Order:
+    * round-robin: Respond the responses in pool one by one.
+    * random: Respond the response in pool randomly.
+    """
+
+    def __post_init__(self) -> None:
+        if isinstance(self.refill, str):
+            self.refill = ResponsePoolRefill(self.refill)
+        if isinstance(self.order, str):
+            self.order = ResponsePoolOrder(self.order)
+
+    def _compare(self, other: "ResponsePool") -> bool:
+        return self.size == other.size and self.refill is other.refill and self.order is other.order
+
+    @property
+    def key(self) -> str:
+        return "pool"
+
+    def serialize(self, data: Optional["ResponsePool"] = None) -> Optional[Dict[str, Any]]:
+        size: int = self._get_prop(data, prop="size")
+        if not size:
+            return None
+        refill: ResponsePoolRefill = self._get_prop(data, prop="refill")
+        order: ResponsePoolOrder = self._get_prop(data, prop="order")
+        return {
+            "size": size,
+            "refill": ResponsePoolRefill(refill).value,
+            "order": ResponsePoolOrder(order).value,
+        }
+
+    @_Config._ensure_process_with_not_empty_value
+    def deserialize(self, data: Dict[str, Any]) -> Optional["ResponsePool"]:
+        """Convert data to **ResponsePool** type object.
+
+        The data structure should be like following:
+
+        * Example data:
+        .. code-block:: python
+
+            {
+                'pool': {
+                    'size': 256,
+                    'refill': 'background',
+                    'order': 'round-robin',
+                },
+            }
+
+        Args:
+            data (Dict[str, Any]): Target data to convert.
+
+        Returns:
+            A **ResponsePool** type object.
+
+        """
+        self.size = data.get("size", None)
+        self.refill = ResponsePoolRefill(data.get("refill", None) or ResponsePoolRefill.NONE)
+        self.order = ResponsePoolOrder(data.get("order", None) or ResponsePoolOrder.ROUND_ROBIN)
+        return self
+
+    def is_work(self) -> bool:
+        return self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.size",
+            condition=not isinstance(self.size, int) or isinstance(self.size, bool) or self.size <= 0,
+            err_msg="The size of response pool must be a positive integer.",
+        )
@@ -4,7 +4,9 @@ from abc import ABC
 from dataclasses import dataclass, field
 from decimal import Decimal
 from pydoc import locate
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
+
+from pymock_server._utils.regex import Shared_Regex_Pattern_Cache
 
 from ._base import _BaseConfig, _Checkable, _Config
 from .value import FormatStrategy, ValueFormat
@@ -41,6 +43,13 @@ class Format(_Config, _Checkable):
         if self.variables is not None:
             self._convert_variables()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Any change of this format setting makes the compiled regular expressions be out-of-date
+        if name not in ("_cached_compiled_patterns", "_cached_template_format"):
+            self.__dict__.pop("_cached_compiled_patterns", None)
+            self.__dict__.pop("_cached_template_format", None)
+
     def _convert_strategy(self) -> None:
         if isinstance(self.strategy, str):
             self.strategy = FormatStrategy(self.strategy)
@@ -188,6 +197,64 @@ class Format(_Config, _Checkable):
 
     def value_format_is_match(self, data_type: Union[str, type], value: Any) -> bool:
         assert self.strategy
+        if self.strategy is FormatStrategy.BY_DATA_TYPE:
+            search_result = self._compiled_pattern(data_type).search(str(value))
+            if search_result is None:
+                # Cannot find any mapping format string
+                return False
+            return len(str(value)) == len(search_result.group(0))
+        elif self.strategy is FormatStrategy.FROM_ENUMS:
+            return isinstance(value, str) and value in self.enums
+        elif self.strategy is FormatStrategy.CUSTOMIZE:
+            return self._compiled_pattern(data_type).search(str(value)) is not None
+        elif self.strategy is FormatStrategy.FROM_TEMPLATE:
+            return self._template_format().value_format_is_match(data_type=data_type, value=value)
+        else:
+            raise NotImplementedError(
+                f"Doesn't implement how it should generate the response setting by strategy {self}."
+            )
+
+    def _compiled_pattern(self, data_type: Union[str, type]) -> Pattern:
+        """Get the compiled regular expression of this format. It only compiles it at the first time and keeps it
+        until the settings which it depends on are changed, including the nested ones which are modified in place,
+        e.g., *size.max_value*.
+
+        Args:
+            data_type (Union[str, type]): The data type of the value.
+
+        Returns:
+            A compiled regular expression.
+
+        """
+        # The regular expression of strategy *customize* doesn't depend on data type
+        key = data_type if self.strategy is FormatStrategy.BY_DATA_TYPE else None
+        fingerprint = self._regex_fingerprint()
+        # The data structure would be:
+        # {
+        #     <data type>: (<the fingerprint of settings>, <the compiled regular expression>)
+        # }
+        compiled_patterns: Dict[Any, Tuple[tuple, Pattern]] = self.__dict__.setdefault("_cached_compiled_patterns", {})
+        compiled = compiled_patterns.get(key, None)
+        if compiled is None or compiled[0] != fingerprint:
+            compiled = (fingerprint, Shared_Regex_Pattern_Cache.compile(*self._generate_regex(data_type)))
+            compiled_patterns[key] = compiled
+        return compiled[1]
+
+    def _regex_fingerprint(self) -> tuple:
+        # All the settings which the regular expression depends on. It only has the plain values, so it's cheap to
+        # build and compare it.
+        if self.strategy is FormatStrategy.BY_DATA_TYPE:
+            return _digit_fingerprint(self.digit), _size_fingerprint(self.size)
+        template_variables: List[Variable] = []
+        if self._current_template and self._current_template.common_config:
+            template_variables = self._current_template.common_config.format.variables
+        return (
+            self.customize,
+            tuple(_variable_fingerprint(v) for v in self.variables),
+            tuple(_variable_fingerprint(v) for v in template_variables),
+        )
+
+    def _generate_regex(self, data_type: Union[str, type]) -> Tuple[str, int]:
         if self.strategy is FormatStrategy.BY_DATA_TYPE:
             data_type = "big_decimal" if isinstance(data_type, float) else data_type
             data_type = locate(data_type) if (data_type != "big_decimal" and isinstance(data_type, str)) else data_type  # type: ignore[assignment]
@@ -198,13 +265,7 @@ class Format(_Config, _Checkable):
             regex = self.strategy.to_value_format(data_type).generate_regex(
                 size=size.to_value_size(), digit=digit.to_digit_range()
             )
-            search_result = re.search(regex, str(value))
-            if search_result is None:
-                # Cannot find any mapping format string
-                return False
-            return len(str(value)) == len(search_result.group(0))
-        elif self.strategy is FormatStrategy.FROM_ENUMS:
-            return isinstance(value, str) and value in self.enums
+            return regex, 0
         elif self.strategy is FormatStrategy.CUSTOMIZE:
             all_vars_in_customize = re.findall(r"<\w{1,128}>", str(self.customize), re.IGNORECASE)
             regex = re.escape(copy.copy(self.customize))
@@ -226,15 +287,39 @@ class Format(_Config, _Checkable):
                     enums=find_result[0].enum or [], size=size.to_value_size(), digit=digit.to_digit_range()
                 )
                 regex = regex.replace(var, one_var_regex)
-            return re.search(regex, str(value), re.IGNORECASE) is not None
-        elif self.strategy is FormatStrategy.FROM_TEMPLATE:
-            format_config: Format = self._current_template.common_config.format.get_format(self.use_name)
-            format_config._current_template = self._current_template
-            return format_config.value_format_is_match(data_type=data_type, value=value)
+            return regex, re.IGNORECASE
         else:
-            raise NotImplementedError(
-                f"Doesn't implement how it should generate the response setting by strategy {self}."
-            )
+            raise RuntimeError(f"It doesn't need to generate the regular expression by strategy {self.strategy}.")
+
+    def _template_format(self) -> "Format":
+        """Get the format setting in section *template* by the name. It only searches it at the first time and keeps it
+        until this format setting or the format entities in section *template* are changed.
+
+        Returns:
+            A **Format** type object.
+
+        """
+        entities = self._current_template.common_config.format.entities
+        # The data structure would be:
+        # (<the template setting>, <the name>, <the format entities>, <the amount of them>, <the found entity>)
+        cached: Optional[tuple] = self.__dict__.get("_cached_template_format", None)
+        if (
+            cached is None
+            or cached[0] is not self._current_template
+            or cached[1] != self.use_name
+            or cached[2] is not entities
+            or cached[3] != len(entities)
+            or cached[4].name != self.use_name
+        ):
+            found_entities = [e for e in entities if e.name == self.use_name]
+            assert found_entities, f"Cannot find the format setting *{self.use_name}* in section *template*."
+            cached = (self._current_template, self.use_name, entities, len(entities), found_entities[0])
+            self.__dict__["_cached_template_format"] = cached
+        # Get the format setting from the entity every time, so it's still correct if it has been replaced
+        template_format: Format = cached[4].config
+        if template_format._current_template is not self._current_template:
+            template_format._current_template = self._current_template
+        return template_format
 
     def generate_value(self, data_type: type) -> Union[str, int, bool, Decimal]:
         assert self.strategy
@@ -257,9 +342,7 @@ class Format(_Config, _Checkable):
                 value = value.replace(var, str(new_value))
             return value
         elif self.strategy is FormatStrategy.FROM_TEMPLATE:
-            format_config: Format = self._current_template.common_config.format.get_format(self.use_name)
-            format_config._current_template = self._current_template
-            return format_config.generate_value(data_type=data_type)
+            return self._template_format().generate_value(data_type=data_type)
         else:
             digit = self.digit
             if digit is None:
@@ -271,6 +354,33 @@ class Format(_Config, _Checkable):
                 data_type=data_type, enums=self.enums, size=size.to_value_size(), digit=digit.to_digit_range()
             )
 
+    def generate_values(self, data_type: type, amount: int) -> List[Union[str, int, bool, Decimal]]:
+        """Generate multiple values by this format setting in one batch.
+
+        Args:
+            data_type (type): The data type of the values.
+            amount (int): How many values it should generate.
+
+        Returns:
+            A list of generated values.
+
+        """
+        assert self.strategy
+        if self.strategy is FormatStrategy.CUSTOMIZE:
+            return [self.generate_value(data_type=data_type) for _ in range(amount)]
+        elif self.strategy is FormatStrategy.FROM_TEMPLATE:
+            return self._template_format().generate_values(data_type=data_type, amount=amount)
+        else:
+            digit = self.digit
+            if digit is None:
+                digit = Digit()
+            size = self.size
+            if size is None:
+                size = Size()
+            return self.strategy.generate_not_customize_values(
+                amount, data_type=data_type, enums=self.enums, size=size.to_value_size(), digit=digit.to_digit_range()
+            )
+
     def _get_format_config(self, pure_var: str) -> List[Variable]:
         format_config_in_template: Optional[Variable] = None
         if self._current_template and self._current_template.common_config:
@@ -295,6 +405,24 @@ class Format(_Config, _Checkable):
             raise ValueError("Unsupported FormatStrategy")
 
 
+def _digit_fingerprint(digit: Optional[Digit]) -> Optional[tuple]:
+    return (digit.integer, digit.decimal) if digit is not None else None
+
+
+def _size_fingerprint(size: Optional[Size]) -> Optional[tuple]:
+    return (size.max_value, size.min_value, size.only_equal) if size is not None else None
+
+
+def _variable_fingerprint(variable: Variable) -> tuple:
+    return (
+        variable.name,
+        variable.value_format,
+        _digit_fingerprint(variable.digit),
+        _size_fingerprint(variable.size),
+        tuple(variable.enum) if variable.enum is not None else None,
+    )
+
+
 @dataclass(eq=False)
 class _HasFormatPropConfig(_BaseConfig, _Checkable, ABC):
     value_format: Optional[Format] = None
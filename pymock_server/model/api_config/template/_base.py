@@ -1,10 +1,10 @@
-import os
 import pathlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, Type
 
 from pymock_server._utils import YAML
+from pymock_server._utils.file.index import path_is_file
 from pymock_server._utils.file.operation import _BaseFileOperation
 from pymock_server.model.api_config._base import SelfType, _Config
 
@@ -73,7 +73,7 @@ class _BaseTemplatableConfig(_Config, _BaseTemplateAccessable, ABC):
             or self._default_base_file_path
         )
         dividing_config_path = str(pathlib.Path(base_file_path, self.config_path))
-        if dividing_config_path and os.path.exists(dividing_config_path) and os.path.isfile(dividing_config_path):
+        if dividing_config_path and path_is_file(dividing_config_path):
             dividing_data = self._configuration.read(dividing_config_path)
             data.update(**dividing_data)
         return data
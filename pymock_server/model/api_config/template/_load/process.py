@@ -1,12 +1,26 @@
 import fnmatch
-import glob
+import logging
 import os
 import pathlib
 from abc import ABCMeta, abstractmethod
-from typing import Dict, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
 from pymock_server._utils import YAML
-from pymock_server._utils.file.operation import _BaseFileOperation
+from pymock_server._utils.file.index import (
+    glob_paths,
+    path_exists,
+    path_is_dir,
+    path_is_file,
+    shared_directory_index,
+)
+from pymock_server._utils.file.operation import (
+    _BaseFileOperation,
+    can_parse_in_parallel,
+    is_preloading,
+    parse_yaml_files,
+    preload_content,
+)
 from pymock_server.model.api_config.template import TemplateConfig
 from pymock_server.model.api_config.template._base import (
     _BaseTemplatableConfig,
@@ -15,6 +29,36 @@ from pymock_server.model.api_config.template._base import (
 
 from .key import ConfigLoadingOrder, ConfigLoadingOrderKey, set_loading_function
 
+logger = logging.getLogger(__name__)
+
+# The environment variable which is the minimum amount of divided configuration files to parse them by multiple
+# processes. It only parses them by multiple processes if it has enough files, because starting the processes also
+# takes time. Set it as *0* to never parse them by multiple processes.
+Parallel_Parsing_Threshold_Environment_Variable: str = "MockAPI_Parallel_Parsing_Threshold"
+
+_Parallel_Parsing_Threshold: int = 256
+
+
+def parallel_parsing_threshold() -> int:
+    """Get the minimum amount of divided configuration files to parse them by multiple processes by environment
+    variable. It would be *256* if the environment variable is not set or invalid.
+
+    Returns:
+        An integer value. It returns *0* if it should never parse the files by multiple processes.
+
+    """
+    value = os.environ.get(Parallel_Parsing_Threshold_Environment_Variable, None)
+    if not value:
+        return _Parallel_Parsing_Threshold
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        logger.warning(
+            f"Invalid value *{value}* of environment variable *{Parallel_Parsing_Threshold_Environment_Variable}*, "
+            f"it would use the default value {_Parallel_Parsing_Threshold}."
+        )
+        return _Parallel_Parsing_Threshold
+
 
 class TemplateConfigOpts(metaclass=ABCMeta):
     _config_file_name: str = "api.yaml"
@@ -117,12 +161,12 @@ class TemplateConfigLoaderByScanFile(_BaseTemplateConfigLoader):
         customize_config_file_format = "**"
         config_file_format = f"[!_**]{customize_config_file_format}"
         config_base_path = self._template_config_opts._template_config.file.config_path_values.base_file_path
-        all_paths = glob.glob(str(pathlib.Path(config_base_path, config_file_format)))
+        all_paths = glob_paths(config_base_path, config_file_format)
         api_config_path = str(pathlib.Path(config_base_path, self._template_config_opts.config_file_name))
-        if os.path.exists(api_config_path):
+        if api_config_path in all_paths:
             all_paths.remove(api_config_path)
         for path in all_paths:
-            if os.path.isdir(path):
+            if path_is_dir(path):
                 self._iterate_files_to_deserialize_template_config(path)
             else:
                 self._use_specific_file_to_deserialize_template_config(path)
@@ -138,7 +182,7 @@ class TemplateConfigLoaderByScanFile(_BaseTemplateConfigLoader):
             config_path = pathlib.Path(
                 path, self._template_config_opts._config_file_format.replace("**", file_name_head)
             )
-            if config_path.exists():
+            if path_exists(str(config_path)):
                 self._deserialize_and_set_template_config(str(config_path))
         else:
             # NOTE: ``only iterates all files when *self._template_config_opts* is *MockAPIs*``
@@ -148,13 +192,13 @@ class TemplateConfigLoaderByScanFile(_BaseTemplateConfigLoader):
             # are not relative with it at all.
             # Please refer to test data *divide_api_http_response_with_nested_data+has_tag_include_template*
             # to clear the usage scenario.
-            for path_with_tag in glob.glob(str(pathlib.Path(path, self._template_config_opts._config_file_format))):
+            for path_with_tag in glob_paths(path, self._template_config_opts._config_file_format):
                 # In the tag directory, it's config
                 self._deserialize_and_set_template_config(path_with_tag)
 
     def _use_specific_file_to_deserialize_template_config(self, path: str) -> None:
         # Doesn't have tag, it's config
-        assert os.path.isfile(path) is True
+        assert path_is_file(path) is True
         if fnmatch.fnmatch(path, self._template_config_opts._config_file_format):
             self._deserialize_and_set_template_config(path)
 
@@ -210,6 +254,13 @@ class TemplateConfigLoader(_BaseTemplateConfigLoader):
             loader.register(template_config_ops)
 
     def load_config(self, mocked_apis_data: dict) -> None:
+        # All the loaders of each data model share one directory index, so each directory only be listed once.
+        # Parse all the divided configuration files ahead by multiple processes, but still deserialize them one by one
+        # in the loading order, so the result is the same as loading them sequentially.
+        with shared_directory_index(), self._preload_divided_config():
+            self._load_config_in_order(mocked_apis_data)
+
+    def _load_config_in_order(self, mocked_apis_data: dict) -> None:
         loading_order = self._template_config_opts._template_config.file.load_config.order
 
         if self._template_config_opts._template_config.file.load_config.includes_apis:
@@ -225,6 +276,40 @@ class TemplateConfigLoader(_BaseTemplateConfigLoader):
                 args = load_config.get_loading_function_args(*args)  # type: ignore[assignment]
                 load_config.get_loading_function(data_modal_key=self._template_config_opts._config_file_format)(*args)
 
+    @contextmanager
+    def _preload_divided_config(self) -> Iterator[None]:
+        contents = None
+        if (
+            self._template_config_opts._template_config.file.activate
+            and not is_preloading()
+            and can_parse_in_parallel()
+        ):
+            threshold = parallel_parsing_threshold()
+            if threshold > 0:
+                paths = self._divided_config_paths()
+                if len(paths) >= threshold:
+                    contents = parse_yaml_files(paths)
+        if contents is None:
+            yield
+        else:
+            with preload_content(contents):
+                yield
+
+    def _divided_config_paths(self) -> List[str]:
+        # The divided configuration files are in the base directory or the directories in it
+        base_path = self._template_config_opts._template_config.file.config_path_values.base_file_path
+        config_path = str(pathlib.Path(base_path, self._template_config_opts.config_file_name))
+        paths: List[str] = []
+        directories = [base_path]
+        for directory in directories:
+            for path in glob_paths(directory, "[!_]*"):
+                if path_is_dir(path):
+                    if directory == base_path:
+                        directories.append(path)
+                elif path.endswith((".yaml", ".yml")) and path != config_path:
+                    paths.append(path)
+        return paths
+
 
 class TemplatableConfigLoadable(TemplateConfigOpts):
     _template_config_loader: Optional[_BaseTemplateConfigLoader] = None
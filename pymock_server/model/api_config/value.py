@@ -17,6 +17,10 @@ Default_Value_Size = ValueSize(max=10, min=1)
 Default_Digit_Range = DigitRange(integer=128, decimal=128)
 
 
+def _generate_max_value(digit_number: int) -> int:
+    return 10**digit_number - 1 if digit_number > 0 else 0
+
+
 class ValueFormat(Enum):
     String: str = "str"
     Integer: str = "int"
@@ -45,10 +49,6 @@ class ValueFormat(Enum):
     def generate_value(
         self, enums: List[str] = [], size: ValueSize = Default_Value_Size, digit: DigitRange = Default_Digit_Range
     ) -> Union[str, int, bool, Decimal]:
-
-        def _generate_max_value(digit_number: int) -> int:
-            return int("".join(["9" for _ in range(digit_number)])) if digit_number > 0 else 0
-
         self._ensure_setting_value_is_valid(enums=enums, size=size, digit=digit)
         if self is ValueFormat.String:
             return RandomString.generate(size=size)
@@ -69,6 +69,49 @@ class ValueFormat(Enum):
         else:
             raise NotImplementedError(f"Doesn't implement how to generate the value by format {self}.")
 
+    def generate_values(
+        self,
+        amount: int,
+        enums: List[str] = [],
+        size: ValueSize = Default_Value_Size,
+        digit: DigitRange = Default_Digit_Range,
+    ) -> List[Union[str, int, bool, Decimal]]:
+        """Generate multiple values by this format in one batch. It's much faster than calling *generate_value* one by
+        one if it needs a lot of values, e.g., the elements of a list with thousands size.
+
+        Args:
+            amount (int): How many values it should generate.
+            enums (List[str]): The candidate values of format *enum*.
+            size (ValueSize): The size range of format *str*.
+            digit (DigitRange): The digit setting of format *int* and *big_decimal*.
+
+        Returns:
+            A list of generated values.
+
+        """
+        self._ensure_setting_value_is_valid(enums=enums, size=size, digit=digit)
+        if self is ValueFormat.String:
+            return RandomString.generate_many(amount, size=size)  # type: ignore[return-value]
+        elif self is ValueFormat.Integer:
+            max_value = _generate_max_value(digit.integer)
+            return RandomInteger.generate_many(  # type: ignore[return-value]
+                amount, value_range=ValueSize(min=0 - max_value, max=max_value)
+            )
+        elif self is ValueFormat.BigDecimal:
+            max_integer_value = _generate_max_value(digit.integer)
+            max_decimal_value = _generate_max_value(digit.decimal)
+            return RandomBigDecimal.generate_many(  # type: ignore[return-value]
+                amount,
+                integer_range=ValueSize(min=0 - max_integer_value, max=max_integer_value),
+                decimal_range=ValueSize(min=0, max=max_decimal_value),
+            )
+        elif self is ValueFormat.Boolean:
+            return RandomBoolean.generate_many(amount)  # type: ignore[return-value]
+        elif self is ValueFormat.Enum:
+            return RandomFromSequence.generate_many(amount, enums)
+        else:
+            raise NotImplementedError(f"Doesn't implement how to generate the value by format {self}.")
+
     def generate_regex(
         self, enums: List[str] = [], size: ValueSize = Default_Value_Size, digit: DigitRange = Default_Digit_Range
     ) -> str:
@@ -141,3 +184,20 @@ class FormatStrategy(Enum):
                 data_type = "enum"  # type: ignore[assignment]
             return self.to_value_format(data_type=data_type).generate_value(enums=enums, size=size, digit=digit)
         raise ValueError(f"This function doesn't support *{self}* currently.")
+
+    def generate_not_customize_values(
+        self,
+        amount: int,
+        data_type: Optional[type] = None,
+        enums: List[str] = [],
+        size: ValueSize = Default_Value_Size,
+        digit: DigitRange = Default_Digit_Range,
+    ) -> List[Union[str, int, bool, Decimal]]:
+        if self in [FormatStrategy.BY_DATA_TYPE, FormatStrategy.FROM_ENUMS]:
+            assert data_type is not None, "Format setting require *data_type* must not be empty."
+            if self is FormatStrategy.FROM_ENUMS:
+                data_type = "enum"  # type: ignore[assignment]
+            return self.to_value_format(data_type=data_type).generate_values(
+                amount, enums=enums, size=size, digit=digit
+            )
+        raise ValueError(f"This function doesn't support *{self}* currently.")
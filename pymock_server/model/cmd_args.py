@@ -1,14 +1,16 @@
 import json
 from argparse import Namespace
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from pymock_server._utils.file import Format
 
 from ._sample import SampleType
-from .api_config.apis import ResponseStrategy
 from .subcmd_common import SysArg
 
+if TYPE_CHECKING:
+    from .api_config.apis import ResponseStrategy
+
 
 @dataclass(frozen=True)
 class ParserArguments:
@@ -43,6 +45,10 @@ class SubcmdRunArguments(ParserArguments):
     bind: str
     workers: int
     log_level: str
+    json_backend: str = "auto"
+    hot_reload: bool = False
+    metrics: bool = False
+    metrics_dir: str = ""
 
 
 @dataclass(frozen=True)
@@ -51,7 +57,7 @@ class SubcmdAddArguments(_BaseSubCmdArgumentsSavingConfig):
     api_path: str
     http_method: str
     parameters: List[dict]
-    response_strategy: ResponseStrategy
+    response_strategy: "ResponseStrategy"
     response_value: List[Union[str, dict]]
 
     def api_info_is_complete(self) -> bool:
@@ -75,6 +81,12 @@ class SubcmdCheckArguments(ParserArguments):
     check_api_parameters: bool
 
 
+@dataclass(frozen=True)
+class SubcmdCompileArguments(ParserArguments):
+    config_path: str
+    output_path: str
+
+
 @dataclass(frozen=True)
 class SubcmdGetArguments(ParserArguments):
     config_path: str
@@ -111,10 +123,17 @@ class DeserializeParsedArgs:
             bind=args.bind,
             workers=args.workers,
             log_level=args.log_level,
+            json_backend=args.json_backend,
+            hot_reload=args.hot_reload,
+            metrics=args.metrics,
+            metrics_dir=args.metrics_dir,
         )
 
     @classmethod
     def subcommand_add(cls, args: Namespace) -> SubcmdAddArguments:
+        # It's the only one which needs the data models, so import it when it's used
+        from .api_config.apis import ResponseStrategy
+
         args.response_strategy = ResponseStrategy(args.response_strategy)
         if args.parameters:
             args.parameters = list(map(lambda p: json.loads(p), args.parameters))
@@ -161,6 +180,14 @@ class DeserializeParsedArgs:
             check_api_parameters=args.check_api_parameters,
         )
 
+    @classmethod
+    def subcommand_compile(cls, args: Namespace) -> SubcmdCompileArguments:
+        return SubcmdCompileArguments(
+            subparser_structure=ParserArguments.parse_subparser_cmd(args),
+            config_path=args.config_path,
+            output_path=args.output_path,
+        )
+
     @classmethod
     def subcommand_get(cls, args: Namespace) -> SubcmdGetArguments:
         return SubcmdGetArguments(
@@ -0,0 +1,185 @@
+"""*The compiled configuration*
+
+Loading the configuration needs to parse all the YAML files and convert them to data models, and each worker of the
+server gateway loads it again by itself. This module compiles the loaded configuration, including all the divided
+configuration and the template configuration files, into one binary file. So it only needs to read one file without any
+parsing or converting to get the data models back.
+
+The compiled configuration file is composed by 3 parts:
+
+* The magic line which identifies the file format.
+* The header in one JSON line, e.g., the version of PyMock-Server which compiles it.
+* The pickled data models.
+
+The files which are the HTTP response content (strategy *file*) are not compiled. Their paths are saved as absolute
+paths, and loading the compiled configuration fails if any of them doesn't exist.
+
+The data models are loaded back by *pickle*, which could run any code in the file, so only load the compiled
+configuration which you compiled or trust.
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+from typing import Any, Dict, Iterator
+
+from pymock_server.__pkg_info__ import __version__
+from pymock_server.exceptions import InvalidCompiledConfig
+
+from .api_config import APIConfig
+from .api_config.apis import HTTPResponse
+from .api_config.apis.response_strategy import ResponseStrategy
+
+Compiled_Config_Extension: str = ".pymock"
+
+_Compiled_Config_Magic: bytes = b"PYMOCK-COMPILED-CONFIG\n"
+_Compiled_Config_Format_Version: int = 1
+
+
+def is_compiled_config(path: str) -> bool:
+    """Check whether the path is a compiled configuration file or not by its file extension.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        A boolean value.
+
+    """
+    return pathlib.Path(path).suffix.lower() == Compiled_Config_Extension
+
+
+def compiled_config_path(path: str) -> str:
+    """Get the default path of the compiled configuration, i.e., the configuration file path with extension
+    *.pymock*.
+
+    Args:
+        path (str): The configuration file path.
+
+    Returns:
+        A file path.
+
+    """
+    return str(pathlib.Path(path).with_suffix(Compiled_Config_Extension))
+
+
+def compile_config(api_config: APIConfig, path: str, source: str = "") -> None:
+    """Compile the loaded configuration into one binary file. The file paths of the HTTP responses with strategy
+    *file* would be converted to absolute paths, so the compiled configuration could be used in any working directory.
+
+    Args:
+        api_config (APIConfig): The loaded configuration.
+        path (str): The file path to save the compiled configuration.
+        source (str): The configuration file path which the configuration is loaded from.
+
+    Returns:
+        None
+
+    """
+    for response in _file_responses(api_config):
+        response.path = os.path.abspath(response.path)
+    content = pickle.dumps(api_config, protocol=pickle.HIGHEST_PROTOCOL)
+    # The data structure would be:
+    # {
+    #     "format": <the version of compiled configuration format>,
+    #     "version": <the version of PyMock-Server>,
+    #     "python": <the version of Python>,
+    #     "source": <the configuration file path>,
+    #     "digest": <the hash of the pickled data models>,
+    # }
+    header: Dict[str, Any] = {
+        "format": _Compiled_Config_Format_Version,
+        "version": __version__,
+        "python": ".".join(map(str, sys.version_info[:3])),
+        "source": source,
+        "digest": hashlib.blake2b(content, digest_size=16).hexdigest(),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # Write into a temporary file first, so the workers which are loading it won't read an incomplete one
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as file_stream:
+            file_stream.write(_Compiled_Config_Magic)
+            file_stream.write(json.dumps(header).encode("utf-8") + b"\n")
+            file_stream.write(content)
+        # The temporary file could only be read by its owner, but the compiled one may be shipped to others
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_compiled_config_header(path: str) -> Dict[str, Any]:
+    """Read the header of the compiled configuration without loading the data models.
+
+    Args:
+        path (str): The compiled configuration file path.
+
+    Returns:
+        A dict type value.
+
+    """
+    with open(path, "rb") as file_stream:
+        return _read_header(path, file_stream)
+
+
+def load_compiled_config(path: str) -> APIConfig:
+    """Load the configuration from the compiled configuration file.
+
+    The data models are unpickled, so it must be a compiled configuration which is trusted. The header and the digest
+    only check whether it's compiled by the same version and isn't broken, they couldn't prevent from running the code
+    in a malicious file.
+
+    Args:
+        path (str): The compiled configuration file path.
+
+    Returns:
+        A **APIConfig** type object.
+
+    """
+    with open(path, "rb") as file_stream:
+        header = _read_header(path, file_stream)
+        content = file_stream.read()
+    if hashlib.blake2b(content, digest_size=16).hexdigest() != header.get("digest"):
+        raise InvalidCompiledConfig(path, reason="its content is broken")
+    try:
+        api_config = pickle.loads(content)
+    except Exception as e:
+        raise InvalidCompiledConfig(path, reason=f"it cannot be unpickled ({e})") from e
+    if not isinstance(api_config, APIConfig):
+        raise InvalidCompiledConfig(path, reason="it doesn't have any configuration")
+    for response in _file_responses(api_config):
+        if not os.path.isfile(response.path):
+            raise InvalidCompiledConfig(path, reason=f"the file *{response.path}* of HTTP response doesn't exist")
+    return api_config
+
+
+def _file_responses(api_config: APIConfig) -> Iterator[HTTPResponse]:
+    if api_config.apis is None:
+        return
+    for api in api_config.apis.apis.values():
+        if api and api.http and api.http.response and api.http.response.strategy is ResponseStrategy.FILE:
+            yield api.http.response
+
+
+def _read_header(path: str, file_stream: Any) -> Dict[str, Any]:
+    if file_stream.readline() != _Compiled_Config_Magic:
+        raise InvalidCompiledConfig(path, reason="it's not a compiled configuration file")
+    try:
+        header = json.loads(file_stream.readline())
+    except ValueError as e:
+        raise InvalidCompiledConfig(path, reason="its header is broken") from e
+    if header.get("format") != _Compiled_Config_Format_Version:
+        raise InvalidCompiledConfig(path, reason=f"it doesn't support the format version {header.get('format')}")
+    # The data models may be different between versions
+    if header.get("version") != __version__:
+        raise InvalidCompiledConfig(
+            path, reason=f"it's compiled by PyMock-Server {header.get('version')} but current one is {__version__}"
+        )
+    return header
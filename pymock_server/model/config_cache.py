@@ -0,0 +1,153 @@
+"""*The on-disk cache of the loaded configuration*
+
+Loading the configuration needs to parse all the YAML files and convert them to data models, it takes seconds if the
+configuration has been divided into hundreds of files. This module saves the loaded configuration as a snapshot in
+directory *.pymock_cache* beside the configuration file, with a manifest of all the files it depends on. So it could
+use the snapshot directly next time if none of the files has been changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from typing import Callable, Optional, Tuple
+
+from pymock_server.__pkg_info__ import __version__
+from pymock_server._utils.file.manifest import FileManifest, record_dependencies
+
+from .api_config import APIConfig
+
+logger = logging.getLogger(__name__)
+
+# The environment variable which is whether it should cache the loaded configuration or not.
+Config_Cache_Environment_Variable: str = "MockAPI_Config_Cache"
+
+Config_Cache_Directory: str = ".pymock_cache"
+
+
+def config_cache_is_enabled() -> bool:
+    """Check whether it should cache the loaded configuration by environment variable.
+
+    Returns:
+        A boolean value.
+
+    """
+    if Config_Cache_Environment_Variable not in os.environ:
+        return False
+    return os.environ[Config_Cache_Environment_Variable].lower() in ("1", "true")
+
+
+class ConfigCache:
+    """*The on-disk cache of the loaded configuration*
+
+    Each loading would be cached by its own key, which is composed by the configuration file path, the loading
+    arguments, the current working directory (the paths in configuration may be relative to it) and the versions of
+    Python and PyMock-Server (the snapshot is pickled data models).
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+
+        Args:
+            directory (Optional[str]): The directory to save the cache. It would be *.pymock_cache* beside the
+                configuration file if it's empty.
+        """
+        self._directory = directory
+
+    def cache_directory(self, path: str) -> str:
+        """Get the directory to save the cache of the configuration.
+
+        Args:
+            path (str): The configuration file path.
+
+        Returns:
+            A directory path.
+
+        """
+        return self._directory or os.path.join(os.path.dirname(os.path.abspath(path)), Config_Cache_Directory)
+
+    def load(self, path: str, loader: Callable[[], Optional[APIConfig]], **kwargs) -> Optional[APIConfig]:
+        """Get the configuration from cache, or load it and save it into cache if the cache is stale.
+
+        Args:
+            path (str): The configuration file path.
+            loader (Callable[[], Optional[APIConfig]]): The function to load the configuration.
+            **kwargs: The arguments of loading which would change the loaded configuration.
+
+        Returns:
+            A **APIConfig** type object.
+
+        """
+        manifest_path, snapshot_path = self._cache_paths(path, **kwargs)
+        api_config = self._read(manifest_path, snapshot_path)
+        if api_config is not None:
+            logger.debug(f"Use the cached configuration of *{path}*.")
+            return api_config
+
+        with record_dependencies() as manifest:
+            api_config = loader()
+        if api_config is not None:
+            self._write(manifest_path, snapshot_path, manifest=manifest, api_config=api_config)
+        return api_config
+
+    def _cache_paths(self, path: str, **kwargs) -> Tuple[str, str]:
+        key = json.dumps(
+            {
+                "path": os.path.abspath(path),
+                "cwd": os.getcwd(),
+                "python": sys.version,
+                "version": __version__,
+                **kwargs,
+            },
+            sort_keys=True,
+        )
+        name = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        directory = self.cache_directory(path)
+        return os.path.join(directory, f"{name}.manifest.json"), os.path.join(directory, f"{name}.pickle")
+
+    def _read(self, manifest_path: str, snapshot_path: str) -> Optional[APIConfig]:
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as file_stream:
+                data = json.load(file_stream)
+            if not FileManifest.deserialize(data["dependencies"]).is_fresh():
+                return None
+            with open(snapshot_path, "rb") as file_stream:
+                snapshot = file_stream.read()
+            # The snapshot may have been replaced by another process after it read the manifest
+            if hashlib.blake2b(snapshot, digest_size=16).hexdigest() != data["snapshot"]:
+                return None
+            api_config = pickle.loads(snapshot)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug(f"Ignore the invalid configuration cache *{manifest_path}*: {e}")
+            return None
+        return api_config if isinstance(api_config, APIConfig) else None
+
+    def _write(self, manifest_path: str, snapshot_path: str, manifest: FileManifest, api_config: APIConfig) -> None:
+        try:
+            snapshot = pickle.dumps(api_config, protocol=pickle.HIGHEST_PROTOCOL)
+            data = {
+                "snapshot": hashlib.blake2b(snapshot, digest_size=16).hexdigest(),
+                "dependencies": manifest.serialize(),
+            }
+            os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+            # Write the snapshot before the manifest, so the manifest always points to a completed snapshot
+            self._write_atomically(snapshot_path, snapshot)
+            self._write_atomically(manifest_path, json.dumps(data).encode("utf-8"))
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"Cannot save the configuration cache into *{os.path.dirname(manifest_path)}*: {e}")
+
+    @staticmethod
+    def _write_atomically(path: str, content: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file_stream:
+                file_stream.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
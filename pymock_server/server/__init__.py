@@ -5,18 +5,27 @@ Interface) tool, e.g., *gunicorn*, etc.
 """
 
 import os
+from typing import Any
 
 from pymock_server._utils.importing import ensure_importing, import_web_lib
 from pymock_server.server.rest.sgi.cmd import ASGIServer, BaseSGIServer, WSGIServer
 
-from .mock import MockHTTPServer
-from .rest.application import BaseAppServer, FastAPIServer, FlaskServer
+from .mock import Hot_Reload_Environment_Variable, MockHTTPServer
+from .rest.application import (
+    ASGINativeServer,
+    BaseAppServer,
+    FastAPIServer,
+    FlaskServer,
+    WSGINativeServer,
+)
 from .rest.sgi import setup_server_gateway
 from .rest.sgi._model import Command, CommandOptions
 from .rest.sgi.cmd import ASGIServer, BaseSGIServer, WSGIServer
 
 flask_app: "flask.Flask" = None  # type: ignore
 fastapi_app: "fastapi.FastAPI" = None  # type: ignore
+asgi_native_app: Any = None
+wsgi_native_app: Any = None
 
 
 def create_flask_app() -> "flask.Flask":  # type: ignore
@@ -29,6 +38,16 @@ def create_fastapi_app() -> "fastapi.FastAPI":  # type: ignore
     return fastapi_app
 
 
+def create_asgi_native_app() -> Any:
+    load_app.by_asgi_native()
+    return asgi_native_app
+
+
+def create_wsgi_native_app() -> Any:
+    load_app.by_wsgi_native()
+    return wsgi_native_app
+
+
 def setup_wsgi() -> WSGIServer:
     return setup_server_gateway.wsgi(web_app=create_flask_app, module_dict=globals())
 
@@ -37,6 +56,14 @@ def setup_asgi() -> ASGIServer:
     return setup_server_gateway.asgi(web_app=create_fastapi_app, module_dict=globals())
 
 
+def setup_wsgi_native() -> WSGIServer:
+    return setup_server_gateway.wsgi(web_app=create_wsgi_native_app, module_dict=globals())
+
+
+def setup_asgi_native() -> ASGIServer:
+    return setup_server_gateway.asgi(web_app=create_asgi_native_app, module_dict=globals())
+
+
 class load_app:
     """*Set up and safely load the web application with Python web framework*
 
@@ -71,6 +98,30 @@ class load_app:
         config = cls._get_config_path()
         fastapi_app = cls._initial_mock_server(config_path=config, app_server=FastAPIServer()).web_app
 
+    @classmethod
+    def by_asgi_native(cls) -> None:
+        """Set up the raw ASGI web application without any Python web framework.
+
+        Returns:
+            None
+
+        """
+        global asgi_native_app
+        config = cls._get_config_path()
+        asgi_native_app = cls._initial_mock_server(config_path=config, app_server=ASGINativeServer()).web_app
+
+    @classmethod
+    def by_wsgi_native(cls) -> None:
+        """Set up the raw WSGI web application without any Python web framework.
+
+        Returns:
+            None
+
+        """
+        global wsgi_native_app
+        config = cls._get_config_path()
+        wsgi_native_app = cls._initial_mock_server(config_path=config, app_server=WSGINativeServer()).web_app
+
     @classmethod
     def _get_config_path(cls) -> str:
         """Get the configuration file path by environment variable in OS runtime environment.
@@ -81,6 +132,18 @@ class load_app:
         """
         return os.environ.get("MockAPI_Config", "api.yaml")
 
+    @classmethod
+    def _hot_reload_is_enabled(cls) -> bool:
+        """Check whether it should reload the configuration once it has been changed by environment variable.
+
+        Returns:
+            A boolean value.
+
+        """
+        if Hot_Reload_Environment_Variable not in os.environ:
+            return False
+        return os.environ[Hot_Reload_Environment_Variable].lower() in ("1", "true")
+
     @classmethod
     def _initial_mock_server(cls, config_path: str, app_server: BaseAppServer) -> MockHTTPServer:
         """Instantiate the mocked web server.
@@ -93,4 +156,7 @@ class load_app:
             A **MockHTTPServer** type object.
 
         """
-        return MockHTTPServer(config_path=config_path, app_server=app_server, auto_setup=True)
+        mock_server = MockHTTPServer(config_path=config_path, app_server=app_server, auto_setup=True)
+        if cls._hot_reload_is_enabled():
+            mock_server.watch()
+        return mock_server
@@ -3,12 +3,24 @@
 This module provides objects for mocking APIs as a web application with different Python framework.
 """
 
-from typing import Any, Optional
+import logging
+import os
+import time
+from typing import Any, List, Optional
 
+from pymock_server._utils.file.watch import BaseFileWatcher, file_watcher
 from pymock_server.model import APIConfig, MockAPIs, load_config
+from pymock_server.model.compiled_config import is_compiled_config
 
 from .rest.application import BaseAppServer, FlaskServer
 
+logger = logging.getLogger(__name__)
+
+# The environment variable which is whether it should reload the configuration once it has been changed or not.
+Hot_Reload_Environment_Variable: str = "MockAPI_Hot_Reload"
+
+_Config_File_Extensions = (".yaml", ".yml")
+
 
 class MockHTTPServer:
     """*Mocking APIs as web application with HTTP*
@@ -45,6 +57,7 @@ class MockHTTPServer:
             app_server = FlaskServer()
         self._app_server = app_server
         self._web_application = None
+        self._watcher: Optional[BaseFileWatcher] = None
 
         if auto_setup and (self._api_config and self._api_config.apis):
             self.create_apis(mocked_apis=self._api_config.apis)
@@ -66,3 +79,93 @@ class MockHTTPServer:
 
         """
         self._app_server.create_api(mocked_apis)
+
+    def reload(self) -> bool:
+        """Load the configuration again and apply the changes of mocked APIs to the web application without restarting
+        it. It would keep using the current configuration if the new one could not be loaded, e.g., it's being edited.
+
+        Returns:
+            It returns ``True`` if it applies the new configuration.
+
+        """
+        start = time.perf_counter()
+        try:
+            api_config = load_config(path=self._config_path)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(f"Cannot reload the configuration *{self._config_path}*, keep using the current one: {e}")
+            return False
+        if not (api_config and api_config.apis):
+            logger.warning(f"The configuration *{self._config_path}* doesn't have any mocked API, ignore it.")
+            return False
+
+        changes = self._app_server.reload_api(api_config.apis)
+        self._api_config = api_config
+        logger.info(
+            f"Reload the configuration *{self._config_path}* in {(time.perf_counter() - start) * 1000:.1f} ms: "
+            + ", ".join(f"{amount} {change}" for change, amount in changes.items())
+            + " mocked APIs."
+        )
+        return True
+
+    def watch(self, interval: float = 1.0) -> BaseFileWatcher:
+        """Reload the configuration once any of its files has been changed. The files would be watched in a daemon
+        thread.
+
+        Args:
+            interval (float): The interval (in seconds) between each checking if it could only check the files
+                periodically.
+
+        Returns:
+            The file watcher which is watching the configuration files.
+
+        """
+        if self._watcher is None:
+            self._watcher = file_watcher(
+                list_paths=self.config_paths, on_change=lambda _: self.reload(), interval=interval
+            )
+        self._watcher.start()
+        return self._watcher
+
+    def stop_watching(self) -> None:
+        """Stop watching the configuration files."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def config_paths(self) -> List[str]:
+        """Get the paths of the configuration files, including the divided ones, and the directories which may have
+        the divided configuration files. It scans the files as the loaders of template configuration do, i.e., the
+        files and directories which name doesn't start with *_* in the base directory and the directories in it.
+
+        Returns:
+            A list of file and directory paths.
+
+        """
+        paths: List[str] = [os.path.abspath(self._config_path)]
+        if is_compiled_config(self._config_path):
+            # All the divided configuration has been compiled into one file
+            return paths
+        base_file_path = ""
+        template = self._api_config.apis.template if self._api_config and self._api_config.apis else None
+        if template and template.activate:
+            # The divided configuration files would only be loaded if the template section is activated
+            base_file_path = template.file.config_path_values.base_file_path
+        base_directory = os.path.abspath(base_file_path or os.path.dirname(self._config_path) or ".")
+        directories = [base_directory]
+        paths.append(base_directory)
+        for directory in directories:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name.startswith(("_", ".")):
+                    continue
+                if entry.is_dir():
+                    # Only the directories in the base directory could have the divided configuration files
+                    if directory == base_directory:
+                        directories.append(entry.path)
+                        paths.append(entry.path)
+                elif entry.name.endswith(_Config_File_Extensions) and entry.path not in paths:
+                    paths.append(entry.path)
+        return paths
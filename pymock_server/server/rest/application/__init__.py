@@ -4,8 +4,10 @@ This module provides which library of Python web framework you could use to set
 """
 
 import logging
-from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+import os
+import time
+from abc import ABC, ABCMeta, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pymock_server._utils import import_web_lib
 from pymock_server.model.api_config import MockAPIs
@@ -15,14 +17,39 @@ from .code_generator import (
     BaseWebServerCodeGenerator,
     FastAPICodeGenerator,
     FlaskCodeGenerator,
+    NativeCodeGenerator,
 )
+from .metrics import (
+    Metrics_Content_Type,
+    Metrics_Dir_Environment_Variable,
+    Metrics_URL_Path,
+    MetricsRegistry,
+    metrics_is_enabled,
+)
+from .native import ASGIApplication, WSGIApplication
 from .process import HTTPRequestProcess, HTTPResponseProcess
-from .request import FastAPIRequest, FlaskRequest
-from .response import FastAPIResponse, FlaskResponse
+from .request import FastAPIRequest, FlaskRequest, NativeRequest, RawRequest
+from .response import (
+    DeterministicResponses,
+    FastAPIResponse,
+    FlaskResponse,
+    NativeResponse,
+    PreRenderedResponse,
+    RawResponse,
+    ResponsePools,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _is_same_api(api_config: MockAPI, other: MockAPI) -> bool:
+    try:
+        return api_config == other
+    except (TypeError, ValueError):
+        # The HTTP responses with different strategies cannot be compared with each other
+        return False
+
+
 class BaseAppServer(metaclass=ABCMeta):
     """*Base class for set up web application*"""
 
@@ -37,17 +64,32 @@ class BaseAppServer(metaclass=ABCMeta):
         # }
         self._mock_api_details: Dict[str, Dict[str, MockAPI]] = {}
         self._api_functions: Dict[str, str] = {}
+        # The data structure would be:
+        # {
+        #     <the object ID of API details>: <the key of mocked API in configuration>
+        # }
+        self._api_keys: Dict[int, str] = {}
 
         self._code_generator = self.init_code_generator()
 
         self._http_request = self.init_http_request_process()
         self._http_response = self.init_http_response_process()
 
+        self._metrics: Optional[MetricsRegistry] = None
+        if metrics_is_enabled():
+            self._metrics = MetricsRegistry(directory=os.environ.get(Metrics_Dir_Environment_Variable, None) or None)
+            self._code_generator.observe_process = self._observe_process
+
     @property
     def web_application(self) -> Any:
         """:obj:`Any`: Property with only getter for the instance of web application, e.g., *Flask*, *FastAPI*, etc."""
         if not self._web_application:
             self._web_application = self.setup()
+            self._code_generator.setup_application(self._web_application)
+            if self._metrics is not None:
+                self._code_generator.add_metrics_api(
+                    self._web_application, url=Metrics_URL_Path, metrics_function=self._metrics_process
+                )
         return self._web_application
 
     @property
@@ -57,6 +99,22 @@ class BaseAppServer(metaclass=ABCMeta):
             return self._mock_api_details
         return self._mock_api_details
 
+    @property
+    def metrics(self) -> Optional[MetricsRegistry]:
+        """:obj:`MetricsRegistry`: Property with only getter for the metrics of mocked APIs. It's empty if it's
+        disabled."""
+        return self._metrics
+
+    @property
+    def response_pools(self) -> ResponsePools:
+        """:obj:`ResponsePools`: Property with only getter for the pools of pre-generated HTTP responses."""
+        return self._http_response.response_pools
+
+    @property
+    def deterministic_responses(self) -> DeterministicResponses:
+        """:obj:`DeterministicResponses`: Property with only getter for the cache of deterministic HTTP responses."""
+        return self._http_response.deterministic_responses
+
     @abstractmethod
     def setup(self) -> Any:
         """Initial object for setting up web application.
@@ -80,38 +138,145 @@ class BaseAppServer(metaclass=ABCMeta):
 
     def create_api(self, mocked_apis: MockAPIs) -> None:
         """
-        [Entry point for generating Python code]
+        [Entry point for generating the API functions]
         """
+        base_url = mocked_apis.base.url if mocked_apis.base else None
+        self._api_keys = {id(api_config): api_key for api_key, api_config in (mocked_apis.apis or {}).items()}
         aggregated_mocked_apis = self._get_all_api_details(mocked_apis)
         for api_name, api_config in aggregated_mocked_apis.items():
             if api_name and api_config:
                 logger.debug(f"api_name: {api_name}")
-                annotate_function_pycode = self._code_generator.annotate_function(api_name, api_config)
-                add_api_pycode = self._code_generator.add_api(
-                    api_name, api_config, base_url=mocked_apis.base.url if mocked_apis.base else None
+                api_function = self._code_generator.annotate_function(
+                    api_name,
+                    api_config,
+                    request_process=self._request_process,
+                    response_process=self._response_process,
+                )
+                self._code_generator.add_api(
+                    self.web_application, api_name, api_config, api_function=api_function, base_url=base_url
                 )
-                logger.debug(f"annotate_function_pycode: {annotate_function_pycode}")
-                # pylint: disable=exec-used
-                exec(annotate_function_pycode)
-                # pylint: disable=exec-used
-                logger.debug(f"add_api_pycode: {add_api_pycode}")
-                exec(add_api_pycode)
+        # Index all the URL paths of mocked APIs once here instead of searching them by each request
+        self._http_request.mock_api_details = self.mock_api_details
+        self._http_response.mock_api_details = self.mock_api_details
+
+    def reload_api(self, mocked_apis: MockAPIs) -> Dict[str, int]:
+        """Apply the changes of mocked APIs to the running web application. It only registers the API functions of the
+        new mocked APIs and unregisters the removed ones, the unchanged mocked APIs keep using the same setting objects,
+        so their compiled validators, pre-rendered responses and response pools still could be used. The details of
+        mocked APIs would be swapped at once, so the requests never get the details which is half updated.
+
+        Args:
+            mocked_apis (MockAPIs): The data object of mocked APIs configuration which is loaded again.
+
+        Returns:
+            A dict type value which has the amount of added, changed, removed and unchanged mocked APIs.
+
+        """
+        base_url = mocked_apis.base.url if mocked_apis.base else None
+        current_details = self.mock_api_details
+        changes = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+
+        # The data structure would be:
+        # {
+        #     <API URL path>: {
+        #         <HTTP method>: <API details>
+        #     }
+        # }
+        new_details: Dict[str, Dict[str, MockAPI]] = {}
+        api_keys: Dict[int, str] = {}
+        need_registering: Dict[int, MockAPI] = {}
+        outdated_apis: List[Tuple[str, str]] = []
+        for api_key, api_config in (mocked_apis.apis or {}).items():
+            if not (api_config and api_config.http and api_config.http.request):
+                continue
+            url = self._code_generator.url_path(api_config.url, base_url)
+            http_method = api_config.http.request.method
+            current_api_config = current_details.get(url, {}).get(http_method, None)
+            if current_api_config is None:
+                changes["added"] += 1
+                need_registering[id(api_config)] = api_config
+            elif _is_same_api(current_api_config, api_config):
+                changes["unchanged"] += 1
+                api_config = current_api_config
+            else:
+                changes["changed"] += 1
+                if self._code_generator.reregister_changed_api:
+                    need_registering[id(api_config)] = api_config
+                    outdated_apis.append((url, http_method))
+            new_details.setdefault(url, {})[http_method] = api_config
+            api_keys[id(api_config)] = api_key
+        removed_apis = [
+            (url, http_method)
+            for url, api_details in current_details.items()
+            for http_method in api_details.keys()
+            if http_method not in new_details.get(url, {})
+        ]
+        changes["removed"] = len(removed_apis)
+        outdated_apis.extend(removed_apis)
+
+        # Swap the details of mocked APIs at once
+        setattr(self._code_generator, "_mock_api_details", new_details)
+        self._mock_api_details = new_details
+        self._api_keys = api_keys
+        self._http_request.mock_api_details = new_details
+        self._http_response.mock_api_details = new_details
+
+        for url, http_method in outdated_apis:
+            self._code_generator.remove_api(self.web_application, url=url, http_method=http_method)
+        for api_name, api_config in self._get_all_api_details(mocked_apis).items():
+            if isinstance(api_config, list):
+                api_config = [ac for ac in api_config if id(ac) in need_registering]
+                if not api_config:
+                    continue
+            elif api_config is None or id(api_config) not in need_registering:
+                continue
+            api_function = self._code_generator.annotate_function(
+                api_name,
+                api_config,
+                request_process=self._request_process,
+                response_process=self._response_process,
+            )
+            self._code_generator.add_reloaded_api(
+                self.web_application, api_name, api_config, api_function=api_function, base_url=base_url
+            )
+        if need_registering:
+            self._code_generator.reorder_apis(
+                self.web_application,
+                apis=[(url, http_method) for url, api_details in new_details.items() for http_method in api_details],
+            )
+        return changes
 
     @abstractmethod
     def _get_all_api_details(self, mocked_apis) -> Dict[str, Union[Optional[MockAPI], List[MockAPI]]]:
         """
-        Part of [Entry point for generating Python code]
+        Part of [Entry point for generating the API functions]
         """
 
     def _request_process(self, **kwargs) -> "flask.Response":  # type: ignore
         self._http_request.mock_api_details = self.mock_api_details
         return self._http_request.process(**kwargs)
 
-    def _response_process(self, **kwargs) -> Union[str, dict]:
+    def _response_process(self, **kwargs) -> Union[str, dict, Any]:
         # TODO: Add the setting logic to unit test
         self._http_response.mock_api_details = self.mock_api_details
         return self._http_response.process(**kwargs)
 
+    def _observe_process(self, kwargs: Dict[str, Any], response: Any, seconds: Optional[float]) -> None:
+        assert self._metrics is not None
+        http_method, api_config = self._http_request.current_api_config(**kwargs)
+        api_key = self._api_keys.get(id(api_config), None)
+        if api_key is None:
+            # The mocked API has been removed by reloading the configuration
+            return
+        # The response would be the data object instead of the response object of web framework in some cases
+        self._metrics.observe(api_key, http_method, getattr(response, "status_code", 200), seconds)
+
+    def _metrics_process(self) -> Any:
+        assert self._metrics is not None
+        return self._http_request.generate_pre_rendered(
+            PreRenderedResponse(self._metrics.render().encode("utf-8"), content_type=Metrics_Content_Type)
+        )
+
 
 class FlaskServer(BaseAppServer):
     """*Build a web application with *Flask**"""
@@ -134,16 +299,13 @@ class FlaskServer(BaseAppServer):
     def init_http_response_process(self) -> HTTPResponseProcess:
         return HTTPResponseProcess(
             request=FlaskRequest(),
+            response=FlaskResponse(),
         )
 
 
 class FastAPIServer(BaseAppServer):
     """*Build a web application with *FastAPI**"""
 
-    def __init__(self):
-        super().__init__()
-        self._api_has_params: bool = False
-
     def setup(self) -> "fastapi.FastAPI":  # type: ignore
         return import_web_lib.fastapi().FastAPI()
 
@@ -162,4 +324,85 @@ class FastAPIServer(BaseAppServer):
     def init_http_response_process(self) -> HTTPResponseProcess:
         return HTTPResponseProcess(
             request=FastAPIRequest(),
+            response=FastAPIResponse(),
         )
+
+
+class BaseNativeAppServer(BaseAppServer, ABC):
+    """*Base class for set up the native web application without any Python web framework*
+
+    It routes the requests by the index of mocked APIs' URL paths by itself, and reuses the same processing of HTTP
+    request and response as the other web applications.
+    """
+
+    def __init__(self):
+        # Share the same request and response processing so that the index of URL paths only be built once
+        self._native_request = NativeRequest()
+        self._native_response = NativeResponse()
+        super().__init__()
+
+    def init_code_generator(self) -> NativeCodeGenerator:
+        return NativeCodeGenerator()
+
+    def _get_all_api_details(self, mocked_apis: MockAPIs) -> Dict[str, List[MockAPI]]:  # type: ignore[override]
+        return mocked_apis.group_by_url()
+
+    def init_http_request_process(self) -> HTTPRequestProcess:
+        return HTTPRequestProcess(
+            request=self._native_request,
+            response=self._native_response,
+        )
+
+    def init_http_response_process(self) -> HTTPResponseProcess:
+        return HTTPResponseProcess(
+            request=self._native_request,
+            response=self._native_response,
+        )
+
+    def dispatch(self, request: RawRequest) -> RawResponse:
+        """Handle the request by the mocked API which matches its URL path and HTTP method.
+
+        Args:
+            request (RawRequest): The current request.
+
+        Returns:
+            A **RawResponse** type object.
+
+        """
+        if self._metrics is not None and request.path == Metrics_URL_Path and request.method == "GET":
+            return self._metrics_process()
+        try:
+            api_details = self._native_request.find_api_detail_by_request(self.mock_api_details, request)
+        except KeyError:
+            return self._native_response.generate(body="Not Found", status_code=404)
+        if request.method not in api_details:
+            response = self._native_response.generate(body="Method Not Allowed", status_code=405)
+            response.headers.append(("Allow", ", ".join(api_details.keys())))
+            return response
+
+        if self._metrics is None:
+            return self._process(request)
+        start = time.perf_counter()
+        response = self._process(request)
+        self._observe_process({"request": request}, response, time.perf_counter() - start)
+        return response
+
+    def _process(self, request: RawRequest) -> RawResponse:
+        process_result = self._request_process(request=request)
+        if process_result.status_code != 200:
+            return process_result
+        return self._native_response.generate_content(self._response_process(request=request))
+
+
+class ASGINativeServer(BaseNativeAppServer):
+    """*Build a raw ASGI web application without any Python web framework*"""
+
+    def setup(self) -> ASGIApplication:
+        return ASGIApplication(self.dispatch)
+
+
+class WSGINativeServer(BaseNativeAppServer):
+    """*Build a raw WSGI web application without any Python web framework*"""
+
+    def setup(self) -> WSGIApplication:
+        return WSGIApplication(self.dispatch)
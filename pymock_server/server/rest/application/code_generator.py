@@ -1,12 +1,43 @@
+"""*Generating the API functions of web application*
+
+This module generates the function of each mocked API as a closure and registers it into the web application of Python
+web framework directly. It doesn't compile any Python code at runtime, so the cost of setting up web application only
+grows linearly with the amount of mocked APIs.
+"""
+
+import inspect
 import re
+import time
 from abc import ABCMeta, abstractmethod
-from typing import Dict, List, Optional, Union, cast
+from pydoc import locate
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
+from pymock_server._utils import import_web_lib
 from pymock_server.model import MockAPI
 from pymock_server.model.api_config.apis import HTTPRequest, HTTPResponse
 
+from .route import RouteIndex
+
+try:
+    from pydantic import create_model
+except ImportError:
+    # The library *pydantic* is only installed with *FastAPI*, and only the code generator of *FastAPI* uses it
+    create_model = None  # type: ignore[assignment]
+
+# The process function of the web application server, e.g., *BaseAppServer._request_process*
+ProcessFunction = Callable[..., Any]
+# The function to record the metrics of each request, e.g., *BaseAppServer._observe_process*. Its arguments are the
+# keyword arguments of API function, the response and the latency (in seconds) of processing the request. The latency
+# would be empty if it cannot be measured, e.g., the request is rejected by the web framework.
+ObserveFunction = Callable[[Dict[str, Any], Any, Optional[float]], None]
+
 
 class BaseWebServerCodeGenerator(metaclass=ABCMeta):
+    # Whether the API function should be registered again if the setting of mocked API has been changed, e.g., the
+    # signature of API function depends on the parameters of the mocked API.
+    reregister_changed_api: bool = False
+
     def __init__(self):
         # The data structure would be:
         # {
@@ -15,19 +46,21 @@ class BaseWebServerCodeGenerator(metaclass=ABCMeta):
         #     }
         # }
         self._mock_api_details: Dict[str, Dict[str, MockAPI]] = {}
-
-    def annotate_function(self, api_name: str, api_config: List[MockAPI]) -> str:
-        """
-        [Generating code]
-        """
-        initial_global_server = """global SERVER\nSERVER = self\n"""
-        define_function_for_api = self._define_api_function_pycode(api_name, api_config)
-        return initial_global_server + define_function_for_api
+        # Record the metrics of each request if it's set. It's bound into the API function when generating it, so it
+        # doesn't cost anything if the metrics are disabled.
+        self.observe_process: Optional[ObserveFunction] = None
 
     @abstractmethod
-    def _define_api_function_pycode(self, api_name: str, api_config: List[MockAPI]) -> str:
+    def annotate_function(
+        self,
+        api_name: str,
+        api_config: Union[MockAPI, List[MockAPI]],
+        request_process: ProcessFunction,
+        response_process: ProcessFunction,
+    ) -> Callable:
         """
-        [Generating code]
+        [Generating function] Generate the function of the mocked API which calls the process functions of the web
+        application server. The process functions are bound in the closure, so it doesn't need any global variable.
         """
 
     def _parse_variable_in_api(self, api_function_name: str) -> Dict[str, str]:
@@ -54,35 +87,47 @@ class BaseWebServerCodeGenerator(metaclass=ABCMeta):
             var_mapping_table[one_var_in_url] = new_one_var_in_url
         return var_mapping_table
 
-    def _run_request_process_pycode(self, **kwargs) -> str:
+    def _generate_api_function(
+        self, function_name: str, request_process: ProcessFunction, response_process: ProcessFunction
+    ) -> Callable:
         """
-        [Generating code]
-        """
-        return """
-        process_result = SERVER._request_process()
+        [Generating function] The common processing of each mocked API: validate the request first, and generate the
+        response if the request is valid.
         """
 
-    def _handle_request_process_result_pycode(self, **kwargs) -> str:
-        """
-        [Generating code]
-        """
-        return """
-        if process_result.status_code != 200:
-            return process_result
-        """
+        def _api_function(**kwargs) -> Any:
+            process_result = request_process(**kwargs)
+            if process_result.status_code != 200:
+                return process_result
+            return response_process(**kwargs)
 
-    def _generate_response_pycode(self) -> str:
-        """
-        [Generating code]
-        """
-        return """
-        return SERVER._response_process()
-        """
+        api_function = _api_function
+        observe_process = self.observe_process
+        if observe_process is not None:
+
+            def _observed_api_function(**kwargs) -> Any:
+                start = time.perf_counter()
+                response = _api_function(**kwargs)
+                observe_process(kwargs, response, time.perf_counter() - start)
+                return response
+
+            api_function = _observed_api_function
+
+        api_function.__name__ = function_name
+        api_function.__qualname__ = function_name
+        return api_function
 
     @abstractmethod
-    def add_api(self, api_name: str, api_config: Union[MockAPI, List[MockAPI]], base_url: Optional[str] = None) -> str:
+    def add_api(
+        self,
+        web_application: Any,
+        api_name: str,
+        api_config: Union[MockAPI, List[MockAPI]],
+        api_function: Callable,
+        base_url: Optional[str] = None,
+    ) -> None:
         """
-        [Generating code] but doing data processing first
+        [Registering function] but doing data processing first
         """
         if isinstance(api_config, list):
             url = api_name
@@ -91,7 +136,47 @@ class BaseWebServerCodeGenerator(metaclass=ABCMeta):
         else:
             raise TypeError
         self._record_api_params_info(url=self.url_path(url=url, base_url=base_url), api_config=api_config)
-        return ""
+
+    def setup_application(self, web_application: Any) -> None:
+        """
+        [Registering function] Prepare the web application before registering any API function. It doesn't do anything
+        in default.
+        """
+
+    def add_reloaded_api(
+        self,
+        web_application: Any,
+        api_name: str,
+        api_config: Union[MockAPI, List[MockAPI]],
+        api_function: Callable,
+        base_url: Optional[str] = None,
+    ) -> None:
+        """
+        [Registering function] Register the API function of the mocked API which has been added or changed by reloading
+        the configuration, i.e., the web application may be serving already. It registers it as the others in default.
+        """
+        self.add_api(web_application, api_name, api_config, api_function=api_function, base_url=base_url)
+
+    def remove_api(self, web_application: Any, url: str, http_method: str) -> None:
+        """
+        [Registering function] Unregister the API function of the mocked API which has been removed. It doesn't do
+        anything in default, and the removed mocked API would be responded with status code *404* or *405* by the
+        processing of request.
+        """
+
+    def reorder_apis(self, web_application: Any, apis: List[Tuple[str, str]]) -> None:
+        """
+        [Registering function] Sort the registered API functions by the order of mocked APIs in configuration, e.g.,
+        the API function which is registered again after reloading should still be matched before the one which has
+        variable in the same URL path. It doesn't do anything in default, i.e., the web application doesn't route the
+        requests by the registering order.
+        """
+
+    def add_metrics_api(self, web_application: Any, url: str, metrics_function: Callable) -> None:
+        """
+        [Registering function] Register the function which responds the metrics of mocked APIs. It doesn't do anything
+        in default, e.g., the native web application routes the requests of metrics by itself.
+        """
 
     def url_path(self, url: Optional[str], base_url: Optional[str] = None) -> str:
         """
@@ -102,8 +187,8 @@ class BaseWebServerCodeGenerator(metaclass=ABCMeta):
 
     def _record_api_params_info(self, url: str, api_config: Union[MockAPI, List[MockAPI]]) -> None:
         """
-        [Generating code] but doing data processing first
-        This processing for the outer function which would be called by the generating code
+        [Registering function] but doing data processing first
+        This processing for the outer function which would be called by the generated function
         """
         if isinstance(api_config, list):
             for ac in api_config:
@@ -126,26 +211,116 @@ class FlaskCodeGenerator(BaseWebServerCodeGenerator):
 
     _variables_in_url: Dict[str, str] = {}
 
-    def _define_api_function_pycode(self, api_name: str, api_config: List[MockAPI]) -> str:
+    # The HTTP methods which the view function of the reloaded API functions accepts
+    _reloaded_api_methods: List[str] = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+    def __init__(self):
+        super().__init__()
+        # The data structure would be:
+        # {
+        #     <API URL path>: {
+        #         <HTTP method>: <API function>
+        #     }
+        # }
+        self._reloaded_api_functions: Dict[str, Dict[str, Callable]] = {}
+        self._route_index: Optional[RouteIndex] = None
+
+    def annotate_function(  # type: ignore[override]
+        self,
+        api_name: str,
+        api_config: List[MockAPI],
+        request_process: ProcessFunction,
+        response_process: ProcessFunction,
+    ) -> Callable:
         self._variables_in_url.clear()
         self._variables_in_url = self._parse_variable_in_api(api_name)
 
-        return f"""def {self._api_controller_name(api_name)}({self._api_function_signature()}) -> Union[str, dict]:
-            {self._run_request_process_pycode()}
-            {self._handle_request_process_result_pycode()}
-            {self._generate_response_pycode()}
-        """
+        api_function = self._generate_api_function(
+            self._api_controller_name(api_name), request_process=request_process, response_process=response_process
+        )
 
-    def add_api(self, api_name: str, api_config: Union[MockAPI, List[MockAPI]], base_url: Optional[str] = None) -> str:
-        super().add_api(api_name=api_name, api_config=api_config, base_url=base_url)
+        # Flask passes the variables in URL as keyword arguments, but the processing gets them from *flask.request*
+        def _flask_api_function(**_variables_in_url) -> Any:
+            return api_function()
+
+        _flask_api_function.__name__ = api_function.__name__
+        _flask_api_function.__qualname__ = api_function.__qualname__
+        return _flask_api_function
+
+    def add_api(  # type: ignore[override]
+        self,
+        web_application: "flask.Flask",  # type: ignore[name-defined]
+        api_name: str,
+        api_config: Union[MockAPI, List[MockAPI]],
+        api_function: Callable,
+        base_url: Optional[str] = None,
+    ) -> None:
+        super().add_api(
+            web_application, api_name=api_name, api_config=api_config, api_function=api_function, base_url=base_url
+        )
         # TODO: Should align the data structure and remove this checking
         if not isinstance(api_config, list):
             raise TypeError("")
         acceptance_method = [cast(HTTPRequest, self._ensure_http(ac, "request")).method for ac in api_config]
-        return f"""self.web_application.route(
-                "{self.url_path(api_name, base_url)}", methods={acceptance_method}
-                )({self._api_controller_name(api_name)})
-            """
+        web_application.add_url_rule(
+            self.url_path(api_name, base_url),
+            endpoint=api_function.__name__,
+            view_func=api_function,
+            methods=acceptance_method,
+        )
+
+    def setup_application(self, web_application: "flask.Flask") -> None:  # type: ignore[name-defined]
+        # Flask doesn't allow registering any URL rule after it has handled the first request, so the API functions
+        # which are added by reloading the configuration are dispatched by this view function. The URL rules of the
+        # others always are matched before it, because it has the variable with converter *path*.
+        web_application.add_url_rule(
+            "/<path:_pymock_path>",
+            endpoint="pymock_reloaded_apis",
+            view_func=self._dispatch_reloaded_api,
+            methods=self._reloaded_api_methods,
+            provide_automatic_options=False,
+        )
+
+    def add_reloaded_api(  # type: ignore[override]
+        self,
+        web_application: "flask.Flask",  # type: ignore[name-defined]
+        api_name: str,
+        api_config: Union[MockAPI, List[MockAPI]],
+        api_function: Callable,
+        base_url: Optional[str] = None,
+    ) -> None:
+        BaseWebServerCodeGenerator.add_api(
+            self,
+            web_application,
+            api_name=api_name,
+            api_config=api_config,
+            api_function=api_function,
+            base_url=base_url,
+        )
+        # TODO: Should align the data structure and remove this checking
+        if not isinstance(api_config, list):
+            raise TypeError("")
+        api_functions = self._reloaded_api_functions.setdefault(self.url_path(api_name, base_url), {})
+        for ac in api_config:
+            api_functions[cast(HTTPRequest, self._ensure_http(ac, "request")).method.upper()] = api_function
+
+    def _dispatch_reloaded_api(self, **_variables_in_url) -> Any:
+        flask = import_web_lib.flask()
+        if self._route_index is None or not self._route_index.is_indexing(self._mock_api_details):
+            self._route_index = RouteIndex(self._mock_api_details)
+        route_match = self._route_index.find(flask.request.path)
+        if route_match is None:
+            flask.abort(404)
+        api_function = self._reloaded_api_functions.get(route_match.template, {}).get(flask.request.method, None)
+        if api_function is None:
+            # The URL rule of this path has been registered, but it doesn't accept this HTTP method
+            flask.abort(405, valid_methods=sorted(route_match.api_details.keys()))
+        return api_function()
+
+    def add_metrics_api(
+        self, web_application: "flask.Flask", url: str, metrics_function: Callable  # type: ignore[name-defined]
+    ) -> None:
+        web_application.add_url_rule(url, endpoint="pymock_metrics", view_func=metrics_function, methods=["GET"])
 
     def _ensure_http(self, api_config: MockAPI, http_attr: str) -> Union[HTTPRequest, HTTPResponse]:
         """
@@ -162,106 +337,95 @@ class FlaskCodeGenerator(BaseWebServerCodeGenerator):
             api_function_name = api_function_name.replace(var_in_url, new_name)
         return api_function_name
 
-    def _api_function_signature(self) -> str:
-        func_sig = ""
-        all_variable_params = list(map(lambda var: str(var).replace("var_", ""), self._variables_in_url.values()))
-        if all_variable_params:
-            func_sig = ", ".join(all_variable_params)
-        return func_sig
-
 
 class FastAPICodeGenerator(BaseWebServerCodeGenerator):
 
     _variables_in_url: Dict[str, str] = {}
 
-    def annotate_function(self, api_name: str, api_config: MockAPI) -> str:  # type: ignore[override]
+    # The signature of API function is generated by the parameters of mocked API
+    reregister_changed_api: bool = True
+
+    def annotate_function(  # type: ignore[override]
+        self,
+        api_name: str,
+        api_config: MockAPI,
+        request_process: ProcessFunction,
+        response_process: ProcessFunction,
+    ) -> Callable:
         self._variables_in_url.clear()
         self._variables_in_url = self._parse_variable_in_api(api_config.url)
 
-        import_fastapi = "from fastapi import Query, Request as FastAPIRequest\n"
-        import_typing = "from typing import List, Union\n"
-        import_typing_ext = "from typing_extensions import Annotated\n"
-        initial_global_server = """global SERVER\nSERVER = self\n"""
-        define_params_model = self._annotate_api_parameters_model_pycode(api_name, api_config)
-        define_function_for_api = self._define_api_function_pycode(api_name, api_config)
-        return (
-            import_fastapi
-            + import_typing
-            + import_typing_ext
-            + initial_global_server
-            + define_params_model
-            + define_function_for_api
+        fastapi = import_web_lib.fastapi()
+        http_request: HTTPRequest = api_config.http.request  # type: ignore[union-attr,assignment]
+        api_has_params = bool(http_request.parameters)
+        is_get_method = str(http_request.method).upper() == "GET"
+
+        # The signature of function for FastAPI to parse the variables in URL and the parameters
+        signature_params: List[inspect.Parameter] = [
+            inspect.Parameter(var_name, inspect.Parameter.KEYWORD_ONLY, annotation=str)
+            for var_name in self._api_function_variables()
+        ]
+        signature_params.append(
+            inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=fastapi.Request)
         )
-
-    def _define_api_function_pycode(self, api_name: str, api_config: MockAPI) -> str:  # type: ignore[override]
-        # The code implementation is different if the HTTP method is *GET* or not
-        if api_config.http.request.method.upper() != "GET":  # type: ignore[union-attr]
-            api_func_signature = ""
-            # Process the function signature if API has parameter settings
-            # TODO (FastAPI): Add the logic about variable in URL here
-            if api_config.http.request.parameters:  # type: ignore[union-attr]
-                parameter_class = self._api_name_as_camel_case(api_name)
-                api_func_signature = f"model: {parameter_class}, " if self._api_has_params else ""
-            # Combine all the string value as a valid Python code
-            api_variable_function_signature = self._api_function_signature()
-            function_signature = ", ".join(
-                filter(
-                    lambda fs: fs not in [None, ""],
-                    [api_variable_function_signature, f"{api_func_signature}request: FastAPIRequest"],
-                )
-            )
-            return f"""def {self._api_controller_name(api_name)}({function_signature}):
-                {self._run_request_process_pycode()}
-                {self._handle_request_process_result_pycode()}
-                {self._generate_response_pycode()}
-            """
-        else:
-            function_args = ""
-            assign_value_to_model = ""
-            instantiate_model = ""
-            # Process the function signature if API has parameter settings
-            for param in api_config.http.request.parameters:  # type: ignore[union-attr]
-                if param.value_type == "list":
-                    value_type = (
-                        "Annotated[Union[List[str], None], Query()] = None"
-                        if param.value_type == "list"
-                        else param.value_type
+        param_names: List[str] = []
+        if api_has_params:
+            if is_get_method:
+                # API with HTTP method *GET* doesn't need to use 'pydantic.BaseModel' object to process API parameters
+                for param in http_request.parameters:
+                    signature_params.append(self._query_parameter(param))
+                    param_names.append(param.name)
+            else:
+                # API without HTTP method *GET* needs to use 'pydantic.BaseModel' object to process API parameters
+                signature_params.append(
+                    inspect.Parameter(
+                        "model",
+                        inspect.Parameter.KEYWORD_ONLY,
+                        annotation=self._api_parameters_model(api_name, http_request),
                     )
-                    function_args += f", {param.name}: {value_type}"
-                else:
-                    if param.default is not None:
-                        if param.value_type == "str":
-                            default_value = f"'{param.default}'"
-                        else:
-                            default_value = f"{param.default}"
-                        function_args += f", {param.name}: {param.value_type} = {default_value}"
-                    else:
-                        function_args += f", {param.name}: {param.value_type} = None"
-                assign_value_to_model += f"""
-        setattr(model, '{param.name}', {param.name})
-                """
-            # Instantiate and assign data into objects as data model
-            if api_config.http.request.parameters:  # type: ignore[union-attr]
-                parameter_class = self._api_name_as_camel_case(api_name)
-                instantiate_model = f"""
-        class {parameter_class}: pass
-        model = {parameter_class}()
-                """
-            # Combine all the string value as a valid Python code
-            api_variable_function_signature = self._api_function_signature()
-            function_signature = ", ".join(
-                filter(
-                    lambda fs: fs not in [None, ""],
-                    [api_variable_function_signature, f"request: FastAPIRequest{function_args}"],
                 )
-            )
-            return f"""def {self._api_controller_name(api_name)}({function_signature}):
-                {instantiate_model}
-                {assign_value_to_model}
-                {self._run_request_process_pycode()}
-                {self._handle_request_process_result_pycode()}
-                {self._generate_response_pycode()}
-            """
+
+        api_function = self._generate_api_function(
+            self._api_controller_name(api_name), request_process=request_process, response_process=response_process
+        )
+
+        def _fastapi_api_function(**kwargs) -> Any:
+            request = kwargs["request"]
+            if not api_has_params:
+                return api_function(request=request)
+            if is_get_method:
+                model = SimpleNamespace(**{name: kwargs.get(name, None) for name in param_names})
+            else:
+                model = kwargs["model"]
+            return api_function(model=model, request=request)
+
+        _fastapi_api_function.__name__ = api_function.__name__
+        _fastapi_api_function.__qualname__ = api_function.__qualname__
+        _fastapi_api_function.__signature__ = inspect.Signature(signature_params)  # type: ignore[attr-defined]
+        return _fastapi_api_function
+
+    def _query_parameter(self, param: Any) -> inspect.Parameter:
+        if param.value_type == "list":
+            fastapi = import_web_lib.fastapi()
+            annotation = Optional[List[str]]
+            default = fastapi.Query(default=None)
+        else:
+            annotation = locate(param.value_type) if param.value_type else str
+            default = param.default
+        return inspect.Parameter(param.name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation, default=default)
+
+    def _api_parameters_model(self, api_name: str, http_request: HTTPRequest) -> type:
+        fields: Dict[str, Any] = {}
+        for prop in http_request.parameters:
+            data_type = locate(prop.value_type) if prop.value_type else str
+            if prop.default is not None:
+                fields[prop.name] = (data_type, prop.default)
+            elif prop.required:
+                fields[prop.name] = (data_type, ...)
+            else:
+                fields[prop.name] = (Optional[data_type], None)
+        assert create_model is not None, "It needs the library *pydantic* to generate the API function of FastAPI."
+        return create_model(self._api_name_as_camel_case(api_name), **fields)
 
     def _api_name_as_camel_case(self, api_name: str) -> str:
         new_api_name: List[str] = []
@@ -274,71 +438,79 @@ class FastAPICodeGenerator(BaseWebServerCodeGenerator):
         camel_case_api_name = "".join(map(lambda n: f"{n[0].upper()}{n[1:]}", new_api_name))
         return f"{camel_case_api_name}Parameter"
 
-    def _annotate_api_parameters_model_pycode(self, api_name: str, api_config: MockAPI) -> str:
-        define_parameters_model = ""
-        if api_config.http.request.parameters:  # type: ignore[union-attr]
-            # The code implementation is different if the HTTP method is *GET* or not
-            if api_config.http.request.method.upper() == "GET":  # type: ignore[union-attr]
-                # API with HTTP method *GET* doesn't need to use 'pydantic.BaseModel' object to process API parameters
-                self._api_has_params = True
-                return define_parameters_model
-            else:
-                # API without HTTP method *GET* needs to use 'pydantic.BaseModel' object to process API parameters
-                self._api_has_params = True
-                # Handle the class annotation
-                parameter_class = self._api_name_as_camel_case(api_name)
-                define_parameters_model = f"""from pydantic import BaseModel\nclass {parameter_class}(BaseModel):\n"""
-            # Handle the class's attributes
-            for prop in api_config.http.request.parameters:  # type: ignore[union-attr]
-                if prop.default is not None:
-                    if prop.value_type == "str":
-                        default_value = f"'{prop.default}'"
-                    else:
-                        default_value = f"{prop.default}"
-                    define_parameters_model += f"    {prop.name}: {prop.value_type} = {default_value}\n"
-                else:
-                    if prop.required:
-                        define_parameters_model += f"    {prop.name}: {prop.value_type}\n"
-                    else:
-                        define_parameters_model += f"    {prop.name}: {prop.value_type} = None\n"
-            return define_parameters_model
-        else:
-            self._api_has_params = False
-            return define_parameters_model
-
-    def _api_function_signature(self) -> str:
-        func_sig = ""
-        all_variable_params = list(map(lambda var: str(var).replace("var_", ""), self._variables_in_url.values()))
-        if all_variable_params:
-            func_sig = ", ".join(all_variable_params)
-        return func_sig
-
-    def _run_request_process_pycode(self, **kwargs) -> str:
-        return (
-            """
-        process_result = SERVER._request_process(model=model, request=request)
-        """
-            if self._api_has_params
-            else """
-        process_result = SERVER._request_process(request=request)
-        """
+    def _api_function_variables(self) -> List[str]:
+        return list(map(lambda var: str(var).replace("var_", ""), self._variables_in_url.values()))
+
+    def add_api(  # type: ignore[override]
+        self,
+        web_application: "fastapi.FastAPI",  # type: ignore[name-defined]
+        api_name: str,
+        api_config: Union[MockAPI, List[MockAPI]],
+        api_function: Callable,
+        base_url: Optional[str] = None,
+    ) -> None:
+        super().add_api(
+            web_application, api_name=api_name, api_config=api_config, api_function=api_function, base_url=base_url
         )
-
-    def _generate_response_pycode(self) -> str:
-        return """
-        return SERVER._response_process(request=request)
-        """
-
-    def add_api(self, api_name: str, api_config: Union[MockAPI, List[MockAPI]], base_url: Optional[str] = None) -> str:
-        super().add_api(api_name=api_name, api_config=api_config, base_url=base_url)
         # TODO: Should align the data structure and remove this checking
         if not isinstance(api_config, MockAPI):
             raise TypeError("")
-        http_method = api_config.http.request.method.lower()  # type: ignore[union-attr]
+        http_method = api_config.http.request.method.upper()  # type: ignore[union-attr]
         url_path = self.url_path(api_config.url, base_url)
-        return f"""self.web_application.{http_method}(
-                path="{url_path}")({self._api_controller_name(api_name)})
-            """
+        web_application.add_api_route(url_path, api_function, methods=[http_method])
+
+    def add_metrics_api(
+        self, web_application: "fastapi.FastAPI", url: str, metrics_function: Callable  # type: ignore[name-defined]
+    ) -> None:
+        web_application.add_api_route(url, metrics_function, methods=["GET"], include_in_schema=False)
+
+        # FastAPI validates the request by the model of parameters and responds status code *422* before calling the
+        # API function, so the invalid requests are recorded by the exception handler.
+        from fastapi.exception_handlers import request_validation_exception_handler
+        from fastapi.exceptions import RequestValidationError
+
+        observe_process = self.observe_process
+
+        async def _request_validation_exception_handler(request: "fastapi.Request", exc: Exception) -> Any:  # type: ignore[name-defined]
+            response = await request_validation_exception_handler(request, exc)  # type: ignore[arg-type]
+            if observe_process is not None:
+                observe_process({"request": request}, response, None)
+            return response
+
+        web_application.add_exception_handler(RequestValidationError, _request_validation_exception_handler)
+
+    def remove_api(self, web_application: "fastapi.FastAPI", url: str, http_method: str) -> None:  # type: ignore[name-defined]
+        routes = web_application.router.routes
+        remaining_routes = [
+            route
+            for route in routes
+            if not (
+                getattr(route, "path", None) == url and http_method.upper() in (getattr(route, "methods", None) or [])
+            )
+        ]
+        if len(remaining_routes) != len(routes):
+            # Replace the list of routes at once instead of modifying it while it may be iterated by routing requests
+            web_application.router.routes = remaining_routes
+            web_application.openapi_schema = None
+
+    def reorder_apis(self, web_application: "fastapi.FastAPI", apis: List[Tuple[str, str]]) -> None:  # type: ignore[name-defined]
+        # FastAPI matches the routes one by one in the order of registering, but the new route is always appended at
+        # the end
+        api_indexes = {api: index for index, api in enumerate(apis)}
+
+        def _route_index(route: Any) -> int:
+            path = getattr(route, "path", None)
+            # The routes which aren't mocked APIs, e.g., the document pages, keep being at the front
+            return max(
+                (api_indexes.get((path, method), -1) for method in getattr(route, "methods", None) or []), default=-1
+            )
+
+        routes = web_application.router.routes
+        # The sorting is stable, so the routes which have the same index keep their order
+        sorted_routes = sorted(routes, key=_route_index)
+        if sorted_routes != routes:
+            web_application.router.routes = sorted_routes
+            web_application.openapi_schema = None
 
     def url_path(self, url: Optional[str], base_url: Optional[str] = None) -> str:
         """
@@ -353,3 +525,37 @@ class FastAPICodeGenerator(BaseWebServerCodeGenerator):
         for var_in_url, new_name in self._variables_in_url.items():
             api_function_name = api_function_name.replace(var_in_url, new_name)
         return api_function_name
+
+
+class NativeCodeGenerator(BaseWebServerCodeGenerator):
+    """*The data processing for the native web application*
+
+    The native web application routes the requests by itself, so it doesn't need to register any function. It only
+    records the details of all mocked APIs.
+    """
+
+    def annotate_function(  # type: ignore[override]
+        self,
+        api_name: str,
+        api_config: List[MockAPI],
+        request_process: ProcessFunction,
+        response_process: ProcessFunction,
+    ) -> Callable:
+        return self._generate_api_function(
+            self._api_controller_name(api_name), request_process=request_process, response_process=response_process
+        )
+
+    def add_api(  # type: ignore[override]
+        self,
+        web_application: Any,
+        api_name: str,
+        api_config: Union[MockAPI, List[MockAPI]],
+        api_function: Callable,
+        base_url: Optional[str] = None,
+    ) -> None:
+        super().add_api(
+            web_application, api_name=api_name, api_config=api_config, api_function=api_function, base_url=base_url
+        )
+
+    def _api_controller_name(self, api_name: str) -> str:
+        return api_name
@@ -0,0 +1,357 @@
+"""*The metrics of mocked APIs*
+
+This module records how many requests each mocked API gets, the HTTP status codes of their responses, how many
+requests are invalid and the latencies of processing them. The metrics could be scraped from URL path
+*/__pymock__/metrics* in the text format of *Prometheus*.
+
+Each thread records the metrics in its own data without any lock, and the metrics of all threads are merged only when
+it's scraped. If the web application runs with multiple workers, e.g., by *gunicorn*, each worker saves its metrics
+into one file in the shared directory periodically, and the metrics of all workers are merged from the files.
+"""
+
+import atexit
+import bisect
+import glob
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# The environment variable which is whether it should record the metrics of mocked APIs or not.
+Metrics_Environment_Variable: str = "MockAPI_Metrics"
+# The environment variable which is the directory to share the metrics between all the workers.
+Metrics_Dir_Environment_Variable: str = "MockAPI_Metrics_Dir"
+
+# The URL path to scrape the metrics
+Metrics_URL_Path: str = "/__pymock__/metrics"
+Metrics_Content_Type: str = "text/plain; version=0.0.4; charset=utf-8"
+
+# The upper bounds (in seconds) of the buckets of latency histogram. Mocking one API usually takes less than 1 ms, so
+# the buckets are finer than the default ones of Prometheus.
+Latency_Buckets: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+# The HTTP status codes of the responses of invalid requests. It's *422* if the request is validated by *FastAPI*.
+Validation_Failure_Status_Codes: Tuple[int, ...] = (400, 422)
+
+_Metrics_File_Prefix: str = "metrics-"
+
+
+def metrics_is_enabled() -> bool:
+    """Check whether it should record the metrics of mocked APIs by environment variable. It's enabled if the
+    directory to share the metrics has been set.
+
+    Returns:
+        A boolean value.
+
+    """
+    if os.environ.get(Metrics_Dir_Environment_Variable, None):
+        return True
+    if Metrics_Environment_Variable not in os.environ:
+        return False
+    return os.environ[Metrics_Environment_Variable].lower() in ("1", "true")
+
+
+def reset_metrics_directory(directory: str) -> None:
+    """Remove the metrics which are saved by the workers of the previous running.
+
+    Args:
+        directory (str): The directory to share the metrics between all the workers.
+
+    Returns:
+        None
+
+    """
+    os.makedirs(directory, exist_ok=True)
+    for path in _metrics_files(directory):
+        os.remove(path)
+
+
+class _ThreadMetrics:
+    """*The metrics which are recorded by one thread*
+
+    Only the thread which owns it would modify it, so it doesn't need any lock.
+    """
+
+    __slots__ = ("requests", "validation_failures", "latencies")
+
+    def __init__(self):
+        # The data structure would be:
+        # {
+        #     (<API key>, <HTTP method>, <HTTP status code>): <the amount of requests>
+        # }
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        # The data structure would be:
+        # {
+        #     (<API key>, <HTTP method>): <the amount of invalid requests>
+        # }
+        self.validation_failures: Dict[Tuple[str, str], int] = {}
+        # The data structure would be:
+        # {
+        #     (<API key>, <HTTP method>): [<the amount in each bucket>, ..., <the amount over all buckets>, <sum>]
+        # }
+        self.latencies: Dict[Tuple[str, str], List[float]] = {}
+
+
+class MetricsSnapshot:
+    """*The metrics at one moment*
+
+    It could be merged with the other ones, and be converted to JSON or the text format of *Prometheus*.
+    """
+
+    def __init__(self):
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.validation_failures: Dict[Tuple[str, str], int] = {}
+        self.latencies: Dict[Tuple[str, str], List[float]] = {}
+
+    def merge(self, thread_metrics: Any) -> None:
+        # Copying the dict and list is atomic in CPython, so it could be read while the other thread is modifying it
+        for key, amount in thread_metrics.requests.copy().items():
+            self.requests[key] = self.requests.get(key, 0) + amount
+        for key, amount in thread_metrics.validation_failures.copy().items():
+            self.validation_failures[key] = self.validation_failures.get(key, 0) + amount
+        for key, latency in thread_metrics.latencies.copy().items():
+            merged_latency = self.latencies.setdefault(key, [0] * (len(Latency_Buckets) + 2))
+            for index, value in enumerate(list(latency)):
+                merged_latency[index] += value
+
+    def serialize(self) -> Dict[str, Any]:
+        # The data structure would be:
+        # {
+        #     "requests": [[<API key>, <HTTP method>, <HTTP status code>, <the amount of requests>]],
+        #     "validation_failures": [[<API key>, <HTTP method>, <the amount of invalid requests>]],
+        #     "latencies": [[<API key>, <HTTP method>, [<the amount in each bucket>, ..., <sum>]]],
+        # }
+        return {
+            "requests": [[*key, amount] for key, amount in self.requests.items()],
+            "validation_failures": [[*key, amount] for key, amount in self.validation_failures.items()],
+            "latencies": [[*key, latency] for key, latency in self.latencies.items()],
+        }
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any]) -> "MetricsSnapshot":
+        snapshot = cls()
+        snapshot.requests = {(api, method, status): amount for api, method, status, amount in data["requests"]}
+        snapshot.validation_failures = {(api, method): amount for api, method, amount in data["validation_failures"]}
+        snapshot.latencies = {(api, method): latency for api, method, latency in data["latencies"]}
+        return snapshot
+
+    def render(self) -> str:
+        """Convert the metrics to the text format of *Prometheus*.
+
+        Returns:
+            A string type value.
+
+        """
+        lines: List[str] = [
+            "# HELP pymock_requests_total The amount of requests of each mocked API.",
+            "# TYPE pymock_requests_total counter",
+        ]
+        for (api, method, status), amount in sorted(self.requests.items()):
+            lines.append(f"pymock_requests_total{_labels(api=api, method=method, status=str(status))} {amount}")
+        lines += [
+            "# HELP pymock_validation_failures_total The amount of requests which have invalid parameters.",
+            "# TYPE pymock_validation_failures_total counter",
+        ]
+        for (api, method), amount in sorted(self.validation_failures.items()):
+            lines.append(f"pymock_validation_failures_total{_labels(api=api, method=method)} {amount}")
+        lines += [
+            "# HELP pymock_request_duration_seconds The latency of processing the requests of each mocked API.",
+            "# TYPE pymock_request_duration_seconds histogram",
+        ]
+        for (api, method), latency in sorted(self.latencies.items()):
+            cumulative_amount = 0
+            for upper_bound, amount in zip((*map(repr, Latency_Buckets), "+Inf"), latency[:-1]):
+                cumulative_amount += int(amount)
+                lines.append(
+                    f"pymock_request_duration_seconds_bucket{_labels(api=api, method=method, le=upper_bound)} "
+                    f"{cumulative_amount}"
+                )
+            lines.append(f"pymock_request_duration_seconds_sum{_labels(api=api, method=method)} {latency[-1]!r}")
+            lines.append(f"pymock_request_duration_seconds_count{_labels(api=api, method=method)} {cumulative_amount}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """*The registry of metrics in one worker*
+
+    Record the metrics of each request without any lock. If it has the directory to share the metrics, it saves the
+    metrics of this worker into the directory every interval in a daemon thread, and it merges the metrics of all
+    workers from the directory when it's scraped.
+    """
+
+    def __init__(self, directory: Optional[str] = None, flush_interval: float = 1.0):
+        """
+
+        Args:
+            directory (Optional[str]): The directory to share the metrics between all the workers. It only records the
+                metrics of current worker if it's empty.
+            flush_interval (float): The interval (in seconds) of saving the metrics into the directory.
+        """
+        self._directory = directory
+        self._flush_interval = flush_interval
+        self._local = threading.local()
+        self._all_thread_metrics: List[_ThreadMetrics] = []
+        # The process ID of the worker which saves the metrics periodically. It would be different after forking.
+        self._flushing_pid: Optional[int] = None
+        self._flushing_lock = threading.Lock()
+        self._flush_at_exit: bool = False
+
+    @property
+    def directory(self) -> Optional[str]:
+        return self._directory
+
+    def observe(self, api: str, method: str, status_code: int, seconds: Optional[float]) -> None:
+        """Record one request.
+
+        Args:
+            api (str): The key of mocked API in configuration.
+            method (str): The HTTP method.
+            status_code (int): The HTTP status code of the response.
+            seconds (Optional[float]): The latency of processing the request. It isn't recorded into the histogram if
+                it's empty.
+
+        Returns:
+            None
+
+        """
+        thread_metrics = self._thread_metrics()
+        request_key = (api, method, status_code)
+        thread_metrics.requests[request_key] = thread_metrics.requests.get(request_key, 0) + 1
+        api_key = (api, method)
+        if status_code in Validation_Failure_Status_Codes:
+            thread_metrics.validation_failures[api_key] = thread_metrics.validation_failures.get(api_key, 0) + 1
+        if seconds is not None:
+            latency = thread_metrics.latencies.get(api_key, None)
+            if latency is None:
+                latency = thread_metrics.latencies[api_key] = [0] * (len(Latency_Buckets) + 2)
+            latency[bisect.bisect_left(Latency_Buckets, seconds)] += 1
+            latency[-1] += seconds
+
+        if self._directory is not None and self._flushing_pid != os.getpid():
+            self._start_flushing()
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Get the metrics of current worker.
+
+        Returns:
+            A **MetricsSnapshot** type object.
+
+        """
+        snapshot = MetricsSnapshot()
+        for thread_metrics in list(self._all_thread_metrics):
+            snapshot.merge(thread_metrics)
+        return snapshot
+
+    def collect(self) -> MetricsSnapshot:
+        """Get the metrics of all workers if it has the directory to share them, or only current worker's.
+
+        Returns:
+            A **MetricsSnapshot** type object.
+
+        """
+        if self._directory is None:
+            return self.snapshot()
+        self.flush()
+        snapshot = MetricsSnapshot()
+        for path in _metrics_files(self._directory):
+            try:
+                with open(path, "r", encoding="utf-8") as file_stream:
+                    snapshot.merge(MetricsSnapshot.deserialize(json.load(file_stream)))
+            except (OSError, ValueError, KeyError) as e:
+                # The worker may be removing it, or it's not saved by PyMock-Server
+                logger.debug(f"Skip the metrics file *{path}*: {e}")
+        return snapshot
+
+    def render(self) -> str:
+        """Get the metrics in the text format of *Prometheus*.
+
+        Returns:
+            A string type value.
+
+        """
+        return self.collect().render()
+
+    def flush(self) -> None:
+        """Save the metrics of current worker into the directory to share them.
+
+        Returns:
+            None
+
+        """
+        if self._directory is None:
+            return
+        os.makedirs(self._directory, exist_ok=True)
+        content = json.dumps(self.snapshot().serialize())
+        # Write into a temporary file first, so the other workers won't read an incomplete one
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file_stream:
+                file_stream.write(content)
+            os.replace(tmp_path, os.path.join(self._directory, f"{_Metrics_File_Prefix}{os.getpid()}.json"))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _thread_metrics(self) -> _ThreadMetrics:
+        thread_metrics = getattr(self._local, "metrics", None)
+        if thread_metrics is None:
+            thread_metrics = self._local.metrics = _ThreadMetrics()
+            # Appending an element into a list is atomic in CPython
+            self._all_thread_metrics.append(thread_metrics)
+        return thread_metrics
+
+    def _start_flushing(self) -> None:
+        pid = os.getpid()
+        with self._flushing_lock:
+            # The other thread may have started it when this thread is waiting for the lock
+            if self._flushing_pid == pid:
+                return
+            self._flushing_pid = pid
+            threading.Thread(target=self._flush_periodically, name="pymock-metrics-flusher", daemon=True).start()
+            # The exit handler is inherited by the forked worker, so it only needs to be registered once
+            if not self._flush_at_exit:
+                atexit.register(self._try_flush)
+                self._flush_at_exit = True
+
+    def _flush_periodically(self) -> None:
+        pid = os.getpid()
+        while self._flushing_pid == pid:
+            time.sleep(self._flush_interval)
+            self._try_flush()
+
+    def _try_flush(self) -> None:
+        try:
+            self.flush()
+        except OSError as e:
+            logger.warning(f"Cannot save the metrics into directory *{self._directory}*: {e}")
+
+
+def _metrics_files(directory: str) -> List[str]:
+    return glob.glob(os.path.join(directory, f"{_Metrics_File_Prefix}*.json"))
@@ -0,0 +1,189 @@
+"""*The native web application without any Python web framework*
+
+This module provides the web application which follows the server gateway interface directly. It only does what
+mocking APIs needs: matching the URL path, validating the request parameters and generating the response. So it
+doesn't have the overhead of routing, dependency injection or data model validation of Python web framework.
+"""
+
+import asyncio
+import os
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .request import RawRequest
+from .response import RawResponse, ResponseFile
+
+ASGIReceive = Callable[[], Awaitable[Dict[str, Any]]]
+ASGISend = Callable[[Dict[str, Any]], Awaitable[None]]
+WSGIStartResponse = Callable[[str, List[Tuple[str, str]]], Any]
+
+
+def _status_line(status_code: int) -> str:
+    try:
+        return f"{status_code} {HTTPStatus(status_code).phrase}"
+    except ValueError:
+        return f"{status_code} Unknown"
+
+
+# The status lines of WSGI for all the standard HTTP status codes so that it doesn't need to build them by each request
+_WSGI_Status_Lines: Dict[int, str] = {status.value: _status_line(status.value) for status in HTTPStatus}
+
+
+class ASGIApplication:
+    """*The raw ASGI (Asynchronous Server Gateway Interface) application*
+
+    It parses the ASGI scope and the request body as **RawRequest** and sends the **RawResponse** from the dispatch
+    function back. The dispatch function and the chunks of the streaming response are sync, so they would be run in
+    the thread pool of the event loop. Therefore, one slow request doesn't block the others.
+    """
+
+    def __init__(self, dispatch: Callable[[RawRequest], RawResponse]):
+        """
+
+        Args:
+            dispatch (Callable[[RawRequest], RawResponse]): The function which handles the request and returns the
+                response.
+        """
+        self._dispatch = dispatch
+
+    async def __call__(self, scope: Dict[str, Any], receive: ASGIReceive, send: ASGISend) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise NotImplementedError(f"It doesn't support the ASGI scope type *{scope['type']}*.")
+
+        request = RawRequest(
+            method=scope["method"],
+            path=scope["path"],
+            query_string=scope.get("query_string", b"").decode("latin-1"),
+            body=await self._read_body(receive),
+            content_type=self._find_header(scope, b"content-type") or "",
+            storage=scope,
+        )
+        loop = asyncio.get_running_loop()
+        # Handle the request in thread so that generating the response doesn't block the event loop
+        response = await loop.run_in_executor(None, self._dispatch, request)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in response.headers],
+            }
+        )
+        if request.method == "HEAD":
+            # The response of request with HTTP method *HEAD* only has the headers, e.g., *Content-Length* is still the
+            # size of the body which would be sent by *GET*
+            await send({"type": "http.response.body", "body": b""})
+            return
+        if isinstance(response.body, bytes):
+            await send({"type": "http.response.body", "body": response.body})
+            return
+        if isinstance(response.body, ResponseFile):
+            await self._send_file(scope, response.body, send)
+            return
+        chunks = iter(response.body)
+        while True:
+            # Generate the chunk in thread so that it doesn't block the event loop
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                break
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _send_file(self, scope: Dict[str, Any], response_file: ResponseFile, send: ASGISend) -> None:
+        extensions = scope.get("extensions", None) or {}
+        if "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": os.path.abspath(response_file.path)})
+            return
+        with open(response_file.path, "rb") as file_stream:
+            if "http.response.zerocopysend" in extensions:
+                # The server would send the file by the system call *sendfile*
+                await send({"type": "http.response.zerocopysend", "file": file_stream})
+                return
+            loop = asyncio.get_running_loop()
+            while True:
+                # Read the file in thread so that it doesn't block the event loop
+                chunk = await loop.run_in_executor(None, file_stream.read, response_file.block_size)
+                if not chunk:
+                    break
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _read_body(self, receive: ASGIReceive) -> bytes:
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        return body
+
+    async def _lifespan(self, receive: ASGIReceive, send: ASGISend) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def _find_header(self, scope: Dict[str, Any], name: bytes) -> Optional[str]:
+        for header_name, header_value in scope.get("headers", []):
+            if header_name == name:
+                return header_value.decode("latin-1")
+        return None
+
+
+class WSGIApplication:
+    """*The raw WSGI (Web Server Gateway Interface) application*
+
+    It parses the WSGI environ as **RawRequest** and returns the body of **RawResponse** from the dispatch function
+    back. It doesn't have any request context or global request proxy, so it's lightweight for the sync workers of
+    *gunicorn*.
+    """
+
+    def __init__(self, dispatch: Callable[[RawRequest], RawResponse]):
+        """
+
+        Args:
+            dispatch (Callable[[RawRequest], RawResponse]): The function which handles the request and returns the
+                response.
+        """
+        self._dispatch = dispatch
+
+    def __call__(self, environ: Dict[str, Any], start_response: WSGIStartResponse) -> Iterable[bytes]:
+        request = RawRequest(
+            method=environ["REQUEST_METHOD"],
+            # The value in WSGI environ is decoded by ISO-8859-1, so it needs to decode it again by UTF-8
+            path=environ.get("PATH_INFO", "").encode("latin-1").decode("utf-8", "replace"),
+            query_string=environ.get("QUERY_STRING", ""),
+            body=self._read_body(environ),
+            content_type=environ.get("CONTENT_TYPE", ""),
+            storage=environ,
+        )
+        response = self._dispatch(request)
+        status_line = _WSGI_Status_Lines.get(response.status_code, None) or _status_line(response.status_code)
+        start_response(status_line, response.headers)
+        if request.method == "HEAD":
+            # The response of request with HTTP method *HEAD* only has the headers
+            return []
+        if isinstance(response.body, bytes):
+            return [response.body]
+        if isinstance(response.body, ResponseFile):
+            # The server like *gunicorn* would send the file by the system call *sendfile*
+            file_wrapper = environ.get("wsgi.file_wrapper", None)
+            if file_wrapper is not None:
+                return file_wrapper(open(response.body.path, "rb"), response.body.block_size)
+            return response.body.chunks()
+        # The server would iterate the chunks and send them one by one
+        return response.body
+
+    def _read_body(self, environ: Dict[str, Any]) -> bytes:
+        try:
+            content_length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length <= 0:
+            return b""
+        return environ["wsgi.input"].read(content_length)
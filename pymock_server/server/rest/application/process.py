@@ -1,14 +1,28 @@
-import re
 from abc import ABC, ABCMeta, abstractmethod
-from pydoc import locate
-from typing import Any, Dict, List, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from pymock_server.model import MockAPI
-from pymock_server.model.api_config.apis import APIParameter, HTTPRequest, HTTPResponse
+from pymock_server.model.api_config.apis import HTTPRequest, HTTPResponse
 
 from .request import BaseCurrentRequest
-from .response import BaseResponse
+from .response import (
+    BaseResponse,
+    CacheValidators,
+    CompiledObjectResponses,
+    DeterministicResponses,
+)
 from .response import HTTPResponse as MockHTTPResponse
+from .response import (
+    PreRenderedResponse,
+    ResponseFile,
+    ResponsePools,
+    ResponseStream,
+    StaticResponseCache,
+    json_serializer,
+    request_seed,
+    serialize_response,
+)
+from .validator import RequestValidator
 
 
 class BaseMockAPIProcess(metaclass=ABCMeta):
@@ -36,6 +50,24 @@ class BaseHTTPProcess(BaseMockAPIProcess, ABC):
     @mock_api_details.setter
     def mock_api_details(self, details: Dict[str, Dict[str, MockAPI]]) -> None:
         self._mock_api_details = details
+        # Build the index of URL paths ahead so that it doesn't need to do it at the first request
+        self._request.route_index(details)
+
+    def current_api_config(self, **kwargs) -> Tuple[str, Optional[MockAPI]]:
+        """Find the setting of mocked API which handles the current request.
+
+        Returns:
+            The HTTP method of current request, and the setting of mocked API. The setting would be empty if there isn't
+            any mocked API for the request, e.g., it has been removed by reloading the configuration.
+
+        """
+        request = self._get_current_request(**kwargs)
+        http_method = self._get_current_request_http_method(request)
+        try:
+            api_details = self._find_detail_by_request(request)
+        except KeyError:
+            return http_method, None
+        return http_method, api_details.get(http_method, None)
 
     def _get_current_request(self, **kwargs) -> Any:
         return self._request.request_instance(**kwargs)
@@ -47,105 +79,186 @@ class BaseHTTPProcess(BaseMockAPIProcess, ABC):
     def _get_current_api_path(self, request: Any) -> str:
         return self._request.api_path(request=request)
 
+    def _get_current_request_path(self, request: Any) -> str:
+        return self._request.request_path(request=request)
+
     def _get_current_request_http_method(self, request: Any) -> str:
         return self._request.http_method(request=request)
 
+    def _get_current_request_header(self, request: Any, name: str) -> Optional[str]:
+        return self._request.header(request=request, name=name)
+
     def _find_detail_by_api_path(self, api_path: str) -> dict:
         return self._request.find_api_detail_by_api_path(self.mock_api_details, api_path)
 
+    def _find_detail_by_request(self, request: Any) -> dict:
+        return self._request.find_api_detail_by_request(self.mock_api_details, request)
+
 
 class HTTPRequestProcess(BaseHTTPProcess):
     def __init__(self, request: BaseCurrentRequest, response: BaseResponse):
         super().__init__(request=request)
         self._response: BaseResponse = response
+        # The data structure would be:
+        # {
+        #     <the object ID of HTTP request setting>: <the compiled validator>
+        # }
+        self._request_validators: Dict[int, RequestValidator] = {}
+
+    @BaseHTTPProcess.mock_api_details.setter  # type: ignore[attr-defined]
+    def mock_api_details(self, details: Dict[str, Dict[str, MockAPI]]) -> None:
+        is_new_details = details is not self._mock_api_details
+        BaseHTTPProcess.mock_api_details.fset(self, details)  # type: ignore[attr-defined]
+        if is_new_details:
+            # Compile the validators of all mocked APIs ahead so that it doesn't need to do it at the first request
+            request_validators: Dict[int, RequestValidator] = {}
+            for api_details in details.values():
+                for api_config in api_details.values():
+                    if api_config.http and api_config.http.request:
+                        http_request = api_config.http.request
+                        request_validators[id(http_request)] = self._get_request_validator(http_request)
+            # Drop the validators of the mocked APIs which have been removed or changed
+            self._request_validators = request_validators
 
     def process(self, **kwargs) -> Any:
         request = self._get_current_request(**kwargs)
+        try:
+            api_details = self._find_detail_by_request(request)
+        except KeyError:
+            # The mocked API has been removed by reloading the configuration, but the web framework still routes it
+            return self._generate_http_response(body="Not Found", status_code=404)
+        api_config = api_details.get(self._get_current_request_http_method(request), None)
+        if api_config is None:
+            return self._generate_http_response(body="Method Not Allowed", status_code=405)
         req_params = self._get_current_api_parameters(**kwargs)
 
-        api_params_info: List[APIParameter] = self._find_detail_by_api_path(self._get_current_api_path(request))[
-            self._get_current_request_http_method(request)
-        ].http.request.parameters
-        for param_info in api_params_info:
-            # Check the required parameter
-            one_req_param_value = req_params.get(param_info.name, None)
-            if param_info.required and (param_info.name not in req_params.keys() or one_req_param_value is None):
-                return self._generate_http_response(f"Miss required parameter *{param_info.name}*.", status_code=400)
-            if one_req_param_value:
-                # Check the data type of parameter
-                assert param_info.value_type, "It must cannot miss the value type value of each parameters."
-                value_py_data_type: type = locate(param_info.value_type)  # type: ignore[assignment]
-                if value_py_data_type in [int, float, "big_decimal"] and self._request.int_type_value_is_string:
-                    # For the Flask part. It would always be string type of each API parameter.
-                    if re.search(r"\d{1,128}", str(one_req_param_value)) is None:
-                        return self._generate_http_response(
-                            f"The type of data from Font-End site (*{type(one_req_param_value)}*) is different with the "
-                            f"implementation of Back-End site (*{value_py_data_type}*).",
-                            status_code=400,
-                        )
-                else:
-                    if param_info.value_type and not isinstance(one_req_param_value, value_py_data_type):
-                        return self._generate_http_response(
-                            f"The type of data from Font-End site (*{type(one_req_param_value)}*) is different with the "
-                            f"implementation of Back-End site (*{value_py_data_type}*).",
-                            status_code=400,
-                        )
-                # Check the element of list
-                if param_info.value_type and value_py_data_type is list and param_info.items:
-                    assert isinstance(one_req_param_value, list)
-                    for e in one_req_param_value:
-                        if len(param_info.items) > 1:
-                            assert isinstance(e, dict), "The data type of item object must be *dict* type."
-                            for item in param_info.items:
-                                if item.required is True and item.name not in e.keys():
-                                    return self._generate_http_response(
-                                        f"Miss required parameter *{param_info.name}.{item.name}*.",
-                                        status_code=400,
-                                    )
-                                if item.value_type and not isinstance(e[item.name], locate(item.value_type)):  # type: ignore[arg-type]
-                                    return self._generate_http_response(
-                                        f"The type of data from Font-End site (*{type(one_req_param_value)}*) is different "
-                                        f"with the implementation of Back-End site (*{value_py_data_type}*).",
-                                        status_code=400,
-                                    )
-                        elif len(param_info.items) == 1:
-                            assert isinstance(
-                                e, (str, int, float)
-                            ), "The data type of item object must be *str*, *int* or *float* type."
-                            item = param_info.items[0]
-                            if item.value_type and not isinstance(e, locate(item.value_type)):  # type: ignore[arg-type]
-                                return self._generate_http_response(
-                                    f"The type of data from Font-End site (*{type(one_req_param_value)}*) is different "
-                                    f"with the implementation of Back-End site (*{value_py_data_type}*).",
-                                    status_code=400,
-                                )
-                # Check the data format of parameter
-                assert param_info.value_type, "Miss required property *value_type*."
-                assert isinstance(value_py_data_type, type)
-                value_format = param_info.value_format
-                if param_info.value_format and not value_format.value_format_is_match(  # type: ignore[union-attr]
-                    data_type=value_py_data_type, value=one_req_param_value
-                ):
-                    return self._generate_http_response(
-                        f"The format of data from Font-End site (param: '{param_info.name}', "
-                        f"value: '{one_req_param_value}') is incorrect. Its format should be "
-                        f"{param_info.value_format.expect_format_log_msg(data_type=value_py_data_type)}.",
-                        status_code=400,
-                    )
+        http_request: HTTPRequest = api_config.http.request
+        error_msg = self._get_request_validator(http_request).validate(req_params)
+        if error_msg is not None:
+            return self._generate_http_response(error_msg, status_code=400)
         return self._generate_http_response(body="OK.", status_code=200)
 
+    def generate_pre_rendered(self, response: PreRenderedResponse) -> Any:
+        """Wrap the pre-rendered bytes as the response object of web framework, e.g., the metrics of mocked APIs."""
+        return self._response.generate_pre_rendered(response)
+
+    def _get_request_validator(self, http_request: HTTPRequest) -> RequestValidator:
+        validator = self._request_validators.get(id(http_request), None)
+        if validator is None or not validator.is_compiled_from(http_request.parameters):
+            validator = RequestValidator(
+                http_request.parameters, int_type_value_is_string=self._request.int_type_value_is_string
+            )
+            self._request_validators[id(http_request)] = validator
+        return validator
+
     def _generate_http_response(self, body: str, status_code: int) -> Any:
         return self._response.generate(body=body, status_code=status_code)
 
 
 class HTTPResponseProcess(BaseHTTPProcess):
-    def process(self, **kwargs) -> Union[str, dict]:
+    def __init__(self, request: BaseCurrentRequest, response: Optional[BaseResponse] = None):
+        super().__init__(request=request)
+        self._response: Optional[BaseResponse] = response
+        str_as_json = response.str_as_json if response else False
+        self._json_serializer = json_serializer(sort_keys=response.sort_keys if response else False)
+        self._compiled_responses = CompiledObjectResponses()
+        self._static_response_cache = StaticResponseCache(str_as_json=str_as_json, serializer=self._json_serializer)
+        self._response_pools = ResponsePools(
+            str_as_json=str_as_json, compiled=self._compiled_responses, serializer=self._json_serializer
+        )
+        self._deterministic_responses = DeterministicResponses(
+            str_as_json=str_as_json, compiled=self._compiled_responses
+        )
+
+    @property
+    def response_pools(self) -> ResponsePools:
+        """:obj:`ResponsePools`: Property with only getter for the pools of pre-generated HTTP responses."""
+        return self._response_pools
+
+    @property
+    def deterministic_responses(self) -> DeterministicResponses:
+        """:obj:`DeterministicResponses`: Property with only getter for the cache of deterministic HTTP responses."""
+        return self._deterministic_responses
+
+    @BaseHTTPProcess.mock_api_details.setter  # type: ignore[attr-defined]
+    def mock_api_details(self, details: Dict[str, Dict[str, MockAPI]]) -> None:
+        is_new_details = details is not self._mock_api_details
+        BaseHTTPProcess.mock_api_details.fset(self, details)  # type: ignore[attr-defined]
+        if is_new_details and self._response is not None:
+            # Generate the responses in pools ahead so that each request only needs to pick one of them
+            http_responses: List[HTTPResponse] = []
+            for api_path, api_details in details.items():
+                for http_method, api_config in api_details.items():
+                    if api_config.http and api_config.http.response:
+                        self._response_pools.add(name=f"{http_method} {api_path}", data=api_config.http.response)
+                        http_responses.append(api_config.http.response)
+            # Drop the rendered responses of the mocked APIs which have been removed or changed
+            self._compiled_responses.retain(http_responses)
+            self._static_response_cache.retain(http_responses)
+            self._response_pools.retain(http_responses)
+            self._deterministic_responses.retain(http_responses)
+
+    def process(self, **kwargs) -> Union[str, dict, Any]:
         request = self._get_current_request(**kwargs)
-        api_params_info: MockAPI = self._find_detail_by_api_path(self._get_current_api_path(request))[
-            self._get_current_request_http_method(request)
-        ]
+        http_method = self._get_current_request_http_method(request)
+        api_params_info: MockAPI = self._find_detail_by_request(request)[http_method]
         response = cast(HTTPResponse, self._ensure_http(api_params_info, "response"))
-        return MockHTTPResponse.generate(data=response)
+        if self._response is not None:
+            if response.passthrough:
+                # Send the file content without reading it into Python
+                response_file = ResponseFile(response.path)
+                if self._is_not_modified(request, http_method, response_file.validators):
+                    return self._response.generate_not_modified(response_file.validators)
+                return self._response.generate_file(response_file)
+            if response.stream:
+                # Generate and send the large response chunk by chunk so that it doesn't need to keep all of it in memory
+                return self._response.generate_stream(
+                    ResponseStream(
+                        MockHTTPResponse.generate_stream(
+                            data=response, serializer=self._json_serializer, compiled=self._compiled_responses
+                        )
+                    )
+                )
+            if response.deterministic:
+                # The same request always gets the same response, so it could be rendered once by the seed of request
+                seed = request_seed(
+                    api_path=self._get_current_request_path(request),
+                    http_method=http_method,
+                    parameters=self._get_current_api_parameters(**kwargs),
+                )
+                pre_rendered_response: Optional[PreRenderedResponse] = self._deterministic_responses.get(
+                    response, seed=seed, serializer=self._json_serializer
+                )
+            else:
+                # The static response could be rendered once and send the bytes directly
+                pre_rendered_response = self._static_response_cache.get(response) or self._response_pools.get(response)
+            if pre_rendered_response is not None:
+                if pre_rendered_response.variants:
+                    pre_rendered_response = pre_rendered_response.select_encoding(
+                        self._get_current_request_header(request, "Accept-Encoding")
+                    )
+                validators = pre_rendered_response.validators
+                if validators is not None and self._is_not_modified(request, http_method, validators):
+                    return self._response.generate_not_modified(validators)
+                return self._response.generate_pre_rendered(pre_rendered_response)
+            # Serialize the generated response by the JSON serializer here instead of the web framework
+            return self._response.generate_pre_rendered(
+                serialize_response(
+                    MockHTTPResponse.generate(data=response, compiled=self._compiled_responses),
+                    str_as_json=self._response.str_as_json,
+                    serializer=self._json_serializer,
+                )
+            )
+        return MockHTTPResponse.generate(data=response, compiled=self._compiled_responses)
+
+    def _is_not_modified(self, request: Any, http_method: str, validators: CacheValidators) -> bool:
+        # Only the safe HTTP methods could be responded with status code *304*
+        if http_method not in ("GET", "HEAD"):
+            return False
+        return validators.is_not_modified(
+            if_none_match=self._get_current_request_header(request, "If-None-Match"),
+            if_modified_since=self._get_current_request_header(request, "If-Modified-Since"),
+        )
 
     def _ensure_http(self, api_config: MockAPI, http_attr: str) -> Union[HTTPRequest, HTTPResponse]:
         assert api_config.http and getattr(
@@ -1,15 +1,23 @@
 import json
-import re
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs
 
 from pymock_server._utils import import_web_lib
 from pymock_server.model.api_config.apis import APIParameter
 
+from .route import RouteIndex, RouteMatch
+
 
 class BaseCurrentRequest(metaclass=ABCMeta):
     int_type_value_is_string: bool = False
 
+    # The key to keep the matched mocked API in the storage of current request
+    _route_match_key: str = "pymock_server.route_match"
+
+    def __init__(self):
+        self._route_index: Optional[RouteIndex] = None
+
     @abstractmethod
     def request_instance(self, **kwargs) -> Any:
         pass
@@ -18,17 +26,98 @@ class BaseCurrentRequest(metaclass=ABCMeta):
     def api_parameters(self, **kwargs) -> dict:
         pass
 
+    def route_index(self, mock_api_details: Dict[str, dict]) -> RouteIndex:
+        """Get the index of mocked APIs' URL paths. It only builds the index again if the details of mocked APIs has
+        been changed.
+
+        Args:
+            mock_api_details (Dict[str, dict]): The details of all mocked APIs.
+
+        Returns:
+            A **RouteIndex** type object.
+
+        """
+        if self._route_index is None or not self._route_index.is_indexing(mock_api_details):
+            self._route_index = RouteIndex(mock_api_details)
+        return self._route_index
+
     def find_api_detail_by_api_path(self, mock_api_details: Dict[str, dict], api_path: str) -> dict:
-        return mock_api_details[api_path]
+        route_match = self.route_index(mock_api_details).find(api_path)
+        if route_match is None:
+            raise KeyError(f"Cannot find any mocked API with path *{api_path}*.")
+        return route_match.api_details
+
+    def find_api_detail_by_request(self, mock_api_details: Dict[str, dict], request: Any) -> dict:
+        """Find the details of mocked API by current request. The matched result would be kept in current request, so
+        it won't search again in the later processing, e.g., generating HTTP response, of the same request.
+
+        Args:
+            mock_api_details (Dict[str, dict]): The details of all mocked APIs.
+            request (Any): The request object of the web framework.
+
+        Returns:
+            The mapping of HTTP method to the mocked API.
+
+        """
+        storage = self._request_storage(request)
+        if isinstance(storage, dict):
+            route_match: Optional[RouteMatch] = storage.get(self._route_match_key, None)
+            if route_match is not None:
+                return route_match.api_details
+
+        api_path = self.api_path(request)
+        route_match = self.route_index(mock_api_details).find(api_path)
+        if route_match is None:
+            raise KeyError(f"Cannot find any mocked API with path *{api_path}*.")
+        if isinstance(storage, dict):
+            storage[self._route_match_key] = route_match
+        return route_match.api_details
+
+    def _request_storage(self, request: Any) -> Optional[dict]:
+        """The storage which lives with current request. In default, it doesn't have any storage.
+
+        Args:
+            request (Any): The request object of the web framework.
+
+        Returns:
+            A dict type value or ``None``.
+
+        """
+        return None
 
     @abstractmethod
     def api_path(self, request: Any) -> str:
         pass
 
+    def request_path(self, request: Any) -> str:
+        """Get the actual URL path of current request, i.e., the variables in URL have been replaced by their values.
+
+        Args:
+            request (Any): The request object of the web framework.
+
+        Returns:
+            A string type value.
+
+        """
+        return self.api_path(request)
+
     @abstractmethod
     def http_method(self, request: Any) -> str:
         pass
 
+    @abstractmethod
+    def header(self, request: Any, name: str) -> Optional[str]:
+        """Get the value of the HTTP header in current request.
+
+        Args:
+            request (Any): The request object of the web framework.
+            name (str): The name of HTTP header. It's case-insensitive.
+
+        Returns:
+            The value of the HTTP header. It returns ``None`` if current request doesn't have it.
+
+        """
+
 
 class FlaskRequest(BaseCurrentRequest):
     # For Flask, the API parameter always be string even it's integer.
@@ -44,9 +133,9 @@ class FlaskRequest(BaseCurrentRequest):
             mock_api_details = kwargs.get("mock_api_details", None)
             if not mock_api_details:
                 raise ValueError("Missing necessary argument *mock_api_details*.")
-            mock_api_params_info: List[APIParameter] = self.find_api_detail_by_api_path(
-                mock_api_details, self.api_path(request)
-            )[self.http_method(request)].http.request.parameters
+            mock_api_params_info: List[APIParameter] = self.find_api_detail_by_request(mock_api_details, request)[
+                self.http_method(request)
+            ].http.request.parameters
             iterable_mock_api_params = list(filter(lambda p: p.value_type == "list", mock_api_params_info))
 
             # Get iterable parameters (only for HTTP method *GET*)
@@ -66,28 +155,8 @@ class FlaskRequest(BaseCurrentRequest):
             return handled_api_params
         return api_params
 
-    def find_api_detail_by_api_path(self, mock_api_details: Dict[str, dict], api_path: str) -> dict:
-
-        def _find_mapping_api(api: str):
-            simple_api_path_parts = re.sub(r"<\w{1,32}>", "<>", api).split("<>")
-            search_regular = r""
-            for api_part in simple_api_path_parts:
-                search_regular += re.escape(api_part) + r"\w{1,256}"
-            return re.search(search_regular, api_path)
-
-        try:
-            return mock_api_details[api_path]
-        except KeyError:
-            api_has_variable = list(filter(lambda p: re.search(r"<\w{1,32}>", p) is not None, mock_api_details.keys()))
-            mapping_variable_api = list(filter(lambda api: _find_mapping_api(api) is not None, api_has_variable))
-            if len(mapping_variable_api) > 1:
-                mapping_variable_api = list(
-                    filter(
-                        lambda api: len(api) == max(map(lambda a: len(a), mapping_variable_api)), mapping_variable_api
-                    )
-                )
-            assert len(mapping_variable_api) == 1
-            return mock_api_details[mapping_variable_api[0]]
+    def _request_storage(self, request: "flask.Request") -> Optional[dict]:  # type: ignore[name-defined]
+        return getattr(request, "environ", None)
 
     def api_path(self, request: "flask.Request") -> str:  # type: ignore[name-defined]
         return request.path
@@ -95,6 +164,9 @@ class FlaskRequest(BaseCurrentRequest):
     def http_method(self, request: "flask.Request") -> str:  # type: ignore[name-defined]
         return request.method.upper()
 
+    def header(self, request: "flask.Request", name: str) -> Optional[str]:  # type: ignore[name-defined]
+        return request.headers.get(name, None)
+
 
 class FastAPIRequest(BaseCurrentRequest):
     def request_instance(self, **kwargs) -> "fastapi.Request":  # type: ignore[name-defined]
@@ -104,7 +176,7 @@ class FastAPIRequest(BaseCurrentRequest):
         mock_api_details = kwargs.get("mock_api_details", None)
         if not mock_api_details:
             raise ValueError("Missing necessary argument *mock_api_details*.")
-        api_params_info: List[APIParameter] = mock_api_details[self.api_path(kwargs["request"])][
+        api_params_info: List[APIParameter] = self.find_api_detail_by_request(mock_api_details, kwargs["request"])[
             self.http_method(kwargs["request"])
         ].http.request.parameters
         api_param_names = list(map(lambda e: e.name, api_params_info))
@@ -115,8 +187,134 @@ class FastAPIRequest(BaseCurrentRequest):
                     api_param[param_name] = getattr(kwargs["model"], param_name)
         return api_param
 
+    def _request_storage(self, request: "fastapi.Request") -> Optional[dict]:  # type: ignore[name-defined]
+        return getattr(request, "scope", None)
+
     def api_path(self, request: "fastapi.Request") -> str:  # type: ignore[name-defined]
         return request.scope["root_path"] + request.scope["route"].path
 
+    def request_path(self, request: "fastapi.Request") -> str:  # type: ignore[name-defined]
+        return request.scope["root_path"] + request.scope["path"]
+
     def http_method(self, request: "fastapi.Request") -> str:  # type: ignore[name-defined]
         return request.method.upper()
+
+    def header(self, request: "fastapi.Request", name: str) -> Optional[str]:  # type: ignore[name-defined]
+        return request.headers.get(name, None)
+
+
+class RawRequest:
+    """*The HTTP request which is parsed from the server gateway interface directly*
+
+    It's the request object of the native web application which doesn't depend on any Python web framework. It only
+    keeps the values which mocking APIs needs and parses the query string or the body until someone needs it.
+    """
+
+    __slots__ = ("method", "path", "query_string", "body", "content_type", "storage", "_query")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        query_string: str = "",
+        body: bytes = b"",
+        content_type: str = "",
+        storage: Optional[dict] = None,
+    ):
+        """
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The URL path.
+            query_string (str): The query string in URL without the leading question mark.
+            body (bytes): The body of the request.
+            content_type (str): The value of header *Content-Type*.
+            storage (dict): The storage which lives with this request, e.g., the scope of ASGI or the environ of WSGI.
+        """
+        self.method: str = method.upper()
+        self.path: str = path
+        self.query_string: str = query_string
+        self.body: bytes = body
+        self.content_type: str = content_type
+        self.storage: dict = storage if storage is not None else {}
+        self._query: Optional[Dict[str, List[str]]] = None
+
+    @property
+    def query(self) -> Dict[str, List[str]]:
+        """:obj:`dict`: Property with only getter for all the values of each query parameter."""
+        if self._query is None:
+            self._query = parse_qs(self.query_string, keep_blank_values=True)
+        return self._query
+
+    def header(self, name: str) -> Optional[str]:
+        """Get the value of the HTTP header from the storage, i.e., the scope of ASGI or the environ of WSGI.
+
+        Args:
+            name (str): The name of HTTP header. It's case-insensitive.
+
+        Returns:
+            The value of the HTTP header. It returns ``None`` if this request doesn't have it.
+
+        """
+        asgi_headers = self.storage.get("headers", None)
+        if asgi_headers is not None:
+            header_name = name.lower().encode("latin-1")
+            for k, v in asgi_headers:
+                if k == header_name:
+                    return v.decode("latin-1")
+            return None
+        return self.storage.get("HTTP_" + name.upper().replace("-", "_"), None)
+
+    def form(self) -> Dict[str, str]:
+        """Parse the body as the form data if its content type is *application/x-www-form-urlencoded*.
+
+        Returns:
+            A dict type value which maps the parameter name to its first value. It's empty if the body isn't form data.
+
+        """
+        if not self.body or not self.content_type.startswith("application/x-www-form-urlencoded"):
+            return {}
+        return {k: v[0] for k, v in parse_qs(self.body.decode("utf-8"), keep_blank_values=True).items()}
+
+
+class NativeRequest(BaseCurrentRequest):
+    # Same as Flask, the parameters in query string always be string even it's integer.
+    int_type_value_is_string: bool = True
+
+    def request_instance(self, **kwargs) -> RawRequest:
+        return kwargs.get("request")  # type: ignore[return-value]
+
+    def api_parameters(self, **kwargs) -> dict:
+        request: RawRequest = kwargs["request"]
+        if request.method == "GET":
+            mock_api_details = kwargs.get("mock_api_details", None)
+            if not mock_api_details:
+                raise ValueError("Missing necessary argument *mock_api_details*.")
+            mock_api_params_info: List[APIParameter] = self.find_api_detail_by_request(mock_api_details, request)[
+                self.http_method(request)
+            ].http.request.parameters
+            api_params: dict = {k: v[0] for k, v in request.query.items()}
+            # Get iterable parameters (only for HTTP method *GET*)
+            for mock_api_param in mock_api_params_info:
+                if mock_api_param.value_type == "list":
+                    api_params[mock_api_param.name] = request.query.get(mock_api_param.name, [])
+            return api_params
+
+        form = request.form()
+        if form:
+            return form
+        if request.body:
+            return json.loads(request.body.decode("utf-8"))
+        return {}
+
+    def _request_storage(self, request: RawRequest) -> Optional[dict]:
+        return request.storage
+
+    def api_path(self, request: RawRequest) -> str:
+        return request.path
+
+    def http_method(self, request: RawRequest) -> str:
+        return request.method
+
+    def header(self, request: RawRequest, name: str) -> Optional[str]:
+        return request.header(name)
@@ -1,36 +1,644 @@
+import copy
+import gzip
+import hashlib
 import json
+import logging
+import mimetypes
 import os
+import random
+import threading
+import time
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 from decimal import Decimal
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache, partial
 from pydoc import locate
-from typing import Any, Callable, List, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-from pymock_server._utils import import_web_lib
-from pymock_server.exceptions import FileFormatNotSupport
-from pymock_server.model.api_config import ResponseProperty
+from pymock_server._utils import import_compression_lib, import_json_lib, import_web_lib
+from pymock_server._utils.random import seeded_random
+from pymock_server.exceptions import FileFormatNotSupport, InvalidJSONBackend
+from pymock_server.model.api_config import IteratorItem, ResponseProperty
 from pymock_server.model.api_config.apis import (
     HTTPResponse as MockAPIHTTPResponseConfig,
 )
+from pymock_server.model.api_config.apis import ResponsePoolOrder, ResponsePoolRefill
 from pymock_server.model.api_config.apis.response_strategy import ResponseStrategy
 
+logger = logging.getLogger(__name__)
+
+
+# The environment variable which is the name of JSON library to serialize the HTTP response, e.g., *orjson*.
+JSON_Backend_Environment_Variable: str = "MockAPI_JSON_Backend"
+
+
+def _json_default(value: Any) -> Any:
+    # The random value with data type *big_decimal* is *Decimal* type object, convert it to string so that it doesn't
+    # lose any precision
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class BaseJSONSerializer(metaclass=ABCMeta):
+    """*Base class for serializing the HTTP response value as JSON format bytes*"""
+
+    name: str = ""
+
+    def __init__(self, sort_keys: bool = False):
+        """
+
+        Args:
+            sort_keys (bool): Whether it should sort the keys of the dict type value or not.
+        """
+        self.sort_keys = sort_keys
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Serialize the value as JSON format bytes.
+
+        Args:
+            value (Any): The HTTP response value, e.g., the dict type value.
+
+        Returns:
+            The JSON format bytes which is encoded by UTF-8 and doesn't have any whitespace between separators.
+
+        """
+
+
+class StdlibJSONSerializer(BaseJSONSerializer):
+    """*Serialize JSON by the built-in library *json**"""
+
+    name: str = "stdlib"
+
+    def __init__(self, sort_keys: bool = False):
+        super().__init__(sort_keys=sort_keys)
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys, default=_json_default
+        )
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value).encode("utf-8")
+
+
+class OrjsonSerializer(BaseJSONSerializer):
+    """*Serialize JSON by the library *orjson**
+
+    It only supports the integer in 64-bit range, so the value which has the larger integer would be serialized by
+    the built-in library *json*.
+    """
+
+    name: str = "orjson"
+
+    def __init__(self, sort_keys: bool = False):
+        super().__init__(sort_keys=sort_keys)
+        orjson = import_json_lib.orjson()
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        self._dumps = partial(orjson.dumps, default=_json_default, option=option)
+        self._fallback = StdlibJSONSerializer(sort_keys=sort_keys)
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return self._dumps(value)
+        except TypeError:
+            # Integer exceeds 64-bit range
+            return self._fallback.dumps(value)
+
+
+class UjsonSerializer(BaseJSONSerializer):
+    """*Serialize JSON by the library *ujson**
+
+    It only supports the integer in 64-bit range, so the value which has the larger integer would be serialized by
+    the built-in library *json*.
+    """
+
+    name: str = "ujson"
+
+    def __init__(self, sort_keys: bool = False):
+        super().__init__(sort_keys=sort_keys)
+        self._dumps = partial(
+            import_json_lib.ujson().dumps,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            sort_keys=sort_keys,
+            default=_json_default,
+        )
+        self._fallback = StdlibJSONSerializer(sort_keys=sort_keys)
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return self._dumps(value).encode("utf-8")
+        except (TypeError, OverflowError):
+            # Integer is too big to convert
+            return self._fallback.dumps(value)
+
+
+_JSON_Serializer_Types: Dict[str, Type[BaseJSONSerializer]] = {
+    StdlibJSONSerializer.name: StdlibJSONSerializer,
+    OrjsonSerializer.name: OrjsonSerializer,
+    UjsonSerializer.name: UjsonSerializer,
+}
+_JSON_Serializers: Dict[Tuple[str, bool], BaseJSONSerializer] = {}
+
+
+def json_serializer(backend: Optional[str] = None, sort_keys: bool = False) -> BaseJSONSerializer:
+    """Get the JSON serializer by the name of JSON library.
+
+    Args:
+        backend (Optional[str]): The name of JSON library, i.e., *auto*, *stdlib*, *orjson* or *ujson*. It would use
+            the value of environment variable *MockAPI_JSON_Backend* if it's empty. And it would use the fastest one
+            it could import in current runtime environment if the value is *auto*.
+        sort_keys (bool): Whether the serializer should sort the keys of the dict type value or not.
+
+    Returns:
+        A **BaseJSONSerializer** type object.
+
+    """
+    backend = (backend or os.environ.get(JSON_Backend_Environment_Variable, None) or "auto").lower()
+    serializer = _JSON_Serializers.get((backend, sort_keys), None)
+    if serializer is not None:
+        return serializer
+
+    if backend == "auto":
+        if import_json_lib.orjson_ready():
+            serializer = json_serializer(OrjsonSerializer.name, sort_keys=sort_keys)
+        elif import_json_lib.ujson_ready():
+            serializer = json_serializer(UjsonSerializer.name, sort_keys=sort_keys)
+        else:
+            serializer = json_serializer(StdlibJSONSerializer.name, sort_keys=sort_keys)
+    else:
+        serializer_type = _JSON_Serializer_Types.get(backend, None)
+        if serializer_type is None:
+            raise InvalidJSONBackend
+        serializer = serializer_type(sort_keys=sort_keys)
+    _JSON_Serializers[(backend, sort_keys)] = serializer
+    return serializer
+
+
+class CacheValidators:
+    """*The validators of HTTP conditional request for the response which doesn't change*
+
+    The client could send the validators back by the headers *If-None-Match* and *If-Modified-Since*, and it would get
+    the response with status code *304* without any body if the response hasn't been changed. The header
+    *Last-Modified* is only sent if the response has the real modified time of its source, i.e., the file. The others
+    only rely on the header *ETag*.
+    """
+
+    __slots__ = ("etag", "last_modified", "headers")
+
+    def __init__(self, etag: str, last_modified: Optional[float] = None):
+        """
+
+        Args:
+            etag (str): The value of header *ETag* which includes the double quotes.
+            last_modified (Optional[float]): The timestamp when the source of response was modified last time. It
+                doesn't have header *Last-Modified* if it's empty.
+        """
+        self.etag: str = etag
+        # The HTTP date only has the precision in seconds
+        self.last_modified: Optional[int] = int(last_modified) if last_modified is not None else None
+        self.headers: Dict[str, str] = {"ETag": etag}
+        if self.last_modified is not None:
+            self.headers["Last-Modified"] = formatdate(self.last_modified, usegmt=True)
+
+    @classmethod
+    def from_body(cls, body: bytes, last_modified: Optional[float] = None) -> "CacheValidators":
+        """Generate the strong validator by the hash value of the response body.
+
+        Args:
+            body (bytes): The response body.
+            last_modified (Optional[float]): The timestamp when the source of response was modified last time, e.g.,
+                the modified time of the file. It doesn't have header *Last-Modified* if it's empty.
+
+        Returns:
+            A **CacheValidators** type object.
+
+        """
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return cls(etag=etag, last_modified=last_modified)
+
+    @classmethod
+    def from_file_stat(cls, stat_result: os.stat_result) -> "CacheValidators":
+        """Generate the validator by the modified time and size of file so that it doesn't need to read the file.
+
+        Args:
+            stat_result (os.stat_result): The status of the file.
+
+        Returns:
+            A **CacheValidators** type object.
+
+        """
+        return cls(etag=f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"', last_modified=stat_result.st_mtime)
+
+    def is_not_modified(self, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+        """Check whether the response which the client has is still the same as this one or not.
+
+        Args:
+            if_none_match (Optional[str]): The value of header *If-None-Match* of the request.
+            if_modified_since (Optional[str]): The value of header *If-Modified-Since* of the request. It would be
+                ignored if the request has header *If-None-Match* or the response doesn't have header *Last-Modified*.
+
+        Returns:
+            It returns ``True`` if it could respond with status code *304*.
+
+        """
+        if if_none_match is not None:
+            for etag in if_none_match.split(","):
+                etag = etag.strip()
+                # The weak comparison, i.e., the weak validator *W/"xxx"* also matches
+                if etag == "*" or etag == self.etag or etag == f"W/{self.etag}":
+                    return True
+            return False
+        if if_modified_since and self.last_modified is not None:
+            try:
+                modified_since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            return self.last_modified <= modified_since
+        return False
+
+
+def _gzip_compress(body: bytes) -> bytes:
+    # Fix the modified time in header so that the compressed bytes always are the same
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def _brotli_compress(body: bytes) -> bytes:
+    return import_compression_lib.brotli().compress(body, quality=11)
+
+
+def content_encoders() -> Dict[str, Callable[[bytes], bytes]]:
+    """Get the compression functions of all the content codings it could use in current runtime environment.
+
+    Returns:
+        A dict type value which maps the content coding, e.g., *gzip*, to its compression function. The order of it is
+        the preference of the content codings.
+
+    """
+    encoders: Dict[str, Callable[[bytes], bytes]] = {}
+    if import_compression_lib.brotli_ready():
+        encoders["br"] = _brotli_compress
+    encoders["gzip"] = _gzip_compress
+    return encoders
+
+
+@lru_cache(maxsize=256)
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    # The result is cached, so don't modify it
+    qualities: Dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name] = quality
+    return qualities
+
+
+class PreRenderedResponse:
+    """*The HTTP response which has been serialized as bytes and is ready to send*
+
+    It may have the pre-compressed variants of itself with different content codings, e.g., *gzip* or *br*.
+    """
+
+    __slots__ = ("body", "content_type", "content_length", "content_encoding", "validators", "variants", "_header_list")
+
+    def __init__(
+        self,
+        body: bytes,
+        content_type: str,
+        validators: Optional[CacheValidators] = None,
+        content_encoding: Optional[str] = None,
+    ):
+        self.body: bytes = body
+        self.content_type: str = content_type
+        self.content_length: int = len(body)
+        self.content_encoding: Optional[str] = content_encoding
+        self.validators: Optional[CacheValidators] = validators
+        # The data structure would be:
+        # {
+        #     <content coding>: <the compressed response>
+        # }
+        self.variants: Dict[str, "PreRenderedResponse"] = {}
+        self._header_list: Optional[List[Tuple[str, str]]] = None
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """:obj:`dict`: Property with only getter for the HTTP headers of this response."""
+        headers = {"Content-Type": self.content_type, "Content-Length": str(self.content_length)}
+        if self.content_encoding is not None:
+            headers["Content-Encoding"] = self.content_encoding
+        if self.content_encoding is not None or self.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if self.validators is not None:
+            headers.update(self.validators.headers)
+        return headers
+
+    def header_list(self) -> List[Tuple[str, str]]:
+        """Get the HTTP headers of this response as the list of name and value pairs. It's built at the first time, so
+        the response should not be changed after being sent.
+
+        Returns:
+            A new list of the HTTP headers.
+
+        """
+        if self._header_list is None:
+            self._header_list = list(self.headers.items())
+        return list(self._header_list)
+
+    def compress(self, encoders: Dict[str, Callable[[bytes], bytes]]) -> None:
+        """Generate the compressed variants of this response. The variant would be dropped if it's not smaller.
+
+        Args:
+            encoders (Dict[str, Callable[[bytes], bytes]]): The compression functions of the content codings.
+
+        """
+        variants: Dict[str, PreRenderedResponse] = {}
+        for content_encoding, compress in encoders.items():
+            body = compress(self.body)
+            if len(body) >= self.content_length:
+                continue
+            validators = None
+            if self.validators is not None:
+                # Each representation needs its own strong validator
+                validators = CacheValidators.from_body(body, last_modified=self.validators.last_modified)
+            variants[content_encoding] = PreRenderedResponse(
+                body, content_type=self.content_type, validators=validators, content_encoding=content_encoding
+            )
+        self.variants = variants
+
+    def select_encoding(self, accept_encoding: Optional[str]) -> "PreRenderedResponse":
+        """Select the variant by the content codings which the client accepts.
+
+        Args:
+            accept_encoding (Optional[str]): The value of header *Accept-Encoding* of the request.
+
+        Returns:
+            The compressed variant which the client prefers. It returns itself if the client doesn't accept any of them.
+
+        """
+        if not self.variants or not accept_encoding:
+            return self
+        qualities = _parse_accept_encoding(accept_encoding)
+        wildcard_quality = qualities.get("*", 0.0)
+        selected, selected_quality = self, 0.0
+        # The variants are in the preference order, so it only changes the selection if the quality is higher
+        for content_encoding, variant in self.variants.items():
+            quality = qualities.get(content_encoding, wildcard_quality)
+            if quality > selected_quality:
+                selected, selected_quality = variant, quality
+        return selected
+
+
+def serialize_response(
+    value: Any, str_as_json: bool = False, serializer: Optional[BaseJSONSerializer] = None
+) -> PreRenderedResponse:
+    """Serialize the HTTP response value as bytes.
+
+    Args:
+        value (Any): The HTTP response value, e.g., the string or dict type value.
+        str_as_json (bool): Whether it should serialize the string type value as JSON format string or not.
+        serializer (Optional[BaseJSONSerializer]): The JSON serializer. It would use the one which be set by the
+            environment variable if it's empty.
+
+    Returns:
+        A **PreRenderedResponse** type object.
+
+    """
+    if isinstance(value, str) and not str_as_json:
+        return PreRenderedResponse(body=value.encode("utf-8"), content_type="text/html; charset=utf-8")
+    return PreRenderedResponse(
+        body=(serializer or json_serializer()).dumps(value),
+        content_type="application/json",
+    )
+
+
+class ResponseStream:
+    """*The HTTP response which would be serialized and sent chunk by chunk*"""
+
+    __slots__ = ("chunks", "content_type")
+
+    def __init__(self, chunks: Iterator[bytes], content_type: str = "application/json"):
+        self.chunks: Iterator[bytes] = chunks
+        self.content_type: str = content_type
+
+
+@lru_cache(maxsize=1024)
+def _guess_content_type(path: str) -> str:
+    content_type, _ = mimetypes.guess_type(path)
+    if content_type is None:
+        return "application/octet-stream"
+    if content_type.startswith("text/"):
+        return f"{content_type}; charset=utf-8"
+    return content_type
+
+
+class ResponseFile:
+    """*The HTTP response which is the content of a file and would be sent without any change*
+
+    The web server could send the file by the system call *sendfile* so that the content doesn't need to be copied
+    into Python.
+    """
+
+    __slots__ = ("path", "content_type", "content_length", "validators")
+
+    # The size of each chunk (in bytes) when it needs to read and send the file by itself.
+    block_size: int = 64 * 1024
+
+    def __init__(self, path: str):
+        """
+
+        Args:
+            path (str): The file path.
+
+        Raises:
+            FileNotFoundError: The file doesn't exist.
+        """
+        stat_result = os.stat(path)
+        self.path: str = path
+        self.content_type: str = _guess_content_type(path)
+        self.content_length: int = stat_result.st_size
+        self.validators: CacheValidators = CacheValidators.from_file_stat(stat_result)
+
+    def chunks(self) -> Iterator[bytes]:
+        """Read the file chunk by chunk.
+
+        Returns:
+            An iterator of bytes. It would close the file after reading all of it or being closed.
+
+        """
+        with open(self.path, "rb") as file_stream:
+            while True:
+                chunk = file_stream.read(self.block_size)
+                if not chunk:
+                    return
+                yield chunk
+
+
+class RawResponse:
+    """*The HTTP response which would be sent by the server gateway interface directly*
+
+    The body would be an iterable object of bytes if the response is sent as stream, or a **ResponseFile** type object
+    if the response is the content of a file.
+    """
+
+    __slots__ = ("status_code", "headers", "body")
+
+    def __init__(
+        self,
+        body: Union[bytes, Iterable[bytes], ResponseFile],
+        status_code: int = 200,
+        headers: Optional[List[Tuple[str, str]]] = None,
+    ):
+        self.body: Union[bytes, Iterable[bytes], ResponseFile] = body
+        self.status_code: int = status_code
+        self.headers: List[Tuple[str, str]] = headers if headers is not None else []
+
 
 class BaseResponse(metaclass=ABCMeta):
+    # Whether the web framework would serialize the string type response as JSON format string or not.
+    str_as_json: bool = False
+    sort_keys: bool = False
+
     @abstractmethod
     def generate(self, body: str, status_code: int) -> Any:
         """
         [Data processing for both HTTP request] (May also could provide this feature for HTTP response part?)
         """
 
+    @abstractmethod
+    def generate_pre_rendered(self, response: PreRenderedResponse, status_code: int = 200) -> Any:
+        """
+        [Data processing for HTTP response] Wrap the pre-rendered bytes as the response object of web framework.
+        """
+
+    @abstractmethod
+    def generate_stream(self, response: ResponseStream, status_code: int = 200) -> Any:
+        """
+        [Data processing for HTTP response] Wrap the chunks of bytes as the streaming response object of web framework.
+        """
+
+    @abstractmethod
+    def generate_file(self, response: ResponseFile, status_code: int = 200) -> Any:
+        """
+        [Data processing for HTTP response] Wrap the file as the response object of web framework which sends the file
+        content directly.
+        """
+
+    @abstractmethod
+    def generate_not_modified(self, validators: CacheValidators) -> Any:
+        """
+        [Data processing for HTTP response] Generate the response with status code *304* without any body.
+        """
+
 
 class FlaskResponse(BaseResponse):
+    # For Flask, it would sort the keys of the dict type return value (the default setting *app.json.sort_keys*).
+    sort_keys: bool = True
+
     def generate(self, body: str, status_code: int) -> "flask.Response":  # type: ignore
         return import_web_lib.flask().Response(body, status=status_code)
 
+    def generate_pre_rendered(self, response: PreRenderedResponse, status_code: int = 200) -> "flask.Response":  # type: ignore
+        return import_web_lib.flask().Response(response.body, status=status_code, headers=response.headers)
+
+    def generate_stream(self, response: ResponseStream, status_code: int = 200) -> "flask.Response":  # type: ignore
+        return import_web_lib.flask().Response(response.chunks, status=status_code, content_type=response.content_type)
+
+    def generate_file(self, response: ResponseFile, status_code: int = 200) -> "flask.Response":  # type: ignore
+        # It would use *wsgi.file_wrapper* of the WSGI server, e.g., *gunicorn* sends it by *sendfile*
+        file_response = import_web_lib.flask().send_file(
+            os.path.abspath(response.path), mimetype=response.content_type, conditional=False, etag=False
+        )
+        file_response.status_code = status_code
+        file_response.headers.update(response.validators.headers)
+        return file_response
+
+    def generate_not_modified(self, validators: CacheValidators) -> "flask.Response":  # type: ignore
+        return import_web_lib.flask().Response(status=304, headers=validators.headers)
+
 
 class FastAPIResponse(BaseResponse):
+    # For FastAPI, it would serialize the string type return value as JSON format string.
+    str_as_json: bool = True
+
     def generate(self, body: str, status_code: int) -> "fastapi.Response":  # type: ignore
         return import_web_lib.fastapi().Response(body, status_code=status_code)
 
+    def generate_pre_rendered(self, response: PreRenderedResponse, status_code: int = 200) -> "fastapi.Response":  # type: ignore
+        return import_web_lib.fastapi().Response(response.body, status_code=status_code, headers=response.headers)
+
+    def generate_stream(self, response: ResponseStream, status_code: int = 200) -> "fastapi.Response":  # type: ignore
+        return import_web_lib.fastapi().responses.StreamingResponse(
+            response.chunks,
+            status_code=status_code,
+            media_type=response.content_type,
+        )
+
+    def generate_file(self, response: ResponseFile, status_code: int = 200) -> "fastapi.Response":  # type: ignore
+        return import_web_lib.fastapi().responses.FileResponse(
+            response.path,
+            status_code=status_code,
+            headers=response.validators.headers,
+            media_type=response.content_type,
+        )
+
+    def generate_not_modified(self, validators: CacheValidators) -> "fastapi.Response":  # type: ignore
+        return import_web_lib.fastapi().Response(status_code=304, headers=validators.headers)
+
+
+class NativeResponse(BaseResponse):
+    def generate(self, body: str, status_code: int) -> RawResponse:
+        return self.generate_pre_rendered(serialize_response(body), status_code=status_code)
+
+    def generate_pre_rendered(self, response: PreRenderedResponse, status_code: int = 200) -> RawResponse:
+        return RawResponse(response.body, status_code=status_code, headers=response.header_list())
+
+    def generate_stream(self, response: ResponseStream, status_code: int = 200) -> RawResponse:
+        # It doesn't have the header *Content-Length* so that the server would send it with chunked transfer encoding
+        return RawResponse(response.chunks, status_code=status_code, headers=[("Content-Type", response.content_type)])
+
+    def generate_file(self, response: ResponseFile, status_code: int = 200) -> RawResponse:
+        return RawResponse(
+            response,
+            status_code=status_code,
+            headers=[
+                ("Content-Type", response.content_type),
+                ("Content-Length", str(response.content_length)),
+                *response.validators.headers.items(),
+            ],
+        )
+
+    def generate_not_modified(self, validators: CacheValidators) -> RawResponse:
+        return RawResponse(b"", status_code=304, headers=list(validators.headers.items()))
+
+    def generate_content(self, value: Union[str, dict, Any], status_code: int = 200) -> RawResponse:
+        """
+        [Data processing for HTTP response] Serialize the generated response value as the native response object.
+        """
+        if isinstance(value, RawResponse):
+            return value
+        return self.generate_pre_rendered(serialize_response(value, str_as_json=self.str_as_json), status_code)
+
 
 class HTTPResponse:
     """*Data processing of HTTP response for mocked HTTP application*
@@ -40,8 +648,20 @@ class HTTPResponse:
 
     valid_file_format: List[str] = ["json"]
 
+    _default_value_by_data_type: Dict[type, str] = {
+        str: "random string",
+        int: "random integer",
+        float: "random big decimal",
+        bool: "random boolean",
+    }
+
+    # The maximum amount of elements it generates and serializes in one chunk when sending the response as stream.
+    stream_chunk_size: int = 256
+
     @classmethod
-    def generate(cls, data: MockAPIHTTPResponseConfig) -> Union[str, dict]:
+    def generate(
+        cls, data: MockAPIHTTPResponseConfig, compiled: Optional["CompiledObjectResponses"] = None
+    ) -> Union[str, dict]:
         """Generate the HTTP response by the data. It would try to parse it as JSON format data in the beginning. If it
         works, it returns the handled data which is JSON format. But if it gets fail, it would change to check whether
         it is a file path or not. If it is, it would search and read the file to get the content value and parse it to
@@ -49,6 +669,8 @@ class HTTPResponse:
 
         Args:
             data (str): The HTTP response value.
+            compiled (Optional[CompiledObjectResponses]): The compiled generators of the HTTP responses with strategy
+                *object*. It would compile the properties setting every time if it's empty.
 
         Returns:
             A string type or dict type value.
@@ -59,10 +681,92 @@ class HTTPResponse:
         elif data.strategy is ResponseStrategy.FILE:
             return cls._generate_response_by_file(data)
         elif data.strategy is ResponseStrategy.OBJECT:
-            return cls._generate_response_from_object(data)
+            return cls._generate_response_from_object(data, compiled)
         else:
             raise TypeError(f"Cannot identify invalid HTTP response strategy *{data.strategy}*.")
 
+    @classmethod
+    def generate_stream(
+        cls,
+        data: MockAPIHTTPResponseConfig,
+        serializer: Optional[BaseJSONSerializer] = None,
+        compiled: Optional["CompiledObjectResponses"] = None,
+    ) -> Iterator[bytes]:
+        """Generate the HTTP response with strategy *object* as JSON format bytes chunk by chunk. The elements of the
+        list type properties would be generated and serialized one chunk by one chunk lazily, so the memory usage
+        doesn't grow with the size of the list.
+
+        Args:
+            data (MockAPIHTTPResponseConfig): The HTTP response setting.
+            serializer (Optional[BaseJSONSerializer]): The JSON serializer. It would use the one which be set by the
+                environment variable if it's empty.
+            compiled (Optional[CompiledObjectResponses]): The compiled generators of the HTTP responses with strategy
+                *object*. It would compile the properties setting every time if it's empty.
+
+        Returns:
+            An iterator of bytes. The bytes it yields could be composed as one JSON format value.
+
+        """
+        if data.strategy is not ResponseStrategy.OBJECT:
+            raise TypeError(f"Cannot generate the HTTP response with strategy *{data.strategy}* as stream.")
+        if compiled is not None:
+            generate_stream = compiled.stream_generator(data)
+        else:
+            generate_stream = cls._compile_object_response_stream(data.properties)
+        return generate_stream(serializer or json_serializer())
+
+    @classmethod
+    def _compile_object_response_stream(
+        cls, response_properties: List[ResponseProperty]
+    ) -> Callable[[BaseJSONSerializer], Iterator[bytes]]:
+        # Only the list type property in the first layer would be streamed. The others are small enough to generate
+        # them entirely.
+        compiled_properties = tuple(
+            (
+                v.name,
+                cls._compile_list_chunks(v) if locate(v.value_type) is list else None,  # type: ignore[arg-type]
+                cls._compile_property(v),
+            )
+            for v in response_properties
+        )
+        sorted_properties = tuple(sorted(compiled_properties, key=lambda p: p[0]))
+
+        def _generate_stream(serializer: BaseJSONSerializer) -> Iterator[bytes]:
+            dumps = serializer.dumps
+            separator = b"{"
+            for name, generate_chunks, generate in sorted_properties if serializer.sort_keys else compiled_properties:
+                key = separator + dumps(name) + b":"
+                separator = b","
+                if generate_chunks is None:
+                    yield key + dumps(generate())
+                    continue
+                yield key + b"["
+                element_separator = b""
+                for elements in generate_chunks():
+                    if elements:
+                        # Remove the square brackets of the serialized list and join it with the previous chunk
+                        yield element_separator + dumps(elements)[1:-1]
+                        element_separator = b","
+                yield b"]"
+            yield b"{}" if separator == b"{" else b"}"
+
+        return _generate_stream
+
+    @classmethod
+    def _compile_list_chunks(cls, v: Union[ResponseProperty, IteratorItem]) -> Callable[[], Iterator[list]]:
+        generate_elements = cls._compile_collection_elements(v)
+        size = v.value_format.size if v.value_format is not None else None
+        chunk_size = cls.stream_chunk_size
+
+        def _generate_chunks() -> Iterator[list]:
+            amount = size.generate_random_int() if size is not None else 1
+            while amount > 0:
+                chunk_amount = min(amount, chunk_size)
+                amount -= chunk_amount
+                yield generate_elements(chunk_amount)
+
+        return _generate_chunks
+
     @classmethod
     def _generate_response_as_string(cls, data: MockAPIHTTPResponseConfig) -> str:
         response_value = data.value
@@ -74,79 +778,136 @@ class HTTPResponse:
     @classmethod
     def _generate_response_by_file(cls, data: MockAPIHTTPResponseConfig) -> Union[str, dict]:
         file_path = data.path
-        if cls._is_file(path=file_path):
+        if cls._is_file(path=file_path, passthrough=data.passthrough):
+            if data.passthrough:
+                return cls._read_raw_file(path=file_path)
             return cls._read_file(path=file_path)
         # FIXME: Here would be invalid value as file path. How to handle it?
         return data.path
 
     @classmethod
-    def _generate_response_from_object(cls, data: MockAPIHTTPResponseConfig) -> dict:
-
-        def _initial_resp_details(v: ResponseProperty) -> Union[str, int, Decimal, bool, list, dict]:
-
-            def _process_collection_data(
-                _v: ResponseProperty,
-                init_data: Union[list, dict],
-                insert_callback: Callable[[Union[list, dict], dict], Union[list, dict]],
-            ) -> Union[list, dict]:
-                _value = init_data
-                _item = {}  # type: ignore[var-annotated]
-                for i in _v.items or []:
-                    if len(_v.items) == 1 and i.name == "":  # type: ignore[arg-type]
-                        _item = _initial_resp_details(i)  # type: ignore[arg-type, assignment]
-                    else:
-                        _item[i.name] = _initial_resp_details(i)  # type: ignore[arg-type]
-                _value = insert_callback(_value, _item)
-                return _value
-
-            assert v.value_type
-            data_type = locate(v.value_type)
-            assert isinstance(data_type, type)
-            if locate(v.value_type) is str:
-                value = v.generate_value_by_format(data_type=data_type, default="random string")
-            elif locate(v.value_type) is int:
-                value = v.generate_value_by_format(data_type=data_type, default="random integer")
-            elif locate(v.value_type) is float:
-                value = v.generate_value_by_format(data_type=data_type, default="random big decimal")
-            elif locate(v.value_type) is bool:
-                value = v.generate_value_by_format(data_type=data_type, default="random boolean")
-            elif locate(v.value_type) is list:
-
-                def _insert_callback(init_value: list, item: dict) -> list:
-                    init_value.append(item)
-                    return init_value
-
-                list_size = 1
-                if v.value_format is not None and v.value_format.size is not None:
-                    list_size = v.value_format.size.generate_random_int()
-                value = []  # type: ignore[assignment]
-                for _ in range(list_size):
-                    one_element_value = _process_collection_data(v, init_data=[], insert_callback=_insert_callback)  # type: ignore[arg-type]
-                    value.extend(one_element_value)  # type: ignore[union-attr]
-            elif locate(v.value_type) is dict:
-
-                def _insert_callback(init_value: dict, item: dict) -> dict:  # type: ignore[misc]
-                    init_value.update(item)
-                    return init_value
-
-                value = _process_collection_data(v, init_data={}, insert_callback=_insert_callback)  # type: ignore[arg-type,assignment]
-            else:
-                raise NotImplementedError
-            return value
+    def _generate_response_from_object(
+        cls, data: MockAPIHTTPResponseConfig, compiled: Optional["CompiledObjectResponses"] = None
+    ) -> dict:
+        if compiled is not None:
+            return compiled.generator(data)()
+        return cls._compile_object_response(data.properties)()
 
-        response_properties = data.properties
-        response = {}
-        for v in response_properties:
-            # TODO: Handle the value with key *format*
-            response[v.name] = _initial_resp_details(v)
-        return response
+    @classmethod
+    def _compile_object_response(cls, response_properties: List[ResponseProperty]) -> Callable[[], dict]:
+        # TODO: Handle the value with key *format*
+        compiled_properties = tuple((v.name, cls._compile_property(v)) for v in response_properties)
+
+        def _generate_response() -> dict:
+            return {name: generate() for name, generate in compiled_properties}
+
+        return _generate_response
 
     @classmethod
-    def _is_file(cls, path: str) -> bool:
+    def _compile_property(cls, v: Union[ResponseProperty, IteratorItem]) -> Callable[[], Any]:
+        assert v.value_type
+        data_type = locate(v.value_type)
+        assert isinstance(data_type, type)
+
+        if data_type in cls._default_value_by_data_type:
+            value_format = v.value_format
+            if value_format is None:
+                default = cls._default_value_by_data_type[data_type]
+                return lambda: default
+            return partial(value_format.generate_value, data_type=data_type)
+
+        elif data_type is list:
+            generate_elements = cls._compile_collection_elements(v)
+            size = v.value_format.size if v.value_format is not None else None
+            if size is None:
+                return lambda: generate_elements(1)
+
+            def _generate_list() -> list:
+                return generate_elements(size.generate_random_int())
+
+            return _generate_list
+
+        elif data_type is dict:
+            generate_element = cls._compile_collection_element(v)
+            if cls._has_only_one_anonymous_item(v):
+
+                def _generate_dict() -> dict:
+                    value: dict = {}
+                    value.update(generate_element())
+                    return value
+
+                return _generate_dict
+            # The element of named items always is a new dict object
+            return generate_element
+
+        else:
+            raise NotImplementedError
+
+    @classmethod
+    def _compile_collection_element(cls, v: Union[ResponseProperty, IteratorItem]) -> Callable[[], Any]:
+        if cls._has_only_one_anonymous_item(v):
+            return cls._compile_property(v.items[0])  # type: ignore[index]
+
+        compiled_items = tuple((i.name, cls._compile_property(i)) for i in v.items or [])
+
+        def _generate_element() -> dict:
+            return {name: generate() for name, generate in compiled_items}
+
+        return _generate_element
+
+    @classmethod
+    def _compile_collection_elements(cls, v: Union[ResponseProperty, IteratorItem]) -> Callable[[int], list]:
+        """Compile the element setting of the collection into the function which generates multiple elements in one
+        batch. So the list with thousands elements doesn't need to generate each value one by one.
+
+        Args:
+            v (Union[ResponseProperty, IteratorItem]): The setting of the collection type property.
+
+        Returns:
+            A callable object which receives the amount of elements and returns a list of elements.
+
+        """
+        if cls._has_only_one_anonymous_item(v):
+            return cls._compile_property_batch(v.items[0])  # type: ignore[index]
+
+        compiled_items = tuple((i.name, cls._compile_property_batch(i)) for i in v.items or [])
+        item_names = tuple(name for name, _ in compiled_items)
+
+        def _generate_elements(amount: int) -> list:
+            columns = [generate(amount) for _, generate in compiled_items]
+            return [dict(zip(item_names, row)) for row in zip(*columns)] if columns else [{} for _ in range(amount)]
+
+        return _generate_elements
+
+    @classmethod
+    def _compile_property_batch(cls, v: Union[ResponseProperty, IteratorItem]) -> Callable[[int], list]:
+        assert v.value_type
+        data_type = locate(v.value_type)
+        assert isinstance(data_type, type)
+
+        if data_type in cls._default_value_by_data_type:
+            value_format = v.value_format
+            if value_format is None:
+                default = cls._default_value_by_data_type[data_type]
+                return lambda amount: [default] * amount
+            return partial(value_format.generate_values, data_type)
+
+        # The nested collections still be generated one by one, but each of them would be filled in batch
+        generate = cls._compile_property(v)
+        return lambda amount: [generate() for _ in range(amount)]
+
+    @classmethod
+    def _has_only_one_anonymous_item(cls, v: Union[ResponseProperty, IteratorItem]) -> bool:
+        return len(v.items or []) == 1 and v.items[0].name == ""  # type: ignore[index]
+
+    @classmethod
+    def _is_file(cls, path: str, passthrough: bool = False) -> bool:
         """Check whether the data is a file path or not.
 
         Args:
             path (str): A string type value.
+            passthrough (bool): Whether the file content would be sent directly or not. It accepts any file format if
+                it's ``True`` because it doesn't need to parse the file.
 
         Returns:
             It returns ``True`` if it is a file path and the file exists, nor it returns ``False``.
@@ -155,7 +916,7 @@ class HTTPResponse:
         path_sep_by_dot = path.split(".")
         path_sep_by_dot_without_non = list(filter(lambda e: e, path_sep_by_dot))
         if len(path_sep_by_dot_without_non) > 1:
-            support = path_sep_by_dot[-1] in cls.valid_file_format
+            support = passthrough or path_sep_by_dot[-1] in cls.valid_file_format
             if not support:
                 raise FileFormatNotSupport(cls.valid_file_format)
             return support
@@ -180,3 +941,559 @@ class HTTPResponse:
         with open(path, "r", encoding="utf-8") as file_stream:
             data = file_stream.read()
         return json.loads(data)
+
+    @classmethod
+    def _read_raw_file(cls, path: str) -> str:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"The target configuration file {path} doesn't exist.")
+        with open(path, "r", encoding="utf-8") as file_stream:
+            return file_stream.read()
+
+
+class CompiledObjectResponses:
+    """*The compiled generators of the HTTP responses with strategy *object**
+
+    The properties setting of the HTTP response with strategy *object* would be compiled as the generator functions
+    once, and each request only calls them to generate the response. Each of the processes keeps its own compiled
+    generators, and it drops the ones of the mocked APIs which have been removed or changed when reloading the
+    configuration.
+    """
+
+    def __init__(self):
+        # The data structure would be:
+        # {
+        #     <the object ID of HTTP response setting>: _CompiledObjectResponse
+        # }
+        self._entries: Dict[int, "_CompiledObjectResponse"] = {}
+
+    @property
+    def size(self) -> int:
+        """:obj:`int`: Property with only getter for the current amount of compiled HTTP responses."""
+        return len(self._entries)
+
+    def generator(self, data: MockAPIHTTPResponseConfig) -> Callable[[], dict]:
+        """Get the generator function of the HTTP response. It would compile the properties setting at the first time
+        and reuse it until the properties setting is replaced.
+
+        Args:
+            data (MockAPIHTTPResponseConfig): The HTTP response setting.
+
+        Returns:
+            A callable object which generates the HTTP response.
+
+        """
+        entry = self._entry(data)
+        if entry.generate is None:
+            entry.generate = HTTPResponse._compile_object_response(data.properties)
+        return entry.generate
+
+    def stream_generator(self, data: MockAPIHTTPResponseConfig) -> Callable[[BaseJSONSerializer], Iterator[bytes]]:
+        """Get the generator function of the HTTP response which is sent as stream. It would compile the properties
+        setting at the first time and reuse it until the properties setting is replaced.
+
+        Args:
+            data (MockAPIHTTPResponseConfig): The HTTP response setting.
+
+        Returns:
+            A callable object which generates the HTTP response as JSON format bytes chunk by chunk.
+
+        """
+        entry = self._entry(data)
+        if entry.generate_stream is None:
+            entry.generate_stream = HTTPResponse._compile_object_response_stream(data.properties)
+        return entry.generate_stream
+
+    def retain(self, data: Iterable[MockAPIHTTPResponseConfig]) -> None:
+        """Only keep the compiled generators of the specific settings, e.g., the ones which still exist after reloading
+        the configuration. The one whose properties setting has been modified in place would also be dropped.
+
+        Args:
+            data (Iterable[MockAPIHTTPResponseConfig]): The HTTP response settings.
+
+        """
+        alive = {id(d): d for d in data}
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if alive.get(key, None) is entry.data and entry.is_valid(entry.data)
+        }
+
+    def clear(self) -> None:
+        """Clear all the compiled generators."""
+        self._entries.clear()
+
+    def _entry(self, data: MockAPIHTTPResponseConfig) -> "_CompiledObjectResponse":
+        entry = self._entries.get(id(data), None)
+        if entry is None or entry.data is not data or entry.properties is not data.properties:
+            entry = _CompiledObjectResponse(data)
+            self._entries[id(data)] = entry
+        return entry
+
+
+class _CompiledObjectResponse:
+    __slots__ = ("data", "properties", "snapshot", "generate", "generate_stream")
+
+    def __init__(self, data: MockAPIHTTPResponseConfig):
+        # Keep the setting object to ensure its object ID won't be reused by others
+        self.data = data
+        self.properties = data.properties
+        # Keep a copy of the properties setting to detect the modification in place
+        self.snapshot: List[ResponseProperty] = copy.deepcopy(data.properties)
+        self.generate: Optional[Callable[[], dict]] = None
+        self.generate_stream: Optional[Callable[[BaseJSONSerializer], Iterator[bytes]]] = None
+
+    def is_valid(self, data: MockAPIHTTPResponseConfig) -> bool:
+        return data is self.data and data.properties is self.properties and data.properties == self.snapshot
+
+
+class StaticResponseCache:
+    """*The cache of the pre-rendered HTTP responses which never change*
+
+    The HTTP response with strategy *string* or *file* always is the same, so it only needs to be parsed and serialized
+    once. The entry with strategy *file* would be rendered again if the file has been modified, i.e., its modified
+    time or inode has been changed. Each of the pre-rendered responses has the strong *ETag* by its body, so the
+    client could get the response with status code *304* if it already has the same one. The large response would
+    also be compressed once by each content coding, so it could send the compressed one without compressing it again.
+    """
+
+    # The minimum interval (in seconds) between checking whether the file has been modified or not.
+    file_check_interval: float = 1.0
+
+    # The minimum size (in bytes) of the response which would be pre-compressed.
+    compression_min_size: int = 1024
+
+    def __init__(self, str_as_json: bool = False, serializer: Optional[BaseJSONSerializer] = None):
+        """
+
+        Args:
+            str_as_json (bool): Whether it should serialize the string type response as JSON format string or not.
+            serializer (Optional[BaseJSONSerializer]): The JSON serializer. It would use the one which be set by the
+                environment variable if it's empty.
+        """
+        self._str_as_json = str_as_json
+        self._serializer = serializer
+
+        # The data structure would be:
+        # {
+        #     <the object ID of HTTP response setting>: _StaticResponseEntry
+        # }
+        self._entries: Dict[int, "_StaticResponseEntry"] = {}
+
+    def get(self, data: MockAPIHTTPResponseConfig) -> Optional[PreRenderedResponse]:
+        """Get the pre-rendered HTTP response. It would render it at the first time.
+
+        Args:
+            data (MockAPIHTTPResponseConfig): The HTTP response setting.
+
+        Returns:
+            A **PreRenderedResponse** type object. It returns ``None`` if the response could not be pre-rendered, e.g.,
+            it's strategy *object*, the file content would be sent directly or the file doesn't exist.
+
+        """
+        if data.strategy not in (ResponseStrategy.STRING, ResponseStrategy.FILE) or data.passthrough:
+            return None
+        entry = self._entries.get(id(data), None)
+        if entry is not None and entry.is_valid(data, check_interval=self.file_check_interval):
+            return entry.response
+
+        entry = self._render(data)
+        if entry is None:
+            self._entries.pop(id(data), None)
+            return None
+        self._entries[id(data)] = entry
+        return entry.response
+
+    def retain(self, data: Iterable[MockAPIHTTPResponseConfig]) -> None:
+        """Only keep the pre-rendered HTTP responses of the specific settings, e.g., the ones which still exist after
+        reloading the configuration.
+
+        Args:
+            data (Iterable[MockAPIHTTPResponseConfig]): The HTTP response settings.
+
+        """
+        alive = {id(d): d for d in data}
+        self._entries = {key: entry for key, entry in self._entries.items() if alive.get(key, None) is entry.data}
+
+    def clear(self) -> None:
+        """Clear all the pre-rendered HTTP responses."""
+        self._entries.clear()
+
+    def _render(self, data: MockAPIHTTPResponseConfig) -> Optional["_StaticResponseEntry"]:
+        file_signature: Optional[Tuple[int, int]] = None
+        if data.strategy is ResponseStrategy.FILE:
+            if HTTPResponse._is_file(path=data.path):
+                file_signature = _file_signature(data.path)
+                if file_signature is None:
+                    return None
+        response = self._serialize(HTTPResponse.generate(data=data))
+        response.validators = CacheValidators.from_body(
+            response.body, last_modified=file_signature[0] / 1e9 if file_signature else None
+        )
+        if data.compress and response.content_length >= self.compression_min_size:
+            response.compress(content_encoders())
+        return _StaticResponseEntry(
+            data=data,
+            response=response,
+            file_signature=file_signature,
+        )
+
+    def _serialize(self, value: Any) -> PreRenderedResponse:
+        return serialize_response(value, str_as_json=self._str_as_json, serializer=self._serializer)
+
+
+class _StaticResponseEntry:
+    __slots__ = ("data", "source", "response", "file_signature", "checked_at")
+
+    def __init__(
+        self,
+        data: MockAPIHTTPResponseConfig,
+        response: PreRenderedResponse,
+        file_signature: Optional[Tuple[int, int]] = None,
+    ):
+        # Keep the setting object to ensure its object ID won't be reused by others
+        self.data = data
+        self.source: str = data.value if data.strategy is ResponseStrategy.STRING else data.path
+        self.response = response
+        self.file_signature = file_signature
+        self.checked_at: float = time.monotonic()
+
+    def is_valid(self, data: MockAPIHTTPResponseConfig, check_interval: float) -> bool:
+        source = data.value if data.strategy is ResponseStrategy.STRING else data.path
+        if data is not self.data or source != self.source:
+            return False
+        if self.file_signature is None:
+            return True
+        now = time.monotonic()
+        if now - self.checked_at < check_interval:
+            return True
+        self.checked_at = now
+        return _file_signature(self.source) == self.file_signature
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_ino
+
+
+class ResponsePools:
+    """*The pools of pre-generated HTTP responses*
+
+    The HTTP response with strategy *object* would be generated randomly by each request. If it has the setting
+    *response.pool*, it would be generated as bytes with the pool size amount ahead, and each request only picks one of
+    them from the pool. The pools with refill setting *background* would be regenerated one by one in a daemon thread
+    to keep the variety of the responses.
+    """
+
+    # The interval (in seconds) between refilling each of the responses in the pools.
+    refill_interval: float = 0.05
+
+    def __init__(
+        self,
+        str_as_json: bool = False,
+        compiled: Optional[CompiledObjectResponses] = None,
+        serializer: Optional[BaseJSONSerializer] = None,
+    ):
+        """
+
+        Args:
+            str_as_json (bool): Whether it should serialize the string type response as JSON format string or not.
+            compiled (Optional[CompiledObjectResponses]): The compiled generators of the HTTP responses with strategy
+                *object*. It would have its own one if it's empty.
+            serializer (Optional[BaseJSONSerializer]): The JSON serializer. It would use the one which be set by the
+                environment variable if it's empty.
+        """
+        self._str_as_json = str_as_json
+        self._serializer = serializer
+        self._compiled = compiled if compiled is not None else CompiledObjectResponses()
+
+        # The data structure would be:
+        # {
+        #     <the object ID of HTTP response setting>: _ResponsePool
+        # }
+        self._pools: Dict[int, "_ResponsePool"] = {}
+        self._lock = threading.Lock()
+        self._stop_refilling = threading.Event()
+        self._refill_thread: Optional[threading.Thread] = None
+
+    def add(self, name: str, data: MockAPIHTTPResponseConfig) -> bool:
+        """Generate the responses in pool if the HTTP response has the pool setting.
+
+        Args:
+            name (str): The name of the pool, e.g., the HTTP method and URL path of the mocked API.
+            data (MockAPIHTTPResponseConfig): The HTTP response setting.
+
+        Returns:
+            It returns ``True`` if it creates the pool.
+
+        """
+        if not data.pool or data.strategy is not ResponseStrategy.OBJECT:
+            return False
+        pool = self._pools.get(id(data), None)
+        if pool is not None and pool.is_valid(data):
+            return False
+
+        pool = _ResponsePool(name=name, data=data, generate=partial(self._generate, data))
+        with self._lock:
+            self._pools[id(data)] = pool
+        if data.pool.refill is ResponsePoolRefill.BACKGROUND:
+            self._start_refilling()
+        return True
+
+    def get(self, data: MockAPIHTTPResponseConfig) -> Optional[PreRenderedResponse]:
+        """Get one of the pre-generated HTTP responses in pool.
+
+        Args:
+            data (MockAPIHTTPResponseConfig): The HTTP response setting.
+
+        Returns:
+            A **PreRenderedResponse** type object. It returns ``None`` if the HTTP response doesn't have any pool.
+
+        """
+        pool = self._pools.get(id(data), None)
+        if pool is None or not pool.is_valid(data):
+            return None
+        return pool.get()
+
+    def info(self) -> Dict[str, Dict[str, int]]:
+        """Get the statistics of all the pools.
+
+        Returns:
+            A dict type value which maps the name of each pool to its size, hit count and refill count.
+
+        """
+        return {pool.name: pool.info() for pool in list(self._pools.values())}
+
+    def stop(self) -> None:
+        """Stop refilling the responses in pools in background."""
+        self._stop_refilling.set()
+        if self._refill_thread is not None:
+            self._refill_thread.join()
+            self._refill_thread = None
+
+    def retain(self, data: Iterable[MockAPIHTTPResponseConfig]) -> None:
+        """Only keep the pools of the specific settings, e.g., the ones which still exist after reloading the
+        configuration.
+
+        Args:
+            data (Iterable[MockAPIHTTPResponseConfig]): The HTTP response settings.
+
+        """
+        alive = {id(d): d for d in data}
+        with self._lock:
+            self._pools = {key: pool for key, pool in self._pools.items() if alive.get(key, None) is pool.data}
+
+    def clear(self) -> None:
+        """Stop refilling and clear all the pools."""
+        self.stop()
+        with self._lock:
+            self._pools.clear()
+
+    def _generate(self, data: MockAPIHTTPResponseConfig) -> PreRenderedResponse:
+        return serialize_response(
+            HTTPResponse.generate(data=data, compiled=self._compiled),
+            str_as_json=self._str_as_json,
+            serializer=self._serializer,
+        )
+
+    def _start_refilling(self) -> None:
+        if self._refill_thread is not None and self._refill_thread.is_alive():
+            return
+        self._stop_refilling.clear()
+        self._refill_thread = threading.Thread(target=self._refill, name="pymock-response-pool-refill", daemon=True)
+        self._refill_thread.start()
+
+    def _refill(self) -> None:
+        while not self._stop_refilling.wait(self.refill_interval):
+            with self._lock:
+                pools = [pool for pool in self._pools.values() if pool.refill_in_background]
+            for pool in pools:
+                try:
+                    pool.refill()
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.warning(f"Cannot refill the response pool *{pool.name}*: {e}")
+
+
+class _ResponsePool:
+    __slots__ = (
+        "name",
+        "data",
+        "size",
+        "refill_in_background",
+        "responses",
+        "hits",
+        "refills",
+        "_generate",
+        "_next_index",
+        "_next_refill_index",
+        "_pick_randomly",
+    )
+
+    def __init__(self, name: str, data: MockAPIHTTPResponseConfig, generate: Callable[[], PreRenderedResponse]):
+        assert data.pool
+        self.name = name
+        # Keep the setting object to ensure its object ID won't be reused by others
+        self.data = data
+        self.size: int = data.pool.size
+        self.refill_in_background: bool = data.pool.refill is ResponsePoolRefill.BACKGROUND
+        self._pick_randomly: bool = data.pool.order is ResponsePoolOrder.RANDOM
+        self._generate = generate
+        self.responses: List[PreRenderedResponse] = [generate() for _ in range(self.size)]
+        self.hits: int = 0
+        self.refills: int = 0
+        self._next_index: int = 0
+        self._next_refill_index: int = 0
+
+    def is_valid(self, data: MockAPIHTTPResponseConfig) -> bool:
+        return data is self.data and data.pool is not None and data.pool.size == self.size
+
+    def get(self) -> PreRenderedResponse:
+        self.hits += 1
+        if self._pick_randomly:
+            return random.choice(self.responses)
+        index = self._next_index
+        self._next_index = (index + 1) % self.size
+        return self.responses[index]
+
+    def refill(self) -> None:
+        index = self._next_refill_index
+        self.responses[index] = self._generate()
+        self._next_refill_index = (index + 1) % self.size
+        self.refills += 1
+
+    def info(self) -> Dict[str, int]:
+        return {"size": self.size, "hits": self.hits, "refills": self.refills}
+
+
+def request_seed(api_path: str, http_method: str, parameters: Optional[dict] = None) -> int:
+    """Get the seed of randomness by the request. The same request always has the same seed even in the different
+    processes, so it doesn't use the built-in function *hash* which is salted in each process.
+
+    Args:
+        api_path (str): The URL path of the mocked API.
+        http_method (str): The HTTP method of the request.
+        parameters (Optional[dict]): The parameters of the request. The order of them doesn't matter.
+
+    Returns:
+        An integer type value which is 64 bits at most.
+
+    """
+    normalized_parameters = json.dumps(dict(parameters or {}), sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.blake2b(
+        f"{http_method.upper()} {api_path}\n{normalized_parameters}".encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big")
+
+
+class DeterministicResponses:
+    """*The bounded cache of the HTTP responses which are generated deterministically*
+
+    The HTTP response with strategy *object* and setting *deterministic* would be generated by the independent
+    *random.Random* object with the seed from the request, i.e., the mocked API, HTTP method and parameters. So the same
+    request always gets the same response, and the rendered responses could be kept in the bounded cache. It keeps the
+    most recently used responses and records the hit and miss counts of it.
+    """
+
+    def __init__(
+        self, max_size: int = 1024, str_as_json: bool = False, compiled: Optional[CompiledObjectResponses] = None
+    ):
+        """
+
+        Args:
+            max_size (int): The maximum amount of rendered responses it keeps.
+            str_as_json (bool): Whether it should serialize the string type response as JSON format string or not.
+            compiled (Optional[CompiledObjectResponses]): The compiled generators of the HTTP responses with strategy
+                *object*. It would have its own one if it's empty.
+        """
+        if max_size <= 0:
+            raise ValueError("The maximum size of deterministic response cache must be greater than 0.")
+        self._max_size = max_size
+        self._str_as_json = str_as_json
+        self._compiled = compiled if compiled is not None else CompiledObjectResponses()
+
+        # The data structure would be:
+        # {
+        #     (<the object ID of HTTP response setting>, <seed>): (<HTTP response setting>, PreRenderedResponse)
+        # }
+        self._responses: "OrderedDict[Tuple[int, int], Tuple[MockAPIHTTPResponseConfig, PreRenderedResponse]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def max_size(self) -> int:
+        """:obj:`int`: Property with only getter for the maximum amount of rendered responses."""
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        """:obj:`int`: Property with only getter for the current amount of rendered responses."""
+        return len(self._responses)
+
+    def get(
+        self, data: MockAPIHTTPResponseConfig, seed: int, serializer: Optional[BaseJSONSerializer] = None
+    ) -> PreRenderedResponse:
+        """Get the HTTP response which is generated by the seed. It only generates it if it doesn't have it in cache.
+
+        Args:
+            data (MockAPIHTTPResponseConfig): The HTTP response setting.
+            seed (int): The seed of randomness, e.g., the one from *request_seed*.
+            serializer (Optional[BaseJSONSerializer]): The JSON serializer.
+
+        Returns:
+            A **PreRenderedResponse** type object.
+
+        """
+        key = (id(data), seed)
+        with self._lock:
+            cached = self._responses.get(key, None)
+            # Check the setting object to ensure the object ID isn't reused by the new one
+            if cached is not None and cached[0] is data:
+                self._hits += 1
+                self._responses.move_to_end(key)
+                return cached[1]
+            self._misses += 1
+
+        with seeded_random(seed):
+            value = HTTPResponse.generate(data=data, compiled=self._compiled)
+        response = serialize_response(value, str_as_json=self._str_as_json, serializer=serializer)
+        response.validators = CacheValidators.from_body(response.body)
+        with self._lock:
+            self._responses[key] = (data, response)
+            self._responses.move_to_end(key)
+            if len(self._responses) > self._max_size:
+                self._responses.popitem(last=False)
+        return response
+
+    def info(self) -> Dict[str, int]:
+        """Get the statistics of this cache.
+
+        Returns:
+            A dict type value which has the hit count, miss count, current size and maximum size.
+
+        """
+        return {"hits": self._hits, "misses": self._misses, "size": self.size, "max_size": self._max_size}
+
+    def retain(self, data: Iterable[MockAPIHTTPResponseConfig]) -> None:
+        """Only keep the rendered responses of the specific settings, e.g., the ones which still exist after reloading
+        the configuration.
+
+        Args:
+            data (Iterable[MockAPIHTTPResponseConfig]): The HTTP response settings.
+
+        """
+        alive = {id(d): d for d in data}
+        with self._lock:
+            for key in [key for key, (d, _) in self._responses.items() if alive.get(key[0], None) is not d]:
+                del self._responses[key]
+
+    def clear(self) -> None:
+        """Clear all the rendered responses and the statistics."""
+        with self._lock:
+            self._responses.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,127 @@
+"""*The index of mocked APIs' URL paths*
+
+This module provides the data structure for finding the mocked API details by the path of current request. It would
+be built once when the web application creates all the mocked APIs, so the searching cost of each request won't grow
+with the amount of mocked APIs.
+"""
+
+import re
+from collections import namedtuple
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from pymock_server.model import MockAPI
+
+RouteMatch = namedtuple("RouteMatch", ("template", "api_details"))
+
+_Variable_In_Path_Regex: Pattern = re.compile(r"<[\w\-]{1,32}>|\{[\w\-]{1,32}\}")
+
+
+class _RouteNode:
+    __slots__ = ("static", "dynamic", "variable", "template")
+
+    def __init__(self):
+        # The child nodes of the URL path segments which doesn't have any variable
+        self.static: Dict[str, "_RouteNode"] = {}
+        # The child nodes of the URL path segments which mixes the fixed string with the variables, e.g., *foo-<id>*
+        self.dynamic: Dict[str, Tuple[Pattern, "_RouteNode"]] = {}
+        # The child node of the URL path segment which is an entire variable, e.g., *<id>* or *{id}*
+        self.variable: Optional["_RouteNode"] = None
+        # The URL path template if the mocked API ends at this node
+        self.template: Optional[str] = None
+
+
+class RouteIndex:
+    """*The segment trie of all mocked APIs' URL paths*
+
+    It maps the path of current request to the mocked API's URL path template which may have variables with format
+    *<var>* or *{var}*. The path which doesn't have any variable could be found by dict directly. The others would be
+    found by walking through the trie by each path segment, so the cost only depends on the depth of the path.
+    """
+
+    def __init__(self, mock_api_details: Dict[str, Dict[str, MockAPI]]):
+        """
+
+        Args:
+            mock_api_details (Dict[str, Dict[str, MockAPI]]): The details of all mocked APIs. The data structure is
+                the mapping of URL path to the mapping of HTTP method to the mocked API.
+        """
+        self._mock_api_details = mock_api_details
+        self._indexed_amount: int = len(mock_api_details)
+        self._root = _RouteNode()
+        for template in mock_api_details.keys():
+            self._insert(template)
+
+    @property
+    def mock_api_details(self) -> Dict[str, Dict[str, MockAPI]]:
+        """:obj:`dict`: Property with only getter for the details of all mocked APIs which be indexed."""
+        return self._mock_api_details
+
+    def is_indexing(self, mock_api_details: Dict[str, Dict[str, MockAPI]]) -> bool:
+        """Check whether this index is still up-to-date with the details of mocked APIs or not.
+
+        Args:
+            mock_api_details (Dict[str, Dict[str, MockAPI]]): The details of all mocked APIs.
+
+        Returns:
+            It returns ``True`` if the index is built by the same object and no any new API be added after that.
+
+        """
+        return mock_api_details is self._mock_api_details and len(mock_api_details) == self._indexed_amount
+
+    def find(self, api_path: str) -> Optional[RouteMatch]:
+        """Find the mocked API by the path of current request.
+
+        Args:
+            api_path (str): The URL path of current request.
+
+        Returns:
+            A **RouteMatch** type object which has the URL path template and its details. It returns ``None`` if it
+            cannot find any mocked API with the path.
+
+        """
+        api_details = self._mock_api_details.get(api_path, None)
+        if api_details is not None:
+            return RouteMatch(template=api_path, api_details=api_details)
+        template = self._search(self._root, api_path.split("/"), 0)
+        if template is None:
+            return None
+        return RouteMatch(template=template, api_details=self._mock_api_details[template])
+
+    def _insert(self, template: str) -> None:
+        node = self._root
+        for segment in template.split("/"):
+            if not _Variable_In_Path_Regex.search(segment):
+                node = node.static.setdefault(segment, _RouteNode())
+            elif _Variable_In_Path_Regex.fullmatch(segment):
+                if node.variable is None:
+                    node.variable = _RouteNode()
+                node = node.variable
+            else:
+                if segment not in node.dynamic:
+                    node.dynamic[segment] = (self._compile_segment(segment), _RouteNode())
+                node = node.dynamic[segment][1]
+        node.template = template
+
+    def _compile_segment(self, segment: str) -> Pattern:
+        fixed_parts: List[str] = _Variable_In_Path_Regex.split(segment)
+        return re.compile(r"[^/]+?".join(map(re.escape, fixed_parts)))
+
+    def _search(self, node: _RouteNode, segments: List[str], index: int) -> Optional[str]:
+        if index == len(segments):
+            return node.template
+
+        segment = segments[index]
+        # The fixed path segment has higher priority than the variable one
+        static_node = node.static.get(segment, None)
+        if static_node is not None:
+            template = self._search(static_node, segments, index + 1)
+            if template is not None:
+                return template
+        for pattern, dynamic_node in node.dynamic.values():
+            if pattern.fullmatch(segment):
+                template = self._search(dynamic_node, segments, index + 1)
+                if template is not None:
+                    return template
+        if node.variable is not None and segment:
+            return self._search(node.variable, segments, index + 1)
+        return None
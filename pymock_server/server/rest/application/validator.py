@@ -0,0 +1,174 @@
+"""*The validation of HTTP request parameters*
+
+This module compiles the parameters settings of each mocked API into a flat list of checking which has resolved all
+the data types and patterns ahead. So it only needs to run the compiled checking for each request.
+"""
+
+import re
+from pydoc import locate
+from typing import Any, FrozenSet, List, Optional, Pattern, Tuple
+
+from pymock_server.model.api_config.apis import APIParameter
+from pymock_server.model.api_config.format import Format
+
+_Digit_Value_Regex: Pattern = re.compile(r"\d{1,128}")
+
+
+def _type_is_different_msg(value: Any, data_type: Any) -> str:
+    return (
+        f"The type of data from Font-End site (*{type(value)}*) is different with the implementation of Back-End "
+        f"site (*{data_type}*)."
+    )
+
+
+class ParameterValidator:
+    """*The compiled checking of one API parameter*"""
+
+    __slots__ = (
+        "name",
+        "required",
+        "value_type",
+        "value_format",
+        "_py_data_type",
+        "_check_digit_string",
+        "_items",
+        "_required_item_names",
+        "_has_only_one_item",
+    )
+
+    def __init__(self, param: APIParameter, int_type_value_is_string: bool = False):
+        """
+
+        Args:
+            param (APIParameter): The API parameter setting.
+            int_type_value_is_string (bool): Whether the numeric parameter value would be string type or not, e.g.,
+                it's always string in *Flask*.
+        """
+        self.name: str = param.name
+        self.required: Optional[bool] = param.required
+        self.value_type: Optional[str] = param.value_type
+        self.value_format: Optional[Format] = param.value_format
+
+        self._py_data_type: Any = locate(param.value_type) if param.value_type else None
+        self._check_digit_string: bool = int_type_value_is_string and self._py_data_type in [int, float]
+
+        # Each element is (item name, item is required or not, the Python data type of item)
+        self._items: Tuple[Tuple[str, Optional[bool], Any], ...] = ()
+        self._required_item_names: FrozenSet[str] = frozenset()
+        self._has_only_one_item: bool = False
+        if self._py_data_type is list and param.items:
+            self._items = tuple(
+                (item.name, item.required, locate(item.value_type) if item.value_type else None) for item in param.items
+            )
+            self._required_item_names = frozenset(item.name for item in param.items if item.required is True)
+            self._has_only_one_item = len(param.items) == 1
+
+    def validate(self, req_params: dict) -> Optional[str]:
+        """Check the value of this parameter in the request.
+
+        Args:
+            req_params (dict): All the parameters of current request.
+
+        Returns:
+            The error message if the value is invalid, nor it returns ``None``.
+
+        """
+        value = req_params.get(self.name, None)
+        # Check the required parameter
+        if self.required and (value is None or self.name not in req_params):
+            return f"Miss required parameter *{self.name}*."
+        if not value:
+            return None
+
+        # Check the data type of parameter
+        assert self.value_type, "It must cannot miss the value type value of each parameters."
+        if self._check_digit_string:
+            # For the Flask part. It would always be string type of each API parameter.
+            if _Digit_Value_Regex.search(str(value)) is None:
+                return _type_is_different_msg(value, self._py_data_type)
+        elif not isinstance(value, self._py_data_type):
+            return _type_is_different_msg(value, self._py_data_type)
+
+        # Check the element of list
+        if self._items:
+            error_msg = self._validate_items(value)
+            if error_msg:
+                return error_msg
+
+        # Check the data format of parameter
+        if self.value_format and not self.value_format.value_format_is_match(data_type=self._py_data_type, value=value):
+            return (
+                f"The format of data from Font-End site (param: '{self.name}', value: '{value}') is incorrect. Its "
+                f"format should be {self.value_format.expect_format_log_msg(data_type=self._py_data_type)}."
+            )
+        return None
+
+    def _validate_items(self, value: list) -> Optional[str]:
+        assert isinstance(value, list)
+        if self._has_only_one_item:
+            _, _, item_data_type = self._items[0]
+            for e in value:
+                assert isinstance(
+                    e, (str, int, float)
+                ), "The data type of item object must be *str*, *int* or *float* type."
+                if item_data_type and not isinstance(e, item_data_type):
+                    return _type_is_different_msg(value, self._py_data_type)
+            return None
+
+        for e in value:
+            assert isinstance(e, dict), "The data type of item object must be *dict* type."
+            # Check all the required items by one set operation, so the missing items in the loop below are only the
+            # optional ones in most of the requests
+            all_required_exist = self._required_item_names.issubset(e.keys())
+            for item_name, item_required, item_data_type in self._items:
+                if item_name not in e:
+                    if not all_required_exist and item_required is True:
+                        return f"Miss required parameter *{self.name}.{item_name}*."
+                    continue
+                if item_data_type and not isinstance(e[item_name], item_data_type):
+                    return _type_is_different_msg(value, self._py_data_type)
+        return None
+
+
+class RequestValidator:
+    """*The compiled checking of all the parameters of one mocked API*"""
+
+    def __init__(self, parameters: List[APIParameter], int_type_value_is_string: bool = False):
+        """
+
+        Args:
+            parameters (List[APIParameter]): All the parameters settings of the mocked API.
+            int_type_value_is_string (bool): Whether the numeric parameter value would be string type or not.
+        """
+        self._parameters = parameters
+        self._validators: Tuple[ParameterValidator, ...] = tuple(
+            ParameterValidator(param, int_type_value_is_string=int_type_value_is_string) for param in parameters
+        )
+
+    def is_compiled_from(self, parameters: List[APIParameter]) -> bool:
+        """Check whether this validator is compiled by the parameters settings or not.
+
+        Args:
+            parameters (List[APIParameter]): All the parameters settings of the mocked API.
+
+        Returns:
+            It returns ``True`` if it's compiled by the same object and no any parameter be added after that.
+
+        """
+        return parameters is self._parameters and len(parameters) == len(self._validators)
+
+    def validate(self, req_params: dict) -> Optional[str]:
+        """Check all the parameters of current request.
+
+        Args:
+            req_params (dict): All the parameters of current request.
+
+        Returns:
+            The error message of the first invalid parameter, nor it returns ``None``.
+
+        """
+        for validator in self._validators:
+            error_msg = validator.validate(req_params)
+            if error_msg is not None:
+                return error_msg
+        return None
@@ -13,6 +13,7 @@
 # Allowable argument:
 # * unit-test: Get and run unit test.
 # * integration-test: Get and run integration test.
+# * benchmark: Get and run benchmark.
 #
 ##########################################################################################
 
@@ -63,6 +64,9 @@ then
 elif echo "$testing_type" | grep -q "system-test";
 then
     test_path=$(bash "$Scripts_Dir/$Test_Running_Script" ./test/system_test/ windows | sed "s/\"//g" | sed 's/^//')
+elif echo "$testing_type" | grep -q "benchmark";
+then
+    test_path=$(bash "$Scripts_Dir/$Test_Running_Script" ./test/benchmark/ windows | sed "s/\"//g" | sed 's/^//')
 elif echo "$testing_type" | grep -q "all-test";
 then
     unit_test_path=$(bash "$Scripts_Dir/$Test_Running_Script" ./test/unit_test/ windows | sed "s/\"//g" | sed 's/^//')
@@ -728,6 +728,10 @@ def _generate_response_for_add(strategy: ResponseStrategy) -> Tuple[ResponseStra
 # Test subcommand *check* options
 _Test_SubCommand_Check: str = "check"
 
+# Test subcommand *compile* options
+_Test_SubCommand_Compile: str = "compile"
+_Compiled_Config_Path: str = "test-api.pymock"
+
 # Test subcommand *inspect* options
 _Test_SubCommand_Get: str = "get"
 _Swagger_API_Document_URL: str = "Swagger API document URL"
@@ -763,6 +767,7 @@ class SubCommand:
     Run: str = "run"
     Add: str = "add"
     Check: str = "check"
+    Compile: str = "compile"
     Get: str = "get"
     Sample: str = "sample"
     Pull: str = "pull"
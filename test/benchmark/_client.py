@@ -0,0 +1,104 @@
+"""*The in-process clients for benchmark*
+
+Send the requests to the WSGI or ASGI application by calling it directly without any socket, so the result only has
+the time of processing the requests in the web application.
+"""
+
+import asyncio
+import json
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class BaseInProcessClient(metaclass=ABCMeta):
+    def __init__(self, app: Any):
+        self._app = app
+
+    @abstractmethod
+    def measure(
+        self, method: str, path: str, body: Optional[dict] = None, amount: int = 1
+    ) -> Tuple[List[float], List[int]]:
+        """Send the same request multiple times one by one and measure the latency of each one.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The URL path.
+            body (Optional[dict]): The request body in JSON format.
+            amount (int): How many times to send the request.
+
+        Returns:
+            The latencies (in seconds) and the HTTP status codes of all the requests.
+
+        """
+
+
+class WSGIClient(BaseInProcessClient):
+    def measure(
+        self, method: str, path: str, body: Optional[dict] = None, amount: int = 1
+    ) -> Tuple[List[float], List[int]]:
+        from werkzeug.test import EnvironBuilder
+
+        # The input stream of the request body could only be read once, so it needs one environment for each request
+        environs = [EnvironBuilder(method=method, path=path, json=body).get_environ() for _ in range(amount)]
+        latencies: List[float] = []
+        status_codes: List[int] = []
+
+        def _start_response(status: str, headers: list, exc_info: Any = None) -> None:
+            status_codes.append(int(status.split(" ", 1)[0]))
+
+        for environ in environs:
+            start = time.perf_counter()
+            response = self._app(environ, _start_response)
+            for _ in response:
+                pass
+            if hasattr(response, "close"):
+                response.close()
+            latencies.append(time.perf_counter() - start)
+        return latencies, status_codes
+
+
+class ASGIClient(BaseInProcessClient):
+    def measure(
+        self, method: str, path: str, body: Optional[dict] = None, amount: int = 1
+    ) -> Tuple[List[float], List[int]]:
+        return asyncio.run(self._measure(method, path, body, amount))
+
+    async def _measure(
+        self, method: str, path: str, body: Optional[dict], amount: int
+    ) -> Tuple[List[float], List[int]]:
+        content = json.dumps(body).encode("utf-8") if body is not None else b""
+        headers = [(b"host", b"testserver")]
+        if body is not None:
+            headers += [(b"content-type", b"application/json"), (b"content-length", str(len(content)).encode())]
+        scope: Dict[str, Any] = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode("utf-8"),
+            "query_string": b"",
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        # The web framework may set something into the scope, so it needs one scope for each request
+        scopes = [dict(scope) for _ in range(amount)]
+        latencies: List[float] = []
+        status_codes: List[int] = []
+
+        async def _receive() -> Dict[str, Any]:
+            return {"type": "http.request", "body": content, "more_body": False}
+
+        async def _send(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status_codes.append(message["status"])
+
+        for request_scope in scopes:
+            start = time.perf_counter()
+            await self._app(request_scope, _receive, _send)
+            latencies.append(time.perf_counter() - start)
+        return latencies, status_codes
@@ -0,0 +1,243 @@
+"""*The synthetic configuration for benchmark*
+
+Generate the configuration with any amount of mocked APIs. It could be one single file, or be divided into multiple files
+in the layout of any one combination of the dividing strategy, i.e., the layout of subcommand *pull* with options
+*--divide-api*, *--divide-http*, *--divide-http-request* and *--divide-http-response*.
+
+It also generates the configuration which has one mocked API for each kind of workload of processing requests.
+"""
+
+import itertools
+import os
+from typing import Any, Dict, List
+
+from pymock_server._utils import YAML
+from pymock_server.model.api_config.template._divide import DivideStrategy
+
+# The amount of tags which the mocked APIs be grouped by, each tag is one directory if the configuration is divided
+_Tags_Amount: int = 10
+
+# The amount of each type of parameters of the mocked API which has a lot of parameters
+_Parameters_Amount: int = 5
+
+
+def all_divide_strategies() -> List[DivideStrategy]:
+    """Get all the combinations of dividing strategy. The one which doesn't divide anything is the single file layout.
+
+    Returns:
+        A list of **DivideStrategy** type objects.
+
+    """
+    return [DivideStrategy(*divide) for divide in itertools.product([False, True], repeat=4)]
+
+
+def layout_name(strategy: DivideStrategy) -> str:
+    """Get the readable name of the configuration layout, e.g., *api+http*.
+
+    Args:
+        strategy (DivideStrategy): The dividing strategy.
+
+    Returns:
+        A string type value.
+
+    """
+    divided_parts = [
+        part
+        for part, divide in (
+            ("api", strategy.divide_api),
+            ("http", strategy.divide_http),
+            ("request", strategy.divide_http_request),
+            ("response", strategy.divide_http_response),
+        )
+        if divide
+    ]
+    return "+".join(divided_parts) or "single-file"
+
+
+def generate_config(directory: str, apis_amount: int, strategy: DivideStrategy) -> str:
+    """Generate the configuration into the directory.
+
+    Args:
+        directory (str): The directory to save the configuration files.
+        apis_amount (int): The amount of mocked APIs.
+        strategy (DivideStrategy): The dividing strategy of the configuration layout.
+
+    Returns:
+        The file path of the entry configuration.
+
+    """
+    directory = os.path.abspath(directory)
+    os.makedirs(directory, exist_ok=True)
+    yaml = YAML()
+
+    def _divide(name: str, tag: str, part: str, content: Dict[str, Any]) -> Dict[str, Any]:
+        yaml.write(path=os.path.join(directory, tag, f"{name}-{part}.yaml"), config=content, mode="w")
+        return {
+            "apply_template_props": True,
+            "base_file_path": os.path.join(directory, tag),
+            "config_path": None,
+            "config_path_format": f"**-{part}",
+        }
+
+    mocked_apis: Dict[str, Any] = {}
+    for index in range(apis_amount):
+        name, tag = f"get_foo{index}", f"tag{index % _Tags_Amount}"
+        os.makedirs(os.path.join(directory, tag), exist_ok=True)
+        request = _request()
+        if strategy.divide_http_request:
+            request = _divide(name, tag, "request", request)
+        response = _response()
+        if strategy.divide_http_response:
+            response = _divide(name, tag, "response", response)
+        http = {"request": request, "response": response}
+        if strategy.divide_http:
+            http = _divide(name, tag, "http", http)
+        api = {"url": f"/foo{index}", "tag": tag, "http": http}
+        if strategy.divide_api:
+            # It would be found by scanning the files under the base file path of template
+            yaml.write(path=os.path.join(directory, tag, f"{name}-api.yaml"), config=api, mode="w")
+        else:
+            mocked_apis[name] = api
+
+    config: Dict[str, Any] = {"name": "Benchmark", "description": f"{apis_amount} mocked APIs"}
+    config["mocked_apis"] = {"template": _template(directory)} if any(vars(strategy).values()) else {}
+    config["mocked_apis"]["base"] = {"url": "/api/v1/benchmark"}
+    if mocked_apis:
+        config["mocked_apis"]["apis"] = mocked_apis
+    path = os.path.join(directory, "api.yaml")
+    yaml.write(path=path, config=config, mode="w")
+    return path
+
+
+def generate_workload_config(directory: str) -> str:
+    """Generate the configuration which has the mocked APIs for the workloads of processing requests:
+
+    * *get_string*: Respond the static string value.
+    * *get_object*: Respond the object which is generated by its properties.
+    * *get_variable*: The URL has variable.
+    * *post_parameters*: The request has a lot of parameters to validate.
+
+    Args:
+        directory (str): The directory to save the configuration file.
+
+    Returns:
+        The file path of the configuration.
+
+    """
+    os.makedirs(directory, exist_ok=True)
+    config = {
+        "name": "Benchmark",
+        "description": "The workloads of processing requests",
+        "mocked_apis": {
+            "base": {"url": "/api/v1/benchmark"},
+            "apis": {
+                "get_string": {
+                    "url": "/string",
+                    "http": {
+                        "request": {"method": "GET"},
+                        "response": {"strategy": "string", "value": "This is a static response."},
+                    },
+                },
+                "get_object": {
+                    "url": "/object",
+                    "http": {"request": {"method": "GET"}, "response": _response()},
+                },
+                "get_variable": {
+                    "url": "/variable/<item_id>",
+                    "http": {
+                        "request": {"method": "GET"},
+                        "response": {"strategy": "string", "value": "This is a response of URL with variable."},
+                    },
+                },
+                "post_parameters": {
+                    "url": "/parameters",
+                    "http": {
+                        "request": {"method": "POST", "parameters": _many_parameters()},
+                        "response": {"strategy": "string", "value": "The parameters are valid."},
+                    },
+                },
+            },
+        },
+    }
+    path = os.path.join(directory, "api.yaml")
+    YAML().write(path=path, config=config, mode="w")
+    return path
+
+
+def many_parameters_request_body() -> Dict[str, Any]:
+    """Get the valid request body of the mocked API *post_parameters* in the workload configuration.
+
+    Returns:
+        A dict type value.
+
+    """
+    body: Dict[str, Any] = {}
+    for index in range(_Parameters_Amount):
+        body[f"id{index}"] = index
+        body[f"name{index}"] = f"name {index}"
+        body[f"type{index}"] = "foo" if index % 2 else "bar"
+        body[f"enabled{index}"] = bool(index % 2)
+    return body
+
+
+def _many_parameters() -> List[Dict[str, Any]]:
+    parameters: List[Dict[str, Any]] = []
+    for index in range(_Parameters_Amount):
+        parameters.append({"name": f"id{index}", "required": True, "type": "int"})
+        parameters.append({"name": f"name{index}", "required": True, "type": "str"})
+        parameters.append(
+            {
+                "name": f"type{index}",
+                "required": True,
+                "type": "str",
+                "format": {"strategy": "from_enums", "enums": ["foo", "bar"]},
+            }
+        )
+        parameters.append({"name": f"enabled{index}", "required": False, "type": "bool", "default": False})
+    return parameters
+
+
+def _template(directory: str) -> Dict[str, Any]:
+    return {
+        "activate": True,
+        "file": {
+            "activate": True,
+            "load_config": {"includes_apis": True, "order": ["apis", "apply", "file"]},
+            "config_path_values": {
+                "base_file_path": directory,
+                "api": {"config_path_format": "**-api.yaml"},
+                "http": {"config_path_format": "**-http.yaml"},
+                "request": {"config_path_format": "**-request.yaml"},
+                "response": {"config_path_format": "**-response.yaml"},
+            },
+        },
+    }
+
+
+def _request() -> Dict[str, Any]:
+    return {
+        "method": "GET",
+        "parameters": [
+            {"name": "id", "required": True, "type": "int"},
+            {"name": "fooType", "required": False, "type": "str", "default": "all"},
+        ],
+    }
+
+
+def _response() -> Dict[str, Any]:
+    return {
+        "strategy": "object",
+        "properties": [
+            {"name": "id", "required": True, "type": "int"},
+            {"name": "name", "required": True, "type": "str"},
+            {
+                "name": "items",
+                "required": False,
+                "type": "list",
+                "items": [
+                    {"name": "id", "required": True, "type": "int"},
+                    {"name": "value", "required": True, "type": "str"},
+                ],
+            },
+        ],
+    }
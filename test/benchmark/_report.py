@@ -0,0 +1,113 @@
+"""*The measurement and report of benchmark*
+
+Measure the time of each phase by wrapping the functions of the phases, and save the results as JSON so the regression
+could be tracked by comparing the reports.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from unittest.mock import patch
+
+from pymock_server.__pkg_info__ import __version__
+
+# The environment variable which is the directory to save the benchmark reports.
+Benchmark_Report_Environment_Variable: str = "MockAPI_Benchmark_Report_Dir"
+
+
+class PhaseTimer:
+    """*Measure the time of each phase*
+
+    The time of one phase doesn't include the time of the other phases in it, e.g., the time of reading YAML files
+    while loading the template configuration is counted in phase *yaml_read* instead of *template_loading*. So the sum
+    of all phases is the total time.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = defaultdict(float)
+        # The data structure would be:
+        # [
+        #     [<phase name>, <start time>, <the time of the other phases in it>],
+        # ]
+        self._running: List[List[Any]] = []
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        running = [phase, time.perf_counter(), 0.0]
+        self._running.append(running)
+        try:
+            yield
+        finally:
+            self._running.pop()
+            elapsed = time.perf_counter() - running[1]
+            self.phases[phase] += elapsed - running[2]
+            if self._running:
+                self._running[-1][2] += elapsed
+
+    @contextmanager
+    def patch(self, targets: List[Tuple[Any, str, str]]) -> Iterator["PhaseTimer"]:
+        """Measure the functions in the context.
+
+        Args:
+            targets (List[Tuple[Any, str, str]]): The functions to measure, each one is the object which has the
+                function, the function name and the phase name.
+
+        Returns:
+            The timer itself.
+
+        """
+        with ExitStack() as stack:
+            for target, attribute, phase in targets:
+                stack.enter_context(patch.object(target, attribute, self._wrap(getattr(target, attribute), phase)))
+            yield self
+
+    def _wrap(self, function: Callable, phase: str) -> Callable:
+        @wraps(function)
+        def _measured(*args, **kwargs):
+            with self.measure(phase):
+                return function(*args, **kwargs)
+
+        return _measured
+
+
+def in_milliseconds(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class BenchmarkReport:
+    """*The report of benchmark*
+
+    Collect the result of each benchmark case and save all of them into one JSON file.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.results: List[Dict[str, Any]] = []
+
+    def record(self, case: Dict[str, Any], **result: Any) -> None:
+        self.results.append({**case, **result})
+
+    def serialize(self) -> Dict[str, Any]:
+        return {
+            "benchmark": self.name,
+            "version": __version__,
+            "python": platform.python_version(),
+            "implementation": sys.implementation.name,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "results": self.results,
+        }
+
+    def save(self) -> str:
+        directory = os.environ.get(Benchmark_Report_Environment_Variable, ".")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"benchmark-{self.name}.json")
+        with open(path, "w", encoding="utf-8") as file_stream:
+            json.dump(self.serialize(), file_stream, indent=2)
+        return path
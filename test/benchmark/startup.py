@@ -0,0 +1,130 @@
+"""*The benchmark of starting the mocked APIs web application*
+
+Measure how loading the configuration and creating the mocked APIs scale with the amount of mocked APIs, in all the
+layouts of configuration. The result of each phase would be saved into a JSON report.
+
+The phases are:
+
+* *yaml_read*: Read and parse the YAML files.
+* *deserialize*: Convert the data of mocked APIs in the entry configuration to data models, including loading the
+  divided configuration files which are referred by them.
+* *template_loading*: Find the divided configuration files by the template configuration and convert them to data
+  models.
+* *route_build*: Add the mocked APIs into the web application.
+* *others*: Anything else in setting up the web application.
+
+The amounts of mocked APIs could be set by environment variable, e.g., ``MockAPI_Benchmark_APIs=10,100``, and the
+report would be saved as *benchmark-startup.json* in the directory which could be set by environment variable
+``MockAPI_Benchmark_Report_Dir``.
+"""
+
+import os
+import time
+from typing import Iterator, List
+
+import pytest
+
+from pymock_server._utils.file.operation import YAML
+from pymock_server.model.api_config.template._divide import DivideStrategy
+from pymock_server.model.api_config.template._load.process import (
+    TemplateConfigLoaderByApply,
+    TemplateConfigLoaderByScanFile,
+    TemplateConfigLoaderWithAPIConfig,
+)
+from pymock_server.model.config_cache import Config_Cache_Environment_Variable
+from pymock_server.server import mock
+from pymock_server.server.rest.application import (
+    BaseAppServer,
+    FastAPIServer,
+    FlaskServer,
+)
+
+from ._config import all_divide_strategies, generate_config, layout_name
+from ._report import BenchmarkReport, PhaseTimer, in_milliseconds
+
+# The environment variable which is the amounts of mocked APIs to benchmark, separated by comma.
+Benchmark_APIs_Environment_Variable: str = "MockAPI_Benchmark_APIs"
+
+_Default_APIs_Amounts: str = "10,100,1000,10000"
+
+_App_Servers = {
+    "flask": FlaskServer,
+    "fastapi": FastAPIServer,
+}
+
+
+def _apis_amounts() -> List[int]:
+    amounts = os.environ.get(Benchmark_APIs_Environment_Variable, _Default_APIs_Amounts)
+    return [int(amount) for amount in amounts.split(",") if amount.strip()]
+
+
+@pytest.fixture(scope="module")
+def report() -> Iterator[BenchmarkReport]:
+    benchmark_report = BenchmarkReport(name="startup")
+    yield benchmark_report
+    benchmark_report.save()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_up(tmp_path_factory) -> None:
+    # Import the web frameworks ahead, so the first benchmark case doesn't include the time of importing them
+    config_path = generate_config(str(tmp_path_factory.mktemp("warm-up")), apis_amount=1, strategy=DivideStrategy())
+    for app_server in _App_Servers.values():
+        mock.MockHTTPServer(config_path=config_path, app_server=app_server(), auto_setup=True)
+
+
+@pytest.fixture(scope="module")
+def config_root(tmp_path_factory) -> str:
+    return str(tmp_path_factory.mktemp("benchmark"))
+
+
+@pytest.mark.parametrize("app_server", list(_App_Servers.keys()))
+@pytest.mark.parametrize("strategy", all_divide_strategies(), ids=layout_name)
+@pytest.mark.parametrize("apis_amount", _apis_amounts())
+def test_startup(
+    report: BenchmarkReport,
+    config_root: str,
+    monkeypatch,
+    apis_amount: int,
+    strategy: DivideStrategy,
+    app_server: str,
+):
+    # Only measure loading the configuration files, not the cached data models
+    monkeypatch.delenv(Config_Cache_Environment_Variable, raising=False)
+    directory = os.path.join(config_root, f"{apis_amount}-{layout_name(strategy)}")
+    config_path = os.path.join(directory, "api.yaml")
+    if not os.path.exists(config_path):
+        generate_config(directory, apis_amount=apis_amount, strategy=strategy)
+    files_amount = sum(len(files) for _, _, files in os.walk(directory))
+
+    timer = PhaseTimer()
+    with timer.patch(
+        [
+            (YAML, "read", "yaml_read"),
+            (mock, "load_config", "deserialize"),
+            (TemplateConfigLoaderWithAPIConfig, "load_config", "deserialize"),
+            (TemplateConfigLoaderByScanFile, "load_config", "template_loading"),
+            (TemplateConfigLoaderByApply, "load_config", "template_loading"),
+            (BaseAppServer, "create_api", "route_build"),
+        ]
+    ):
+        start = time.perf_counter()
+        with timer.measure("others"):
+            server = mock.MockHTTPServer(
+                config_path=config_path, app_server=_App_Servers[app_server](), auto_setup=True
+            )
+        total = time.perf_counter() - start
+
+    assert server._api_config is not None and len(server._api_config.apis.apis) == apis_amount
+    if any(vars(strategy).values()):
+        assert timer.phases["template_loading"] > 0
+    report.record(
+        case={
+            "apis": apis_amount,
+            "layout": layout_name(strategy),
+            "files": files_amount,
+            "app_server": app_server,
+        },
+        phases={phase: in_milliseconds(seconds) for phase, seconds in timer.phases.items()},
+        total=in_milliseconds(total),
+    )
@@ -0,0 +1,113 @@
+"""*The benchmark of processing requests*
+
+Measure the cost of processing each request by the web applications from ``create_flask_app`` (WSGI) and
+``create_fastapi_app`` (ASGI). The requests are sent by calling the applications directly in the same process without
+any socket, so the result is the cost of PyMock-Server and the web framework only.
+
+The result of each scenario has the requests per second and the latencies (in milliseconds) at 50th and 99th
+percentile. The report would be saved as *benchmark-throughput.json* in the directory which could be set by
+environment variable ``MockAPI_Benchmark_Report_Dir``.
+
+The amount of requests of each scenario could be set by environment variable, e.g., ``MockAPI_Benchmark_Requests=500``.
+"""
+
+import os
+import statistics
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional
+
+import pytest
+
+from pymock_server import server
+
+from ._client import ASGIClient, BaseInProcessClient, WSGIClient
+from ._config import generate_workload_config, many_parameters_request_body
+from ._report import BenchmarkReport, in_milliseconds
+
+# The environment variable which is the amount of requests of each scenario.
+Benchmark_Requests_Environment_Variable: str = "MockAPI_Benchmark_Requests"
+
+_Default_Requests_Amount: str = "2000"
+# The requests before measuring, e.g., for the web framework to initial something lazily
+_Warm_Up_Requests_Amount: int = 50
+
+_Base_URL: str = "/api/v1/benchmark"
+
+# The data structure would be:
+# {
+#     <web application>: (<the function to create the application>, <the client to send requests to the application>),
+# }
+_Apps: Dict[str, tuple] = {
+    "flask": (server.create_flask_app, WSGIClient),
+    "fastapi": (server.create_fastapi_app, ASGIClient),
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    path: str
+    body: Optional[dict] = None
+    status_code: int = 200
+
+
+_Scenarios = [
+    Scenario(name="string", method="GET", path=f"{_Base_URL}/string"),
+    Scenario(name="object", method="GET", path=f"{_Base_URL}/object"),
+    Scenario(name="url_variable", method="GET", path=f"{_Base_URL}/variable/123"),
+    Scenario(name="parameters", method="POST", path=f"{_Base_URL}/parameters", body=many_parameters_request_body()),
+    Scenario(
+        name="invalid_parameters",
+        method="POST",
+        path=f"{_Base_URL}/parameters",
+        body={**many_parameters_request_body(), "type4": "not in enums"},
+        status_code=400,
+    ),
+]
+
+
+def _requests_amount() -> int:
+    return int(os.environ.get(Benchmark_Requests_Environment_Variable, _Default_Requests_Amount))
+
+
+@pytest.fixture(scope="module")
+def report() -> Iterator[BenchmarkReport]:
+    benchmark_report = BenchmarkReport(name="throughput")
+    yield benchmark_report
+    benchmark_report.save()
+
+
+@pytest.fixture(scope="module")
+def clients(tmp_path_factory) -> Dict[str, BaseInProcessClient]:
+    config_path = generate_workload_config(str(tmp_path_factory.mktemp("benchmark")))
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("MockAPI_Config", config_path)
+        in_process_clients: Dict[str, BaseInProcessClient] = {}
+        for app_name, (create_app, client) in _Apps.items():
+            in_process_clients[app_name] = client(create_app())
+    return in_process_clients
+
+
+@pytest.mark.parametrize("scenario", _Scenarios, ids=lambda scenario: scenario.name)
+@pytest.mark.parametrize("app_name", list(_Apps.keys()))
+def test_throughput(
+    report: BenchmarkReport, clients: Dict[str, BaseInProcessClient], app_name: str, scenario: Scenario
+):
+    client = clients[app_name]
+    measure: Callable = lambda amount: client.measure(scenario.method, scenario.path, body=scenario.body, amount=amount)
+    measure(_Warm_Up_Requests_Amount)
+
+    amount = _requests_amount()
+    latencies, status_codes = measure(amount)
+
+    assert set(status_codes) == {scenario.status_code}
+    # The data structure would be: [<1st percentile>, <2nd percentile>, ..., <99th percentile>]
+    percentiles = statistics.quantiles(latencies, n=100)
+    report.record(
+        case={"app": app_name, "scenario": scenario.name},
+        requests=amount,
+        rps=round(amount / sum(latencies), 1),
+        p50=in_milliseconds(percentiles[49]),
+        p99=in_milliseconds(percentiles[98]),
+    )
@@ -1,10 +1,17 @@
 import json
+import os
 from typing import Dict
+from unittest.mock import Mock, patch
 
 import pytest
 
 from pymock_server import APIConfig
+from pymock_server._utils.file.operation import parse_yaml_files
 from pymock_server.model import deserialize_api_doc_config, load_config
+from pymock_server.model.api_config.template._load.process import (
+    Parallel_Parsing_Threshold_Environment_Variable,
+)
+from pymock_server.model.config_cache import ConfigCache
 
 # isort: off
 from test._file_utils import MockAPI_Config_Yaml_Path, yaml_factory
@@ -94,6 +101,59 @@ class TestInitFunctions:
             assert expected_api_config.http.response is not None
             assert api_config.http.response.serialize() == expected_api_config.http.response.serialize()
 
+    @pytest.mark.parametrize(("yaml_config_path", "expected_yaml_config_path"), LOAD_DIVIDING_CONFIG_TEST_CASE)
+    def test_load_config_with_dividing_feature_from_cache(
+        self, tmp_path, yaml_config_path: str, expected_yaml_config_path: str
+    ):
+        cache = ConfigCache(directory=str(tmp_path))
+        loader = Mock(side_effect=lambda: load_config(yaml_config_path, cache=False))
+
+        loaded_config = cache.load(yaml_config_path, loader=loader)
+        cached_config = cache.load(yaml_config_path, loader=loader)
+
+        # It should load the configuration only once, and all the divided files are recorded as dependencies
+        loader.assert_called_once()
+        assert cached_config is not None and loaded_config is not None
+        assert cached_config is not loaded_config
+        assert cached_config.serialize() == loaded_config.serialize()
+        assert len(list(tmp_path.glob("*.manifest.json"))) == 1
+        manifest = json.loads(next(tmp_path.glob("*.manifest.json")).read_text())
+        assert len(manifest["dependencies"]["files"]) > 1
+
+    @pytest.mark.parametrize(("yaml_config_path", "expected_yaml_config_path"), LOAD_DIVIDING_CONFIG_TEST_CASE)
+    def test_load_config_with_dividing_feature_in_parallel(self, yaml_config_path: str, expected_yaml_config_path: str):
+        sequential_config = load_config(yaml_config_path, cache=False)
+        with patch("pymock_server.model.api_config.template._load.process._Parallel_Parsing_Threshold", 1):
+            with patch(
+                "pymock_server.model.api_config.template._load.process.can_parse_in_parallel", return_value=True
+            ):
+                with patch(
+                    "pymock_server.model.api_config.template._load.process.parse_yaml_files",
+                    side_effect=lambda paths: parse_yaml_files(paths, max_workers=2),
+                ) as mock_parse_yaml_files:
+                    parallel_config = load_config(yaml_config_path, cache=False)
+                    mock_parse_yaml_files.assert_called_once()
+
+        # The loading order is the same, so the result should be the same
+        assert parallel_config is not None and sequential_config is not None
+        assert parallel_config.serialize() == sequential_config.serialize()
+
+    @pytest.mark.parametrize(("yaml_config_path", "expected_yaml_config_path"), LOAD_DIVIDING_CONFIG_TEST_CASE[:1])
+    def test_load_config_with_dividing_feature_and_parallel_parsing_is_disabled(
+        self, yaml_config_path: str, expected_yaml_config_path: str
+    ):
+        with patch("pymock_server.model.api_config.template._load.process._Parallel_Parsing_Threshold", 1), patch.dict(
+            os.environ, {Parallel_Parsing_Threshold_Environment_Variable: "0"}
+        ):
+            with patch(
+                "pymock_server.model.api_config.template._load.process.can_parse_in_parallel", return_value=True
+            ):
+                with patch(
+                    "pymock_server.model.api_config.template._load.process.parse_yaml_files"
+                ) as mock_parse_yaml_files:
+                    assert load_config(yaml_config_path, cache=False) is not None
+                    mock_parse_yaml_files.assert_not_called()
+
     @pytest.mark.parametrize("openapi_config_path", DESERIALIZE_OPENAPI_DOCUMENT_CONFIG_TEST_CASE)
     def test_deserialize_swagger_api_config_with_openapi_config(self, openapi_config_path: str):
         # Pre-process
@@ -109,6 +109,7 @@ class TestSubCmdRestServer(CommandFunctionTestSpec):
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Pull.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Run.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Check.value)
+        self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Compile.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Add.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Get.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Sample.value)
@@ -126,6 +127,7 @@ class TestSubCmdRestServerHelp(CommandFunctionTestSpec):
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Pull.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Run.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Check.value)
+        self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Compile.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Add.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Get.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Sample.value)
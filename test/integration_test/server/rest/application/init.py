@@ -8,14 +8,17 @@ import pytest
 from fastapi.testclient import TestClient as FastAPITestClient
 from flask.app import Response as FlaskResponse
 from httpx import Response as FastAPIResponse
+from werkzeug.test import Client as WSGITestClient
 
 from pymock_server import APIConfig
 from pymock_server.model import MockAPI, load_config
 from pymock_server.model.api_config.apis import APIParameter
 from pymock_server.server.rest.application import (
+    ASGINativeServer,
     BaseAppServer,
     FastAPIServer,
     FlaskServer,
+    WSGINativeServer,
 )
 from pymock_server.server.rest.application.response import HTTPResponse as _HTTPResponse
 
@@ -275,3 +278,39 @@ class TestMockHTTPServerWithFastAPIApp(MockHTTPServerTestSpec):
             return response.json()
         except:
             return response.text
+
+
+class TestMockHTTPServerWithASGINativeApp(TestMockHTTPServerWithFastAPIApp):
+    @pytest.fixture(scope="class")
+    def server_app_type(self) -> ASGINativeServer:  # type: ignore[override]
+        return ASGINativeServer()
+
+    @pytest.fixture(scope="function")
+    def client(self, mock_server_app: Any) -> FastAPITestClient:  # type: ignore[override]
+        return FastAPITestClient(mock_server_app)
+
+    def test_not_found_and_method_not_allowed(self, client: FastAPITestClient):
+        response = client.get(f"{_Base_URL}/not-exist-api")
+        assert response.status_code == 404
+
+        response = client.patch(f"{_Base_URL}{_Google_Home_Value['url']}")
+        assert response.status_code == 405
+        assert "GET" in response.headers["Allow"]
+
+
+class TestMockHTTPServerWithWSGINativeApp(TestMockHTTPServerWithFlaskApp):
+    @pytest.fixture(scope="class")
+    def server_app_type(self) -> WSGINativeServer:  # type: ignore[override]
+        return WSGINativeServer()
+
+    @pytest.fixture(scope="function")
+    def client(self, mock_server_app: Any) -> WSGITestClient:  # type: ignore[override]
+        return WSGITestClient(mock_server_app)
+
+    def test_not_found_and_method_not_allowed(self, client: WSGITestClient):
+        response = client.get(f"{_Base_URL}/not-exist-api")
+        assert response.status_code == 404
+
+        response = client.patch(f"{_Base_URL}{_Google_Home_Value['url']}")
+        assert response.status_code == 405
+        assert "GET" in response.headers["Allow"]
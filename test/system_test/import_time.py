@@ -0,0 +1,76 @@
+import os
+import pathlib
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import pytest
+
+# The budget (in microseconds) of the import time of PyMock-Server when it only shows the help of command line. It
+# takes about 70 ms currently, and it took about 220 ms before importing the data models and the web frameworks lazily.
+Import_Time_Budget: int = 150_000
+
+# The modules which are only needed by some subcommands, so they shouldn't be imported if it doesn't run any of them
+Lazy_Imported_Modules: List[str] = [
+    "yaml",
+    "flask",
+    "fastapi",
+    "urllib3",
+    "pymock_server.model.api_config",
+    "pymock_server.model.rest_api_doc_config",
+    "pymock_server.server",
+]
+
+_Project_Path: str = str(pathlib.Path(__file__).parent.parent.parent)
+
+
+def _import_time(cmd_args: List[str]) -> Dict[str, Tuple[int, bool]]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_Project_Path, env.get("PYTHONPATH", "")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pymock_server", *cmd_args],
+        cwd=_Project_Path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # The data structure would be:
+    # {
+    #     <module name>: (<cumulative import time in microseconds>, <it's imported by the other module or not>)
+    # }
+    import_time: Dict[str, Tuple[int, bool]] = {}
+    for line in result.stderr.splitlines():
+        matched = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)", line)
+        if matched:
+            import_time[matched.group(3)] = (int(matched.group(1)), bool(matched.group(2)))
+    return import_time
+
+
+@pytest.mark.parametrize(
+    "cmd_args",
+    [
+        ["--help"],
+        ["rest-server", "--help"],
+        ["rest-server", "run", "--help"],
+    ],
+)
+def test_import_time_of_showing_help(cmd_args: List[str]):
+    # Use the best one to reduce the noise of the machine
+    import_times = [_import_time(cmd_args) for _ in range(3)]
+
+    for lazy_module in Lazy_Imported_Modules:
+        assert lazy_module not in import_times[0], f"It shouldn't import module *{lazy_module}* to show the help."
+    package_import_time = min(
+        sum(
+            time
+            for module, (time, is_nested) in import_time.items()
+            if module.split(".")[0] == "pymock_server" and not is_nested
+        )
+        for import_time in import_times
+    )
+    assert package_import_time < Import_Time_Budget, (
+        f"It takes {package_import_time / 1000:.1f} ms to import PyMock-Server, it's over the budget "
+        f"{Import_Time_Budget / 1000:.1f} ms."
+    )
@@ -107,6 +107,7 @@ class TestSubCmdRestServerWithoutAnyCmdArgs(SubCmdRestServerTestSuite):
         self._should_contains_chars_in_result(cmd_running_result, SubCommand.Pull)
         self._should_contains_chars_in_result(cmd_running_result, SubCommand.Run)
         self._should_contains_chars_in_result(cmd_running_result, SubCommand.Check)
+        self._should_contains_chars_in_result(cmd_running_result, SubCommand.Compile)
         self._should_contains_chars_in_result(cmd_running_result, SubCommand.Add)
         self._should_contains_chars_in_result(cmd_running_result, SubCommand.Get)
         self._should_contains_chars_in_result(cmd_running_result, SubCommand.Sample)
@@ -127,6 +128,24 @@ class TestSubCommandRun(SubCmdRestServerTestSuite):
         self._should_contains_chars_in_result(cmd_running_result, "-b BIND, --bind BIND")
         self._should_contains_chars_in_result(cmd_running_result, "-w WORKERS, --workers WORKERS")
         self._should_contains_chars_in_result(cmd_running_result, "--log-level LOG_LEVEL")
+        self._should_contains_chars_in_result(cmd_running_result, "--json-backend JSON_BACKEND")
+        self._should_contains_chars_in_result(cmd_running_result, "--hot-reload")
+        self._should_contains_chars_in_result(cmd_running_result, "--metrics")
+        self._should_contains_chars_in_result(cmd_running_result, "--metrics-dir METRICS_DIR")
+
+
+class TestSubCommandCompile(SubCmdRestServerTestSuite):
+    Terminate_Command_Running_When_Sniff_IP_Info: bool = False
+
+    @property
+    def options(self) -> str:
+        return "compile --help"
+
+    def _verify_running_output(self, cmd_running_result: str) -> None:
+        self._should_contains_chars_in_result(cmd_running_result, "mock rest-server compile [-h]")
+        self._should_contains_chars_in_result(cmd_running_result, "-h, --help")
+        self._should_contains_chars_in_result(cmd_running_result, "-p CONFIG_PATH, --config-path CONFIG_PATH")
+        self._should_contains_chars_in_result(cmd_running_result, "-o OUTPUT_PATH, --output OUTPUT_PATH")
 
 
 class TestSubCommandSample(SubCmdRestServerTestSuite):
@@ -0,0 +1,138 @@
+import glob
+import os
+import pathlib
+from unittest.mock import patch
+
+import pytest
+
+from pymock_server._utils.file.index import (
+    DirectoryIndex,
+    glob_paths,
+    path_exists,
+    path_is_dir,
+    path_is_file,
+    shared_directory_index,
+)
+from pymock_server._utils.file.manifest import record_dependencies
+
+
+@pytest.fixture(scope="function")
+def config_dir(tmp_path) -> str:
+    (tmp_path / "api.yaml").write_text("name: test")
+    (tmp_path / "_expected_api.yaml").write_text("name: test")
+    (tmp_path / ".hidden.yaml").write_text("name: test")
+    (tmp_path / "foo").mkdir()
+    (tmp_path / "foo" / "get_foo-api.yaml").write_text("url: /foo")
+    (tmp_path / "foo" / "get_foo-request.yaml").write_text("method: GET")
+    return str(tmp_path)
+
+
+class TestDirectoryIndex:
+    @pytest.fixture(scope="function")
+    def index(self) -> DirectoryIndex:
+        return DirectoryIndex()
+
+    @pytest.mark.parametrize(
+        ("path", "expected_exists", "expected_is_file", "expected_is_dir"),
+        [
+            ("api.yaml", True, True, False),
+            ("foo", True, False, True),
+            ("foo/get_foo-api.yaml", True, True, False),
+            ("foo/not_exist.yaml", False, False, False),
+            ("not_exist/get_foo-api.yaml", False, False, False),
+            ("api.yaml/not_exist.yaml", False, False, False),
+            ("", True, False, True),
+        ],
+    )
+    def test_checking(
+        self,
+        index: DirectoryIndex,
+        config_dir: str,
+        path: str,
+        expected_exists: bool,
+        expected_is_file: bool,
+        expected_is_dir: bool,
+    ):
+        path = str(pathlib.Path(config_dir, path))
+        assert index.exists(path) is expected_exists is os.path.exists(path)
+        assert index.is_file(path) is expected_is_file is os.path.isfile(path)
+        assert index.is_dir(path) is expected_is_dir is os.path.isdir(path)
+
+    def test_checking_root_directory(self, index: DirectoryIndex):
+        assert index.exists("/") is True
+        assert index.is_dir("/") is True
+
+    def test_checking_relative_path(self, index: DirectoryIndex, config_dir: str):
+        relative_path = os.path.relpath(os.path.join(config_dir, "foo", "get_foo-api.yaml"))
+        assert index.is_file(relative_path) is True
+        assert index.is_file(f"./{relative_path}") is True
+
+    @pytest.mark.parametrize("pattern", ["[!_**]**", "**-api.yaml", "*.yaml", ".*", "not_exist*"])
+    def test_glob(self, index: DirectoryIndex, config_dir: str, pattern: str):
+        for directory in (config_dir, os.path.join(config_dir, "foo")):
+            expected_paths = glob.glob(str(pathlib.Path(directory, pattern)))
+            assert sorted(index.glob(directory, pattern)) == sorted(expected_paths)
+
+    def test_glob_with_not_exist_directory(self, index: DirectoryIndex, config_dir: str):
+        assert index.glob(os.path.join(config_dir, "not_exist"), "*") == []
+
+    def test_list(self, index: DirectoryIndex, config_dir: str):
+        assert sorted(index.list(os.path.join(config_dir, "foo"))) == [
+            os.path.join(config_dir, "foo", "get_foo-api.yaml"),
+            os.path.join(config_dir, "foo", "get_foo-request.yaml"),
+        ]
+        assert index.list(os.path.join(config_dir, "not_exist")) == []
+
+    def test_list_each_directory_only_once(self, index: DirectoryIndex, config_dir: str):
+        with patch("pymock_server._utils.file.index.os.scandir", wraps=os.scandir) as mock_scandir:
+            for _ in range(3):
+                index.is_file(os.path.join(config_dir, "foo", "get_foo-api.yaml"))
+                index.exists(os.path.join(config_dir, "foo", "get_foo-response.yaml"))
+                index.glob(os.path.join(config_dir, "foo"), "*")
+            assert mock_scandir.call_count == 1
+
+
+class TestSharedDirectoryIndex:
+    def test_share_index_in_context(self):
+        with shared_directory_index() as index:
+            with shared_directory_index() as nested_index:
+                assert nested_index is index
+        with shared_directory_index() as other_index:
+            assert other_index is not index
+
+    def test_use_shared_index(self, config_dir: str):
+        file_path = os.path.join(config_dir, "foo", "get_foo-api.yaml")
+        with shared_directory_index():
+            assert path_is_file(file_path) is True
+            # The index doesn't know the changes after listing the directory
+            os.remove(file_path)
+            assert path_exists(file_path) is True
+        assert path_exists(file_path) is False
+
+    def test_without_shared_index(self, config_dir: str):
+        assert path_exists(os.path.join(config_dir, "api.yaml")) is True
+        assert path_is_file(os.path.join(config_dir, "foo")) is False
+        assert path_is_dir(os.path.join(config_dir, "foo")) is True
+        assert sorted(glob_paths(config_dir, "[!_]*.yaml")) == [os.path.join(config_dir, "api.yaml")]
+
+    @pytest.mark.parametrize("use_shared_index", [True, False])
+    def test_record_dependencies(self, config_dir: str, use_shared_index: bool):
+        missing_path = os.path.join(config_dir, "foo", "get_foo-response.yaml")
+        with record_dependencies() as manifest:
+            if use_shared_index:
+                with shared_directory_index():
+                    self._check_paths(config_dir, missing_path)
+            else:
+                self._check_paths(config_dir, missing_path)
+
+        dependencies = manifest.serialize()
+        assert dependencies["missing_paths"] == [missing_path]
+        assert list(dependencies["directories"].keys()) == [config_dir]
+
+    def _check_paths(self, config_dir: str, missing_path: str) -> None:
+        assert path_is_file(missing_path) is False
+        assert path_exists(missing_path) is False
+        # The existing paths are not the dependencies
+        assert path_is_file(os.path.join(config_dir, "api.yaml")) is True
+        assert path_is_file(os.path.join(config_dir, "foo")) is False
+        glob_paths(config_dir, "*")
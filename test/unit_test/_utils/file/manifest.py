@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from pymock_server._utils.file.manifest import (
+    FileManifest,
+    depend_on_directory,
+    depend_on_file,
+    depend_on_missing_path,
+    file_digest,
+    record_dependencies,
+)
+
+
+def _write(path: str, content: str) -> None:
+    with open(path, "w", encoding="utf-8") as file_stream:
+        file_stream.write(content)
+
+
+def test_file_digest(tmp_path):
+    file_path = str(tmp_path / "api.yaml")
+    _write(file_path, "name: test")
+    other_file_path = str(tmp_path / "other.yaml")
+    _write(other_file_path, "name: test")
+
+    assert file_digest(file_path) == file_digest(other_file_path)
+    _write(other_file_path, "name: other")
+    assert file_digest(file_path) != file_digest(other_file_path)
+
+
+def test_record_dependencies(tmp_path):
+    file_path = str(tmp_path / "api.yaml")
+    _write(file_path, "name: test")
+    missing_path = str(tmp_path / "not_exist.yaml")
+
+    # It doesn't record anything if it's not recording
+    depend_on_file(file_path)
+    depend_on_missing_path(missing_path)
+
+    with record_dependencies() as manifest:
+        depend_on_file(file_path)
+        depend_on_missing_path(missing_path)
+        depend_on_directory(str(tmp_path))
+
+    assert manifest.serialize() == {
+        "files": {file_path: [os.stat(file_path).st_mtime_ns, len("name: test"), file_digest(file_path)]},
+        "missing_paths": [missing_path],
+        "directories": {str(tmp_path): ["api.yaml"]},
+    }
+
+
+class TestFileManifest:
+    @pytest.fixture(scope="function")
+    def file_path(self, tmp_path) -> str:
+        path = str(tmp_path / "api.yaml")
+        _write(path, "name: test")
+        return path
+
+    @pytest.fixture(scope="function")
+    def manifest(self, tmp_path, file_path: str) -> FileManifest:
+        manifest = FileManifest()
+        manifest.add_file(file_path)
+        manifest.add_missing_path(str(tmp_path / "not_exist.yaml"))
+        manifest.add_directory(str(tmp_path))
+        return manifest
+
+    def test_is_fresh(self, manifest: FileManifest):
+        assert manifest.is_fresh() is True
+
+    def test_is_fresh_after_modifying_file(self, manifest: FileManifest, file_path: str):
+        _write(file_path, "name: modified test")
+        assert manifest.is_fresh() is False
+
+    def test_is_fresh_after_only_touching_file(self, manifest: FileManifest, file_path: str):
+        stat_result = os.stat(file_path)
+        os.utime(file_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+        # The content is the same, so it's still fresh
+        assert manifest.is_fresh() is True
+
+    def test_is_fresh_after_modifying_file_with_same_size(self, manifest: FileManifest, file_path: str):
+        stat_result = os.stat(file_path)
+        _write(file_path, "name: TEST")
+        os.utime(file_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+        assert manifest.is_fresh() is False
+
+    def test_is_fresh_after_deleting_file(self, manifest: FileManifest, file_path: str):
+        os.remove(file_path)
+        assert manifest.is_fresh() is False
+
+    def test_is_fresh_after_creating_missing_path(self, manifest: FileManifest, tmp_path):
+        _write(str(tmp_path / "not_exist.yaml"), "name: test")
+        assert manifest.is_fresh() is False
+
+    def test_is_fresh_after_adding_file_into_directory(self, manifest: FileManifest, tmp_path):
+        (tmp_path / "foo").mkdir()
+        assert manifest.is_fresh() is False
+
+    def test_is_fresh_after_adding_hidden_file_into_directory(self, manifest: FileManifest, tmp_path):
+        (tmp_path / ".pymock_cache").mkdir()
+        assert manifest.is_fresh() is True
+
+    def test_serialize_and_deserialize(self, manifest: FileManifest, file_path: str):
+        deserialized_manifest = FileManifest.deserialize(manifest.serialize())
+        assert deserialized_manifest.serialize() == manifest.serialize()
+        assert deserialized_manifest.files == [file_path]
+        assert deserialized_manifest.is_fresh() is True
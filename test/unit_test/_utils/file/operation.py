@@ -1,9 +1,20 @@
+import os
+import threading
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import mock_open, patch
 
 import pytest
 
-from pymock_server._utils.file.operation import JSON, YAML, _BaseFileOperation
+from pymock_server._utils.file.operation import (
+    JSON,
+    YAML,
+    _BaseFileOperation,
+    can_parse_in_parallel,
+    is_preloading,
+    parse_yaml_files,
+    preload_content,
+)
 
 
 class _FileOptTestSpec(metaclass=ABCMeta):
@@ -64,3 +75,68 @@ class TestJSON(_FileOptTestSpec):
     @property
     def _load_function_path(self) -> str:
         return "pymock_server._utils.file.operation.json.loads"
+
+
+class TestYAMLPreloading:
+    @pytest.fixture(scope="function")
+    def yaml_paths(self, tmp_path) -> list:
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"api-{i}.yaml"
+            path.write_text(f"name: api-{i}")
+            paths.append(str(path))
+        return paths
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_parse_yaml_files(self, tmp_path, yaml_paths: list, max_workers: int):
+        invalid_path = tmp_path / "invalid.yaml"
+        invalid_path.write_text("name: [invalid YAML")
+
+        contents = parse_yaml_files(yaml_paths + [str(invalid_path)], max_workers=max_workers)
+
+        # The invalid file would be skipped
+        assert contents == {os.path.abspath(p): {"name": f"api-{i}"} for i, p in enumerate(yaml_paths)}
+
+    def test_parse_yaml_files_without_forking(self, yaml_paths: list):
+        with patch(
+            "pymock_server._utils.file.operation.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as mock_executor:
+            contents = parse_yaml_files(yaml_paths, max_workers=2)
+
+        assert len(contents) == len(yaml_paths)
+        # It doesn't fork the process which may have the other running threads
+        assert mock_executor.call_args.kwargs["mp_context"].get_start_method() in ("forkserver", "spawn")
+
+    def test_parse_yaml_files_if_processes_are_broken(self, yaml_paths: list):
+        with patch("pymock_server._utils.file.operation.ProcessPoolExecutor", side_effect=OSError("Cannot fork")):
+            assert parse_yaml_files(yaml_paths, max_workers=2) == {}
+
+    def test_read_with_preloaded_content(self, yaml_paths: list):
+        assert is_preloading() is False
+        with preload_content({os.path.abspath(yaml_paths[0]): {"name": "preloaded"}}):
+            assert is_preloading() is True
+            assert YAML().read(yaml_paths[0]) == {"name": "preloaded"}
+            # Each preloaded content would only be used once
+            assert YAML().read(yaml_paths[0]) == {"name": "api-0"}
+            assert YAML().read(yaml_paths[1]) == {"name": "api-1"}
+        assert is_preloading() is False
+
+    @pytest.mark.parametrize(
+        ("cpu_count", "in_main_thread", "expected_result"),
+        [
+            (4, True, True),
+            (1, True, False),
+            (None, True, False),
+            (4, False, False),
+        ],
+    )
+    def test_can_parse_in_parallel(self, cpu_count, in_main_thread: bool, expected_result: bool):
+        result = []
+        with patch("pymock_server._utils.file.operation.os.cpu_count", return_value=cpu_count):
+            if in_main_thread:
+                result.append(can_parse_in_parallel())
+            else:
+                thread = threading.Thread(target=lambda: result.append(can_parse_in_parallel()))
+                thread.start()
+                thread.join()
+        assert result == [expected_result]
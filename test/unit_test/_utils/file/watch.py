@@ -0,0 +1,193 @@
+import os
+import sys
+import threading
+import time
+from typing import List, Set
+from unittest.mock import patch
+
+import pytest
+
+from pymock_server._utils.file.watch import (
+    InotifyFileWatcher,
+    PollingFileWatcher,
+    changed_files,
+    file_watcher,
+    snapshot_files,
+)
+
+_Is_Linux = sys.platform.startswith("linux")
+
+
+def _write(path: str, content: str) -> None:
+    with open(path, "w", encoding="utf-8") as file_stream:
+        file_stream.write(content)
+
+
+def test_snapshot_files(tmp_path):
+    file_path = str(tmp_path / "api.yaml")
+    _write(file_path, "name: test")
+    not_exist_path = str(tmp_path / "not_exist.yaml")
+
+    files, directories = snapshot_files([file_path, str(tmp_path), not_exist_path])
+
+    assert list(files.keys()) == [file_path]
+    assert files[file_path][1] == len("name: test")
+    assert directories == {str(tmp_path)}
+
+
+@pytest.mark.parametrize(
+    ("previous", "current", "expect_changed"),
+    [
+        ({"a": (1, 1)}, {"a": (1, 1)}, set()),
+        ({"a": (1, 1)}, {"a": (2, 1)}, {"a"}),
+        ({"a": (1, 1)}, {"a": (1, 2)}, {"a"}),
+        ({"a": (1, 1)}, {"a": (1, 1), "b": (1, 1)}, {"b"}),
+        ({"a": (1, 1), "b": (1, 1)}, {"a": (1, 1)}, {"b"}),
+        ({}, {}, set()),
+    ],
+)
+def test_changed_files(previous: dict, current: dict, expect_changed: Set[str]):
+    assert changed_files(previous, current) == expect_changed
+
+
+class TestPollingFileWatcher:
+    @pytest.fixture(scope="function")
+    def file_path(self, tmp_path) -> str:
+        path = str(tmp_path / "api.yaml")
+        _write(path, "name: test")
+        return path
+
+    def test_check_without_changes(self, file_path: str):
+        received: List[Set[str]] = []
+        watcher = PollingFileWatcher(list_paths=lambda: [file_path], on_change=received.append)
+        watcher._refresh()
+
+        assert watcher.check() == set()
+        assert received == []
+
+    def test_check_with_modified_file(self, file_path: str):
+        received: List[Set[str]] = []
+        watcher = PollingFileWatcher(list_paths=lambda: [file_path], on_change=received.append)
+        watcher._refresh()
+
+        _write(file_path, "name: modified test")
+
+        assert watcher.check() == {file_path}
+        assert received == [{file_path}]
+        # It should take the new status as the base of next comparing
+        assert watcher.check() == set()
+
+    def test_check_with_added_and_deleted_files(self, tmp_path, file_path: str):
+        new_file_path = str(tmp_path / "new.yaml")
+        watcher = PollingFileWatcher(
+            list_paths=lambda: [p for p in (file_path, new_file_path) if os.path.exists(p)], on_change=lambda _: None
+        )
+        watcher._refresh()
+
+        _write(new_file_path, "name: new")
+        os.remove(file_path)
+
+        assert watcher.check() == {file_path, new_file_path}
+
+    def test_check_with_error_in_callback(self, file_path: str):
+        def _on_change(_: Set[str]) -> None:
+            raise RuntimeError("Invalid configuration")
+
+        watcher = PollingFileWatcher(list_paths=lambda: [file_path], on_change=_on_change)
+        watcher._refresh()
+
+        _write(file_path, "name: modified test")
+
+        assert watcher.check() == {file_path}
+
+    def test_start_and_stop(self, file_path: str):
+        changed = threading.Event()
+        watcher = PollingFileWatcher(list_paths=lambda: [file_path], on_change=lambda _: changed.set(), interval=0.01)
+        watcher.start()
+        try:
+            assert watcher.is_running is True
+            _write(file_path, "name: modified test")
+            assert changed.wait(timeout=5) is True
+        finally:
+            watcher.stop()
+        assert watcher.is_running is False
+
+
+@pytest.mark.skipif(not _Is_Linux, reason="The inotify API is only available in Linux.")
+class TestInotifyFileWatcher:
+    def test_get_changes_immediately(self, tmp_path):
+        file_path = str(tmp_path / "api.yaml")
+        _write(file_path, "name: test")
+        received: List[Set[str]] = []
+        changed = threading.Event()
+
+        def _on_change(paths: Set[str]) -> None:
+            received.append(paths)
+            changed.set()
+
+        # The interval is long, so it could get the changes in time only by inotify
+        watcher = InotifyFileWatcher(list_paths=lambda: [file_path, str(tmp_path)], on_change=_on_change, interval=30)
+        watcher.start()
+        try:
+            assert str(tmp_path) in watcher._watch_descriptors.keys()
+            start = time.perf_counter()
+            _write(file_path, "name: modified test")
+            assert changed.wait(timeout=5) is True
+            assert time.perf_counter() - start < 5
+        finally:
+            watcher.stop()
+        assert received == [{file_path}]
+        assert watcher._fd == -1
+
+    def test_start_again_after_stopping(self, tmp_path):
+        file_path = str(tmp_path / "api.yaml")
+        _write(file_path, "name: test")
+        changed = threading.Event()
+        watcher = InotifyFileWatcher(
+            list_paths=lambda: [file_path, str(tmp_path)], on_change=lambda _: changed.set(), interval=30
+        )
+        watcher.start()
+        watcher.stop()
+        assert watcher._fd == -1
+        assert watcher._wake_up_writer == -1
+
+        watcher.start()
+        try:
+            assert watcher.is_running is True
+            assert watcher._fd >= 0
+            assert str(tmp_path) in watcher._watch_descriptors.keys()
+            _write(file_path, "name: modified test")
+            assert changed.wait(timeout=5) is True
+        finally:
+            watcher.stop()
+        assert watcher.is_running is False
+        assert watcher._fd == -1
+
+    def test_stop_before_starting(self):
+        watcher = InotifyFileWatcher(list_paths=lambda: [], on_change=lambda _: None)
+        with patch("pymock_server._utils.file.watch.os.close") as mock_close:
+            watcher.stop()
+        # It doesn't open anything until it's started
+        mock_close.assert_not_called()
+        assert watcher._fd == -1
+        assert watcher.is_running is False
+
+    def test_instantiate_in_not_linux_platform(self):
+        with patch("pymock_server._utils.file.watch.sys.platform", "darwin"):
+            with pytest.raises(OSError):
+                InotifyFileWatcher(list_paths=lambda: [], on_change=lambda _: None)
+
+
+class TestFileWatcher:
+    @pytest.mark.skipif(not _Is_Linux, reason="The inotify API is only available in Linux.")
+    def test_use_inotify(self):
+        watcher = file_watcher(list_paths=lambda: [], on_change=lambda _: None)
+        try:
+            assert isinstance(watcher, InotifyFileWatcher)
+        finally:
+            watcher.stop()
+
+    def test_use_polling_if_inotify_is_not_available(self):
+        with patch("pymock_server._utils.file.watch.sys.platform", "darwin"):
+            watcher = file_watcher(list_paths=lambda: [], on_change=lambda _: None)
+        assert isinstance(watcher, PollingFileWatcher)
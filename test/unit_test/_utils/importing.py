@@ -1,18 +1,53 @@
+import importlib
 import re
-from typing import Any, Callable, Optional, Type
+import sys
+import types
+from typing import Any, Callable, Iterator, Optional, Type
 from unittest.mock import MagicMock, Mock, _patch, patch
 
 import fastapi
 import flask
 import pytest
 
-from pymock_server._utils.importing import ensure_importing, import_web_lib
+from pymock_server._utils.importing import (
+    ensure_importing,
+    import_compression_lib,
+    import_json_lib,
+    import_web_lib,
+    lazy_import,
+)
 
 
 def fake_function() -> str:
     return "Fake function for PyTest"
 
 
+class TestImportOptionalLib:
+    @pytest.mark.parametrize(
+        ("lib_importer", "lib_name"),
+        [
+            (import_json_lib, "orjson"),
+            (import_json_lib, "ujson"),
+            (import_compression_lib, "brotli"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        ("find_spec_return", "side_effect", "lib_ready"),
+        [(Mock(), None, True), (None, None, False), (None, ImportError("PyTest ImportError"), False)],
+    )
+    def test_lib_ready(
+        self, lib_importer: type, lib_name: str, find_spec_return: Any, side_effect: Any, lib_ready: bool
+    ):
+        with patch(
+            "pymock_server._utils.importing.find_spec", return_value=find_spec_return, side_effect=side_effect
+        ) as mock_find_spec:
+            with patch.object(lib_importer, lib_name) as mock_import_lib:
+                assert getattr(lib_importer, f"{lib_name}_ready")() is lib_ready
+                mock_find_spec.assert_called_once_with(lib_name)
+                # It only finds the library without importing it
+                mock_import_lib.assert_not_called()
+
+
 class TestImportWebLib:
     @pytest.fixture(scope="function")
     def import_web_lib(self) -> Type[import_web_lib]:
@@ -108,3 +143,35 @@ class TestEnsureImporting:
 
     def _when_ensure_import(self, web_lib: str, err_callback: Callable = None) -> Callable:
         return ensure_importing(getattr(import_web_lib, web_lib), import_err_callback=err_callback)(fake_function)
+
+
+class TestLazyImport:
+    @pytest.fixture(scope="function")
+    def package(self) -> Iterator[types.ModuleType]:
+        package = types.ModuleType("pytest_lazy_package")
+        package.__getattr__ = lazy_import(package.__name__, {"Format": "pymock_server._utils.file"})
+        with patch.dict(sys.modules, {package.__name__: package}):
+            yield package
+
+    def test_import_attribute(self, package: types.ModuleType):
+        from pymock_server._utils.file import Format
+
+        assert "Format" not in vars(package)
+        assert package.Format is Format
+        # It saves the attribute into the package, so it doesn't import the module again
+        assert "Format" in vars(package)
+        with patch("importlib.import_module") as mock_import_module:
+            assert package.Format is Format
+            mock_import_module.assert_not_called()
+
+    def test_import_not_exist_attribute(self, package: types.ModuleType):
+        with pytest.raises(AttributeError) as exc_info:
+            package.NotExist
+        assert re.search(r"has no attribute 'NotExist'", str(exc_info.value))
+        assert not hasattr(package, "NotExist")
+
+    def test_import_package_lazily(self):
+        import pymock_server.model
+        from pymock_server.model.api_config import APIConfig
+
+        assert pymock_server.model.APIConfig is APIConfig
@@ -1,4 +1,7 @@
+import random
 import re
+import threading
+from decimal import Decimal
 from typing import Type
 
 import pytest
@@ -10,6 +13,8 @@ from pymock_server._utils.random import (
     RandomFromSequence,
     RandomInteger,
     RandomString,
+    ValueSize,
+    seeded_random,
 )
 
 
@@ -20,3 +25,99 @@ def test_invalid_usage(random_obj: Type[BaseRandomGenerator]):
     with pytest.raises(RuntimeError) as exc_info:
         random_obj()
     assert re.search(r"don't instantiate", str(exc_info.value)) is not None
+
+
+class TestRandomGeneratorInBatch:
+    @pytest.mark.parametrize("size", [ValueSize(min=0, max=3), ValueSize(min=5, max=8), ValueSize(min=4, max=4)])
+    def test_generate_many_strings(self, size: ValueSize):
+        values = RandomString.generate_many(100, size=size)
+        assert len(values) == 100
+        for value in values:
+            assert isinstance(value, str)
+            assert size.min <= len(value) <= size.max
+            assert re.fullmatch(r"[a-zA-Z]*", value) is not None
+
+    @pytest.mark.parametrize("value_range", [ValueSize(min=-9, max=9), ValueSize(min=3, max=3)])
+    def test_generate_many_integers(self, value_range: ValueSize):
+        values = RandomInteger.generate_many(100, value_range=value_range)
+        assert len(values) == 100
+        for value in values:
+            assert isinstance(value, int)
+            assert value_range.min <= value <= value_range.max
+
+    def test_generate_many_big_decimals(self):
+        values = RandomBigDecimal.generate_many(
+            100, integer_range=ValueSize(min=-99, max=99), decimal_range=ValueSize(min=0, max=999)
+        )
+        assert len(values) == 100
+        for value in values:
+            assert isinstance(value, Decimal)
+            assert Decimal("-99.999") <= value <= Decimal("99.999")
+
+    def test_generate_many_booleans(self):
+        values = RandomBoolean.generate_many(100)
+        assert len(values) == 100
+        assert set(values).issubset({True, False})
+
+    def test_generate_many_from_sequence(self):
+        sequence = ["ENUM_1", "ENUM_2", "ENUM_3"]
+        values = RandomFromSequence.generate_many(100, sequence)
+        assert len(values) == 100
+        assert set(values).issubset(set(sequence))
+
+    @pytest.mark.parametrize(
+        ("random_obj", "kwargs"),
+        [
+            (RandomString, {}),
+            (RandomInteger, {}),
+            (RandomBigDecimal, {}),
+            (RandomBoolean, {}),
+            (RandomFromSequence, {"sequence": ["ENUM_1"]}),
+        ],
+    )
+    def test_generate_nothing(self, random_obj: Type[BaseRandomGenerator], kwargs: dict):
+        assert random_obj.generate_many(0, **kwargs) == []
+
+
+class TestSeededRandom:
+    @staticmethod
+    def _generate_values() -> list:
+        return [
+            RandomString.generate(size=ValueSize(min=1, max=32)),
+            RandomString.generate_many(8, size=ValueSize(min=1, max=32)),
+            RandomInteger.generate(),
+            RandomInteger.generate_many(8),
+            RandomBigDecimal.generate(),
+            RandomBigDecimal.generate_many(8),
+            RandomBoolean.generate_many(8),
+            RandomFromSequence.generate_many(8, ["a", "b", "c", "d"]),
+        ]
+
+    def test_same_seed_generates_same_values(self):
+        with seeded_random(123):
+            values = self._generate_values()
+        with seeded_random(123):
+            assert self._generate_values() == values
+        with seeded_random(456):
+            assert self._generate_values() != values
+
+    def test_global_state_is_not_affected(self):
+        random.seed(789)
+        expected_value = random.random()
+
+        random.seed(789)
+        with seeded_random(123):
+            self._generate_values()
+        assert random.random() == expected_value
+
+    def test_other_threads_are_not_affected(self):
+        other_thread_values: list = []
+        with seeded_random(123):
+            values = self._generate_values()
+        with seeded_random(123):
+            thread = threading.Thread(target=lambda: other_thread_values.extend(self._generate_values()))
+            thread.start()
+            thread.join()
+            # The values in other threads are generated by the global state, and it doesn't consume this seeded one
+            assert self._generate_values() == values
+        assert other_thread_values != values
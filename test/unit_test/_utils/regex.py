@@ -0,0 +1,47 @@
+import re
+
+import pytest
+
+from pymock_server._utils.regex import RegexPatternCache
+
+
+class TestRegexPatternCache:
+    def test_compile(self):
+        cache = RegexPatternCache(max_size=2)
+        pattern = cache.compile(r"\d{1,3}")
+        assert pattern.fullmatch("123")
+        assert cache.info() == {"hits": 0, "misses": 1, "size": 1, "max_size": 2}
+
+        assert cache.compile(r"\d{1,3}") is pattern
+        assert cache.hits == 1 and cache.misses == 1
+
+        # The same regular expression with different flags is a different pattern
+        ignore_case_pattern = cache.compile(r"[a-z]", re.IGNORECASE)
+        assert ignore_case_pattern.flags & re.IGNORECASE
+        assert cache.misses == 2 and cache.size == 2
+
+    def test_compile_over_max_size(self):
+        cache = RegexPatternCache(max_size=2)
+        first_pattern = cache.compile(r"first")
+        cache.compile(r"second")
+        # Use the first one to let it be the most recently used
+        cache.compile(r"first")
+        cache.compile(r"third")
+        assert cache.size == 2
+
+        # The least recently used one should be removed
+        assert cache.compile(r"first") is first_pattern
+        misses = cache.misses
+        cache.compile(r"second")
+        assert cache.misses == misses + 1
+
+    def test_clear(self):
+        cache = RegexPatternCache()
+        cache.compile(r"\w+")
+        cache.compile(r"\w+")
+        cache.clear()
+        assert cache.info() == {"hits": 0, "misses": 0, "size": 0, "max_size": cache.max_size}
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            RegexPatternCache(max_size=0)
@@ -0,0 +1,82 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pymock_server.command.rest_server.compile.component import SubCmdCompileComponent
+from pymock_server.model.cmd_args import SubcmdCompileArguments
+from pymock_server.model.subcmd_common import SysArg
+
+# isort: off
+from test._values import SubCommand, _Test_Config
+
+# isort: on
+
+
+class TestSubCmdCompileComponent:
+    @pytest.fixture(scope="class")
+    def component(self) -> SubCmdCompileComponent:
+        return SubCmdCompileComponent()
+
+    @pytest.mark.parametrize(
+        ("output_path", "expected_output_path"),
+        [
+            ("", "test-api.pymock"),
+            ("./dist/api.pymock", "./dist/api.pymock"),
+        ],
+    )
+    def test_process(self, component: SubCmdCompileComponent, output_path: str, expected_output_path: str):
+        args = SubcmdCompileArguments(
+            subparser_structure=SysArg.parse([SubCommand.RestServer, SubCommand.Compile]),
+            config_path=_Test_Config,
+            output_path=output_path,
+        )
+        api_config = Mock()
+        api_config.is_work = Mock(return_value=True)
+        with patch(
+            "pymock_server.command.rest_server.compile.component.load_config", return_value=api_config
+        ) as mock_load_config:
+            with patch("pymock_server.command.rest_server.compile.component.compile_config") as mock_compile_config:
+                component.process(parser=Mock(), args=args)
+
+                mock_load_config.assert_called_once_with(path=_Test_Config, cache=False)
+                api_config.is_work.assert_called_once()
+                mock_compile_config.assert_called_once_with(api_config, path=expected_output_path, source=_Test_Config)
+
+    @pytest.mark.parametrize("api_config", [None, Mock(is_work=Mock(return_value=False))])
+    def test_process_with_invalid_config(self, component: SubCmdCompileComponent, api_config: Mock):
+        args = SubcmdCompileArguments(
+            subparser_structure=SysArg.parse([SubCommand.RestServer, SubCommand.Compile]),
+            config_path=_Test_Config,
+            output_path="",
+        )
+        with patch("pymock_server.command.rest_server.compile.component.load_config", return_value=api_config):
+            with patch("pymock_server.command.rest_server.compile.component.compile_config") as mock_compile_config:
+                with pytest.raises(SystemExit) as exc_info:
+                    component.process(parser=Mock(), args=args)
+
+                assert str(exc_info.value) == "1"
+                mock_compile_config.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("error", "expected_exception"),
+        [
+            (ValueError("'invalid' is not a valid ResponseStrategy"), SystemExit),
+            (ValueError("other error"), ValueError),
+        ],
+    )
+    def test_process_with_error_in_loading(
+        self, component: SubCmdCompileComponent, error: ValueError, expected_exception: type
+    ):
+        args = SubcmdCompileArguments(
+            subparser_structure=SysArg.parse([SubCommand.RestServer, SubCommand.Compile]),
+            config_path=_Test_Config,
+            output_path="",
+        )
+        with patch("pymock_server.command.rest_server.compile.component.load_config", side_effect=error):
+            with patch("pymock_server.command.rest_server.compile.component.compile_config") as mock_compile_config:
+                with pytest.raises(expected_exception) as exc_info:
+                    component.process(parser=Mock(), args=args)
+
+                if expected_exception is SystemExit:
+                    assert str(exc_info.value) == "1"
+                mock_compile_config.assert_not_called()
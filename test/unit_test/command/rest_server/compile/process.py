@@ -0,0 +1,93 @@
+import glob
+import os
+import pathlib
+import sys
+from argparse import Namespace
+from typing import Callable, List, Optional, Type
+from unittest.mock import Mock, patch
+
+import pytest
+
+# isort: off
+
+from test._values import SubCommand, _Compiled_Config_Path, _Test_Config
+from test.unit_test.command._base.process import BaseCommandProcessorTestSpec
+
+# isort: on
+
+from pymock_server.command.rest_server.compile.process import SubCmdCompile
+from pymock_server.command.subcommand import SubCommandLine
+from pymock_server.model import SubcmdCompileArguments, load_config
+from pymock_server.model.subcmd_common import SysArg
+
+
+def _get_all_yaml(config_type: str) -> List[str]:
+    yaml_dir = os.path.join(
+        str(pathlib.Path(__file__).parent.parent.parent.parent.parent),
+        "data",
+        "check_test",
+        "config",
+        config_type,
+        "*.yaml",
+    )
+    return glob.glob(yaml_dir)
+
+
+class TestSubCmdCompile(BaseCommandProcessorTestSpec):
+    @pytest.fixture(scope="function")
+    def cmd_ps(self) -> SubCmdCompile:
+        return SubCmdCompile()
+
+    @pytest.mark.parametrize("config_path", _get_all_yaml(config_type="valid"))
+    def test_with_command_processor(self, config_path: str, tmp_path, object_under_test: Callable):
+        self._test_process(config_path=config_path, tmp_path=tmp_path, cmd_ps=object_under_test)
+
+    @pytest.mark.parametrize("config_path", _get_all_yaml(config_type="valid"))
+    def test_with_run_entry_point(self, config_path: str, tmp_path, entry_point_under_test: Callable):
+        self._test_process(config_path=config_path, tmp_path=tmp_path, cmd_ps=entry_point_under_test)
+
+    @pytest.mark.parametrize("config_path", _get_all_yaml(config_type="invalid"))
+    def test_with_invalid_config(self, config_path: str, tmp_path, object_under_test: Callable):
+        output_path = str(tmp_path / _Compiled_Config_Path)
+        mock_parser_arg = self._given_parser_args(config_path=config_path, output_path=output_path)
+        with patch.object(sys, "argv", self._given_command_line()):
+            with pytest.raises(SystemExit) as exc_info:
+                object_under_test(Mock(), mock_parser_arg)
+        assert str(exc_info.value) == "1"
+        assert not os.path.exists(output_path)
+
+    def _test_process(self, config_path: str, tmp_path: pathlib.Path, cmd_ps: Callable):
+        output_path = str(tmp_path / _Compiled_Config_Path)
+        mock_parser_arg = self._given_parser_args(config_path=config_path, output_path=output_path)
+        with patch.object(sys, "argv", self._given_command_line()):
+            cmd_ps(Mock(), mock_parser_arg)
+        compiled_config = load_config(output_path)
+        assert compiled_config is not None
+        assert compiled_config.serialize() == load_config(config_path).serialize()
+
+    def _given_command_line(self) -> List[str]:
+        return ["rest-server", "compile"]
+
+    def _given_parser_args(self, config_path: str, output_path: str) -> SubcmdCompileArguments:
+        return SubcmdCompileArguments(
+            subparser_structure=SysArg.parse([SubCommand.RestServer, SubCommand.Compile]),
+            config_path=config_path,
+            output_path=output_path,
+        )
+
+    def _given_cmd_args_namespace(self) -> Namespace:
+        args_namespace = Namespace()
+        args_namespace.subcommand = SubCommand.RestServer
+        setattr(args_namespace, SubCommand.RestServer, SubCommand.Compile)
+        args_namespace.config_path = _Test_Config
+        args_namespace.output_path = _Compiled_Config_Path
+        return args_namespace
+
+    def _given_subcmd(self) -> Optional[SysArg]:
+        return SysArg(
+            pre_subcmd=SysArg(pre_subcmd=SysArg(subcmd=SubCommandLine.Base), subcmd=SubCommandLine.RestServer),
+            subcmd=SubCommandLine.Compile,
+        )
+
+    def _expected_argument_type(self) -> Type[SubcmdCompileArguments]:
+        return SubcmdCompileArguments
@@ -1,11 +1,21 @@
+import os
 import re
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from pymock_server.command.rest_server.run.component import SubCmdRunComponent
+from pymock_server.exceptions import InvalidJSONBackend
 from pymock_server.model.cmd_args import SubcmdRunArguments
 from pymock_server.model.subcmd_common import SysArg
+from pymock_server.server.mock import Hot_Reload_Environment_Variable
+from pymock_server.server.rest.application.metrics import (
+    Metrics_Dir_Environment_Variable,
+    Metrics_Environment_Variable,
+)
+from pymock_server.server.rest.application.response import (
+    JSON_Backend_Environment_Variable,
+)
 
 # isort: off
 from test._values import (
@@ -56,3 +66,87 @@ class TestSubCmdRunComponent:
         assert re.search(r"Option '.{1,20}' value cannot be empty.", str(exc_info.value), re.IGNORECASE)
         component._initial_server_gateway.assert_not_called()
         component._server_gateway.run.assert_not_called()
+
+    @pytest.mark.parametrize("json_backend", ["stdlib", "orjson", "auto"])
+    def test_process_option_with_json_backend(self, component: SubCmdRunComponent, json_backend: str):
+        args = self._given_args(json_backend=json_backend)
+        with patch.dict(os.environ, {}, clear=False):
+            with patch.object(component, "_initial_server_gateway") as mock_initial_server_gateway:
+                component._process_option(args)
+                mock_initial_server_gateway.assert_called_once_with(lib=args.app_type)
+            assert os.environ[JSON_Backend_Environment_Variable] == json_backend
+
+    def test_process_option_with_invalid_json_backend(self, component: SubCmdRunComponent):
+        args = self._given_args(json_backend="invalid JSON library")
+        with patch.dict(os.environ, {}, clear=False):
+            with patch.object(component, "_initial_server_gateway") as mock_initial_server_gateway:
+                with pytest.raises(InvalidJSONBackend):
+                    component._process_option(args)
+                mock_initial_server_gateway.assert_not_called()
+            assert os.environ.get(JSON_Backend_Environment_Variable, None) != args.json_backend
+
+    @pytest.mark.parametrize("hot_reload", [True, False])
+    def test_process_option_with_hot_reload(self, component: SubCmdRunComponent, hot_reload: bool):
+        args = self._given_args(json_backend="auto", hot_reload=hot_reload)
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop(Hot_Reload_Environment_Variable, None)
+            with patch.object(component, "_initial_server_gateway"):
+                component._process_option(args)
+            assert os.environ.get(Hot_Reload_Environment_Variable, None) == ("true" if hot_reload else None)
+
+    @pytest.mark.parametrize(
+        ("metrics", "workers", "has_metrics_dir"),
+        [
+            (False, 1, False),
+            (True, 1, False),
+            (True, _Workers_Amount.value, True),
+        ],
+    )
+    def test_process_option_with_metrics(
+        self, component: SubCmdRunComponent, metrics: bool, workers: int, has_metrics_dir: bool
+    ):
+        args = self._given_args(json_backend="auto", metrics=metrics, workers=workers)
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop(Metrics_Environment_Variable, None)
+            os.environ.pop(Metrics_Dir_Environment_Variable, None)
+            with patch.object(component, "_initial_server_gateway"):
+                component._process_option(args)
+            assert os.environ.get(Metrics_Environment_Variable, None) == ("true" if metrics else None)
+            metrics_dir = os.environ.get(Metrics_Dir_Environment_Variable, None)
+            assert (metrics_dir is not None) is has_metrics_dir
+            if metrics_dir:
+                assert os.path.isdir(metrics_dir)
+                os.rmdir(metrics_dir)
+
+    def test_process_option_with_metrics_dir(self, component: SubCmdRunComponent, tmp_path):
+        stale_metrics = tmp_path / "metrics-12345.json"
+        stale_metrics.write_text("{}")
+        args = self._given_args(json_backend="auto", metrics_dir=str(tmp_path))
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop(Metrics_Environment_Variable, None)
+            with patch.object(component, "_initial_server_gateway"):
+                component._process_option(args)
+            assert os.environ[Metrics_Environment_Variable] == "true"
+            assert os.environ[Metrics_Dir_Environment_Variable] == str(tmp_path)
+        assert not stale_metrics.exists()
+
+    def _given_args(
+        self,
+        json_backend: str,
+        hot_reload: bool = False,
+        metrics: bool = False,
+        metrics_dir: str = "",
+        workers: int = _Workers_Amount.value,
+    ) -> SubcmdRunArguments:
+        return SubcmdRunArguments(
+            subparser_structure=SysArg.parse([SubCommand.RestServer, SubCommand.Run]),
+            app_type=_Test_Auto_Type,
+            config=_Test_Config,
+            bind=_Bind_Host_And_Port.value,
+            workers=workers,
+            log_level=_Log_Level.value,
+            json_backend=json_backend,
+            hot_reload=hot_reload,
+            metrics=metrics,
+            metrics_dir=metrics_dir,
+        )
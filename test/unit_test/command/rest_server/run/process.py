@@ -38,6 +38,8 @@ class TestSubCmdRun(BaseCommandProcessorTestSpec):
             (_Test_App_Type, False),
             (_Test_FastAPI_App_Type, False),
             (_Test_Auto_Type, False),
+            ("asgi-native", False),
+            ("wsgi-native", False),
             ("invalid app-type which is not a Python web library or framework", True),
         ],
     )
@@ -55,6 +57,8 @@ class TestSubCmdRun(BaseCommandProcessorTestSpec):
             (_Test_App_Type, False),
             (_Test_FastAPI_App_Type, False),
             (_Test_Auto_Type, False),
+            ("asgi-native", False),
+            ("wsgi-native", False),
             ("invalid app-type which is not a Python web library or framework", True),
         ],
     )
@@ -87,10 +91,10 @@ class TestSubCmdRun(BaseCommandProcessorTestSpec):
                         if app_type == "auto":
                             mock_asgi_generate.assert_called_once_with(mock_parser_arg)
                             mock_wsgi_generate.assert_not_called()
-                        elif app_type == "flask":
+                        elif app_type in ("flask", "wsgi-native"):
                             mock_asgi_generate.assert_not_called()
                             mock_wsgi_generate.assert_called_once_with(mock_parser_arg)
-                        elif app_type == "fastapi":
+                        elif app_type in ("fastapi", "asgi-native"):
                             mock_asgi_generate.assert_called_once_with(mock_parser_arg)
                             mock_wsgi_generate.assert_not_called()
                         else:
@@ -127,6 +131,10 @@ class TestSubCmdRun(BaseCommandProcessorTestSpec):
         args_namespace.bind = _Bind_Host_And_Port.value
         args_namespace.workers = _Workers_Amount.value
         args_namespace.log_level = _Log_Level.value
+        args_namespace.json_backend = "auto"
+        args_namespace.hot_reload = False
+        args_namespace.metrics = False
+        args_namespace.metrics_dir = ""
         return args_namespace
 
     def _given_subcmd(self) -> Optional[SysArg]:
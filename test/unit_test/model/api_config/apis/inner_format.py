@@ -1193,6 +1193,72 @@ class TestFormatWithCustomizeStrategy(TestFormatWithGeneralStrategy, CheckableTe
         msg = non_strategy_format.expect_format_log_msg(data_type="any data type")
         assert msg and isinstance(msg, str)
 
+    def test_compiled_pattern_is_kept_until_format_changed(self):
+        format_model = Format(strategy=FormatStrategy.BY_DATA_TYPE, size=Size(max_value=5, min_value=1))
+        assert format_model.value_format_is_match(data_type=str, value="abc") is True
+        compiled_pattern = format_model._compiled_pattern(str)
+        assert format_model.value_format_is_match(data_type=str, value="abcdef") is False
+        assert format_model._compiled_pattern(str) is compiled_pattern
+
+        # It should compile the regular expression again after the format setting changed
+        format_model.size = Size(max_value=10, min_value=1)
+        assert format_model._compiled_pattern(str) is not compiled_pattern
+        assert format_model.value_format_is_match(data_type=str, value="abcdef") is True
+
+    def test_compiled_pattern_follows_nested_setting_changed_in_place(self):
+        format_model = Format(strategy=FormatStrategy.BY_DATA_TYPE, size=Size(max_value=5, min_value=1))
+        assert format_model.value_format_is_match(data_type=str, value="abcdef") is False
+
+        assert format_model.size is not None
+        format_model.size.max_value = 10
+        assert format_model.value_format_is_match(data_type=str, value="abcdef") is True
+
+    def test_compiled_pattern_follows_variable_changed_in_place(self):
+        format_model = Format(
+            strategy=FormatStrategy.CUSTOMIZE,
+            customize="<name>",
+            variables=[Variable(name="name", value_format=ValueFormat.String, size=Size(max_value=3, min_value=1))],
+        )
+        assert format_model.value_format_is_match(data_type=str, value="ab") is True
+
+        format_model.variables[0].value_format = ValueFormat.Integer
+        format_model.variables[0].digit = Digit(integer=6, decimal=0)
+        assert format_model.value_format_is_match(data_type=str, value="123456") is True
+        assert format_model.value_format_is_match(data_type=str, value="ab") is False
+
+    def test_template_format_follows_template_changed_in_place(self):
+        format_model = Format(strategy=FormatStrategy.FROM_TEMPLATE, use_name="enum")
+        entity = TemplateFormatEntity(name="enum", config=Format(strategy=FormatStrategy.FROM_ENUMS, enums=["ENUM_1"]))
+        format_model._current_template = TemplateConfig(
+            common_config=TemplateCommonConfig(format=TemplateFormatConfig(entities=[entity]))
+        )
+        assert format_model.value_format_is_match(data_type=str, value="ENUM_1") is True
+
+        entity.config = Format(strategy=FormatStrategy.FROM_ENUMS, enums=["ENUM_2"])
+        assert format_model.value_format_is_match(data_type=str, value="ENUM_1") is False
+        assert format_model.value_format_is_match(data_type=str, value="ENUM_2") is True
+
+    def test_template_format_is_kept_until_format_changed(self):
+        template_format = Format(strategy=FormatStrategy.FROM_ENUMS, enums=["ENUM_1"])
+        other_template_format = Format(strategy=FormatStrategy.FROM_ENUMS, enums=["ENUM_2"])
+        format_model = Format(strategy=FormatStrategy.FROM_TEMPLATE, use_name="enum_1")
+        format_model._current_template = TemplateConfig(
+            common_config=TemplateCommonConfig(
+                format=TemplateFormatConfig(
+                    entities=[
+                        TemplateFormatEntity(name="enum_1", config=template_format),
+                        TemplateFormatEntity(name="enum_2", config=other_template_format),
+                    ]
+                )
+            )
+        )
+        assert format_model.value_format_is_match(data_type=str, value="ENUM_1") is True
+        assert format_model._template_format() is template_format
+
+        format_model.use_name = "enum_2"
+        assert format_model._template_format() is other_template_format
+        assert format_model.value_format_is_match(data_type=str, value="ENUM_1") is False
+
     def test_invalid_expect_format_log_msg(self):
         non_strategy_format = Format(strategy=None)
         with pytest.raises(ValueError):
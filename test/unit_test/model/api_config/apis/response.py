@@ -6,7 +6,12 @@ import pytest
 
 from pymock_server.model.api_config import ResponseProperty, _Config
 from pymock_server.model.api_config._base import _HasItemsPropConfig
-from pymock_server.model.api_config.apis import HTTPResponse, ResponseStrategy
+from pymock_server.model.api_config.apis import (
+    HTTPResponse,
+    ResponsePool,
+    ResponsePoolOrder,
+    ResponseStrategy,
+)
 
 # isort: off
 from test._values import (
@@ -295,6 +300,44 @@ class TestHTTPResponse(TemplatableConfigTestSuite, CheckableTestSuite):
                     "properties": [p.serialize() for p in MockModel().response_properties],
                 },
             ),
+            (
+                HTTPResponse(
+                    strategy=ResponseStrategy.OBJECT,
+                    properties=MockModel().response_properties,
+                    pool={"size": 8, "refill": "background"},
+                ),
+                {
+                    "strategy": ResponseStrategy.OBJECT.value,
+                    "properties": [p.serialize() for p in MockModel().response_properties],
+                    "pool": {"size": 8, "refill": "background", "order": "round-robin"},
+                },
+            ),
+            (
+                HTTPResponse(strategy=ResponseStrategy.FILE, path="file path", passthrough=True),
+                {"strategy": ResponseStrategy.FILE.value, "path": "file path", "passthrough": True},
+            ),
+            (
+                HTTPResponse(strategy=ResponseStrategy.STRING, value="OK", compress=False),
+                {"strategy": ResponseStrategy.STRING.value, "value": "OK", "compress": False},
+            ),
+            (
+                HTTPResponse(
+                    strategy=ResponseStrategy.OBJECT, properties=MockModel().response_properties, deterministic=True
+                ),
+                {
+                    "strategy": ResponseStrategy.OBJECT.value,
+                    "properties": [p.serialize() for p in MockModel().response_properties],
+                    "deterministic": True,
+                },
+            ),
+            (
+                HTTPResponse(strategy=ResponseStrategy.OBJECT, properties=MockModel().response_properties, stream=True),
+                {
+                    "strategy": ResponseStrategy.OBJECT.value,
+                    "properties": [p.serialize() for p in MockModel().response_properties],
+                    "stream": True,
+                },
+            ),
         ],
     )
     def test_serialize_with_strategy(self, response: HTTPResponse, expected_data: dict):
@@ -311,6 +354,24 @@ class TestHTTPResponse(TemplatableConfigTestSuite, CheckableTestSuite):
                 {"strategy": ResponseStrategy.FILE.value, "path": "file path"},
                 HTTPResponse(strategy=ResponseStrategy.FILE, path="file path"),
             ),
+            (
+                {"strategy": ResponseStrategy.FILE.value, "path": "file path", "passthrough": True},
+                HTTPResponse(strategy=ResponseStrategy.FILE, path="file path", passthrough=True),
+            ),
+            (
+                {"strategy": ResponseStrategy.FILE.value, "path": "file path", "compress": False},
+                HTTPResponse(strategy=ResponseStrategy.FILE, path="file path", compress=False),
+            ),
+            (
+                {
+                    "strategy": ResponseStrategy.OBJECT.value,
+                    "properties": [p.serialize() for p in MockModel().response_properties],
+                    "deterministic": True,
+                },
+                HTTPResponse(
+                    strategy=ResponseStrategy.OBJECT, properties=MockModel().response_properties, deterministic=True
+                ),
+            ),
             (
                 {
                     "strategy": ResponseStrategy.OBJECT.value,
@@ -318,11 +379,36 @@ class TestHTTPResponse(TemplatableConfigTestSuite, CheckableTestSuite):
                 },
                 HTTPResponse(strategy=ResponseStrategy.OBJECT, properties=MockModel().response_properties),
             ),
+            (
+                {
+                    "strategy": ResponseStrategy.OBJECT.value,
+                    "properties": [p.serialize() for p in MockModel().response_properties],
+                    "pool": {"size": 8, "order": "random"},
+                },
+                HTTPResponse(
+                    strategy=ResponseStrategy.OBJECT,
+                    properties=MockModel().response_properties,
+                    pool=ResponsePool(size=8, order=ResponsePoolOrder.RANDOM),
+                ),
+            ),
+            (
+                {
+                    "strategy": ResponseStrategy.OBJECT.value,
+                    "properties": [p.serialize() for p in MockModel().response_properties],
+                    "stream": True,
+                },
+                HTTPResponse(strategy=ResponseStrategy.OBJECT, properties=MockModel().response_properties, stream=True),
+            ),
         ],
     )
     def test_valid_deserialize_with_strategy(self, data: dict, expected_response: HTTPResponse):
         assert HTTPResponse().deserialize(data=data) == expected_response
 
+    def test_invalid_set_pool(self):
+        with pytest.raises(TypeError) as exc_info:
+            HTTPResponse(strategy=ResponseStrategy.OBJECT, pool="invalid pool")
+        assert re.search(r".{0,64}data type.{0,64}key \*pool\*.{0,64}", str(exc_info.value), re.IGNORECASE)
+
     def test_deserialize_with_missing_strategy(self):
         with pytest.raises(ValueError):
             HTTPResponse().deserialize(data={"miss strategy": ""})
@@ -0,0 +1,79 @@
+from typing import Any, Type
+
+import pytest
+
+from pymock_server.model.api_config.apis import (
+    ResponsePool,
+    ResponsePoolOrder,
+    ResponsePoolRefill,
+)
+
+# isort: off
+from test.unit_test.model._enums import EnumTestSuite
+from test.unit_test.model.api_config._base import (
+    CheckableTestSuite,
+    _assertion_msg,
+    set_checking_test_data,
+)
+
+# isort: on
+
+_Test_Pool: dict = {"size": 256, "refill": "background", "order": "random"}
+
+
+class TestResponsePool(CheckableTestSuite):
+    test_data_dir = "response_pool"
+    set_checking_test_data(test_data_dir)
+
+    @pytest.fixture(scope="function")
+    def sut(self) -> ResponsePool:
+        return ResponsePool(size=256, refill=ResponsePoolRefill.BACKGROUND, order=ResponsePoolOrder.RANDOM)
+
+    @pytest.fixture(scope="function")
+    def sut_with_nothing(self) -> ResponsePool:
+        return ResponsePool()
+
+    def test_value_attributes(self, sut: ResponsePool):
+        assert sut.size == 256, _assertion_msg
+        assert sut.refill is ResponsePoolRefill.BACKGROUND, _assertion_msg
+        assert sut.order is ResponsePoolOrder.RANDOM, _assertion_msg
+
+    def test_convert_str_type_value(self):
+        pool = ResponsePool(size=8, refill="background", order="random")
+        assert pool.refill is ResponsePoolRefill.BACKGROUND
+        assert pool.order is ResponsePoolOrder.RANDOM
+
+    def test_deserialize_with_default_value(self, sut_with_nothing: ResponsePool):
+        pool = sut_with_nothing.deserialize(data={"size": 8})
+        assert pool.size == 8
+        assert pool.refill is ResponsePoolRefill.NONE
+        assert pool.order is ResponsePoolOrder.ROUND_ROBIN
+
+    def _expected_serialize_value(self) -> dict:
+        return _Test_Pool
+
+    def _expected_deserialize_value(self, obj: ResponsePool) -> None:
+        assert isinstance(obj, ResponsePool)
+        assert obj.size == _Test_Pool["size"]
+        assert obj.refill is ResponsePoolRefill(_Test_Pool["refill"])
+        assert obj.order is ResponsePoolOrder(_Test_Pool["order"])
+
+
+class TestResponsePoolRefill(EnumTestSuite):
+    @pytest.fixture(scope="function")
+    def enum_obj(self) -> Type[ResponsePoolRefill]:
+        return ResponsePoolRefill
+
+    @pytest.mark.parametrize("value", [ResponsePoolRefill.NONE, "none", "background"])
+    def test_to_enum(self, value: Any, enum_obj: Type[ResponsePoolRefill]):
+        super().test_to_enum(value, enum_obj)
+
+
+class TestResponsePoolOrder(EnumTestSuite):
+    @pytest.fixture(scope="function")
+    def enum_obj(self) -> Type[ResponsePoolOrder]:
+        return ResponsePoolOrder
+
+    @pytest.mark.parametrize("value", [ResponsePoolOrder.RANDOM, "round-robin", "random"])
+    def test_to_enum(self, value: Any, enum_obj: Type[ResponsePoolOrder]):
+        super().test_to_enum(value, enum_obj)
@@ -1,4 +1,6 @@
-from typing import List
+import os
+from typing import List, Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -7,7 +9,11 @@ from pymock_server.model.api_config import (
     TemplatableConfigLoadable,
     _BaseTemplateConfigLoader,
 )
-from pymock_server.model.api_config.template._load.process import TemplateConfigOpts
+from pymock_server.model.api_config.template._load.process import (
+    Parallel_Parsing_Threshold_Environment_Variable,
+    TemplateConfigOpts,
+    parallel_parsing_threshold,
+)
 
 # isort: off
 from test.unit_test.model.api_config.template._test_case import (
@@ -57,3 +63,22 @@ def test_loader_independent(api_config: APIConfig, api_config_yaml_path: str):
             != get_template_config_opts_id(api_modal)
             != get_template_config_opts_id(http_modal)
         )
+
+
+@pytest.mark.parametrize(
+    ("env_value", "expected_threshold"),
+    [
+        (None, 256),
+        ("", 256),
+        ("1000", 1000),
+        ("0", 0),
+        ("-1", 0),
+        ("invalid", 256),
+    ],
+)
+def test_parallel_parsing_threshold(env_value: Optional[str], expected_threshold: int):
+    env = {Parallel_Parsing_Threshold_Environment_Variable: env_value} if env_value is not None else {}
+    with patch.dict(os.environ, env, clear=False):
+        if env_value is None:
+            os.environ.pop(Parallel_Parsing_Threshold_Environment_Variable, None)
+        assert parallel_parsing_threshold() == expected_threshold
@@ -97,6 +97,37 @@ class TestValueFormat(EnumTestSuite):
         assert isinstance(value, expect_type)
         Verify.numerical_value_should_be_in_range(value=value, expect_range=expect_range)
 
+    @pytest.mark.parametrize(
+        ("formatter", "enums", "size", "digit_range", "expect_type"),
+        [
+            (ValueFormat.String, [], ValueSize(max=8, min=5), DigitRange(integer=1, decimal=0), str),
+            (ValueFormat.Integer, [], ValueSize(max=8, min=5), DigitRange(integer=3, decimal=0), int),
+            (ValueFormat.BigDecimal, [], ValueSize(max=8, min=5), DigitRange(integer=3, decimal=2), Decimal),
+            (ValueFormat.Boolean, [], ValueSize(max=8, min=5), DigitRange(integer=1, decimal=0), bool),
+            (ValueFormat.Enum, ["ENUM_1", "ENUM_2"], ValueSize(max=8, min=5), DigitRange(integer=1, decimal=0), str),
+        ],
+    )
+    def test_generate_values(
+        self, formatter: ValueFormat, enums: List[str], size: ValueSize, digit_range: DigitRange, expect_type: object
+    ):
+        values = formatter.generate_values(50, enums=enums, size=size, digit=digit_range)
+        assert len(values) == 50
+        for value in values:
+            assert isinstance(value, expect_type)
+            if formatter is ValueFormat.String:
+                assert size.min <= len(value) <= size.max
+            elif formatter is ValueFormat.Integer:
+                Verify.numerical_value_should_be_in_range(value=value, expect_range=ValueSize(min=-999, max=999))
+            elif formatter is ValueFormat.BigDecimal:
+                Verify.numerical_value_should_be_in_range(value=value, expect_range=ValueSize(min=-999.99, max=999.99))
+            elif formatter is ValueFormat.Enum:
+                assert value in enums
+
+    def test_failure_generate_values(self):
+        with pytest.raises(AssertionError) as exc_info:
+            ValueFormat.Enum.generate_values(10, enums=[])
+        assert re.search(r"must not be empty", str(exc_info.value), re.IGNORECASE)
+
     @pytest.mark.parametrize(
         ("formatter", "invalid_enums", "invalid_size", "invalid_digit", "expect_err_msg"),
         [
@@ -12,6 +12,7 @@ from pymock_server.model.cmd_args import (
     DeserializeParsedArgs,
     SubcmdAddArguments,
     SubcmdCheckArguments,
+    SubcmdCompileArguments,
     SubcmdGetArguments,
     SubcmdPullArguments,
     SubcmdRunArguments,
@@ -28,6 +29,7 @@ from test._values import (
     _Bind_Host_And_Port,
     _Cmd_Arg_API_Path,
     _Cmd_Arg_HTTP_Method,
+    _Compiled_Config_Path,
     _Default_Base_File_Path,
     _Default_Include_Template_Config,
     _Generate_Sample,
@@ -50,6 +52,7 @@ from test._values import (
     _Test_Response_Strategy,
     _Test_SubCommand_Add,
     _Test_SubCommand_Check,
+    _Test_SubCommand_Compile,
     _Test_SubCommand_Get,
     _Test_SubCommand_Pull,
     _Test_SubCommand_Run,
@@ -79,6 +82,10 @@ class TestDeserialize:
             "bind": _Bind_Host_And_Port.value,
             "workers": _Workers_Amount.value,
             "log_level": _Log_Level.value,
+            "json_backend": "orjson",
+            "hot_reload": True,
+            "metrics": True,
+            "metrics_dir": "./metrics",
         }
         namespace = Namespace(**namespace_args)
         arguments = deserialize.subcommand_run(namespace)
@@ -89,6 +96,10 @@ class TestDeserialize:
         assert arguments.bind == _Bind_Host_And_Port.value
         assert arguments.workers == _Workers_Amount.value
         assert arguments.log_level == _Log_Level.value
+        assert arguments.json_backend == "orjson"
+        assert arguments.hot_reload is True
+        assert arguments.metrics is True
+        assert arguments.metrics_dir == "./metrics"
 
     def test_parser_subcommand_add_arguments(self, deserialize: Type[DeserializeParsedArgs]):
         namespace_args = {
@@ -197,6 +208,20 @@ class TestDeserialize:
         assert arguments.check_api_http_method is expected_check_props.http_method
         assert arguments.check_api_parameters is expected_check_props.api_parameters
 
+    def test_parser_subcommand_compile_arguments(self, deserialize: Type[DeserializeParsedArgs]):
+        namespace_args = {
+            "subcommand": SubCommand.RestServer,
+            SubCommand.RestServer: _Test_SubCommand_Compile,
+            "config_path": _Test_Config,
+            "output_path": _Compiled_Config_Path,
+        }
+        namespace = Namespace(**namespace_args)
+        arguments = deserialize.subcommand_compile(namespace)
+        assert isinstance(arguments, SubcmdCompileArguments)
+        assert arguments.subparser_structure == SysArg.parse([SubCommand.RestServer, _Test_SubCommand_Compile])
+        assert arguments.config_path == _Test_Config
+        assert arguments.output_path == _Compiled_Config_Path
+
     def test_parser_subcommand_get_arguments(
         self,
         deserialize: Type[DeserializeParsedArgs],
@@ -0,0 +1,138 @@
+import os
+import re
+from unittest.mock import patch
+
+import pytest
+
+from pymock_server.exceptions import InvalidCompiledConfig
+from pymock_server.model import APIConfig, load_config
+from pymock_server.model.compiled_config import (
+    compile_config,
+    compiled_config_path,
+    is_compiled_config,
+    load_compiled_config,
+    read_compiled_config_header,
+)
+
+_Config_Content = """
+name: 'Test'
+mocked_apis:
+  base:
+    url: '/test'
+  apis:
+    foo:
+      url: '/foo'
+      http:
+        request:
+          method: 'GET'
+        response:
+          strategy: string
+          value: 'This is foo.'
+"""
+
+
+@pytest.mark.parametrize(
+    ("path", "expected_result"),
+    [
+        ("api.pymock", True),
+        ("./dist/API.PYMOCK", True),
+        ("api.yaml", False),
+        ("pymock", False),
+    ],
+)
+def test_is_compiled_config(path: str, expected_result: bool):
+    assert is_compiled_config(path) is expected_result
+
+
+@pytest.mark.parametrize(
+    ("path", "expected_path"),
+    [
+        ("api.yaml", "api.pymock"),
+        ("./config/api.yml", "config/api.pymock"),
+    ],
+)
+def test_compiled_config_path(path: str, expected_path: str):
+    assert compiled_config_path(path) == expected_path
+
+
+class TestCompiledConfig:
+    @pytest.fixture(scope="function")
+    def config_path(self, tmp_path) -> str:
+        path = str(tmp_path / "api.yaml")
+        with open(path, "w", encoding="utf-8") as file_stream:
+            file_stream.write(_Config_Content)
+        return path
+
+    @pytest.fixture(scope="function")
+    def compiled_path(self, tmp_path, config_path: str) -> str:
+        path = str(tmp_path / "dist" / "api.pymock")
+        api_config = load_config(config_path)
+        assert api_config is not None
+        compile_config(api_config, path=path, source=config_path)
+        return path
+
+    def test_compile_and_load(self, config_path: str, compiled_path: str):
+        api_config = load_compiled_config(compiled_path)
+        assert isinstance(api_config, APIConfig)
+        assert api_config.serialize() == load_config(config_path).serialize()
+        # It doesn't leave any temporary file
+        assert os.listdir(os.path.dirname(compiled_path)) == ["api.pymock"]
+
+    def test_load_config_by_extension(self, compiled_path: str):
+        with patch("pymock_server.model.compiled_config.load_compiled_config", wraps=load_compiled_config) as mock_load:
+            api_config = load_config(compiled_path)
+            mock_load.assert_called_once_with(compiled_path)
+        assert api_config is not None and api_config.apis.apis["foo"].http.response.value == "This is foo."
+
+    def test_read_header(self, config_path: str, compiled_path: str):
+        header = read_compiled_config_header(compiled_path)
+        assert header["source"] == config_path
+        assert header["format"] == 1
+
+    def test_load_not_compiled_file(self, tmp_path, config_path: str):
+        path = str(tmp_path / "api.pymock")
+        os.rename(config_path, path)
+        with pytest.raises(InvalidCompiledConfig) as exc_info:
+            load_compiled_config(path)
+        assert re.search(r"not a compiled configuration", str(exc_info.value))
+
+    def test_load_broken_content(self, compiled_path: str):
+        with open(compiled_path, "rb") as file_stream:
+            content = file_stream.read()
+        with open(compiled_path, "wb") as file_stream:
+            file_stream.write(content[:-10])
+        with pytest.raises(InvalidCompiledConfig) as exc_info:
+            load_compiled_config(compiled_path)
+        assert re.search(r"content is broken", str(exc_info.value))
+
+    def test_compile_with_file_response(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        with open("foo.json", "w", encoding="utf-8") as file_stream:
+            file_stream.write('{"id": 1}')
+        config_path = str(tmp_path / "api.yaml")
+        with open(config_path, "w", encoding="utf-8") as file_stream:
+            file_stream.write(
+                _Config_Content.replace("strategy: string", "strategy: file").replace(
+                    "value: 'This is foo.'", "path: foo.json"
+                )
+            )
+        api_config = load_config(config_path)
+        assert api_config is not None
+        compiled_path = str(tmp_path / "dist" / "api.pymock")
+        compile_config(api_config, path=compiled_path, source=config_path)
+
+        # The relative file path is resolved by the working directory where it's compiled
+        monkeypatch.chdir(tmp_path / "dist")
+        response = load_compiled_config(compiled_path).apis.apis["foo"].http.response
+        assert response.path == str(tmp_path / "foo.json")
+
+        os.remove(tmp_path / "foo.json")
+        with pytest.raises(InvalidCompiledConfig) as exc_info:
+            load_compiled_config(compiled_path)
+        assert re.search(r"the file .{1,256}foo.json.{1,8} of HTTP response doesn't exist", str(exc_info.value))
+
+    def test_load_with_different_version(self, compiled_path: str):
+        with patch("pymock_server.model.compiled_config.__version__", "0.0.0"):
+            with pytest.raises(InvalidCompiledConfig) as exc_info:
+                load_compiled_config(compiled_path)
+        assert re.search(r"compiled by PyMock-Server .{1,32} but current one is 0.0.0", str(exc_info.value))
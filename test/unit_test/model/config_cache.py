@@ -0,0 +1,150 @@
+import os
+import pickle
+from typing import Optional
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pymock_server.model import APIConfig, load_config
+from pymock_server.model.config_cache import (
+    Config_Cache_Directory,
+    Config_Cache_Environment_Variable,
+    ConfigCache,
+    config_cache_is_enabled,
+)
+
+_Config_Content = """
+name: 'Test'
+mocked_apis:
+  base:
+    url: '/test'
+  apis:
+    foo:
+      url: '/foo'
+      http:
+        request:
+          method: 'GET'
+        response:
+          strategy: string
+          value: '{value}'
+"""
+
+
+def _write_config(path: str, value: str) -> None:
+    with open(path, "w", encoding="utf-8") as file_stream:
+        file_stream.write(_Config_Content.replace("{value}", value))
+
+
+@pytest.mark.parametrize(
+    ("env_value", "expected_result"),
+    [
+        (None, False),
+        ("true", True),
+        ("1", True),
+        ("false", False),
+        ("", False),
+    ],
+)
+def test_config_cache_is_enabled(env_value: Optional[str], expected_result: bool):
+    with patch.dict(os.environ, {}, clear=False):
+        os.environ.pop(Config_Cache_Environment_Variable, None)
+        if env_value is not None:
+            os.environ[Config_Cache_Environment_Variable] = env_value
+        assert config_cache_is_enabled() is expected_result
+
+
+class TestConfigCache:
+    @pytest.fixture(scope="function")
+    def config_path(self, tmp_path) -> str:
+        path = str(tmp_path / "api.yaml")
+        _write_config(path, value="This is foo.")
+        return path
+
+    @pytest.fixture(scope="function")
+    def loader(self, config_path: str) -> Mock:
+        return Mock(side_effect=lambda: load_config(config_path, cache=False))
+
+    def test_cache_directory(self, tmp_path, config_path: str):
+        assert ConfigCache().cache_directory(config_path) == str(tmp_path / Config_Cache_Directory)
+        assert ConfigCache(directory="/tmp/cache").cache_directory(config_path) == "/tmp/cache"
+
+    def test_load(self, tmp_path, config_path: str, loader: Mock):
+        cache = ConfigCache()
+        loaded_config = cache.load(config_path, loader=loader)
+        cached_config = cache.load(config_path, loader=loader)
+
+        loader.assert_called_once()
+        assert isinstance(cached_config, APIConfig)
+        assert cached_config.serialize() == loaded_config.serialize()
+        assert len(list((tmp_path / Config_Cache_Directory).glob("*.pickle"))) == 1
+
+    def test_load_after_modifying_config(self, config_path: str, loader: Mock):
+        cache = ConfigCache()
+        cache.load(config_path, loader=loader)
+        _write_config(config_path, value="This is new foo.")
+
+        cached_config = cache.load(config_path, loader=loader)
+        assert loader.call_count == 2
+        assert cached_config.apis.apis["foo"].http.response.value == "This is new foo."
+        # The new one should be cached
+        cache.load(config_path, loader=loader)
+        assert loader.call_count == 2
+
+    def test_load_with_different_arguments(self, config_path: str, loader: Mock):
+        cache = ConfigCache()
+        cache.load(config_path, loader=loader, is_pull=False)
+        cache.load(config_path, loader=loader, is_pull=True)
+        assert loader.call_count == 2
+
+    def test_load_with_invalid_snapshot(self, tmp_path, config_path: str, loader: Mock):
+        cache = ConfigCache()
+        cache.load(config_path, loader=loader)
+        snapshot_path = next((tmp_path / Config_Cache_Directory).glob("*.pickle"))
+        snapshot_path.write_bytes(pickle.dumps({"not": "a configuration"}))
+
+        assert isinstance(cache.load(config_path, loader=loader), APIConfig)
+        assert loader.call_count == 2
+
+    def test_load_with_invalid_manifest(self, tmp_path, config_path: str, loader: Mock):
+        cache = ConfigCache()
+        cache.load(config_path, loader=loader)
+        manifest_path = next((tmp_path / Config_Cache_Directory).glob("*.manifest.json"))
+        manifest_path.write_text("{invalid JSON")
+
+        assert isinstance(cache.load(config_path, loader=loader), APIConfig)
+        assert loader.call_count == 2
+
+    def test_load_without_configuration(self, tmp_path, config_path: str):
+        loader = Mock(return_value=None)
+        assert ConfigCache().load(config_path, loader=loader) is None
+        assert not (tmp_path / Config_Cache_Directory).exists()
+
+    def test_load_if_it_cannot_save_cache(self, tmp_path, config_path: str, loader: Mock):
+        # The cache directory is a file, so it cannot save anything into it
+        (tmp_path / "cache").write_text("")
+        cache = ConfigCache(directory=str(tmp_path / "cache"))
+        assert isinstance(cache.load(config_path, loader=loader), APIConfig)
+        assert isinstance(cache.load(config_path, loader=loader), APIConfig)
+        assert loader.call_count == 2
+
+
+class TestLoadConfigWithCache:
+    @pytest.mark.parametrize(
+        ("cache", "env_value", "expected_cached"),
+        [
+            (None, None, False),
+            (None, "true", True),
+            (False, "true", False),
+            (True, None, True),
+        ],
+    )
+    def test_load_config(self, tmp_path, cache: Optional[bool], env_value: Optional[str], expected_cached: bool):
+        config_path = str(tmp_path / "api.yaml")
+        _write_config(config_path, value="This is foo.")
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop(Config_Cache_Environment_Variable, None)
+            if env_value is not None:
+                os.environ[Config_Cache_Environment_Variable] = env_value
+            api_config = load_config(config_path, cache=cache)
+        assert api_config is not None and api_config.apis.apis["foo"].http.response.value == "This is foo."
+        assert (tmp_path / Config_Cache_Directory).exists() is expected_cached
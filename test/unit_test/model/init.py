@@ -19,6 +19,7 @@ from test._values import (
     _API_Doc_Source,
     _Base_URL,
     _Bind_Host_And_Port,
+    _Compiled_Config_Path,
     _Generate_Sample,
     _Log_Level,
     _Print_Sample,
@@ -28,6 +29,7 @@ from test._values import (
     _Test_Config,
     _Test_SubCommand_Add,
     _Test_SubCommand_Check,
+    _Test_SubCommand_Compile,
     _Test_SubCommand_Get,
     _Test_SubCommand_Pull,
     _Test_SubCommand_Run,
@@ -76,6 +78,18 @@ def test_deserialize_subcommand_check_args(mock_parser_arguments: Mock):
     mock_parser_arguments.assert_called_once_with(namespace)
 
 
+@patch.object(DeserializeParsedArgs, "subcommand_compile")
+def test_deserialize_subcommand_compile_args(mock_parser_arguments: Mock):
+    namespace_args = {
+        "subcommand": _Test_SubCommand_Compile,
+        "config_path": _Test_Config,
+        "output_path": _Compiled_Config_Path,
+    }
+    namespace = Namespace(**namespace_args)
+    deserialize_args.subcmd_compile(namespace)
+    mock_parser_arguments.assert_called_once_with(namespace)
+
+
 @patch.object(DeserializeParsedArgs, "subcommand_get")
 def test_deserialize_subcommand_get_args(mock_parser_arguments: Mock):
     namespace_args = {
@@ -123,7 +137,9 @@ def test_deserialize_invalid_version_api_doc_config():
     data = {"doesn't have key which could identify which version the API document is.": ""}
     with patch("pymock_server.model.SwaggerAPIDocumentConfig.deserialize") as mock_swaggerapi_deserialize_func:
         with patch("pymock_server.model.OpenAPIDocumentConfig.deserialize") as mock_openapi_deserialize_func:
-            with patch("pymock_server.model.get_api_doc_version") as mock_get_api_doc_version:
+            with patch(
+                "pymock_server.model.rest_api_doc_config.config.get_api_doc_version"
+            ) as mock_get_api_doc_version:
                 mock_get_api_doc_version.return_value = "Invalid API document version"
 
                 with pytest.raises(NotSupportAPIDocumentVersion):
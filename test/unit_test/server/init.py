@@ -12,6 +12,8 @@ from test._values import _Test_Config
 
 mock_flask_server = Mock(mock_server.FlaskServer())
 mock_fastapi_server = Mock(mock_server.FastAPIServer())
+mock_asgi_native_server = Mock(mock_server.ASGINativeServer())
+mock_wsgi_native_server = Mock(mock_server.WSGINativeServer())
 mock_server_obj = Mock(mock_server.MockHTTPServer)
 
 
@@ -54,6 +56,40 @@ class TestLoadApp:
             config_path=_Test_Config, app_server=mock_fastapi_server, auto_setup=True
         )
 
+    @patch("pymock_server.server.MockHTTPServer", return_value=mock_server_obj)
+    @patch("pymock_server.server.ASGINativeServer", return_value=mock_asgi_native_server)
+    @patch("os.environ.get", return_value=_Test_Config)
+    def test_by_asgi_native(
+        self,
+        mock_get_os_env: Mock,
+        mock_asgi_native_server_obj: Mock,
+        mock_http_server: Mock,
+        load_app: Type[mock_server.load_app],
+    ):
+        load_app.by_asgi_native()
+        mock_get_os_env.assert_called_once_with("MockAPI_Config", "api.yaml")
+        mock_asgi_native_server_obj.assert_called_once()
+        mock_http_server.assert_called_once_with(
+            config_path=_Test_Config, app_server=mock_asgi_native_server, auto_setup=True
+        )
+
+    @patch("pymock_server.server.MockHTTPServer", return_value=mock_server_obj)
+    @patch("pymock_server.server.WSGINativeServer", return_value=mock_wsgi_native_server)
+    @patch("os.environ.get", return_value=_Test_Config)
+    def test_by_wsgi_native(
+        self,
+        mock_get_os_env: Mock,
+        mock_wsgi_native_server_obj: Mock,
+        mock_http_server: Mock,
+        load_app: Type[mock_server.load_app],
+    ):
+        load_app.by_wsgi_native()
+        mock_get_os_env.assert_called_once_with("MockAPI_Config", "api.yaml")
+        mock_wsgi_native_server_obj.assert_called_once()
+        mock_http_server.assert_called_once_with(
+            config_path=_Test_Config, app_server=mock_wsgi_native_server, auto_setup=True
+        )
+
     @patch("os.environ.get", return_value=_Test_Config)
     def test_inner_get_config_path(self, mock_get_os_env: Mock, load_app: Type[mock_server.load_app]):
         path = load_app._get_config_path()
@@ -79,3 +115,13 @@ class TestCreateAppFunctions:
     def test_create_flask_app(self, mock_load_app: Mock):
         mock_server.create_fastapi_app()
         mock_load_app.assert_called_once()
+
+    @patch.object(mock_server.load_app, "by_asgi_native")
+    def test_create_asgi_native_app(self, mock_load_app: Mock):
+        mock_server.create_asgi_native_app()
+        mock_load_app.assert_called_once()
+
+    @patch.object(mock_server.load_app, "by_wsgi_native")
+    def test_create_wsgi_native_app(self, mock_load_app: Mock):
+        mock_server.create_wsgi_native_app()
+        mock_load_app.assert_called_once()
@@ -4,7 +4,8 @@ from unittest.mock import Mock, patch
 import pytest
 
 from pymock_server import APIConfig
-from pymock_server.model import MockAPI, MockAPIs
+from pymock_server.model import MockAPI, MockAPIs, load_config
+from pymock_server.model.compiled_config import compile_config
 from pymock_server.server.mock import MockHTTPServer
 from pymock_server.server.rest.application import (
     BaseAppServer,
@@ -173,3 +174,88 @@ class TestMockHTTPServer:
                         mock_app_server=mock_flask_server_obj,
                         instantiate_flask_app_server=True,
                     )
+
+
+class TestMockHTTPServerReloading:
+    _Config_Content = """
+name: 'Test'
+mocked_apis:
+  base:
+    url: '/test'
+  apis:
+    foo:
+      url: '/foo'
+      http:
+        request:
+          method: 'GET'
+        response:
+          strategy: string
+          value: '{value}'
+"""
+
+    @pytest.fixture(scope="function")
+    def config_path(self, tmp_path) -> str:
+        path = str(tmp_path / "api.yaml")
+        self._write_config(path, value="This is foo.")
+        return path
+
+    def _write_config(self, path: str, value: str) -> None:
+        with open(path, "w", encoding="utf-8") as file_stream:
+            file_stream.write(self._Config_Content.replace("{value}", value))
+
+    def test_reload(self, config_path: str):
+        mock_server = MockHTTPServer(config_path=config_path, app_server=FlaskServer(), auto_setup=True)
+        self._write_config(config_path, value="This is new foo.")
+        with patch.object(FlaskServer, "reload_api", return_value={"changed": 1}) as mock_reload_api:
+            assert mock_server.reload() is True
+            mock_reload_api.assert_called_once()
+        reloaded_apis = mock_reload_api.call_args.args[0]
+        assert reloaded_apis.apis["foo"].http.response.value == "This is new foo."
+
+    @pytest.mark.parametrize("content", ["name: [invalid YAML", "name: 'Test'"])
+    def test_reload_with_invalid_config(self, config_path: str, content: str):
+        mock_server = MockHTTPServer(config_path=config_path, app_server=FlaskServer(), auto_setup=True)
+        with open(config_path, "w", encoding="utf-8") as file_stream:
+            file_stream.write(content)
+        with patch.object(FlaskServer, "reload_api") as mock_reload_api:
+            assert mock_server.reload() is False
+            mock_reload_api.assert_not_called()
+
+    def test_config_paths(self, tmp_path, config_path: str):
+        (tmp_path / "divided").mkdir()
+        (tmp_path / "divided" / "api.yaml").write_text("apis: {}")
+        (tmp_path / "divided" / "nested").mkdir()
+        (tmp_path / "_private").mkdir()
+        (tmp_path / "_private.yaml").write_text("apis: {}")
+        (tmp_path / "README.md").write_text("# Test")
+
+        mock_server = MockHTTPServer(config_path=config_path, app_server=FlaskServer(), auto_setup=False)
+        assert sorted(mock_server.config_paths()) == sorted(
+            [
+                config_path,
+                str(tmp_path),
+                str(tmp_path / "divided"),
+                str(tmp_path / "divided" / "api.yaml"),
+            ]
+        )
+
+    def test_config_paths_with_compiled_config(self, tmp_path, config_path: str):
+        (tmp_path / "divided").mkdir()
+        (tmp_path / "divided" / "api.yaml").write_text("apis: {}")
+        compiled_path = str(tmp_path / "api.pymock")
+        compile_config(load_config(config_path), path=compiled_path)
+
+        mock_server = MockHTTPServer(config_path=compiled_path, app_server=FlaskServer(), auto_setup=False)
+        assert mock_server.config_paths() == [compiled_path]
+
+    def test_watch(self, config_path: str):
+        mock_server = MockHTTPServer(config_path=config_path, app_server=FlaskServer(), auto_setup=True)
+        watcher = mock_server.watch(interval=0.01)
+        try:
+            assert watcher.is_running is True
+            with patch.object(mock_server, "reload") as mock_reload:
+                watcher._on_change({config_path})
+                mock_reload.assert_called_once()
+        finally:
+            mock_server.stop_watching()
+        assert watcher.is_running is False
@@ -1,7 +1,7 @@
-import re
+import inspect
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 from unittest.mock import Mock, patch
 
 import pytest
@@ -32,67 +32,104 @@ class WebServerCodeGeneratorTestSpec(metaclass=ABCMeta):
             # NOTE: It should implement the test data here in child-class
         ],
     )
-    def test_generate_pycode_about_annotating_function(
+    def test_annotate_function(
         self, sut: BaseWebServerCodeGenerator, mock_api_key: str, mock_api: MockAPI, expected_api_func_naming: str
-    ):
+    ) -> Callable:
         mock_api.http.request.parameters = [APIParameter().deserialize(p) for p in _Test_API_Parameters]
-
-        annotate_function_pycode = sut.annotate_function(
-            api_name=mock_api_key, api_config=self._mock_api_config_data(mock_api)
+        request_process = Mock(return_value=Mock(status_code=200))
+        response_process = Mock(return_value="This is the response")
+
+        api_function = sut.annotate_function(
+            api_name=mock_api_key,
+            api_config=self._mock_api_config_data(mock_api),
+            request_process=request_process,
+            response_process=response_process,
         )
 
-        assert f"def {expected_api_func_naming}(" in annotate_function_pycode
-        return annotate_function_pycode
+        assert callable(api_function)
+        assert api_function.__name__ == expected_api_func_naming
+        return api_function
 
     @abstractmethod
     def _mock_api_config_data(self, api: MockAPI) -> Union[MockAPI, List[MockAPI]]:
         pass
 
+    @pytest.mark.parametrize("status_code", [200, 400])
+    def test_generated_function_calls_process(self, sut: BaseWebServerCodeGenerator, status_code: int):
+        request_process_result = Mock(status_code=status_code)
+        request_process = Mock(return_value=request_process_result)
+        response_process = Mock(return_value="This is the response")
+
+        api_function = sut._generate_api_function(
+            "foo_api", request_process=request_process, response_process=response_process
+        )
+        response = api_function(request="This is the request")
+
+        request_process.assert_called_once_with(request="This is the request")
+        if status_code == 200:
+            response_process.assert_called_once_with(request="This is the request")
+            assert response == "This is the response"
+        else:
+            response_process.assert_not_called()
+            assert response is request_process_result
+
+    def test_generated_function_calls_observe_process(self, sut: BaseWebServerCodeGenerator):
+        request_process = Mock(return_value=Mock(status_code=200))
+        response_process = Mock(return_value="This is the response")
+        observe_process = Mock()
+        sut.observe_process = observe_process
+
+        api_function = sut._generate_api_function(
+            "foo_api", request_process=request_process, response_process=response_process
+        )
+        response = api_function(request="This is the request")
+
+        assert response == "This is the response"
+        observe_process.assert_called_once()
+        kwargs, observed_response, seconds = observe_process.call_args.args
+        assert kwargs == {"request": "This is the request"}
+        assert observed_response == "This is the response"
+        assert seconds >= 0
+
     @pytest.mark.parametrize("base_url", [None, "Has base URL"])
-    def test_generate_pycode_about_adding_api(self, sut: BaseWebServerCodeGenerator, base_url: Optional[str]):
+    def test_add_api(self, sut: BaseWebServerCodeGenerator, base_url: Optional[str]):
         for_test_api_name = "Function name"
         for_test_url = "this is an url path"
         for_test_req_method = "HTTP method"
         api_config = Mock(MockAPI(url=Mock(), http=Mock(HTTP())))
         api_config.url = for_test_url
         api_config.http.request.method = for_test_req_method
-
-        add_api_pycode = sut.add_api(
-            api_name=for_test_api_name, api_config=self._get_api_config_param(api_config), base_url=base_url
-        )
-
-        clean_add_api_pycode = add_api_pycode.replace("  ", "").replace("\n", "")
-        expect_pycode = self._expect_controller_pycode(
-            method=for_test_req_method, base_url=base_url, url=for_test_url, api_name=for_test_api_name
+        web_application = Mock()
+        api_function = Mock(__name__="api_function")
+
+        sut.add_api(
+            web_application,
+            api_name=for_test_api_name,
+            api_config=self._get_api_config_param(api_config),
+            api_function=api_function,
+            base_url=base_url,
         )
-        search_expect_pycode = re.search(re.escape(expect_pycode), clean_add_api_pycode)
 
-        assert (
-            self._get_url_criteria(base_url) in add_api_pycode
-            and self._get_http_method_in_generating_code(for_test_req_method) in add_api_pycode
+        self._verify_registering_api(
+            web_application,
+            api_function=api_function,
+            method=for_test_req_method,
+            url=self._get_url_criteria(base_url),
         )
-        assert search_expect_pycode is not None
+        assert self._get_url_criteria(base_url) in sut._mock_api_details
 
     @abstractmethod
     def _get_api_config_param(self, api_config: MockAPI) -> Union[MockAPI, List[MockAPI]]:
         pass
 
-    @property
-    def _server_instance(self) -> str:
-        return "self.web_application"
-
     @abstractmethod
-    def _expect_controller_pycode(self, method: str, base_url: Optional[str], url: str, api_name: str) -> str:
+    def _verify_registering_api(self, web_application: Mock, api_function: Mock, method: str, url: str) -> None:
         pass
 
     @abstractmethod
     def _get_url_criteria(self, base_url: Optional[str]) -> str:
         pass
 
-    @abstractmethod
-    def _get_http_method_in_generating_code(self, method: str) -> str:
-        pass
-
     def test__record_api_params_info_with_invalid_value(self, sut: BaseWebServerCodeGenerator):
         ut_url = "This is URL path"
         ut_api_config = "Invalid API configuration"
@@ -129,39 +166,37 @@ class TestFlaskCodeGenerator(WebServerCodeGeneratorTestSpec):
             ),
         ],
     )
-    def test_generate_pycode_about_annotating_function(
+    def test_annotate_function(
         self, sut: FlaskCodeGenerator, mock_api_key: str, mock_api: MockAPI, expected_api_func_naming: str
     ):
-        super().test_generate_pycode_about_annotating_function(
+        api_function = super().test_annotate_function(
             sut=sut, mock_api_key=mock_api_key, mock_api=mock_api, expected_api_func_naming=expected_api_func_naming
         )
 
+        # Flask passes the variables in URL as keyword arguments
+        assert api_function(id="123") == "This is the response"
+
     def _mock_api_config_data(self, api: MockAPI) -> List[MockAPI]:
         return [api]
 
     def _get_api_config_param(self, api_config: MockAPI) -> List[MockAPI]:
         return [api_config]
 
-    def _expect_controller_pycode(self, method: str, base_url: Optional[str], url: str, api_name: str) -> str:
-        """
-        Python code:
-        self.web_application.route("Function name", methods=['HTTP method'])()
-        """
-        new_api_name = f"{base_url}{api_name}" if base_url else api_name
-        return f"{self._server_instance}.route(\"{new_api_name}\", methods=['{self._get_http_method_in_generating_code(method)}'])()"
+    def _verify_registering_api(self, web_application: Mock, api_function: Mock, method: str, url: str) -> None:
+        web_application.add_url_rule.assert_called_once_with(
+            url, endpoint=api_function.__name__, view_func=api_function, methods=[method]
+        )
 
     def _get_url_criteria(self, base_url: Optional[str]) -> str:
-        return "Function name"
-
-    def _get_http_method_in_generating_code(self, method: str) -> str:
-        return method
+        for_test_api_name = "Function name"
+        return f"{base_url}{for_test_api_name}" if base_url else for_test_api_name
 
     def test__add_api_with_invalid_value(self, sut: BaseWebServerCodeGenerator):
         ut_url = "This is URL path"
         ut_api_config = MockAPI(url=ut_url)
         with patch.object(sut, "_record_api_params_info"):
             with pytest.raises(TypeError):
-                sut.add_api(api_name=ut_url, api_config=ut_api_config)
+                sut.add_api(Mock(), api_name=ut_url, api_config=ut_api_config, api_function=Mock())
 
     @pytest.mark.parametrize(
         ("api_name", "expect_var_mapping_table"),
@@ -213,18 +248,46 @@ class TestFastAPICodeGenerator(WebServerCodeGeneratorTestSpec):
             ),
         ],
     )
-    def test_generate_pycode_about_annotating_function(
+    def test_annotate_function(
         self,
         sut: FastAPICodeGenerator,
         mock_api_key: str,
         mock_api: MockAPI,
         expect: FastAPIGenCodeExpect,
     ):
-        annotate_function_pycode = super().test_generate_pycode_about_annotating_function(
+        api_function = super().test_annotate_function(
             sut=sut, mock_api_key=mock_api_key, mock_api=mock_api, expected_api_func_naming=expect.func_naming
         )
 
-        assert expect.req_body_obj_naming in annotate_function_pycode
+        # FastAPI parses the request by the signature of function
+        signature = inspect.signature(api_function)
+        assert signature.parameters["model"].annotation.__name__ == expect.req_body_obj_naming
+        assert "request" in signature.parameters
+        for var_in_url in sut._api_function_variables():
+            assert var_in_url in signature.parameters
+
+    def test_annotate_function_with_get_method(self, sut: FastAPICodeGenerator):
+        mock_api = MockAPI(url="/foo/api/url", http=Mock(HTTP()))
+        mock_api.http.request.method = "GET"
+        mock_api.http.request.parameters = [APIParameter().deserialize(p) for p in _Test_API_Parameters]
+        request_process = Mock(return_value=Mock(status_code=200))
+        response_process = Mock(return_value="This is the response")
+
+        api_function = sut.annotate_function(
+            api_name="foo_api_url",
+            api_config=mock_api,
+            request_process=request_process,
+            response_process=response_process,
+        )
+        response = api_function(request="This is the request", param1="value", param2=1)
+
+        signature = inspect.signature(api_function)
+        assert "model" not in signature.parameters
+        assert signature.parameters["param2"].annotation is int
+        assert signature.parameters["param2"].default == 0
+        assert response == "This is the response"
+        model = request_process.call_args.kwargs["model"]
+        assert (model.param1, model.param2, model.param3, model.param4) == ("value", 1, None, None)
 
     def _mock_api_config_data(self, api: MockAPI) -> MockAPI:
         return api
@@ -232,23 +295,13 @@ class TestFastAPICodeGenerator(WebServerCodeGeneratorTestSpec):
     def _get_api_config_param(self, api_config: MockAPI) -> MockAPI:
         return api_config
 
-    def _expect_controller_pycode(self, method: str, base_url: Optional[str], url: str, api_name: str) -> str:
-        """
-        Python code:
-        self.web_application.http method(path="this is an url path")(function name)
-        """
-        api_path = f"{base_url}{url}" if base_url else url
-        return (
-            f'{self._server_instance}.{self._get_http_method_in_generating_code(method)}(path="{api_path}")({api_name})'
-        )
+    def _verify_registering_api(self, web_application: Mock, api_function: Mock, method: str, url: str) -> None:
+        web_application.add_api_route.assert_called_once_with(url, api_function, methods=[method.upper()])
 
     def _get_url_criteria(self, base_url: Optional[str]) -> str:
         for_test_url = "this is an url path"
         return f"{base_url}{for_test_url}" if base_url else for_test_url
 
-    def _get_http_method_in_generating_code(self, method: str) -> str:
-        return method.lower()
-
     @pytest.mark.parametrize(
         ("api_name", "expect_api_name"),
         [
@@ -265,7 +318,7 @@ class TestFastAPICodeGenerator(WebServerCodeGeneratorTestSpec):
         ut_api_config = ["Invalid API configuration"]
         with patch.object(sut, "_record_api_params_info"):
             with pytest.raises(TypeError):
-                sut.add_api(api_name=ut_url, api_config=ut_api_config)
+                sut.add_api(Mock(), api_name=ut_url, api_config=ut_api_config, api_function=Mock())
 
     @pytest.mark.parametrize(
         ("api_name", "expect_var_mapping_table"),
@@ -1,20 +1,40 @@
+import gzip
+import json
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
-from typing import Any, Type, Union, cast
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union, cast
 from unittest.mock import Mock, patch
 
 import fastapi
 import pytest
 from fastapi import FastAPI
 from fastapi import Response as FastAPIResponse
+from fastapi.testclient import TestClient
 from flask import Flask
 from flask import Request as FlaskRequest
 from flask import Response as FlaskResponse
 
+from pymock_server.model import MockAPI, MockAPIs
 from pymock_server.server.rest.application import (
+    ASGINativeServer,
     BaseAppServer,
     FastAPIServer,
     FlaskServer,
+    WSGINativeServer,
+)
+from pymock_server.server.rest.application.metrics import (
+    Metrics_Environment_Variable,
+    Metrics_URL_Path,
+)
+from pymock_server.server.rest.application.native import (
+    ASGIApplication,
+    WSGIApplication,
+)
+from pymock_server.server.rest.application.request import RawRequest
+from pymock_server.server.rest.application.response import (
+    DeterministicResponses,
+    RawResponse,
+    request_seed,
 )
 
 MockerModule = namedtuple("MockerModule", ["module_path", "return_value"])
@@ -58,6 +78,332 @@ class AppServerTestSpec(metaclass=ABCMeta):
                 web_app, self.expected_sut_type
             ), f"The web application server it generates should be *{self.expected_sut_type}* type object."
 
+    def test_create_api_in_multiple_servers(self, sut: BaseAppServer):
+        other_sut = type(sut)()
+        sut.create_api(self._mocked_apis("/foo"))
+        other_sut.create_api(self._mocked_apis("/bar"))
+
+        # Each web application only has its own mocked APIs
+        assert list(sut.mock_api_details.keys()) == ["/test/foo"]
+        assert list(other_sut.mock_api_details.keys()) == ["/test/bar"]
+        assert "/test/foo" in self._registered_url_paths(sut.web_application)
+        assert "/test/bar" not in self._registered_url_paths(sut.web_application)
+        assert "/test/bar" in self._registered_url_paths(other_sut.web_application)
+        assert "/test/foo" not in self._registered_url_paths(other_sut.web_application)
+
+    def test_create_api_with_response_pool(self, sut: BaseAppServer):
+        response = {"strategy": "object", "properties": [{"name": "id", "required": True, "type": "int"}]}
+        response["pool"] = {"size": 2}
+        sut.create_api(self._mocked_apis("/foo", response=response))
+        assert sut.response_pools.info() == {"GET /test/foo": {"size": 2, "hits": 0, "refills": 0}}
+
+        responses = [self._get_response_body(sut.web_application, "/test/foo") for _ in range(4)]
+        assert responses[:2] == responses[2:]
+        assert all("id" in json.loads(r) for r in responses)
+        assert sut.response_pools.info()["GET /test/foo"]["hits"] == 4
+
+    def test_create_api_with_deterministic_response(self, sut: BaseAppServer):
+        response = {
+            "strategy": "object",
+            "deterministic": True,
+            "properties": [
+                {"name": "id", "required": True, "type": "int", "format": {"strategy": "by_data_type"}},
+                {"name": "name", "required": True, "type": "str", "format": {"strategy": "by_data_type"}},
+            ],
+        }
+        sut.create_api(self._mocked_apis("/foo", response=response))
+
+        responses = [self._get_response_body(sut.web_application, "/test/foo") for _ in range(3)]
+        assert responses[0] == responses[1] == responses[2]
+        assert sut.deterministic_responses.info()["misses"] == 1
+        assert sut.deterministic_responses.info()["hits"] == 2
+
+        # It's the same as the one which is generated by the seed of the request directly
+        response_config = sut.mock_api_details["/test/foo"]["GET"].http.response
+        expected_response = DeterministicResponses().get(
+            response_config, seed=request_seed(api_path="/test/foo", http_method="GET", parameters={})
+        )
+        assert json.loads(responses[0]) == json.loads(expected_response.body)
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            {"strategy": "string", "value": '{"name": "foo", "id": 1, "data": {"z": 1, "a": 2}}'},
+            {
+                "strategy": "object",
+                "properties": [
+                    {"name": "name", "required": True, "type": "str"},
+                    {"name": "id", "required": True, "type": "int"},
+                    {
+                        "name": "data",
+                        "required": True,
+                        "type": "dict",
+                        "items": [
+                            {"name": "z", "required": True, "type": "int"},
+                            {"name": "a", "required": True, "type": "int"},
+                        ],
+                    },
+                ],
+            },
+        ],
+    )
+    def test_create_api_with_response_key_order(self, sut: BaseAppServer, response: dict):
+        sut.create_api(self._mocked_apis("/foo", response=response))
+        body = json.loads(self._get_response_body(sut.web_application, "/test/foo"))
+        assert list(body.keys()) == self._expected_response_keys(["name", "id", "data"])
+        assert list(body["data"].keys()) == self._expected_response_keys(["z", "a"])
+
+    def test_create_api_with_stream_response(self, sut: BaseAppServer):
+        response = {
+            "strategy": "object",
+            "stream": True,
+            "properties": [
+                {
+                    "name": "data",
+                    "required": True,
+                    "type": "list",
+                    "format": {"strategy": "by_data_type", "size": {"only_equal": 1000}},
+                    "items": [{"name": "id", "required": True, "type": "int"}],
+                },
+            ],
+        }
+        sut.create_api(self._mocked_apis("/foo", response=response))
+
+        body = json.loads(self._get_response_body(sut.web_application, "/test/foo"))
+        assert len(body["data"]) == 1000
+        assert all("id" in element for element in body["data"])
+
+    def test_create_api_with_passthrough_file_response(self, sut: BaseAppServer, tmp_path):
+        file_path = tmp_path / "response.json"
+        file_path.write_text('{"id": 1,\n "name": "foo"}', encoding="utf-8")
+        response = {"strategy": "file", "path": str(file_path), "passthrough": True}
+        sut.create_api(self._mocked_apis("/foo", response=response))
+        # The file content should be sent without any change
+        assert self._get_response_body(sut.web_application, "/test/foo") == file_path.read_bytes()
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            {"strategy": "string", "value": "This is the response."},
+            {"strategy": "file", "path": "test/data/check_test/data_model/response/valid/test-response.json"},
+            {
+                "strategy": "file",
+                "path": "test/data/check_test/data_model/response/valid/test-response.json",
+                "passthrough": True,
+            },
+        ],
+    )
+    def test_create_api_with_conditional_request(self, sut: BaseAppServer, response: dict):
+        sut.create_api(self._mocked_apis("/foo", response=response))
+
+        status_code, response_headers, body = self._get_response(sut.web_application, "/test/foo")
+        assert status_code == 200
+        etag = response_headers["ETag"]
+        conditional_headers: List[Dict[str, str]] = [{"If-None-Match": etag}]
+        if response["strategy"] == "file":
+            conditional_headers.append({"If-Modified-Since": response_headers["Last-Modified"]})
+        else:
+            # It doesn't have the real modified time, so it only relies on header *ETag*
+            assert "Last-Modified" not in response_headers
+
+        for headers in conditional_headers:
+            status_code, response_headers, not_modified_body = self._get_response(
+                sut.web_application, "/test/foo", headers=headers
+            )
+            assert status_code == 304
+            assert response_headers["ETag"] == etag
+            assert not_modified_body == b""
+
+        status_code, _, modified_body = self._get_response(
+            sut.web_application, "/test/foo", headers={"If-None-Match": '"old"'}
+        )
+        assert status_code == 200
+        assert modified_body == body
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected_encoding"),
+        [
+            ("gzip", "gzip"),
+            ("identity", None),
+        ],
+    )
+    def test_create_api_with_compression(
+        self, sut: BaseAppServer, accept_encoding: str, expected_encoding: Optional[str]
+    ):
+        value = "This is the response. " * 100
+        sut.create_api(self._mocked_apis("/foo", response={"strategy": "string", "value": value}))
+
+        with patch("pymock_server._utils.importing.import_compression_lib.brotli_ready", return_value=False):
+            status_code, headers, body = self._get_response(
+                sut.web_application, "/test/foo", headers={"Accept-Encoding": accept_encoding}
+            )
+        assert status_code == 200
+        assert headers.get("Content-Encoding", None) == expected_encoding
+        assert headers["Vary"] == "Accept-Encoding"
+        # The test client of FastAPI decompresses the body automatically
+        if body[:2] == b"\x1f\x8b":
+            body = gzip.decompress(body)
+        assert value in body.decode("utf-8")
+
+    def test_create_api_without_conditional_request_for_object_response(self, sut: BaseAppServer):
+        response = {"strategy": "object", "properties": [{"name": "id", "required": True, "type": "int"}]}
+        sut.create_api(self._mocked_apis("/foo", response=response))
+        _, response_headers, _ = self._get_response(sut.web_application, "/test/foo")
+        assert "ETag" not in response_headers
+
+    def test_reload_api(self, sut: BaseAppServer):
+        sut.create_api(
+            self._multiple_mocked_apis({"/foo": "This is foo.", "/bar": "This is bar.", "/keep": "This is keep."})
+        )
+        # Send a request first so that the web application has been serving when it reloads
+        assert b"This is foo." in self._get_response_body(sut.web_application, "/test/foo")
+        kept_api = sut.mock_api_details["/test/keep"]["GET"]
+
+        changes = sut.reload_api(
+            self._multiple_mocked_apis({"/foo": "This is new foo.", "/keep": "This is keep.", "/baz": "This is baz."})
+        )
+
+        assert changes == {"added": 1, "changed": 1, "removed": 1, "unchanged": 1}
+        assert sorted(sut.mock_api_details.keys()) == ["/test/baz", "/test/foo", "/test/keep"]
+        # The unchanged mocked API keeps the same object, so its caches could be kept
+        assert sut.mock_api_details["/test/keep"]["GET"] is kept_api
+        assert b"This is new foo." in self._get_response_body(sut.web_application, "/test/foo")
+        assert b"This is baz." in self._get_response_body(sut.web_application, "/test/baz")
+        assert b"This is keep." in self._get_response_body(sut.web_application, "/test/keep")
+        status_code, _, _ = self._get_response(sut.web_application, "/test/bar")
+        assert status_code == 404
+
+    def test_reload_api_without_changes(self, sut: BaseAppServer):
+        sut.create_api(self._multiple_mocked_apis({"/foo": "This is foo."}))
+        changes = sut.reload_api(self._multiple_mocked_apis({"/foo": "This is foo."}))
+        assert changes == {"added": 0, "changed": 0, "removed": 0, "unchanged": 1}
+        assert b"This is foo." in self._get_response_body(sut.web_application, "/test/foo")
+
+    def test_reload_api_keeps_route_precedence(self, sut: BaseAppServer):
+        def _mocked_apis(fixed_value: str) -> MockAPIs:
+            return MockAPIs().deserialize(
+                {
+                    "base": {"url": "/test"},
+                    "apis": {
+                        "fixed": {
+                            "url": "/foo/bar",
+                            "http": {
+                                "request": {"method": "GET"},
+                                "response": {"strategy": "string", "value": fixed_value},
+                            },
+                        },
+                        "var": {
+                            "url": "/foo/<id>",
+                            "http": {
+                                "request": {
+                                    "method": "GET",
+                                    "parameters": [{"name": "q", "required": True, "type": "str"}],
+                                },
+                                "response": {"strategy": "string", "value": "var"},
+                            },
+                        },
+                    },
+                }
+            )
+
+        sut.create_api(_mocked_apis("fixed-v1"))
+        status_code, _, body = self._get_response(sut.web_application, "/test/foo/bar")
+        assert status_code == 200
+        assert b"fixed-v1" in body
+
+        changes = sut.reload_api(_mocked_apis("fixed-v2"))
+
+        assert changes == {"added": 0, "changed": 1, "removed": 0, "unchanged": 1}
+        # The URL path without variable should still be matched before the one which has variable
+        status_code, _, body = self._get_response(sut.web_application, "/test/foo/bar")
+        assert status_code == 200
+        assert b"fixed-v2" in body
+
+    def test_metrics(self, sut: BaseAppServer, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(Metrics_Environment_Variable, "true")
+        sut = type(sut)()
+        sut.create_api(self._multiple_mocked_apis({"/foo": "This is foo.", "/bar": "This is bar."}))
+        for path in ("/test/foo", "/test/foo", "/test/bar"):
+            self._get_response(sut.web_application, path)
+
+        status_code, response_headers, metrics = self._get_response(sut.web_application, Metrics_URL_Path)
+
+        assert status_code == 200
+        assert response_headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert b'pymock_requests_total{api="test_api_foo",method="GET",status="200"} 2' in metrics
+        assert b'pymock_requests_total{api="test_api_bar",method="GET",status="200"} 1' in metrics
+        assert b'pymock_request_duration_seconds_count{api="test_api_foo",method="GET"} 2' in metrics
+        # The metrics endpoint itself isn't one of the mocked APIs
+        assert Metrics_URL_Path.encode() not in metrics
+
+    def test_metrics_after_reloading(self, sut: BaseAppServer, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(Metrics_Environment_Variable, "true")
+        sut = type(sut)()
+        sut.create_api(self._multiple_mocked_apis({"/foo": "This is foo."}))
+        sut.reload_api(self._multiple_mocked_apis({"/foo": "This is foo.", "/baz": "This is baz."}))
+        for path in ("/test/foo", "/test/baz"):
+            self._get_response(sut.web_application, path)
+
+        _, _, metrics = self._get_response(sut.web_application, Metrics_URL_Path)
+
+        assert b'pymock_requests_total{api="test_api_foo",method="GET",status="200"} 1' in metrics
+        assert b'pymock_requests_total{api="test_api_baz",method="GET",status="200"} 1' in metrics
+
+    def test_metrics_is_disabled(self, sut: BaseAppServer, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv(Metrics_Environment_Variable, raising=False)
+        sut = type(sut)()
+        sut.create_api(self._multiple_mocked_apis({"/foo": "This is foo."}))
+        assert sut.metrics is None
+        status_code, _, _ = self._get_response(sut.web_application, Metrics_URL_Path)
+        assert status_code == 404
+
+    def _multiple_mocked_apis(self, responses: Mapping[str, str]) -> MockAPIs:
+        return MockAPIs().deserialize(
+            {
+                "base": {"url": "/test"},
+                "apis": {
+                    f"test_api_{url.strip('/')}": {
+                        "url": url,
+                        "http": {
+                            "request": {"method": "GET"},
+                            "response": {"strategy": "string", "value": value},
+                        },
+                    }
+                    for url, value in responses.items()
+                },
+            }
+        )
+
+    def _mocked_apis(self, url: str, response: Optional[dict] = None) -> MockAPIs:
+        return MockAPIs().deserialize(
+            {
+                "base": {"url": "/test"},
+                "apis": {
+                    "test_api": {
+                        "url": url,
+                        "http": {
+                            "request": {"method": "GET"},
+                            "response": response or {"strategy": "string", "value": "This is the response."},
+                        },
+                    },
+                },
+            }
+        )
+
+    @abstractmethod
+    def _get_response_body(self, web_application: Any, path: str) -> bytes:
+        pass
+
+    @abstractmethod
+    def _get_response(
+        self, web_application: Any, path: str, headers: Optional[dict] = None
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        pass
+
+    @abstractmethod
+    def _registered_url_paths(self, web_application: Any) -> List[str]:
+        pass
+
     @abstractmethod
     def _mock_request(self, method: str, api_params: dict) -> Mock:
         pass
@@ -75,6 +421,10 @@ class AppServerTestSpec(metaclass=ABCMeta):
     def _expected_response_type(self) -> Type[Any]:
         pass
 
+    @abstractmethod
+    def _expected_response_keys(self, keys: List[str]) -> List[str]:
+        pass
+
 
 class TestFlaskServer(AppServerTestSpec):
     @pytest.fixture(scope="function")
@@ -89,6 +439,48 @@ class TestFlaskServer(AppServerTestSpec):
     def mocker(self) -> MockerModule:
         return MockerModule(module_path="flask.Flask", return_value=FakeFlask("PyTest-Used"))
 
+    def _registered_url_paths(self, web_application: Flask) -> List[str]:
+        return [rule.rule for rule in web_application.url_map.iter_rules()]
+
+    def _get_response_body(self, web_application: Flask, path: str) -> bytes:
+        return web_application.test_client().get(path).data
+
+    def _get_response(
+        self, web_application: Flask, path: str, headers: Optional[dict] = None
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        response = web_application.test_client().get(path, headers=headers)
+        return response.status_code, response.headers, response.data
+
+    def test_reload_api_after_serving(self, sut: FlaskServer):
+        sut.create_api(self._multiple_mocked_apis({"/foo": "This is foo.", "/foo/<id>": "This is foo with id."}))
+        client = sut.web_application.test_client()
+        # Flask doesn't allow registering any URL rule after it has handled the first request
+        assert client.get("/test/foo").status_code == 200
+        registered_rules = sorted(rule.rule for rule in sut.web_application.url_map.iter_rules())
+
+        new_apis = self._multiple_mocked_apis(
+            {"/foo": "This is foo.", "/foo/<id>": "This is foo with id.", "/baz": "This is baz."}
+        )
+        new_apis.apis["test_api_foo_post"] = MockAPI().deserialize(
+            {
+                "url": "/foo",
+                "http": {"request": {"method": "POST"}, "response": {"strategy": "string", "value": "Post foo."}},
+            }
+        )
+        changes = sut.reload_api(new_apis)
+
+        assert changes == {"added": 2, "changed": 0, "removed": 0, "unchanged": 2}
+        # The new API functions are dispatched by the view function which is registered in setting up
+        assert sorted(rule.rule for rule in sut.web_application.url_map.iter_rules()) == registered_rules
+        assert client.get("/test/baz").data == b"This is baz."
+        assert client.post("/test/foo").data == b"Post foo."
+        assert client.get("/test/foo").data == b"This is foo."
+        assert client.get("/test/foo/123").data == b"This is foo with id."
+        assert client.get("/test/not-exist").status_code == 404
+        response = client.delete("/test/foo")
+        assert response.status_code == 405
+        assert response.headers["Allow"] == "GET, POST"
+
     def _mock_request(self, method: str, api_params: dict) -> Mock:
         request = Mock()
         request.path = "/test-api-path"
@@ -106,6 +498,10 @@ class TestFlaskServer(AppServerTestSpec):
     def _expected_response_type(self) -> Type[FlaskResponse]:
         return FlaskResponse
 
+    def _expected_response_keys(self, keys: List[str]) -> List[str]:
+        # Flask sorts the keys of JSON response by default
+        return sorted(keys)
+
 
 class TestFastAPIServer(AppServerTestSpec):
     @pytest.fixture(scope="function")
@@ -120,6 +516,18 @@ class TestFastAPIServer(AppServerTestSpec):
     def mocker(self) -> MockerModule:
         return MockerModule(module_path="fastapi.FastAPI", return_value=FakeFastAPI())
 
+    def _registered_url_paths(self, web_application: FastAPI) -> List[str]:
+        return [route.path for route in web_application.routes]
+
+    def _get_response_body(self, web_application: FastAPI, path: str) -> bytes:
+        return TestClient(web_application).get(path).content
+
+    def _get_response(
+        self, web_application: FastAPI, path: str, headers: Optional[dict] = None
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        response = TestClient(web_application).get(path, headers=headers)
+        return response.status_code, response.headers, response.content
+
     def _mock_request(self, method: str, api_params: dict) -> Mock:
         route_prop = Mock()
         route_prop.path = "/test-api-path"
@@ -151,3 +559,98 @@ class TestFastAPIServer(AppServerTestSpec):
     @property
     def _expected_response_type(self) -> Type[FastAPIResponse]:
         return FastAPIResponse
+
+    def _expected_response_keys(self, keys: List[str]) -> List[str]:
+        return keys
+
+
+class TestASGINativeServer:
+    @pytest.fixture(scope="function")
+    def sut(self) -> ASGINativeServer:
+        sut = ASGINativeServer()
+        api_config = Mock()
+        api_config.http.request.parameters = []
+        sut._mock_api_details = {"/test-api-path/<id>": {"GET": api_config}}
+        return sut
+
+    def test_setup(self, sut: ASGINativeServer):
+        assert isinstance(sut.setup(), ASGIApplication)
+
+    @pytest.mark.parametrize(
+        ("method", "path", "expected_status_code", "expected_body"),
+        [
+            ("GET", "/not-exist-api", 404, b"Not Found"),
+            ("POST", "/test-api-path/123", 405, b"Method Not Allowed"),
+        ],
+    )
+    def test_dispatch_without_mocked_api(
+        self, sut: ASGINativeServer, method: str, path: str, expected_status_code: int, expected_body: bytes
+    ):
+        with patch.object(sut, "_request_process") as mock_request_process:
+            response = sut.dispatch(RawRequest(method=method, path=path))
+            mock_request_process.assert_not_called()
+        assert response.status_code == expected_status_code
+        assert response.body == expected_body
+        if expected_status_code == 405:
+            assert ("Allow", "GET") in response.headers
+
+    def test_dispatch(self, sut: ASGINativeServer):
+        request_result = RawResponse(b"OK.", status_code=200)
+        with patch.object(sut, "_request_process", return_value=request_result) as mock_request_process:
+            with patch.object(sut, "_response_process", return_value={"id": 123}) as mock_response_process:
+                response = sut.dispatch(RawRequest(method="GET", path="/test-api-path/123"))
+                mock_request_process.assert_called_once()
+                mock_response_process.assert_called_once()
+        assert response.status_code == 200
+        assert response.body == b'{"id":123}'
+        assert ("Content-Type", "application/json") in response.headers
+
+    def test_dispatch_with_invalid_request(self, sut: ASGINativeServer):
+        request_result = RawResponse(b"Miss required parameter *id*.", status_code=400)
+        with patch.object(sut, "_request_process", return_value=request_result):
+            with patch.object(sut, "_response_process") as mock_response_process:
+                response = sut.dispatch(RawRequest(method="GET", path="/test-api-path/123"))
+                mock_response_process.assert_not_called()
+        assert response is request_result
+
+    def test_dispatch_with_metrics(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(Metrics_Environment_Variable, "true")
+        sut = ASGINativeServer()
+        sut.create_api(
+            MockAPIs().deserialize(
+                {
+                    "base": {"url": "/test"},
+                    "apis": {
+                        "get_foo": {
+                            "url": "/foo",
+                            "http": {
+                                "request": {
+                                    "method": "GET",
+                                    "parameters": [{"name": "id", "required": True, "type": "int"}],
+                                },
+                                "response": {"strategy": "string", "value": "This is foo."},
+                            },
+                        },
+                    },
+                }
+            )
+        )
+        assert sut.dispatch(RawRequest(method="GET", path="/test/foo", query_string="id=1")).status_code == 200
+        assert sut.dispatch(RawRequest(method="GET", path="/test/foo")).status_code == 400
+        assert sut.dispatch(RawRequest(method="GET", path="/not-exist-api")).status_code == 404
+
+        response = sut.dispatch(RawRequest(method="GET", path=Metrics_URL_Path))
+
+        assert response.status_code == 200
+        assert b'pymock_requests_total{api="get_foo",method="GET",status="200"} 1' in response.body
+        assert b'pymock_requests_total{api="get_foo",method="GET",status="400"} 1' in response.body
+        assert b'pymock_validation_failures_total{api="get_foo",method="GET"} 1' in response.body
+        assert b"/not-exist-api" not in response.body
+
+
+class TestWSGINativeServer:
+    def test_setup(self):
+        sut = WSGINativeServer()
+        web_app = sut.setup()
+        assert isinstance(web_app, WSGIApplication)
+        assert web_app._dispatch == sut.dispatch
@@ -0,0 +1,181 @@
+import json
+import os
+import threading
+import time
+from typing import Dict
+from unittest.mock import patch
+
+import pytest
+
+from pymock_server.server.rest.application.metrics import (
+    Latency_Buckets,
+    Metrics_Dir_Environment_Variable,
+    Metrics_Environment_Variable,
+    MetricsRegistry,
+    MetricsSnapshot,
+    metrics_is_enabled,
+    reset_metrics_directory,
+)
+
+
+@pytest.mark.parametrize(
+    ("environment", "expected"),
+    [
+        ({}, False),
+        ({Metrics_Environment_Variable: "true"}, True),
+        ({Metrics_Environment_Variable: "1"}, True),
+        ({Metrics_Environment_Variable: "false"}, False),
+        ({Metrics_Dir_Environment_Variable: "./metrics"}, True),
+        ({Metrics_Dir_Environment_Variable: ""}, False),
+    ],
+)
+def test_metrics_is_enabled(monkeypatch: pytest.MonkeyPatch, environment: Dict[str, str], expected: bool):
+    monkeypatch.delenv(Metrics_Environment_Variable, raising=False)
+    monkeypatch.delenv(Metrics_Dir_Environment_Variable, raising=False)
+    for name, value in environment.items():
+        monkeypatch.setenv(name, value)
+    assert metrics_is_enabled() is expected
+
+
+def test_reset_metrics_directory(tmp_path):
+    (tmp_path / "metrics-123.json").write_text("{}")
+    (tmp_path / "other.json").write_text("{}")
+    reset_metrics_directory(str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ["other.json"]
+
+
+class TestMetricsRegistry:
+    @pytest.fixture(scope="function")
+    def registry(self) -> MetricsRegistry:
+        return MetricsRegistry()
+
+    def test_observe(self, registry: MetricsRegistry):
+        registry.observe("get_foo", "GET", 200, 0.0002)
+        registry.observe("get_foo", "GET", 200, 0.003)
+        registry.observe("get_foo", "GET", 400, 100.0)
+        registry.observe("post_foo", "POST", 422, None)
+
+        snapshot = registry.snapshot()
+
+        assert snapshot.requests == {
+            ("get_foo", "GET", 200): 2,
+            ("get_foo", "GET", 400): 1,
+            ("post_foo", "POST", 422): 1,
+        }
+        assert snapshot.validation_failures == {("get_foo", "GET"): 1, ("post_foo", "POST"): 1}
+        # The request without latency isn't recorded into the histogram
+        assert list(snapshot.latencies.keys()) == [("get_foo", "GET")]
+        latency = snapshot.latencies[("get_foo", "GET")]
+        assert len(latency) == len(Latency_Buckets) + 2
+        assert latency[Latency_Buckets.index(0.00025)] == 1
+        assert latency[Latency_Buckets.index(0.005)] == 1
+        # The one which is over all buckets
+        assert latency[-2] == 1
+        assert latency[-1] == pytest.approx(100.0032)
+
+    def test_observe_in_multiple_threads(self, registry: MetricsRegistry):
+        def _send_requests() -> None:
+            for _ in range(100):
+                registry.observe("get_foo", "GET", 200, 0.001)
+
+        threads = [threading.Thread(target=_send_requests) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = registry.snapshot()
+        assert snapshot.requests == {("get_foo", "GET", 200): 400}
+        assert sum(snapshot.latencies[("get_foo", "GET")][:-1]) == 400
+
+    def test_render(self, registry: MetricsRegistry):
+        registry.observe("get_foo", "GET", 200, 0.0002)
+        registry.observe("get_foo", "GET", 400, 0.003)
+
+        metrics = registry.render()
+
+        assert "# TYPE pymock_requests_total counter" in metrics
+        assert 'pymock_requests_total{api="get_foo",method="GET",status="200"} 1' in metrics
+        assert 'pymock_requests_total{api="get_foo",method="GET",status="400"} 1' in metrics
+        assert 'pymock_validation_failures_total{api="get_foo",method="GET"} 1' in metrics
+        assert "# TYPE pymock_request_duration_seconds histogram" in metrics
+        assert 'pymock_request_duration_seconds_bucket{api="get_foo",method="GET",le="0.0001"} 0' in metrics
+        assert 'pymock_request_duration_seconds_bucket{api="get_foo",method="GET",le="0.00025"} 1' in metrics
+        assert 'pymock_request_duration_seconds_bucket{api="get_foo",method="GET",le="0.005"} 2' in metrics
+        assert 'pymock_request_duration_seconds_bucket{api="get_foo",method="GET",le="+Inf"} 2' in metrics
+        assert 'pymock_request_duration_seconds_count{api="get_foo",method="GET"} 2' in metrics
+        assert metrics.endswith("\n")
+
+    def test_render_with_special_characters_in_labels(self, registry: MetricsRegistry):
+        registry.observe('get_"foo"\\bar', "GET", 200, 0.001)
+        assert 'pymock_requests_total{api="get_\\"foo\\"\\\\bar",method="GET",status="200"} 1' in registry.render()
+
+    def test_render_without_any_request(self, registry: MetricsRegistry):
+        metrics = registry.render()
+        assert "pymock_requests_total{" not in metrics
+        assert "# TYPE pymock_requests_total counter" in metrics
+
+    def test_collect_from_directory(self, tmp_path):
+        registry = MetricsRegistry(directory=str(tmp_path), flush_interval=60)
+        registry.observe("get_foo", "GET", 200, 0.001)
+        # The metrics which are saved by the other worker
+        other_worker = MetricsSnapshot()
+        other_worker.merge(self._given_registry("get_foo", 3).snapshot())
+        (tmp_path / "metrics-1.json").write_text(json.dumps(other_worker.serialize()))
+        # The broken file should be skipped
+        (tmp_path / "metrics-2.json").write_text("{")
+
+        snapshot = registry.collect()
+
+        assert snapshot.requests == {("get_foo", "GET", 200): 4}
+        assert sum(snapshot.latencies[("get_foo", "GET")][:-1]) == 4
+        assert (tmp_path / f"metrics-{os.getpid()}.json").exists()
+
+    def test_flush(self, tmp_path):
+        registry = self._given_registry("get_foo", 2, directory=str(tmp_path))
+        registry.flush()
+        with open(tmp_path / f"metrics-{os.getpid()}.json", "r", encoding="utf-8") as file_stream:
+            snapshot = MetricsSnapshot.deserialize(json.load(file_stream))
+        assert snapshot.requests == {("get_foo", "GET", 200): 2}
+        # It doesn't leave any temporary file
+        assert os.listdir(tmp_path) == [f"metrics-{os.getpid()}.json"]
+
+    def test_start_flushing_once_in_multiple_threads(self, tmp_path):
+        registry = MetricsRegistry(directory=str(tmp_path), flush_interval=60)
+        barrier = threading.Barrier(8)
+
+        def _send_request() -> None:
+            barrier.wait()
+            registry.observe("get_foo", "GET", 200, 0.001)
+
+        pid = os.getpid()
+
+        def _slow_getpid() -> int:
+            # Widen the window between checking and setting the flushing process
+            time.sleep(0.01)
+            return pid
+
+        threads = [threading.Thread(target=_send_request) for _ in range(8)]
+        with patch("pymock_server.server.rest.application.metrics.threading.Thread") as mock_thread, patch(
+            "pymock_server.server.rest.application.metrics.atexit.register"
+        ) as mock_register, patch("pymock_server.server.rest.application.metrics.os.getpid", _slow_getpid):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_thread.assert_called_once()
+        assert mock_thread.call_args.kwargs["name"] == "pymock-metrics-flusher"
+        mock_register.assert_called_once()
+        assert registry.snapshot().requests == {("get_foo", "GET", 200): 8}
+
+    def test_flush_without_directory(self, registry: MetricsRegistry):
+        registry.observe("get_foo", "GET", 200, 0.001)
+        registry.flush()
+        assert registry.directory is None
+
+    def _given_registry(self, api: str, amount: int, directory=None) -> MetricsRegistry:
+        registry = MetricsRegistry(directory=directory, flush_interval=60)
+        for _ in range(amount):
+            registry.observe(api, "GET", 200, 0.001)
+        return registry
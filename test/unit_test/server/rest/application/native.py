@@ -0,0 +1,289 @@
+import asyncio
+import io
+import threading
+from typing import Any, Dict, Iterator, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pymock_server.server.rest.application.native import (
+    ASGIApplication,
+    WSGIApplication,
+)
+from pymock_server.server.rest.application.request import RawRequest
+from pymock_server.server.rest.application.response import RawResponse, ResponseFile
+
+
+class TestASGIApplication:
+    @pytest.fixture(scope="function")
+    def received_requests(self) -> List[RawRequest]:
+        return []
+
+    @pytest.fixture(scope="function")
+    def app(self, received_requests: List[RawRequest]) -> ASGIApplication:
+        def _dispatch(request: RawRequest) -> RawResponse:
+            received_requests.append(request)
+            return RawResponse(b'{"id":123}', status_code=200, headers=[("Content-Type", "application/json")])
+
+        return ASGIApplication(_dispatch)
+
+    def _run(self, app: ASGIApplication, scope: Dict[str, Any], messages: List[Dict[str, Any]]) -> List[dict]:
+        sent_messages: List[dict] = []
+        received_messages = iter(messages)
+
+        async def _receive() -> Dict[str, Any]:
+            return next(received_messages)
+
+        async def _send(message: Dict[str, Any]) -> None:
+            sent_messages.append(message)
+
+        asyncio.run(app(scope, _receive, _send))
+        return sent_messages
+
+    def test_http_request(self, app: ASGIApplication, received_requests: List[RawRequest]):
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/foo/123",
+            "query_string": b"name=bar",
+            "headers": [(b"content-type", b"application/json")],
+        }
+        messages = [
+            {"type": "http.request", "body": b'{"name": ', "more_body": True},
+            {"type": "http.request", "body": b'"bar"}', "more_body": False},
+        ]
+        sent_messages = self._run(app, scope, messages)
+
+        assert len(received_requests) == 1
+        request = received_requests[0]
+        assert request.method == "POST"
+        assert request.path == "/foo/123"
+        assert request.query_string == "name=bar"
+        assert request.body == b'{"name": "bar"}'
+        assert request.content_type == "application/json"
+        assert request.storage is scope
+
+        assert sent_messages == [
+            {"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]},
+            {"type": "http.response.body", "body": b'{"id":123}'},
+        ]
+
+    def test_http_request_with_stream_response(self):
+        app = ASGIApplication(lambda _: RawResponse(iter([b'{"data":[', b"1,2", b"]}"]), status_code=200))
+        sent_messages = self._run(app, {"type": "http", "method": "GET", "path": "/foo"}, [{"type": "http.request"}])
+        assert sent_messages == [
+            {"type": "http.response.start", "status": 200, "headers": []},
+            {"type": "http.response.body", "body": b'{"data":[', "more_body": True},
+            {"type": "http.response.body", "body": b"1,2", "more_body": True},
+            {"type": "http.response.body", "body": b"]}", "more_body": True},
+            {"type": "http.response.body", "body": b""},
+        ]
+
+    def test_http_requests_are_handled_concurrently(self):
+        # Each request waits for the other one, so it only could finish if they're handled at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _dispatch(_: RawRequest) -> RawResponse:
+            barrier.wait()
+            return RawResponse(iter([b"1", b"2"]), status_code=200)
+
+        def _chunks() -> Iterator[bytes]:
+            barrier.wait()
+            yield b"1"
+
+        app = ASGIApplication(_dispatch)
+        stream_app = ASGIApplication(lambda _: RawResponse(_chunks(), status_code=200))
+        scope = {"type": "http", "method": "GET", "path": "/foo"}
+
+        async def _request(asgi_app: ASGIApplication) -> List[dict]:
+            sent_messages: List[dict] = []
+
+            async def _receive() -> Dict[str, Any]:
+                return {"type": "http.request"}
+
+            async def _send(message: Dict[str, Any]) -> None:
+                sent_messages.append(message)
+
+            await asgi_app(scope, _receive, _send)
+            return sent_messages
+
+        async def _run_concurrently(*asgi_apps: ASGIApplication) -> List[List[dict]]:
+            return list(await asyncio.gather(*(_request(a) for a in asgi_apps)))
+
+        for sent_messages in asyncio.run(_run_concurrently(app, app)):
+            assert [m.get("body") for m in sent_messages[1:]] == [b"1", b"2", b""]
+        barrier.reset()
+        for sent_messages in asyncio.run(_run_concurrently(stream_app, stream_app)):
+            assert [m.get("body") for m in sent_messages[1:]] == [b"1", b""]
+
+    @pytest.mark.parametrize(
+        ("extensions", "expected_body_messages"),
+        [
+            (
+                {},
+                [
+                    {"type": "http.response.body", "body": b"a" * 4, "more_body": True},
+                    {"type": "http.response.body", "body": b"a", "more_body": True},
+                    {"type": "http.response.body", "body": b""},
+                ],
+            ),
+            ({"http.response.pathsend": {}}, [{"type": "http.response.pathsend", "path": "<file path>"}]),
+        ],
+    )
+    def test_http_request_with_file_response(self, tmp_path, extensions: dict, expected_body_messages: List[dict]):
+        file_path = tmp_path / "response.json"
+        file_path.write_bytes(b"a" * 5)
+        response_file = ResponseFile(str(file_path))
+        app = ASGIApplication(lambda _: RawResponse(response_file, status_code=200))
+        scope = {"type": "http", "method": "GET", "path": "/foo", "extensions": extensions}
+        with patch.object(ResponseFile, "block_size", 4):
+            sent_messages = self._run(app, scope, [{"type": "http.request"}])
+        for message in expected_body_messages:
+            if message.get("path", None) == "<file path>":
+                message["path"] = str(file_path)
+        assert sent_messages[1:] == expected_body_messages
+
+    def test_http_request_with_file_response_by_zero_copy_send(self, tmp_path):
+        file_path = tmp_path / "response.json"
+        file_path.write_bytes(b"content")
+        app = ASGIApplication(lambda _: RawResponse(ResponseFile(str(file_path)), status_code=200))
+        scope = {"type": "http", "method": "GET", "path": "/foo", "extensions": {"http.response.zerocopysend": {}}}
+        sent_messages = self._run(app, scope, [{"type": "http.request"}])
+        # The message *zerocopysend* without *more_body* would end the response
+        assert len(sent_messages) == 2
+        assert sent_messages[1]["type"] == "http.response.zerocopysend"
+        assert sent_messages[1]["file"].name == str(file_path)
+
+    @pytest.mark.parametrize(
+        "body",
+        [b'{"id":123}', iter([b'{"data":[', b"1,2", b"]}"]), "<file response>"],
+    )
+    def test_http_request_with_head_method(self, tmp_path, body: Any):
+        if body == "<file response>":
+            file_path = tmp_path / "response.json"
+            file_path.write_bytes(b"content")
+            body = ResponseFile(str(file_path))
+        headers = [("Content-Type", "application/json"), ("Content-Length", "10")]
+        app = ASGIApplication(lambda _: RawResponse(body, status_code=200, headers=headers))
+        scope = {"type": "http", "method": "HEAD", "path": "/foo", "extensions": {"http.response.pathsend": {}}}
+        sent_messages = self._run(app, scope, [{"type": "http.request"}])
+        # It only sends the headers without any body
+        assert sent_messages == [
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", b"10")],
+            },
+            {"type": "http.response.body", "body": b""},
+        ]
+
+    def test_lifespan(self, app: ASGIApplication, received_requests: List[RawRequest]):
+        sent_messages = self._run(
+            app, {"type": "lifespan"}, [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        )
+        assert sent_messages == [{"type": "lifespan.startup.complete"}, {"type": "lifespan.shutdown.complete"}]
+        assert not received_requests
+
+    def test_not_supported_scope(self, app: ASGIApplication):
+        with pytest.raises(NotImplementedError):
+            self._run(app, {"type": "websocket"}, [])
+
+
+class TestWSGIApplication:
+    @pytest.fixture(scope="function")
+    def received_requests(self) -> List[RawRequest]:
+        return []
+
+    @pytest.fixture(scope="function")
+    def app(self, received_requests: List[RawRequest]) -> WSGIApplication:
+        def _dispatch(request: RawRequest) -> RawResponse:
+            received_requests.append(request)
+            status_code = 404 if request.path == "/not-exist" else 200
+            return RawResponse(b'{"id":123}', status_code=status_code, headers=[("Content-Type", "application/json")])
+
+        return WSGIApplication(_dispatch)
+
+    def test_http_request(self, app: WSGIApplication, received_requests: List[RawRequest]):
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "PATH_INFO": "/foo/ä".encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": "name=bar",
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": "15",
+            "wsgi.input": io.BytesIO(b'{"name": "bar"}'),
+        }
+        start_response = Mock()
+        body = app(environ, start_response)
+
+        assert len(received_requests) == 1
+        request = received_requests[0]
+        assert request.method == "POST"
+        assert request.path == "/foo/ä"
+        assert request.query_string == "name=bar"
+        assert request.body == b'{"name": "bar"}'
+        assert request.content_type == "application/json"
+        assert request.storage is environ
+
+        start_response.assert_called_once_with("200 OK", [("Content-Type", "application/json")])
+        assert list(body) == [b'{"id":123}']
+
+    def test_http_request_with_stream_response(self):
+        chunks = iter([b'{"data":[', b"1,2", b"]}"])
+        app = WSGIApplication(lambda _: RawResponse(chunks, status_code=200))
+        start_response = Mock()
+        body = app({"REQUEST_METHOD": "GET", "PATH_INFO": "/foo"}, start_response)
+        start_response.assert_called_once_with("200 OK", [])
+        assert body is chunks
+        assert list(body) == [b'{"data":[', b"1,2", b"]}"]
+
+    @pytest.mark.parametrize("has_file_wrapper", [True, False])
+    def test_http_request_with_file_response(self, tmp_path, has_file_wrapper: bool):
+        file_path = tmp_path / "response.json"
+        file_path.write_bytes(b"content")
+        app = WSGIApplication(lambda _: RawResponse(ResponseFile(str(file_path)), status_code=200))
+        environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/foo"}
+        file_wrapper = Mock(side_effect=lambda file_stream, block_size: [file_stream.read()])
+        if has_file_wrapper:
+            environ["wsgi.file_wrapper"] = file_wrapper
+
+        body = app(environ, Mock())
+        assert list(body) == [b"content"]
+        if has_file_wrapper:
+            file_wrapper.assert_called_once()
+            assert file_wrapper.call_args.args[1] == ResponseFile.block_size
+
+    @pytest.mark.parametrize("content_length", ["", "0", "invalid"])
+    def test_http_request_without_body(
+        self, app: WSGIApplication, received_requests: List[RawRequest], content_length: str
+    ):
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": "/not-exist",
+            "CONTENT_LENGTH": content_length,
+            "wsgi.input": io.BytesIO(b""),
+        }
+        start_response = Mock()
+        app(environ, start_response)
+
+        assert received_requests[0].body == b""
+        assert received_requests[0].query_string == ""
+        start_response.assert_called_once_with("404 Not Found", [("Content-Type", "application/json")])
+
+    @pytest.mark.parametrize(
+        "body",
+        [b'{"id":123}', iter([b'{"data":[', b"1,2", b"]}"]), "<file response>"],
+    )
+    def test_http_request_with_head_method(self, tmp_path, body: Any):
+        if body == "<file response>":
+            file_path = tmp_path / "response.json"
+            file_path.write_bytes(b"content")
+            body = ResponseFile(str(file_path))
+        headers = [("Content-Type", "application/json"), ("Content-Length", "10")]
+        app = WSGIApplication(lambda _: RawResponse(body, status_code=200, headers=headers))
+        environ = {"REQUEST_METHOD": "HEAD", "PATH_INFO": "/foo", "wsgi.file_wrapper": Mock()}
+        start_response = Mock()
+
+        # It only sends the headers without any body
+        assert list(app(environ, start_response)) == []
+        start_response.assert_called_once_with("200 OK", headers)
+        environ["wsgi.file_wrapper"].assert_not_called()
@@ -8,6 +8,8 @@ from pymock_server.server.rest.application.request import (
     BaseCurrentRequest,
     FastAPIRequest,
     FlaskRequest,
+    NativeRequest,
+    RawRequest,
 )
 
 
@@ -60,3 +62,74 @@ class TestFastAPIRequest(BaseCurrentRequestTestSpec):
     @pytest.fixture(scope="function")
     def request_util(self) -> FastAPIRequest:
         return FastAPIRequest()
+
+    def test_header(self, request_util: FastAPIRequest):
+        request = Mock()
+        request.headers = {"If-None-Match": '"123"'}
+        assert request_util.header(request, "If-None-Match") == '"123"'
+        assert request_util.header(request, "If-Modified-Since") is None
+
+
+class TestNativeRequest(BaseCurrentRequestTestSpec):
+    @pytest.fixture(scope="function")
+    def request_util(self) -> NativeRequest:
+        return NativeRequest()
+
+    @pytest.fixture(scope="function")
+    def mock_api_details(self) -> dict:
+        list_param = Mock()
+        list_param.name = "ids"
+        list_param.value_type = "list"
+        str_param = Mock()
+        str_param.name = "name"
+        str_param.value_type = "str"
+        api_config = Mock()
+        api_config.http.request.parameters = [list_param, str_param]
+        return {"/foo/<id>": {"GET": api_config, "POST": api_config}}
+
+    def test_api_parameters_with_missing_argument(self, request_util: NativeRequest):
+        with pytest.raises(ValueError) as exc_info:
+            request_util.api_parameters(request=RawRequest(method="GET", path="/foo"))
+        assert re.search(r"missing .{0,128} argument", str(exc_info.value), re.IGNORECASE)
+
+    def test_api_parameters_with_query_string(self, request_util: NativeRequest, mock_api_details: dict):
+        request = RawRequest(method="get", path="/foo/123", query_string="name=bar&ids=1&ids=2&other=")
+        api_params = request_util.api_parameters(request=request, mock_api_details=mock_api_details)
+        assert api_params == {"name": "bar", "ids": ["1", "2"], "other": ""}
+        # The matched mocked API should be kept in the storage of request
+        assert request.storage[request_util._route_match_key].template == "/foo/<id>"
+
+    @pytest.mark.parametrize(
+        ("body", "content_type", "expected_params"),
+        [
+            (b'{"name": "bar", "ids": [1, 2]}', "application/json", {"name": "bar", "ids": [1, 2]}),
+            (b"name=bar&age=18", "application/x-www-form-urlencoded", {"name": "bar", "age": "18"}),
+            (b"", "application/json", {}),
+        ],
+    )
+    def test_api_parameters_with_body(
+        self, request_util: NativeRequest, mock_api_details: dict, body: bytes, content_type: str, expected_params: dict
+    ):
+        request = RawRequest(method="POST", path="/foo/123", body=body, content_type=content_type)
+        assert request_util.api_parameters(request=request, mock_api_details=mock_api_details) == expected_params
+
+    @pytest.mark.parametrize(
+        "storage",
+        [
+            # ASGI scope
+            {"headers": [(b"content-type", b"application/json"), (b"if-none-match", b'"123"')]},
+            # WSGI environ
+            {"CONTENT_TYPE": "application/json", "HTTP_IF_NONE_MATCH": '"123"'},
+        ],
+    )
+    def test_header(self, request_util: NativeRequest, storage: dict):
+        request = RawRequest(method="GET", path="/foo/123", storage=storage)
+        assert request_util.header(request, "If-None-Match") == '"123"'
+        assert request_util.header(request, "if-none-match") == '"123"'
+        assert request_util.header(request, "If-Modified-Since") is None
+
+    def test_api_path_and_http_method(self, request_util: NativeRequest):
+        request = RawRequest(method="delete", path="/foo/123")
+        assert request_util.request_instance(request=request) is request
+        assert request_util.api_path(request) == "/foo/123"
+        assert request_util.http_method(request) == "DELETE"
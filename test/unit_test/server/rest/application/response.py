@@ -1,19 +1,50 @@
+import gzip
 import json
+import math
 import os
 import re
+import time
 from decimal import Decimal
-from typing import Type, Union
+from typing import List, Optional, Type, Union
 from unittest.mock import Mock, mock_open, patch
 
 import pytest
 
-from pymock_server.exceptions import FileFormatNotSupport
+from pymock_server._utils import import_json_lib
+from pymock_server.exceptions import FileFormatNotSupport, InvalidJSONBackend
 from pymock_server.model.api_config import IteratorItem, ResponseProperty
-from pymock_server.model.api_config.apis import HTTPResponse, ResponseStrategy
+from pymock_server.model.api_config.apis import (
+    HTTPResponse,
+    ResponsePool,
+    ResponsePoolOrder,
+    ResponsePoolRefill,
+    ResponseStrategy,
+)
 from pymock_server.model.api_config.format import Format
 from pymock_server.model.api_config.value import FormatStrategy, ValueFormat
 from pymock_server.model.api_config.variable import Size, Variable
+from pymock_server.server.rest.application.response import (
+    CacheValidators,
+    CompiledObjectResponses,
+    DeterministicResponses,
+)
 from pymock_server.server.rest.application.response import HTTPResponse as _HTTPResponse
+from pymock_server.server.rest.application.response import (
+    JSON_Backend_Environment_Variable,
+    NativeResponse,
+    OrjsonSerializer,
+    PreRenderedResponse,
+    RawResponse,
+    ResponseFile,
+    ResponsePools,
+    ResponseStream,
+    StaticResponseCache,
+    StdlibJSONSerializer,
+    content_encoders,
+    json_serializer,
+    request_seed,
+    serialize_response,
+)
 
 # isort: off
 from test._values import (
@@ -107,6 +138,30 @@ class TestInnerHTTPResponse:
                 assert str(exc_info) == expected_err_msg, f"The error message should be same as '{expected_err_msg}'."
                 mock_file_stream.assert_not_called()
 
+    def test_response_with_passthrough_file(self, http_resp: Type[_HTTPResponse], tmp_path):
+        csv_file = tmp_path / "response.csv"
+        csv_file.write_text("id,name\n1,foo\n", encoding="utf-8")
+        resp_config = HTTPResponse(strategy=ResponseStrategy.FILE, path=str(csv_file), passthrough=True)
+        assert http_resp.generate(data=resp_config) == "id,name\n1,foo\n"
+
+    def test_response_with_not_exist_passthrough_file(self, http_resp: Type[_HTTPResponse]):
+        resp_config = HTTPResponse(strategy=ResponseStrategy.FILE, path=_Not_Json_File_Name, passthrough=True)
+        with pytest.raises(FileNotFoundError):
+            http_resp.generate(data=resp_config)
+
+    @pytest.mark.parametrize(
+        ("path", "passthrough", "expected_result"),
+        [
+            (_Json_File_Name, False, True),
+            (_Json_File_Name, True, True),
+            (_Not_Json_File_Name, True, True),
+            (_Unexpected_File_Name, False, False),
+            (_Unexpected_File_Name, True, False),
+        ],
+    )
+    def test_is_file(self, http_resp: Type[_HTTPResponse], path: str, passthrough: bool, expected_result: bool):
+        assert http_resp._is_file(path=path, passthrough=passthrough) is expected_result
+
     def test_response_with_unexpected_file_name(self, http_resp: Type[_HTTPResponse]):
         with patch("builtins.open", mock_open(read_data=None)) as mock_file_stream:
             # Run target function to test
@@ -1088,7 +1143,811 @@ class TestInnerHTTPResponse:
                 else:
                     self._verify_response(v, expect_value_data_type[0])
 
+    def test_response_with_object_compiles_once(self, http_resp: Type[_HTTPResponse]):
+        resp_config = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[ResponseProperty(name="id", required=True, value_type="int")],
+        )
+        compiled = CompiledObjectResponses()
+        with patch.object(http_resp, "_compile_object_response", wraps=http_resp._compile_object_response) as compile_:
+            assert http_resp.generate(data=resp_config, compiled=compiled) == {"id": "random integer"}
+            assert http_resp.generate(data=resp_config, compiled=compiled) == {"id": "random integer"}
+            compile_.assert_called_once()
+
+            # It should compile again after the properties setting be replaced
+            resp_config.properties = [ResponseProperty(name="name", required=True, value_type="str")]
+            assert http_resp.generate(data=resp_config, compiled=compiled) == {"name": "random string"}
+            assert compile_.call_count == 2
+
+            # It doesn't keep anything if it doesn't have the compiled generators
+            assert http_resp.generate(data=resp_config) == {"name": "random string"}
+            assert compile_.call_count == 3
+            assert compiled.size == 1
+
+    def test_response_with_large_list_generates_in_batch(self, http_resp: Type[_HTTPResponse]):
+        resp_config = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[
+                ResponseProperty(
+                    name="data",
+                    required=True,
+                    value_type="list",
+                    value_format=Format(size=Size(only_equal=3000)),
+                    items=[
+                        IteratorItem(
+                            name="id",
+                            value_type="int",
+                            required=True,
+                            value_format=Format(strategy=FormatStrategy.BY_DATA_TYPE),
+                        ),
+                        IteratorItem(name="name", value_type="str", required=True),
+                    ],
+                ),
+            ],
+        )
+        with patch.object(Format, "generate_value", wraps=Format.generate_value) as generate_value:
+            response = http_resp.generate(data=resp_config)
+            generate_value.assert_not_called()
+        assert len(response["data"]) == 3000
+        for element in response["data"]:
+            assert isinstance(element["id"], int)
+            assert element["name"] == "random string"
+
+    @pytest.mark.parametrize("list_size", [1, 255, 256, 257, 1000])
+    def test_generate_stream(self, http_resp: Type[_HTTPResponse], list_size: int):
+        resp_config = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[
+                ResponseProperty(name="total", required=True, value_type="int"),
+                ResponseProperty(
+                    name="data",
+                    required=True,
+                    value_type="list",
+                    value_format=Format(size=Size(only_equal=list_size)),
+                    items=[
+                        IteratorItem(
+                            name="id",
+                            value_type="int",
+                            required=True,
+                            value_format=Format(strategy=FormatStrategy.BY_DATA_TYPE),
+                        ),
+                        IteratorItem(name="name", value_type="str", required=True),
+                    ],
+                ),
+                ResponseProperty(
+                    name="tags",
+                    required=True,
+                    value_type="list",
+                    items=[IteratorItem(name="", value_type="str", required=True)],
+                ),
+            ],
+            stream=True,
+        )
+        chunks = list(http_resp.generate_stream(data=resp_config, serializer=json_serializer("stdlib")))
+
+        # The list elements are sent by chunks with the amount of *stream_chunk_size* at most
+        assert len(chunks) == 7 + math.ceil(list_size / http_resp.stream_chunk_size)
+        response = json.loads(b"".join(chunks))
+        assert list(response.keys()) == ["total", "data", "tags"]
+        assert response["total"] == "random integer"
+        assert len(response["data"]) == list_size
+        for element in response["data"]:
+            assert isinstance(element["id"], int)
+            assert element["name"] == "random string"
+        assert response["tags"] == ["random string"]
+
+        # The keys are sent in order if the serializer sorts them
+        chunks = list(http_resp.generate_stream(data=resp_config, serializer=json_serializer("stdlib", sort_keys=True)))
+        response = json.loads(b"".join(chunks))
+        assert list(response.keys()) == ["data", "tags", "total"]
+        assert list(response["data"][0].keys()) == ["id", "name"]
+
+    def test_generate_stream_with_empty_properties(self, http_resp: Type[_HTTPResponse]):
+        resp_config = HTTPResponse(strategy=ResponseStrategy.OBJECT, properties=[], stream=True)
+        assert b"".join(http_resp.generate_stream(data=resp_config)) == b"{}"
+
+    def test_generate_stream_is_lazy(self, http_resp: Type[_HTTPResponse]):
+        resp_config = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[
+                ResponseProperty(
+                    name="data",
+                    required=True,
+                    value_type="list",
+                    value_format=Format(size=Size(only_equal=1000)),
+                    items=[IteratorItem(name="", value_type="int", required=True)],
+                ),
+            ],
+            stream=True,
+        )
+        serializer = json_serializer("stdlib")
+        with patch.object(serializer, "dumps", wraps=serializer.dumps) as dumps:
+            chunks = http_resp.generate_stream(data=resp_config, serializer=serializer)
+            dumps.assert_not_called()
+            assert next(chunks) == b'{"data":['
+            assert next(chunks).count(b",") == http_resp.stream_chunk_size - 1
+            # It only serializes the key and the first chunk of elements
+            assert dumps.call_count == 2
+
+    @pytest.mark.parametrize("strategy", [ResponseStrategy.STRING, ResponseStrategy.FILE])
+    def test_generate_stream_with_invalid_strategy(self, http_resp: Type[_HTTPResponse], strategy: ResponseStrategy):
+        with pytest.raises(TypeError) as exc_info:
+            http_resp.generate_stream(data=HTTPResponse(strategy=strategy, value="OK", path="file.json"))
+        assert re.search(r".{0,32}as stream.{0,32}", str(exc_info.value), re.IGNORECASE)
+
     def test_response_with_invalid_strategy(self, http_resp: Type[_HTTPResponse]):
         with pytest.raises(TypeError) as exc_info:
             http_resp.generate(data=_MockHTTPResponse.with_invalid_strategy())
         assert re.search(r".{0,32}invalid.{0,32}", str(exc_info.value), re.IGNORECASE)
+
+
+_All_JSON_Backends = [
+    "stdlib",
+    pytest.param(
+        "orjson", marks=pytest.mark.skipif(not import_json_lib.orjson_ready(), reason="orjson is not installed")
+    ),
+    pytest.param("ujson", marks=pytest.mark.skipif(not import_json_lib.ujson_ready(), reason="ujson is not installed")),
+]
+
+
+class TestJSONSerializer:
+    @pytest.mark.parametrize("backend", _All_JSON_Backends)
+    def test_dumps(self, backend: str):
+        value = {"id": 1, "price": Decimal("123.45"), "name": "中文/name", 2: [True, None]}
+        body = json_serializer(backend).dumps(value)
+        assert isinstance(body, bytes)
+        assert json.loads(body) == {"id": 1, "price": "123.45", "name": "中文/name", "2": [True, None]}
+        # No any whitespace between separators and no escaping for non-ASCII characters
+        assert body == json.dumps(json.loads(body), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @pytest.mark.parametrize("backend", _All_JSON_Backends)
+    def test_dumps_with_sort_keys(self, backend: str):
+        value = {"name": "foo", "id": 10**30, "data": {"z": 1, "a": 2}}
+        assert (
+            json_serializer(backend).dumps(value)
+            == b'{"name":"foo","id":1000000000000000000000000000000,"data":{"z":1,"a":2}}'
+        )
+        assert (
+            json_serializer(backend, sort_keys=True).dumps(value)
+            == b'{"data":{"a":2,"z":1},"id":1000000000000000000000000000000,"name":"foo"}'
+        )
+        assert json_serializer(backend, sort_keys=True) is not json_serializer(backend)
+
+    @pytest.mark.parametrize("backend", _All_JSON_Backends)
+    def test_dumps_with_big_integer(self, backend: str):
+        value = {"id": 10**30, "ids": [-(10**30), 1]}
+        assert (
+            json_serializer(backend).dumps(value)
+            == b'{"id":1000000000000000000000000000000,"ids":[-1000000000000000000000000000000,1]}'
+        )
+
+    @pytest.mark.parametrize("backend", _All_JSON_Backends)
+    def test_dumps_with_big_decimal(self, backend: str):
+        value = {"price": Decimal("123456789012345678901234.5678")}
+        assert json_serializer(backend).dumps(value) == b'{"price":"123456789012345678901234.5678"}'
+
+    @pytest.mark.parametrize("backend", _All_JSON_Backends)
+    def test_dumps_with_invalid_value(self, backend: str):
+        with pytest.raises(TypeError):
+            json_serializer(backend).dumps({"invalid": object()})
+
+    @pytest.mark.parametrize(
+        ("backend", "env_backend", "expected_serializer"),
+        [
+            ("stdlib", None, StdlibJSONSerializer),
+            ("STDLIB", None, StdlibJSONSerializer),
+            ("orjson", "stdlib", OrjsonSerializer),
+            (None, "stdlib", StdlibJSONSerializer),
+            (None, None, OrjsonSerializer),
+            ("auto", None, OrjsonSerializer),
+        ],
+    )
+    def test_json_serializer(self, backend: Optional[str], env_backend: Optional[str], expected_serializer: type):
+        env = {JSON_Backend_Environment_Variable: env_backend} if env_backend else {}
+        with patch.dict(os.environ, env, clear=False):
+            if not env_backend:
+                os.environ.pop(JSON_Backend_Environment_Variable, None)
+            serializer = json_serializer(backend)
+        assert isinstance(serializer, expected_serializer)
+        assert json_serializer(serializer.name) is serializer
+
+    def test_json_serializer_with_auto_but_no_fast_library(self):
+        with patch("pymock_server.server.rest.application.response._JSON_Serializers", {}):
+            with patch("pymock_server._utils.importing.import_json_lib.orjson_ready", return_value=False):
+                with patch("pymock_server._utils.importing.import_json_lib.ujson_ready", return_value=False):
+                    assert isinstance(json_serializer("auto"), StdlibJSONSerializer)
+
+    def test_json_serializer_with_invalid_backend(self):
+        with pytest.raises(InvalidJSONBackend):
+            json_serializer("invalid JSON library")
+
+    def test_serialize_response_with_serializer(self):
+        serializer = Mock(dumps=Mock(return_value=b"{}"))
+        response = serialize_response({"id": 1}, serializer=serializer)
+        serializer.dumps.assert_called_once_with({"id": 1})
+        assert response.body == b"{}"
+        assert response.content_type == "application/json"
+
+
+class TestCacheValidators:
+    @pytest.fixture(scope="function")
+    def validators(self) -> CacheValidators:
+        # Last modified time: Sun, 06 Nov 1994 08:49:37 GMT
+        return CacheValidators.from_body(b"This is the response.", last_modified=784111777.5)
+
+    def test_from_body(self, validators: CacheValidators):
+        assert re.fullmatch(r'"[0-9a-f]{32}"', validators.etag)
+        assert validators.etag == CacheValidators.from_body(b"This is the response.").etag
+        assert validators.etag != CacheValidators.from_body(b"This is another response.").etag
+        assert validators.last_modified == 784111777
+        assert validators.headers == {"ETag": validators.etag, "Last-Modified": "Sun, 06 Nov 1994 08:49:37 GMT"}
+
+    def test_from_body_without_last_modified(self):
+        validators = CacheValidators.from_body(b"This is the response.")
+        assert validators.last_modified is None
+        # It only relies on header *ETag* if it doesn't have the real modified time
+        assert validators.headers == {"ETag": validators.etag}
+        assert validators.is_not_modified(None, "Sun, 06 Nov 1994 08:49:37 GMT") is False
+        assert validators.is_not_modified(validators.etag, None) is True
+
+    def test_from_file_stat(self, tmp_path):
+        file_path = tmp_path / "response.json"
+        file_path.write_bytes(b"content")
+        os.utime(file_path, ns=(784111777_000000000, 784111777_000000000))
+        validators = CacheValidators.from_file_stat(os.stat(file_path))
+        assert validators.etag == f'"{784111777_000000000:x}-7"'
+        assert validators.headers["Last-Modified"] == "Sun, 06 Nov 1994 08:49:37 GMT"
+
+    @pytest.mark.parametrize(
+        ("if_none_match", "if_modified_since", "expected_result"),
+        [
+            (None, None, False),
+            ("<etag>", None, True),
+            ("W/<etag>", None, True),
+            ('"other", <etag>', None, True),
+            ("*", None, True),
+            ('"other"', None, False),
+            # It ignores header *If-Modified-Since* if it has header *If-None-Match*
+            ('"other"', "Sun, 06 Nov 1994 08:49:37 GMT", False),
+            (None, "Sun, 06 Nov 1994 08:49:37 GMT", True),
+            (None, "Mon, 07 Nov 1994 08:49:37 GMT", True),
+            (None, "Sun, 06 Nov 1994 08:49:36 GMT", False),
+            (None, "invalid date", False),
+        ],
+    )
+    def test_is_not_modified(
+        self,
+        validators: CacheValidators,
+        if_none_match: Optional[str],
+        if_modified_since: Optional[str],
+        expected_result: bool,
+    ):
+        if if_none_match:
+            if_none_match = if_none_match.replace("<etag>", validators.etag)
+        assert validators.is_not_modified(if_none_match, if_modified_since) is expected_result
+
+
+class TestPreRenderedResponse:
+    @pytest.fixture(scope="function")
+    def response(self) -> PreRenderedResponse:
+        body = json.dumps({"data": [_Json_File_Content] * 100}).encode("utf-8")
+        response = PreRenderedResponse(
+            body, content_type="application/json", validators=CacheValidators.from_body(body)
+        )
+        response.compress({"br": lambda b: b"br:" + b[:10], "gzip": lambda b: gzip.compress(b, mtime=0)})
+        return response
+
+    def test_content_encoders(self):
+        with patch("pymock_server._utils.importing.import_compression_lib.brotli_ready", return_value=False):
+            assert list(content_encoders().keys()) == ["gzip"]
+        with patch("pymock_server._utils.importing.import_compression_lib.brotli_ready", return_value=True):
+            assert list(content_encoders().keys()) == ["br", "gzip"]
+
+    def test_compress(self, response: PreRenderedResponse):
+        assert list(response.variants.keys()) == ["br", "gzip"]
+        gzip_variant = response.variants["gzip"]
+        assert gzip.decompress(gzip_variant.body) == response.body
+        assert gzip_variant.content_length < response.content_length
+        assert gzip_variant.content_encoding == "gzip"
+        assert gzip_variant.headers["Content-Encoding"] == "gzip"
+        assert gzip_variant.headers["Vary"] == "Accept-Encoding"
+        assert gzip_variant.validators is not None and response.validators is not None
+        assert gzip_variant.validators.etag != response.validators.etag
+        assert gzip_variant.validators.last_modified == response.validators.last_modified
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Vary"] == "Accept-Encoding"
+
+    def test_compress_with_small_body(self):
+        response = PreRenderedResponse(b"OK.", content_type="text/html; charset=utf-8")
+        response.compress(content_encoders())
+        # The compressed body is larger than the original one
+        assert response.variants == {}
+        assert "Vary" not in response.headers
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected_encoding"),
+        [
+            (None, None),
+            ("", None),
+            ("gzip", "gzip"),
+            ("gzip, deflate, br", "br"),
+            ("GZIP", "gzip"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("br;q=0, gzip;q=0", None),
+            ("*", "br"),
+            ("*;q=0.1, gzip;q=0.5", "gzip"),
+            ("deflate", None),
+            ("gzip;q=invalid", None),
+        ],
+    )
+    def test_select_encoding(
+        self, response: PreRenderedResponse, accept_encoding: Optional[str], expected_encoding: Optional[str]
+    ):
+        selected = response.select_encoding(accept_encoding)
+        if expected_encoding is None:
+            assert selected is response
+        else:
+            assert selected is response.variants[expected_encoding]
+
+    def test_header_list(self, response: PreRenderedResponse):
+        header_list = response.header_list()
+        assert header_list == list(response.headers.items())
+        # It should be a new list so that changing it doesn't affect the response
+        header_list.append(("Allow", "GET"))
+        assert ("Allow", "GET") not in response.header_list()
+
+
+class TestCompiledObjectResponses:
+    @pytest.fixture(scope="function")
+    def compiled(self) -> CompiledObjectResponses:
+        return CompiledObjectResponses()
+
+    def _object_response(self) -> HTTPResponse:
+        return HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[ResponseProperty(name="id", required=True, value_type="int")],
+        )
+
+    def test_generator(self, compiled: CompiledObjectResponses):
+        resp_config = self._object_response()
+        generator = compiled.generator(resp_config)
+        assert compiled.generator(resp_config) is generator
+        assert compiled.stream_generator(resp_config) is compiled.stream_generator(resp_config)
+        assert compiled.size == 1
+        assert generator() == {"id": "random integer"}
+
+    def test_retain(self, compiled: CompiledObjectResponses):
+        kept, removed = self._object_response(), self._object_response()
+        generator = compiled.generator(kept)
+        compiled.generator(removed)
+        assert compiled.size == 2
+
+        compiled.retain([kept])
+
+        assert compiled.size == 1
+        assert compiled.generator(kept) is generator
+
+    def test_retain_with_properties_modified_in_place(self, compiled: CompiledObjectResponses):
+        resp_config = self._object_response()
+        generator = compiled.generator(resp_config)
+        resp_config.properties[0].value_type = "str"
+
+        compiled.retain([resp_config])
+
+        assert compiled.size == 0
+        new_generator = compiled.generator(resp_config)
+        assert new_generator is not generator
+        assert new_generator() == {"id": "random string"}
+
+    def test_clear(self, compiled: CompiledObjectResponses):
+        compiled.generator(self._object_response())
+        compiled.clear()
+        assert compiled.size == 0
+
+
+class TestStaticResponseCache:
+    @pytest.mark.parametrize(
+        ("str_as_json", "expected_body", "expected_content_type"),
+        [
+            (False, _General_String_Value.encode("utf-8"), "text/html; charset=utf-8"),
+            (True, json.dumps(_General_String_Value).encode("utf-8"), "application/json"),
+        ],
+    )
+    def test_get_with_string_strategy(self, str_as_json: bool, expected_body: bytes, expected_content_type: str):
+        cache = StaticResponseCache(str_as_json=str_as_json)
+        resp_config = _MockHTTPResponse.with_string_strategy()
+
+        response = cache.get(resp_config)
+        assert response is not None
+        assert response.body == expected_body
+        assert response.validators is not None
+        assert "Last-Modified" not in response.validators.headers
+        assert response.content_type == expected_content_type
+        assert response.content_length == len(expected_body)
+        assert response.headers["Content-Length"] == str(len(expected_body))
+        assert response.validators is not None
+        assert response.headers["ETag"] == CacheValidators.from_body(expected_body).etag
+        # It should not render again
+        assert cache.get(resp_config) is response
+
+    def test_get_with_json_format_string_strategy(self):
+        cache = StaticResponseCache()
+        response = cache.get(_MockHTTPResponse.with_json_format_string_strategy())
+        assert response is not None
+        assert json.loads(response.body) == _Json_File_Content
+        assert response.content_type == "application/json"
+
+    def test_get_again_after_changing_string_value(self):
+        cache = StaticResponseCache()
+        resp_config = _MockHTTPResponse.with_string_strategy()
+        response = cache.get(resp_config)
+
+        resp_config.value = "new value"
+        new_response = cache.get(resp_config)
+        assert new_response is not response
+        assert new_response is not None and new_response.body == b"new value"
+
+    def test_retain(self):
+        cache = StaticResponseCache()
+        resp_config = _MockHTTPResponse.with_string_strategy()
+        removed_resp_config = _MockHTTPResponse.with_json_format_string_strategy()
+        response = cache.get(resp_config)
+        removed_response = cache.get(removed_resp_config)
+
+        cache.retain([resp_config])
+        assert cache.get(resp_config) is response
+        assert cache.get(removed_resp_config) is not removed_response
+
+    def test_get_with_file_strategy(self, tmp_path):
+        json_file = tmp_path / "response.json"
+        json_file.write_text(json.dumps(_Json_File_Content), encoding="utf-8")
+        cache = StaticResponseCache()
+        cache.file_check_interval = 0
+        resp_config = HTTPResponse(strategy=ResponseStrategy.FILE, path=str(json_file))
+
+        with patch("builtins.open", wraps=open) as mock_open_file:
+            response = cache.get(resp_config)
+            assert response is not None and json.loads(response.body) == _Json_File_Content
+            assert response.validators is not None
+            assert response.validators.last_modified == int(json_file.stat().st_mtime)
+            assert cache.get(resp_config) is response
+            mock_open_file.assert_called_once()
+
+        # Modify the file content
+        new_content = {"new": "content"}
+        json_file.write_text(json.dumps(new_content), encoding="utf-8")
+        os.utime(json_file, ns=(0, 0))
+        new_response = cache.get(resp_config)
+        assert new_response is not response
+        assert new_response is not None and json.loads(new_response.body) == new_content
+
+    def test_get_with_passthrough_file(self, tmp_path):
+        json_file = tmp_path / "response.json"
+        json_file.write_text(json.dumps(_Json_File_Content), encoding="utf-8")
+        cache = StaticResponseCache()
+        assert cache.get(HTTPResponse(strategy=ResponseStrategy.FILE, path=str(json_file), passthrough=True)) is None
+
+    @pytest.mark.parametrize(
+        ("body_size", "compress", "expected_variants"),
+        [
+            (2048, True, ["gzip"]),
+            (512, True, []),
+            (2048, False, []),
+        ],
+    )
+    def test_get_with_compression(self, body_size: int, compress: bool, expected_variants: List[str]):
+        cache = StaticResponseCache()
+        resp_config = HTTPResponse(strategy=ResponseStrategy.STRING, value="a" * body_size, compress=compress)
+        with patch("pymock_server._utils.importing.import_compression_lib.brotli_ready", return_value=False):
+            response = cache.get(resp_config)
+        assert response is not None
+        assert list(response.variants.keys()) == expected_variants
+        for variant in response.variants.values():
+            assert gzip.decompress(variant.body) == response.body
+
+    def test_get_with_not_exist_file(self):
+        cache = StaticResponseCache()
+        assert cache.get(_MockHTTPResponse.with_not_exist_file_strategy()) is None
+
+    def test_get_with_object_strategy(self):
+        cache = StaticResponseCache()
+        resp_config = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[ResponseProperty(name="id", required=True, value_type="int")],
+        )
+        assert cache.get(resp_config) is None
+
+
+class TestResponseFile:
+    @pytest.mark.parametrize(
+        ("file_name", "expected_content_type"),
+        [
+            ("response.json", "application/json"),
+            ("response.csv", "text/csv; charset=utf-8"),
+            ("response.unknown-format", "application/octet-stream"),
+        ],
+    )
+    def test_content_type(self, tmp_path, file_name: str, expected_content_type: str):
+        file_path = tmp_path / file_name
+        file_path.write_bytes(b"content")
+        response_file = ResponseFile(str(file_path))
+        assert response_file.content_type == expected_content_type
+        assert response_file.content_length == len(b"content")
+
+    def test_chunks(self, tmp_path):
+        content = os.urandom(ResponseFile.block_size * 2 + 1)
+        file_path = tmp_path / "response.bin"
+        file_path.write_bytes(content)
+        chunks = list(ResponseFile(str(file_path)).chunks())
+        assert [len(chunk) for chunk in chunks] == [ResponseFile.block_size, ResponseFile.block_size, 1]
+        assert b"".join(chunks) == content
+
+    def test_not_exist_file(self):
+        with pytest.raises(FileNotFoundError):
+            ResponseFile(_Not_Exist_File_Name)
+
+
+class TestResponsePools:
+    @pytest.fixture(scope="function")
+    def pools(self) -> ResponsePools:
+        pools = ResponsePools()
+        yield pools
+        pools.clear()
+
+    def _object_response(self, pool: ResponsePool) -> HTTPResponse:
+        return HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[ResponseProperty(name="id", required=True, value_type="int")],
+            pool=pool,
+        )
+
+    def test_get_in_round_robin(self, pools: ResponsePools):
+        resp_config = self._object_response(ResponsePool(size=3))
+        assert pools.add(name="GET /foo", data=resp_config) is True
+        # It should not generate the pool again
+        assert pools.add(name="GET /foo", data=resp_config) is False
+
+        responses = [pools.get(resp_config) for _ in range(6)]
+        assert all(r is not None for r in responses)
+        assert responses[:3] == responses[3:]
+        assert all("id" in json.loads(r.body) for r in responses)
+        assert pools.info() == {"GET /foo": {"size": 3, "hits": 6, "refills": 0}}
+
+    def test_retain(self, pools: ResponsePools):
+        resp_config = self._object_response(ResponsePool(size=2))
+        removed_resp_config = self._object_response(ResponsePool(size=2))
+        pools.add(name="GET /foo", data=resp_config)
+        pools.add(name="GET /bar", data=removed_resp_config)
+
+        pools.retain([resp_config])
+        assert list(pools.info().keys()) == ["GET /foo"]
+        assert pools.get(resp_config) is not None
+        assert pools.get(removed_resp_config) is None
+
+    def test_get_randomly(self, pools: ResponsePools):
+        resp_config = self._object_response(ResponsePool(size=3, order=ResponsePoolOrder.RANDOM))
+        pools.add(name="GET /foo", data=resp_config)
+
+        with patch("random.choice", wraps=lambda seq: seq[-1]) as mock_choice:
+            response = pools.get(resp_config)
+            mock_choice.assert_called_once()
+        assert response is not None
+        assert pools.info()["GET /foo"]["hits"] == 1
+
+    @pytest.mark.parametrize(
+        "resp_config",
+        [
+            HTTPResponse(strategy=ResponseStrategy.OBJECT, properties=[ResponseProperty(name="id", value_type="int")]),
+            HTTPResponse(strategy=ResponseStrategy.STRING, value="OK", pool=ResponsePool(size=3)),
+        ],
+    )
+    def test_get_without_pool(self, pools: ResponsePools, resp_config: HTTPResponse):
+        assert pools.add(name="GET /foo", data=resp_config) is False
+        assert pools.get(resp_config) is None
+        assert pools.info() == {}
+
+    def test_refill_in_background(self, pools: ResponsePools):
+        pools.refill_interval = 0.001
+        resp_config = self._object_response(ResponsePool(size=2, refill=ResponsePoolRefill.BACKGROUND))
+
+        with patch.object(ResponsePools, "_generate", return_value=Mock()) as mock_generate:
+            pools.add(name="GET /foo", data=resp_config)
+            assert mock_generate.call_count == 2
+            for _ in range(1000):
+                if pools.info()["GET /foo"]["refills"] >= 2:
+                    break
+                time.sleep(0.001)
+            pools.stop()
+
+        assert pools.info()["GET /foo"]["refills"] >= 2
+        assert mock_generate.call_count == 2 + pools.info()["GET /foo"]["refills"]
+
+
+class TestRequestSeed:
+    def test_same_request_has_same_seed(self):
+        seed = request_seed("/foo", "GET", {"id": 1, "name": "PyTest"})
+        assert isinstance(seed, int)
+        assert 0 <= seed < 2**64
+        # The order of parameters and the case of HTTP method don't matter
+        assert request_seed("/foo", "get", {"name": "PyTest", "id": 1}) == seed
+
+    @pytest.mark.parametrize(
+        ("api_path", "http_method", "parameters"),
+        [
+            ("/bar", "GET", {"id": 1, "name": "PyTest"}),
+            ("/foo", "POST", {"id": 1, "name": "PyTest"}),
+            ("/foo", "GET", {"id": 2, "name": "PyTest"}),
+            ("/foo", "GET", {"id": 1}),
+            ("/foo", "GET", None),
+        ],
+    )
+    def test_different_request_has_different_seed(self, api_path: str, http_method: str, parameters: Optional[dict]):
+        assert request_seed(api_path, http_method, parameters) != request_seed(
+            "/foo", "GET", {"id": 1, "name": "PyTest"}
+        )
+
+    def test_empty_parameters(self):
+        assert request_seed("/foo", "GET", None) == request_seed("/foo", "GET", {})
+
+
+class TestDeterministicResponses:
+    @pytest.fixture(scope="function")
+    def resp_config(self) -> HTTPResponse:
+        return HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[
+                ResponseProperty(
+                    name="id",
+                    required=True,
+                    value_type="int",
+                    value_format=Format(strategy=FormatStrategy.BY_DATA_TYPE),
+                ),
+                ResponseProperty(
+                    name="data",
+                    required=True,
+                    value_type="list",
+                    value_format=Format(size=Size(max_value=20, min_value=5)),
+                    items=[
+                        IteratorItem(
+                            name="name",
+                            value_type="str",
+                            required=True,
+                            value_format=Format(strategy=FormatStrategy.BY_DATA_TYPE),
+                        ),
+                    ],
+                ),
+            ],
+            deterministic=True,
+        )
+
+    def test_get(self, resp_config: HTTPResponse):
+        responses = DeterministicResponses()
+        response = responses.get(resp_config, seed=123)
+        assert isinstance(response, PreRenderedResponse)
+        assert response.content_type == "application/json"
+        assert response.validators is not None
+        assert response.validators.etag == CacheValidators.from_body(response.body).etag
+        assert responses.get(resp_config, seed=123) is response
+        assert responses.info() == {"hits": 1, "misses": 1, "size": 1, "max_size": 1024}
+
+    def test_get_generates_same_response_by_same_seed(self, resp_config: HTTPResponse):
+        body = DeterministicResponses().get(resp_config, seed=123).body
+        # It's the same even if it's generated by another cache
+        assert DeterministicResponses().get(resp_config, seed=123).body == body
+        assert DeterministicResponses().get(resp_config, seed=456).body != body
+
+    def test_get_with_evicting_least_recently_used(self, resp_config: HTTPResponse):
+        responses = DeterministicResponses(max_size=2)
+        first_response = responses.get(resp_config, seed=1)
+        responses.get(resp_config, seed=2)
+        assert responses.get(resp_config, seed=1) is first_response
+        responses.get(resp_config, seed=3)
+        assert responses.size == 2
+
+        # The response with seed 2 is the least recently used one, so it has been evicted
+        responses.get(resp_config, seed=2)
+        assert responses.info() == {"hits": 1, "misses": 4, "size": 2, "max_size": 2}
+        assert responses.get(resp_config, seed=1) is not first_response
+
+    def test_get_with_different_setting(self, resp_config: HTTPResponse):
+        responses = DeterministicResponses()
+        response = responses.get(resp_config, seed=123)
+        other_resp_config = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT, properties=resp_config.properties, deterministic=True
+        )
+        assert responses.get(other_resp_config, seed=123) is not response
+        assert responses.size == 2
+
+    def test_retain(self, resp_config: HTTPResponse):
+        responses = DeterministicResponses()
+        response = responses.get(resp_config, seed=123)
+        removed_resp_config = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT, properties=resp_config.properties, deterministic=True
+        )
+        responses.get(removed_resp_config, seed=123)
+
+        responses.retain([resp_config])
+        assert responses.size == 1
+        assert responses.get(resp_config, seed=123) is response
+
+    def test_clear(self, resp_config: HTTPResponse):
+        responses = DeterministicResponses()
+        responses.get(resp_config, seed=123)
+        responses.get(resp_config, seed=123)
+        responses.clear()
+        assert responses.info() == {"hits": 0, "misses": 0, "size": 0, "max_size": 1024}
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError) as exc_info:
+            DeterministicResponses(max_size=0)
+        assert re.search(r".{0,32}greater than 0.{0,32}", str(exc_info.value), re.IGNORECASE)
+
+
+class TestNativeResponse:
+    @pytest.fixture(scope="function")
+    def native_response(self) -> NativeResponse:
+        return NativeResponse()
+
+    def test_generate(self, native_response: NativeResponse):
+        response = native_response.generate(body="Miss required parameter *id*.", status_code=400)
+        assert isinstance(response, RawResponse)
+        assert response.status_code == 400
+        assert response.body == b"Miss required parameter *id*."
+        assert ("Content-Type", "text/html; charset=utf-8") in response.headers
+        assert ("Content-Length", str(len(response.body))) in response.headers
+
+    @pytest.mark.parametrize(
+        ("value", "expected_body", "expected_content_type"),
+        [
+            ("this is string value", b"this is string value", "text/html; charset=utf-8"),
+            ({"id": 1, "name": "foo"}, b'{"id":1,"name":"foo"}', "application/json"),
+            ([1, 2, 3], b"[1,2,3]", "application/json"),
+        ],
+    )
+    def test_generate_content(
+        self, native_response: NativeResponse, value: Union[str, dict], expected_body: bytes, expected_content_type: str
+    ):
+        response = native_response.generate_content(value)
+        assert response.status_code == 200
+        assert response.body == expected_body
+        assert ("Content-Type", expected_content_type) in response.headers
+
+    def test_generate_stream(self, native_response: NativeResponse):
+        chunks = iter([b'{"data":[', b"1,2", b"]}"])
+        response = native_response.generate_stream(ResponseStream(chunks))
+        assert response.status_code == 200
+        assert response.body is chunks
+        assert response.headers == [("Content-Type", "application/json")]
+
+    def test_generate_file(self, native_response: NativeResponse, tmp_path):
+        file_path = tmp_path / "response.json"
+        file_path.write_text(json.dumps(_Json_File_Content), encoding="utf-8")
+        response_file = ResponseFile(str(file_path))
+        response = native_response.generate_file(response_file)
+        assert response.status_code == 200
+        assert response.body is response_file
+        assert response.headers == [
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(file_path.stat().st_size)),
+            ("ETag", response_file.validators.etag),
+            ("Last-Modified", response_file.validators.headers["Last-Modified"]),
+        ]
+
+    def test_generate_pre_rendered_with_validators(self, native_response: NativeResponse):
+        validators = CacheValidators.from_body(b"OK.", last_modified=784111777)
+        response = native_response.generate_pre_rendered(
+            PreRenderedResponse(b"OK.", content_type="text/html; charset=utf-8", validators=validators)
+        )
+        assert ("ETag", validators.etag) in response.headers
+        assert ("Last-Modified", validators.headers["Last-Modified"]) in response.headers
+
+    def test_generate_not_modified(self, native_response: NativeResponse):
+        validators = CacheValidators.from_body(b"OK.")
+        response = native_response.generate_not_modified(validators)
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers == list(validators.headers.items())
+
+    def test_generate_content_with_raw_response(self, native_response: NativeResponse):
+        raw_response = RawResponse(b"OK.")
+        assert native_response.generate_content(raw_response) is raw_response
@@ -0,0 +1,50 @@
+from typing import Optional
+
+import pytest
+
+from pymock_server.server.rest.application.route import RouteIndex
+
+
+class TestRouteIndex:
+    @pytest.fixture(scope="function")
+    def mock_api_details(self) -> dict:
+        return {
+            "/foo": {"GET": "this is foo."},
+            "/foo/<id>": {"GET": "this is foo with ID *<id>*."},
+            "/foo/<id>/process/<work_id>": {"GET": "this is foo with ID *<id>* by worker *<work_id>*."},
+            "/foo/{id}/detail": {"GET": "this is the detail of foo with ID *{id}*."},
+            "/foo/latest": {"GET": "this is the latest foo."},
+            "/bar/v<version>-<id>": {"GET": "this is bar with version *<version>* and ID *<id>*."},
+        }
+
+    @pytest.mark.parametrize(
+        ("api_path", "expected_template"),
+        [
+            ("/foo", "/foo"),
+            ("/foo/123", "/foo/<id>"),
+            ("/foo/latest", "/foo/latest"),
+            ("/foo/123/process/666", "/foo/<id>/process/<work_id>"),
+            ("/foo/123/detail", "/foo/{id}/detail"),
+            ("/bar/v1-123", "/bar/v<version>-<id>"),
+            ("/foo/123/process", None),
+            ("/foo/", None),
+            ("/bar/1-123", None),
+            ("/not-exist", None),
+        ],
+    )
+    def test_find(self, mock_api_details: dict, api_path: str, expected_template: Optional[str]):
+        route_match = RouteIndex(mock_api_details).find(api_path)
+        if expected_template is None:
+            assert route_match is None
+        else:
+            assert route_match is not None
+            assert route_match.template == expected_template
+            assert route_match.api_details is mock_api_details[expected_template]
+
+    def test_is_indexing(self, mock_api_details: dict):
+        route_index = RouteIndex(mock_api_details)
+        assert route_index.is_indexing(mock_api_details) is True
+        assert route_index.is_indexing(dict(mock_api_details)) is False
+
+        mock_api_details["/new-api"] = {"GET": "this is new API."}
+        assert route_index.is_indexing(mock_api_details) is False
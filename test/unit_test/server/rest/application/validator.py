@@ -0,0 +1,204 @@
+from typing import List, Optional
+
+import pytest
+
+from pymock_server.model.api_config import IteratorItem
+from pymock_server.model.api_config.apis import APIParameter
+from pymock_server.model.api_config.format import Format
+from pymock_server.model.api_config.value import FormatStrategy
+from pymock_server.server.rest.application.validator import (
+    ParameterValidator,
+    RequestValidator,
+)
+
+
+def _type_is_different_msg(value_type: type, data_type: type) -> str:
+    return (
+        f"The type of data from Font-End site (*{value_type}*) is different with the implementation of Back-End "
+        f"site (*{data_type}*)."
+    )
+
+
+def _list_param(items: List[IteratorItem], required: bool = True) -> APIParameter:
+    return APIParameter(name="data", required=required, value_type="list", items=items)
+
+
+class TestParameterValidator:
+    @pytest.mark.parametrize(
+        ("req_params", "expected_error"),
+        [
+            ({"id": 1}, None),
+            ({}, "Miss required parameter *id*."),
+            ({"id": None}, "Miss required parameter *id*."),
+        ],
+    )
+    def test_validate_required_parameter(self, req_params: dict, expected_error: Optional[str]):
+        validator = ParameterValidator(APIParameter(name="id", required=True, value_type="int"))
+        assert validator.validate(req_params) == expected_error
+
+    @pytest.mark.parametrize("req_params", [{}, {"id": None}, {"id": 0}, {"id": ""}])
+    def test_validate_optional_parameter_without_value(self, req_params: dict):
+        validator = ParameterValidator(APIParameter(name="id", required=False, value_type="int"))
+        assert validator.validate(req_params) is None
+
+    @pytest.mark.parametrize(
+        ("value", "expected_error"),
+        [
+            (123, None),
+            ("123", _type_is_different_msg(str, int)),
+            (1.5, _type_is_different_msg(float, int)),
+        ],
+    )
+    def test_validate_data_type(self, value, expected_error: Optional[str]):
+        validator = ParameterValidator(APIParameter(name="id", required=True, value_type="int"))
+        assert validator.validate({"id": value}) == expected_error
+
+    @pytest.mark.parametrize(
+        ("value_type", "value", "expected_error"),
+        [
+            ("int", "123", None),
+            ("float", "1.5", None),
+            ("int", "abc", _type_is_different_msg(str, int)),
+            # It only checks the digit string if the data type is numeric
+            ("str", "abc", None),
+        ],
+    )
+    def test_validate_data_type_with_int_type_value_is_string(
+        self, value_type: str, value: str, expected_error: Optional[str]
+    ):
+        validator = ParameterValidator(
+            APIParameter(name="id", required=True, value_type=value_type), int_type_value_is_string=True
+        )
+        assert validator.validate({"id": value}) == expected_error
+
+    @pytest.mark.parametrize(
+        ("value", "expected_error"),
+        [
+            (["a", "b"], None),
+            (["a", 1], _type_is_different_msg(list, list)),
+        ],
+    )
+    def test_validate_list_with_only_one_item(self, value: list, expected_error: Optional[str]):
+        validator = ParameterValidator(
+            _list_param(items=[IteratorItem(name="", required=True, value_type="str")]),
+        )
+        assert validator.validate({"data": value}) == expected_error
+
+    def test_validate_list_with_only_one_item_which_is_not_primitive(self):
+        validator = ParameterValidator(
+            _list_param(items=[IteratorItem(name="", required=True, value_type="str")]),
+        )
+        with pytest.raises(AssertionError):
+            validator.validate({"data": [{"id": 1}]})
+
+    @pytest.mark.parametrize(
+        ("value", "expected_error"),
+        [
+            ([{"id": 1, "name": "foo"}], None),
+            ([{"id": 1, "name": "foo"}, {"id": 2, "name": "bar"}], None),
+            ([{"name": "foo"}], "Miss required parameter *data.id*."),
+            ([{"id": 1, "name": "foo"}, {"name": "bar"}], "Miss required parameter *data.id*."),
+            ([{"id": "1", "name": "foo"}], _type_is_different_msg(list, list)),
+            ([{"id": 1, "name": 123}], _type_is_different_msg(list, list)),
+        ],
+    )
+    def test_validate_list_with_multiple_items(self, value: list, expected_error: Optional[str]):
+        validator = ParameterValidator(
+            _list_param(
+                items=[
+                    IteratorItem(name="id", required=True, value_type="int"),
+                    IteratorItem(name="name", required=True, value_type="str"),
+                ]
+            ),
+        )
+        assert validator.validate({"data": value}) == expected_error
+
+    @pytest.mark.parametrize(
+        ("value", "expected_error"),
+        [
+            ([{"id": 1, "name": "foo"}], None),
+            # It used to raise *KeyError* if the optional item is missing
+            ([{"id": 1}], None),
+            ([{"id": 1}, {"id": 2, "name": "bar"}], None),
+            ([{"name": "foo"}], "Miss required parameter *data.id*."),
+            ([{"id": 1, "name": 123}], _type_is_different_msg(list, list)),
+        ],
+    )
+    def test_validate_list_with_optional_item(self, value: list, expected_error: Optional[str]):
+        validator = ParameterValidator(
+            _list_param(
+                items=[
+                    IteratorItem(name="id", required=True, value_type="int"),
+                    IteratorItem(name="name", required=False, value_type="str"),
+                ]
+            ),
+        )
+        assert validator.validate({"data": value}) == expected_error
+
+    def test_required_item_names(self):
+        validator = ParameterValidator(
+            _list_param(
+                items=[
+                    IteratorItem(name="id", required=True, value_type="int"),
+                    IteratorItem(name="name", required=False, value_type="str"),
+                    IteratorItem(name="type", required=True, value_type="str"),
+                ]
+            ),
+        )
+        # The required item names are computed once when compiling the validator
+        assert validator._required_item_names == frozenset({"id", "type"})
+        assert validator.validate({"data": [{"id": 1, "type": "foo"}]}) is None
+        assert validator.validate({"data": [{"id": 1, "name": "foo"}]}) == "Miss required parameter *data.type*."
+
+    def test_validate_list_with_multiple_items_which_is_not_dict(self):
+        validator = ParameterValidator(
+            _list_param(
+                items=[
+                    IteratorItem(name="id", required=True, value_type="int"),
+                    IteratorItem(name="name", required=True, value_type="str"),
+                ]
+            ),
+        )
+        with pytest.raises(AssertionError):
+            validator.validate({"data": ["foo"]})
+
+    def test_validate_format(self):
+        value_format = Format(strategy=FormatStrategy.FROM_ENUMS, enums=["ENUM1", "ENUM2"])
+        validator = ParameterValidator(
+            APIParameter(name="type", required=True, value_type="str", value_format=value_format)
+        )
+        assert validator.validate({"type": "ENUM1"}) is None
+        assert validator.validate({"type": "ENUM3"}) == (
+            "The format of data from Font-End site (param: 'type', value: 'ENUM3') is incorrect. Its format should be "
+            f"{value_format.expect_format_log_msg(data_type=str)}."
+        )
+
+
+class TestRequestValidator:
+    @pytest.fixture(scope="function")
+    def parameters(self) -> List[APIParameter]:
+        return [
+            APIParameter(name="id", required=True, value_type="int"),
+            APIParameter(name="name", required=False, value_type="str"),
+        ]
+
+    @pytest.mark.parametrize(
+        ("req_params", "expected_error"),
+        [
+            ({"id": 1, "name": "foo"}, None),
+            ({"id": 1}, None),
+            ({"name": "foo"}, "Miss required parameter *id*."),
+            # It returns the error message of the first invalid parameter
+            ({"id": "1", "name": 123}, _type_is_different_msg(str, int)),
+        ],
+    )
+    def test_validate(self, parameters: List[APIParameter], req_params: dict, expected_error: Optional[str]):
+        assert RequestValidator(parameters).validate(req_params) == expected_error
+
+    def test_is_compiled_from(self, parameters: List[APIParameter]):
+        validator = RequestValidator(parameters)
+        assert validator.is_compiled_from(parameters) is True
+        assert validator.is_compiled_from(list(parameters)) is False
+
+        parameters.append(APIParameter(name="type", required=False, value_type="str"))
+        assert validator.is_compiled_from(parameters) is False